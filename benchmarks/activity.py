@@ -0,0 +1,140 @@
+from thermo.unifac import UNIFAC, UNIFACPsiCache, UNIFACAssignmentCache, DOUFIP2016, DOUFSG
+from thermo.nrtl import NRTL
+from thermo.wilson import Wilson
+from thermo.uniquac import UNIQUAC
+from thermo.regular_solution import RegularSolution
+
+
+class UNIFACManyTimeSuite(object):
+    # Composition sweep of benzene, cyclohexane, acetone, ethanol at a fixed T
+    params = [10, 1000]
+    param_names = ['M']
+
+    def setup(self, M):
+        chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+        self.GE = UNIFAC.from_subgroups(T=373.15, xs=[0.25]*4, chemgroups=chemgroups, version=1,
+                                        interaction_data=DOUFIP2016, subgroups=DOUFSG)
+        xs_matrix = []
+        for i in range(M):
+            xs = [1.0 + (i*7 + j*3) % 11 for j in range(4)]
+            tot = sum(xs)
+            xs_matrix.append([v/tot for v in xs])
+        self.xs_matrix = xs_matrix
+        self.GE.lnGammas_subgroups_pure()
+
+    def time_gammas_many(self, M):
+        self.GE.gammas_many(self.xs_matrix)
+
+    def time_to_T_xs_gammas(self, M):
+        GE = self.GE
+        for xs in self.xs_matrix:
+            GE.to_T_xs(373.15, xs).gammas()
+
+
+class UNIFACPsiCacheTimeSuite(object):
+    # 30 stage column of 16 alcohols and alkanes, with a new model for
+    # each stage on every iteration at the same stage temperatures
+    params = [False, True]
+    param_names = ['psi_cache']
+
+    def setup(self, psi_cache):
+        UNIFAC.psi_cache = UNIFACPsiCache() if psi_cache else None
+        chemgroups = [{1:1, 2:n, 14:1} for n in range(1, 9)] + [{1:2, 2:n} for n in range(1, 9)]
+        N = len(chemgroups)
+        self.GE = UNIFAC.from_subgroups(T=330.0, xs=[1.0/N]*N, chemgroups=chemgroups, version=1,
+                                        interaction_data=DOUFIP2016, subgroups=DOUFSG)
+        self.Ts = [330.0 + 1.5*i for i in range(30)]
+        self.xs = [1.0/N]*N
+        self.column()
+
+    def teardown(self, psi_cache):
+        UNIFAC.psi_cache = None
+
+    def column(self):
+        GE, xs = self.GE, self.xs
+        for T in self.Ts:
+            stage = GE.to_T_xs(T, xs)
+            stage.gammas()
+            stage.dGE_dT()
+
+    def time_column(self, psi_cache):
+        self.column()
+
+
+class UNIFACAssignmentCacheTimeSuite(object):
+    # Repeated screening run; every molecule is already in the database
+    params = [100, 10000]
+    param_names = ['M']
+
+    def setup(self, M):
+        self.cache = UNIFACAssignmentCache(':memory:', seed=False)
+        self.smiles = ['C'*(i % 40 + 1) + 'O'*(i//40 + 1) for i in range(M)]
+        for i, smi in enumerate(self.smiles):
+            self.cache.store('KEY%d' %i, {1: 2, 2: i % 40, 14: 1}, smiles=smi)
+
+    def teardown(self, M):
+        self.cache.close()
+
+    def time_assign_many(self, M):
+        self.cache.assign_many(self.smiles)
+
+
+class EvaluateManyTimeSuite(object):
+    # Temperature and composition sweep of a made-up 5 component system
+    params = (['NRTL', 'Wilson', 'UNIQUAC'], [10, 1000])
+    param_names = ['model', 'M']
+
+    def setup(self, model, M):
+        N = 5
+        As = [[0.0 if i == j else 0.01*(i - j) for j in range(N)] for i in range(N)]
+        Bs = [[0.0 if i == j else 40.0*((3*i + j) % 7) - 120.0 for j in range(N)] for i in range(N)]
+        xs = [1.0/N]*N
+        if model == 'NRTL':
+            alpha_cs = [[0.0 if i == j else 0.3 for j in range(N)] for i in range(N)]
+            self.GE = NRTL(T=330.0, xs=xs, tau_as=As, tau_bs=Bs, alpha_cs=alpha_cs)
+        elif model == 'Wilson':
+            self.GE = Wilson(T=330.0, xs=xs, lambda_as=As, lambda_bs=Bs)
+        else:
+            self.GE = UNIQUAC(T=330.0, xs=xs, rs=[1.0 + 0.3*i for i in range(N)],
+                              qs=[1.0 + 0.2*i for i in range(N)], tau_as=As, tau_bs=Bs)
+        xs_matrix = []
+        for i in range(M):
+            xs = [1.0 + (i*7 + j*3) % 11 for j in range(N)]
+            tot = sum(xs)
+            xs_matrix.append([v/tot for v in xs])
+        self.xs_matrix = xs_matrix
+        self.Ts = [300.0 + 50.0*i/M for i in range(M)]
+
+    def time_evaluate_many(self, model, M):
+        self.GE.evaluate_many(self.Ts, self.xs_matrix)
+
+    def time_to_T_xs(self, model, M):
+        GE = self.GE
+        for T, xs in zip(self.Ts, self.xs_matrix):
+            obj = GE.to_T_xs(T, xs)
+            obj.gammas()
+            obj.GE()
+            obj.dGE_dxs()
+
+
+class RegressBinaryParametersTimeSuite(object):
+    # Fits to an ethanol-water like NRTL curve; `processes` only matters with
+    # multiple_tries, where each initial guess is solved in its own process
+    params = (['NRTL', 'Wilson', 'RegularSolution', 'UNIQUAC'], [100, 10000], [None, 4])
+    param_names = ['model', 'pts', 'processes']
+
+    def setup(self, model, pts, processes):
+        GE = NRTL(T=300.0, xs=[.5, .5], tau_as=[[0, 1.2], [0.5, 0]], alpha_cs=[[0, .3], [.3, 0]])
+        self.xs = [[0.01 + 0.98*i/(pts - 1), 0.99 - 0.98*i/(pts - 1)] for i in range(pts)]
+        self.gammas = GE.evaluate_many([300.0]*pts, self.xs)['gammas'].tolist()
+        self.kwargs = dict(use_numba=False, multiple_tries=True, multiple_tries_max_err=1e-30,
+                           processes=processes)
+        if model == 'RegularSolution':
+            self.kwargs.update(Vs=[7.421e-05, 8.068e-05], SPs=[19570.2, 18864.7], Ts=[300.0]*pts)
+        elif model == 'UNIQUAC':
+            self.kwargs.update(rs=[2.1055, 0.92], qs=[1.972, 1.4])
+        self.cls = {'NRTL': NRTL, 'Wilson': Wilson, 'RegularSolution': RegularSolution,
+                    'UNIQUAC': UNIQUAC}[model]
+
+    def time_regress_binary_parameters(self, model, pts, processes):
+        self.cls.regress_binary_parameters(self.gammas, self.xs, **self.kwargs)
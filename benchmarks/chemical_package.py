@@ -0,0 +1,62 @@
+import tempfile
+from thermo import ChemicalConstantsPackage, chemical_package
+from thermo.database import CompiledDatabank, compile_databank
+
+IDs = ['water', 'methanol', 'ethanol', 'hexane', 'toluene']
+
+natural_gas_IDs = ['methane', 'ethane', 'propane', 'butane', 'isobutane',
+                   'pentane', 'isopentane', 'neopentane', 'hexane', 'heptane',
+                   'octane', 'nitrogen', 'carbon dioxide', 'hydrogen sulfide',
+                   'water', 'helium', 'argon', 'oxygen', 'hydrogen',
+                   'carbon monoxide']
+
+
+class CompiledDatabankTimeSuite(object):
+    def setup_cache(self):
+        path = tempfile.mkdtemp()
+        compile_databank(IDs, path)
+        return path
+
+    def setup(self, path):
+        self.databank = CompiledDatabank(path)
+        ChemicalConstantsPackage.clear_cache()
+
+    def time_from_IDs(self, path):
+        ChemicalConstantsPackage.from_IDs(IDs)
+
+    def time_from_IDs_databank(self, path):
+        ChemicalConstantsPackage.from_IDs(IDs, databank=self.databank)
+
+    def time_constants_from_IDs_databank(self, path):
+        ChemicalConstantsPackage.constants_from_IDs(IDs, databank=self.databank)
+
+
+class FromIDsCacheTimeSuite(object):
+    # Construction of a 20 component natural gas package; cold is every
+    # chemical being loaded (with the data files already read), warm is
+    # every chemical coming from the cache
+    number = 1
+
+    def setup(self):
+        chemical_package.caching = True
+        ChemicalConstantsPackage.from_IDs(natural_gas_IDs)
+
+    def teardown(self):
+        chemical_package.caching = False
+        ChemicalConstantsPackage.clear_cache()
+
+    def time_from_IDs_cold(self):
+        ChemicalConstantsPackage.clear_cache()
+        ChemicalConstantsPackage.from_IDs(natural_gas_IDs)
+
+    def time_from_IDs_warm(self):
+        ChemicalConstantsPackage.from_IDs(natural_gas_IDs)
+
+    def time_constants_from_IDs_warm(self):
+        ChemicalConstantsPackage.constants_from_IDs(natural_gas_IDs)
+
+
+def timeraw_from_IDs_first():
+    # Includes importing thermo and reading every data file used
+    return ("ChemicalConstantsPackage.from_IDs(%r)" %(natural_gas_IDs,),
+            'from thermo import ChemicalConstantsPackage')
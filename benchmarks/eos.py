@@ -0,0 +1,48 @@
+import numpy as np
+from thermo.eos import PR, PRTranslatedTwu
+
+
+class SaturationFitTimeSuite(object):
+    params = [False, True]
+    param_names = ['saturation_fit']
+
+    def setup(self, saturation_fit):
+        PRTranslatedTwu.saturation_fit = saturation_fit
+        self.eos = PRTranslatedTwu(Tc=512.5, Pc=8084000.0, omega=0.559, c=-1e-6, T=300.0, P=1e5,
+                                   alpha_coeffs=(0.694911381318495, 0.919907783415812, 1.70412689631515))
+        # Build the fits outside of the timings
+        self.eos.Psat(400.0)
+
+    def teardown(self, saturation_fit):
+        del PRTranslatedTwu.saturation_fit
+
+    def time_Psat(self, saturation_fit):
+        self.eos.Psat(400.0)
+
+    def time_Tsat(self, saturation_fit):
+        self.eos.Tsat(1e6)
+
+    def time_phi_sat(self, saturation_fit):
+        self.eos.phi_sat(400.0, polish=False)
+
+    def time_V_l_sat(self, saturation_fit):
+        self.eos.V_l_sat(400.0)
+
+
+class EvaluateManyTimeSuite(object):
+    params = [100, 10000]
+    param_names = ['N']
+
+    def setup(self, N):
+        self.eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+        Ts, Ps = np.meshgrid(np.linspace(200.0, 700.0, int(N**0.5)), np.logspace(3, 7, int(N**0.5)))
+        self.Ts, self.Ps = Ts.ravel(), Ps.ravel()
+        self.Ts_list, self.Ps_list = self.Ts.tolist(), self.Ps.tolist()
+
+    def time_evaluate_many(self, N):
+        self.eos.evaluate_many(self.Ts, self.Ps)
+
+    def time_to_TP(self, N):
+        eos = self.eos
+        for T, P in zip(self.Ts_list, self.Ps_list):
+            eos.to_TP(T, P)
@@ -0,0 +1,84 @@
+from thermo.eos_mix import PRMIX, TWUPRMIX, PRMIXTranslatedConsistent, MSRKMIXTranslated
+
+
+class KijsLowRankTimeSuite(object):
+    # Characterized oils; 'light' has kijs only between the two lightest
+    # components and the rest
+    params = ([6, 10, 50, 200], ['zero', 'light'], [False, True])
+    param_names = ['N', 'kijs', 'low_rank_kijs']
+
+    def setup(self, N, kijs, low_rank_kijs):
+        PRMIX.low_rank_kijs = low_rank_kijs
+        self.Tcs = [190.6 + 600.0*i/N for i in range(N)]
+        self.Pcs = [4.6e6 - 3e6*i/N for i in range(N)]
+        self.omegas = [0.01 + 1.2*i/N for i in range(N)]
+        zs = [1.0/N]*N
+        self.kijs = k = [[0.0]*N for _ in range(N)]
+        if kijs == 'light':
+            for i in range(2, N):
+                k[0][i] = k[i][0] = 0.02
+                k[1][i] = k[i][1] = 0.04*i/N
+        self.eos = PRMIX(T=400.0, P=3e6, Tcs=self.Tcs, Pcs=self.Pcs, omegas=self.omegas, zs=zs, kijs=k)
+        self.zs = [(i + 1.0)/(0.5*N*(N + 1)) for i in range(N)]
+
+    def teardown(self, N, kijs, low_rank_kijs):
+        del PRMIX.low_rank_kijs
+
+    def time_a_alpha_and_derivatives(self, N, kijs, low_rank_kijs):
+        eos = self.eos
+        eos.a_alpha_and_derivatives_py(eos.a_alphas, eos.da_alpha_dTs, eos.d2a_alpha_dT2s, eos.T)
+
+    def time_a_alpha(self, N, kijs, low_rank_kijs):
+        eos = self.eos
+        eos.a_alpha_and_derivatives_py(eos.a_alphas, eos.da_alpha_dTs, eos.d2a_alpha_dT2s, eos.T, full=False)
+
+    def time_to_TP_zs_fast(self, N, kijs, low_rank_kijs):
+        self.eos.to_TP_zs_fast(T=400.0, P=3e6, zs=self.zs)
+
+    def time_construction(self, N, kijs, low_rank_kijs):
+        PRMIX(T=400.0, P=3e6, Tcs=self.Tcs, Pcs=self.Pcs, omegas=self.omegas, zs=self.zs, kijs=self.kijs)
+
+
+class MixinAlphaTimeSuite(object):
+    params = (['TWUPRMIX', 'PRMIXTranslatedConsistent', 'MSRKMIXTranslated'], [10, 50])
+    param_names = ['eos', 'N']
+
+    def setup(self, eos, N):
+        Tcs = [190.6 + 600.0*i/N for i in range(N)]
+        Pcs = [4.6e6 - 3e6*i/N for i in range(N)]
+        omegas = [0.01 + 1.2*i/N for i in range(N)]
+        cls = {'TWUPRMIX': TWUPRMIX, 'PRMIXTranslatedConsistent': PRMIXTranslatedConsistent,
+               'MSRKMIXTranslated': MSRKMIXTranslated}[eos]
+        self.eos = cls(T=400.0, P=3e6, Tcs=Tcs, Pcs=Pcs, omegas=omegas, zs=[1.0/N]*N)
+        self.Ts = [250.0 + 5.0*i for i in range(50)]
+
+    def time_a_alpha_and_derivatives_vectorized(self, eos, N):
+        self.eos.a_alpha_and_derivatives_vectorized(400.0)
+
+    def time_a_alpha_and_derivatives_many(self, eos, N):
+        self.eos.a_alpha_and_derivatives_many(self.Ts)
+
+
+class LnphisDerivativesTimeSuite(object):
+    params = (['PRMIX', 'PRMIXTranslatedConsistent'], [5, 20])
+    param_names = ['eos', 'N']
+
+    def setup(self, eos, N):
+        Tcs = [190.6 + 300.0*i/N for i in range(N)]
+        Pcs = [4.6e6 - 1.5e6*i/N for i in range(N)]
+        omegas = [0.01 + 0.3*i/N for i in range(N)]
+        cls = {'PRMIX': PRMIX, 'PRMIXTranslatedConsistent': PRMIXTranslatedConsistent}[eos]
+        self.eos = cls(T=300.0, P=3e6, Tcs=Tcs, Pcs=Pcs, omegas=omegas, zs=[1.0/N]*N)
+        self.phase = 'g' if hasattr(self.eos, 'Z_g') else 'l'
+        self.bufs = ([0.0]*N, [0.0]*N, [0.0]*N, [[0.0]*N for _ in range(N)])
+
+    def time_separate(self, eos, N):
+        e, phase = self.eos, self.phase
+        Z = e.Z_g if phase == 'g' else e.Z_l
+        e.fugacity_coefficients(Z)
+        e.dlnphis_dT(phase)
+        e.dlnphis_dP(phase)
+        e.dlnphis_dns(Z)
+
+    def time_lnphis_and_derivatives(self, eos, N):
+        self.eos.lnphis_and_derivatives(self.phase, *self.bufs)
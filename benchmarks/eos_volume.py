@@ -0,0 +1,33 @@
+from fluids.numerics import IS_PYPY
+import numpy as np
+from thermo.eos import PR
+from thermo.eos_volume import volume_solutions_halley, volume_solutions_halley_many
+if not IS_PYPY:
+    import thermo.numba
+
+
+class VolumeSolutionsManyTimeSuite(object):
+    # A pure component table over the liquid, vapor and supercritical regions
+    def setup(self):
+        eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+        N = 100000
+        self.Ts = Ts = np.repeat(np.linspace(150.0, 600.0, 316), 317)[:N]
+        self.Ps = np.tile(np.logspace(3.0, 7.5, 317), 316)[:N]
+        self.a_alphas = np.array([eos.a_alpha_pure(T) for T in Ts.tolist()])
+        self.bs = np.full(N, eos.b)
+        self.deltas = np.full(N, eos.delta)
+        self.epsilons = np.full(N, eos.epsilon)
+        self.args = (self.Ts, self.Ps, self.bs, self.deltas, self.epsilons, self.a_alphas)
+        self.args_list = list(zip(*[v.tolist() for v in self.args]))
+        if not IS_PYPY:
+            thermo.numba.eos_volume.volume_solutions_halley_many(*[v[:2] for v in self.args])
+
+    def time_volume_solutions_halley(self):
+        for args in self.args_list:
+            volume_solutions_halley(*args)
+
+    def time_volume_solutions_halley_many(self):
+        volume_solutions_halley_many(*self.args)
+
+    def time_volume_solutions_halley_many_numba(self):
+        thermo.numba.eos_volume.volume_solutions_halley_many(*self.args)
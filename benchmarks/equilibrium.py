@@ -0,0 +1,42 @@
+import gc
+import tracemalloc
+
+from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas,
+                    CEOSGas, CEOSLiquid, PRMIX, FlashVL, EquilibriumState,
+                    CompactEquilibriumState)
+
+
+class StoredStateMemorySuite(object):
+    params = ['full', 'compact']
+    param_names = ['dest']
+
+    def setup(self, dest):
+        constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                             omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                             CASs=['74-84-0', '109-66-0'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                             HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVL(constants, correlations, gas=gas, liquid=liquid)
+        self.dest = EquilibriumState if dest == 'full' else CompactEquilibriumState
+        # Fill the phase model caches outside of the measurement
+        for i in range(100):
+            self.flasher.flash(T=300.0 + 0.01*i, P=1e6, zs=[.5, .5], dest=self.dest)
+
+    def track_bytes_per_state(self, dest):
+        flasher, cls, count = self.flasher, self.dest, 200
+        gc.collect()
+        tracemalloc.start()
+        states = [flasher.flash(T=300.0 + 0.01*i, P=1e6, zs=[.5, .5], dest=cls) for i in range(count)]
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size/len(states)
+
+    track_bytes_per_state.unit = 'bytes'
+
+    def time_flash_TP(self, dest):
+        self.flasher.flash(T=300.0, P=1e6, zs=[.5, .5], dest=self.dest)
@@ -0,0 +1,81 @@
+from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas,
+                    CEOSGas, CEOSLiquid, PRMIX, FlashVL)
+
+
+class PhaseEnvelopeTimeSuite(object):
+    def setup(self):
+        constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 369.83, 425.12, 469.7, 507.6],
+                                             Pcs=[4599000.0, 4872000.0, 4248000.0, 3796000.0, 3370000.0, 3025000.0],
+                                             omegas=[0.008, 0.098, 0.152, 0.193, 0.251, 0.2975],
+                                             MWs=[16.04246, 30.06904, 44.09562, 58.1222, 72.14878, 86.17536],
+                                             CASs=['74-82-8', '74-84-0', '74-98-6', '106-97-8', '109-66-0', '110-54-3'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*7 + [0.01, 35.0]))]*6
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVL(constants, correlations, gas=gas, liquid=liquid)
+        self.zs = [0.7, 0.1, 0.08, 0.05, 0.04, 0.03]
+        # Low pressure part of the dew curve, where cold started flashes converge
+        self.Ps = [1e5*1.2**i for i in range(20)]
+
+    def time_phase_envelope(self):
+        self.flasher.phase_envelope(self.zs)
+
+    def time_dew_point_flashes(self):
+        for P in self.Ps:
+            self.flasher.flash(P=P, VF=1.0, zs=self.zs)
+
+
+class FlashTPBatchTimeSuite(object):
+    def setup(self):
+        constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 369.83, 425.12, 469.7, 507.6],
+                                             Pcs=[4599000.0, 4872000.0, 4248000.0, 3796000.0, 3370000.0, 3025000.0],
+                                             omegas=[0.008, 0.098, 0.152, 0.193, 0.251, 0.2975],
+                                             MWs=[16.04246, 30.06904, 44.09562, 58.1222, 72.14878, 86.17536],
+                                             CASs=['74-82-8', '74-84-0', '74-98-6', '106-97-8', '109-66-0', '110-54-3'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*7 + [0.01, 35.0]))]*6
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVL(constants, correlations, gas=gas, liquid=liquid)
+        self.Ts = [200.0 + 2.5*i for i in range(100)]
+        self.Ps = [1e6]*100
+        self.zs_matrix = [[0.7, 0.1, 0.08, 0.05, 0.04, 0.03]]*100
+
+    def time_flash_TP_batch(self):
+        self.flasher.flash_TP_batch(self.Ts, self.Ps, self.zs_matrix)
+
+    def time_flash_TP_loop(self):
+        for T, P, zs in zip(self.Ts, self.Ps, self.zs_matrix):
+            self.flasher.flash(T=T, P=P, zs=zs)
+
+
+class FlashTPHotStartTimeSuite(object):
+    def setup(self):
+        constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 369.83, 425.12, 469.7, 507.6],
+                                             Pcs=[4599000.0, 4872000.0, 4248000.0, 3796000.0, 3370000.0, 3025000.0],
+                                             omegas=[0.008, 0.098, 0.152, 0.193, 0.251, 0.2975],
+                                             MWs=[16.04246, 30.06904, 44.09562, 58.1222, 72.14878, 86.17536],
+                                             CASs=['74-82-8', '74-84-0', '74-98-6', '106-97-8', '109-66-0', '110-54-3'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*7 + [0.01, 35.0]))]*6
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVL(constants, correlations, gas=gas, liquid=liquid)
+        self.zs = [0.7, 0.1, 0.08, 0.05, 0.04, 0.03]
+        # Temperature sweep which is two phase at every point
+        self.Ts = [220.0 + 0.5*i for i in range(100)]
+        self.P = 2e6
+        self.start = self.flasher.flash(T=self.Ts[0], P=self.P, zs=self.zs)
+
+    def time_flash_TP_sweep(self):
+        for T in self.Ts:
+            self.flasher.flash(T=T, P=self.P, zs=self.zs)
+
+    def time_flash_TP_sweep_hot_start(self):
+        prev = self.start
+        for T in self.Ts:
+            prev = self.flasher.flash(T=T, P=self.P, zs=self.zs, hot_start=prev)
@@ -0,0 +1,47 @@
+from thermo.eos_mix import PRMIX, PRSV2MIX
+from thermo.phases import CEOSGas, CEOSLiquid
+
+
+class CEOSAlphaCacheTimeSuite(object):
+    # A gas and a liquid created at the same new temperature, as in a flash
+    params = (['PRMIX', 'PRSV2MIX'], [False, True])
+    param_names = ['eos', 'alpha_caching']
+
+    def setup(self, eos, alpha_caching):
+        N = 20
+        eos_kwargs = dict(Tcs=[190.6 + 15.0*i for i in range(N)], Pcs=[4.6e6 - 1e5*i for i in range(N)],
+                          omegas=[0.01 + 0.03*i for i in range(N)])
+        if eos == 'PRSV2MIX':
+            eos_kwargs.update(kappa1s=[0.05]*N, kappa2s=[0.8]*N, kappa3s=[0.46]*N)
+        eos_class = {'PRMIX': PRMIX, 'PRSV2MIX': PRSV2MIX}[eos]
+        CEOSGas.alpha_caching = CEOSLiquid.alpha_caching = alpha_caching
+        self.zs = zs = [1.0/N]*N
+        self.gas = CEOSGas(eos_class, eos_kwargs, T=300.0, P=1e5, zs=zs)
+        self.liquid = CEOSLiquid(eos_class, eos_kwargs, T=300.0, P=1e5, zs=zs)
+
+    def teardown(self, eos, alpha_caching):
+        CEOSGas.alpha_caching = CEOSLiquid.alpha_caching = False
+
+    def time_gas_liquid_to_TP_zs(self, eos, alpha_caching):
+        self.gas.to_TP_zs(T=350.0, P=1e5, zs=self.zs)
+        self.liquid.to_TP_zs(T=350.0, P=1e5, zs=self.zs)
+
+
+class PSRKLnphisTimeSuite(object):
+    # CO2, n-hexane
+    def setup(self):
+        from thermo.eos_mix import PSRK
+        from thermo.unifac import UNIFAC, PSRKIP, PSRKSG
+        T, P, zs = 313.0, 1e6, [0.5, 0.5]
+        ge_model = UNIFAC.from_subgroups(T=T, xs=zs, chemgroups=[{117: 1}, {1:2, 2:4}], subgroups=PSRKSG,
+                                         interaction_data=PSRKIP, version=0)
+        eos_kwargs = dict(Tcs=[304.2, 507.4], Pcs=[7.37646e6, 3.014419e6], omegas=[0.2252, 0.2975],
+                          alpha_coeffs=[[-1.7039, 0.2515, 0.8252, 1.0], [2.9173, -1.4411, 1.1061, 1.0]],
+                          ge_model=ge_model)
+        self.liquid = CEOSLiquid(PSRK, eos_kwargs, T=T, P=P, zs=zs)
+
+    def time_lnphis_at_zs(self):
+        self.liquid.lnphis_at_zs([0.3, 0.7])
+
+    def time_to_TP_zs_lnphis(self):
+        self.liquid.to_TP_zs(T=313.0, P=1e6, zs=[0.3, 0.7]).lnphis()
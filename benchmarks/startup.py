@@ -0,0 +1,14 @@
+# Each timeraw benchmark runs in a fresh interpreter, so these measure the
+# cold-start cost seen by short-lived processes.
+
+def timeraw_import_thermo():
+    return 'import thermo'
+
+def timeraw_first_VaporPressure():
+    return "VaporPressure(CASRN='7732-18-5')", 'from thermo import VaporPressure'
+
+def timeraw_first_HeatCapacityGas():
+    return "HeatCapacityGas(CASRN='7732-18-5')", 'from thermo import HeatCapacityGas'
+
+def timeraw_first_Chemical():
+    return "Chemical('water')", 'from thermo import Chemical'
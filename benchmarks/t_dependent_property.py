@@ -0,0 +1,74 @@
+from thermo import VaporPressure, HeatCapacityGas, SurfaceTension
+from thermo.utils import POLY_FIT, EXP_CHEB_FIT_LN_TAU
+import numpy as np
+
+
+class TDependentPropertyTimeSuite(object):
+    params = ['VaporPressure', 'HeatCapacityGas', 'SurfaceTension']
+    param_names = ['prop']
+
+    def setup(self, prop):
+        if prop == 'VaporPressure':
+            obj = VaporPressure(CASRN='7732-18-5', Tb=373.124, Tc=647.14, Pc=22048320.0, omega=0.344)
+        elif prop == 'HeatCapacityGas':
+            obj = HeatCapacityGas(CASRN='7732-18-5', MW=18.01528, similarity_variable=0.16652530518537598)
+        else:
+            obj = SurfaceTension(CASRN='7732-18-5', MW=18.01528, Tb=373.124, Tc=647.14, Pc=22048320.0, Vc=5.6e-05, Zc=0.2294728175007233, omega=0.344, StielPolar=0.023)
+        self.obj = obj
+        self.evaluate = obj.evaluator()
+        self.T = 0.5*sum(obj.T_limits[obj.method])
+        self.Ts = np.linspace(obj.T_limits[obj.method][0], obj.T_limits[obj.method][1], 10000)
+
+    def time_T_dependent_property(self, prop):
+        self.obj.T_dependent_property(self.T)
+
+    def time_call(self, prop):
+        self.obj.T_cached = None
+        self.obj(self.T)
+
+    def time_evaluator(self, prop):
+        self.evaluate(self.T)
+
+    def time_T_dependent_property_many(self, prop):
+        self.obj.T_dependent_property_many(self.Ts)
+
+
+class TDependentPropertyFitTimeSuite(object):
+    params = [POLY_FIT, EXP_CHEB_FIT_LN_TAU]
+    param_names = ['method']
+
+    def setup(self, method):
+        if method == POLY_FIT:
+            self.obj = HeatCapacityGas(load_data=False, poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228]))
+        else:
+            self.obj = VaporPressure(load_data=False, Tc=591.72, exp_cheb_fit_ln_tau=(309.0, 591.0, 591.72, [-9.6, -3.8, 0.5, -0.06, 0.007, -0.001]))
+        self.evaluate = self.obj.evaluator()
+        self.Ts = np.linspace(320.0, 580.0, 10000)
+
+    def time_T_dependent_property(self, method):
+        self.obj.T_dependent_property(400.0)
+
+    def time_evaluator(self, method):
+        self.evaluate(400.0)
+
+    def time_T_dependent_property_many(self, method):
+        self.obj.T_dependent_property_many(self.Ts)
+
+    def time_T_dependent_property_derivative_many(self, method):
+        self.obj.T_dependent_property_derivative_many(self.Ts)
+
+
+class TDependentPropertyTabularTimeSuite(object):
+    def setup(self):
+        self.obj = VaporPressure(load_data=False)
+        self.Ts = np.linspace(300.0, 400.0, 10000)
+        self.obj.add_tabular_data(Ts=[300.0, 320.0, 340.0, 360.0, 380.0, 400.0],
+                                  properties=[3536.8, 10546.5, 27188.0, 62093.1, 128880.0, 246630.0],
+                                  name='data')
+        self.obj.interpolate(350.0, 'data')
+
+    def time_interpolate(self):
+        self.obj.interpolate(350.0, 'data')
+
+    def time_interpolate_many(self):
+        self.obj.interpolate_many(self.Ts, 'data')
@@ -145,4 +145,56 @@ def test_add_PropertyCorrelationsPackage():
     c = a + b
     
     c_good = ChemicalConstantsPackage.correlations_from_IDs(IDs=['water', 'hexane', 'toluene'])
-    assert c == c_good
\ No newline at end of file
+    assert c == c_good
+
+def test_from_IDs_cache():
+    from thermo import chemical_package
+    IDs = ['methane', 'water', 'hexane', 'methane']
+    assert not chemical_package.caching
+    constants_fresh, correlations_fresh = ChemicalConstantsPackage.from_IDs(IDs)
+    ChemicalConstantsPackage.clear_cache()
+    try:
+        chemical_package.caching = True
+        constants, correlations = ChemicalConstantsPackage.from_IDs(IDs)
+        constants2, correlations2 = ChemicalConstantsPackage.from_IDs(IDs[::-1])
+        assert constants == constants_fresh
+        for name in PropertyCorrelationsPackage.pure_correlations:
+            for obj, obj_fresh in zip(getattr(correlations, name), getattr(correlations_fresh, name)):
+                assert obj.method == obj_fresh.method
+                assert obj.T_dependent_property(300.0) == obj_fresh.T_dependent_property(300.0)
+        assert constants2.subset([0, 2, 1]) == constants.subset([0, 1, 2])
+        assert ChemicalConstantsPackage.constants_from_IDs(IDs) == constants_fresh
+        # Nothing is shared between packages, or between repeated components
+        assert correlations.VaporPressures[0] is not correlations.VaporPressures[3]
+        assert correlations2.HeatCapacityGases[1] is not correlations.HeatCapacityGases[2]
+
+        # Changes to returned objects do not reach the cache
+        correlations.VaporPressures[2].method = 'ANTOINE_POLING'
+        constants.UNIFAC_groups[2][1] = 100
+        constants3, correlations3 = ChemicalConstantsPackage.from_IDs(['hexane'])
+        assert correlations3.VaporPressures[0].method == correlations_fresh.VaporPressures[2].method
+        assert constants3.UNIFAC_groups[0] == constants_fresh.UNIFAC_groups[2]
+        assert ChemicalConstantsPackage.constants_from_IDs(['hexane']).UNIFAC_groups[0] == constants_fresh.UNIFAC_groups[2]
+
+        ChemicalConstantsPackage.clear_cache(['water'])
+        assert len(chemical_package._from_IDs_cache) == 2
+    finally:
+        chemical_package.caching = False
+        ChemicalConstantsPackage.clear_cache()
+
+
+def test_from_IDs_cache_size():
+    from thermo import chemical_package
+    ChemicalConstantsPackage.clear_cache()
+    old = chemical_package.max_cached_chemicals
+    try:
+        chemical_package.caching = True
+        chemical_package.max_cached_chemicals = 2
+        ChemicalConstantsPackage.correlations_from_IDs(['methane', 'ethane'])
+        ChemicalConstantsPackage.correlations_from_IDs(['propane'])
+        # methane was the least recently used
+        assert [k[0] for k in chemical_package._from_IDs_cache] == ['74-84-0', '74-98-6']
+    finally:
+        chemical_package.caching = False
+        chemical_package.max_cached_chemicals = old
+        ChemicalConstantsPackage.clear_cache()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import pytest
+import numpy as np
+from fluids.numerics import assert_close
+from thermo import ChemicalConstantsPackage
+from thermo.database import CompiledDatabank, compile_databank
+
+
+@pytest.fixture(scope='module')
+def databank(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('databank'))
+    return compile_databank(['water', 'hexane', 'toluene'], path)
+
+def test_compiled_databank_memory_mapped(databank):
+    assert isinstance(databank.table, np.memmap)
+    assert list(databank.CAS_ints) == sorted(databank.CAS_ints)
+    # Reopening the same directory gives the same data
+    reopened = CompiledDatabank(databank.path)
+    assert reopened.index('hexane') == databank.index('110-54-3')
+
+def test_compiled_databank_lookup(databank):
+    assert 'water' in databank
+    assert 'Water' in databank
+    assert '7732-18-5' in databank
+    # Resolved through the identifiers database
+    assert 'H2O' in databank
+    assert 'methane' not in databank
+    with pytest.raises(KeyError):
+        databank.index('methane')
+
+def test_compiled_databank_constants(databank):
+    IDs = ['toluene', 'water']
+    constants = ChemicalConstantsPackage.constants_from_IDs(IDs, databank=databank)
+    expect = ChemicalConstantsPackage.constants_from_IDs(IDs)
+    assert constants == expect
+    assert constants.UNIFAC_groups == expect.UNIFAC_groups
+    assert constants.atomss == expect.atomss
+    assert type(constants.charges[0]) is int
+    # Packages do not share dictionaries with the databank
+    constants.UNIFAC_groups[0][1] = 100
+    constants.atomss[1]['H'] = 100
+    again = ChemicalConstantsPackage.constants_from_IDs(IDs, databank=databank)
+    assert again.UNIFAC_groups == expect.UNIFAC_groups
+    assert again.atomss == expect.atomss
+
+def test_compiled_databank_correlations(databank):
+    IDs = ['hexane', 'water']
+    constants, correlations = ChemicalConstantsPackage.from_IDs(IDs, databank=databank)
+    expect = ChemicalConstantsPackage.correlations_from_IDs(IDs)
+    assert correlations.constants == constants
+
+    # Stored fits are used without loading data
+    obj = correlations.VaporPressures[0]
+    assert obj.method == 'EXP_CHEB_FIT'
+    assert 'WAGNER_MCGARRY' not in obj.all_methods
+    assert obj.Tc == constants.Tcs[0]
+
+    for name in ('VaporPressures', 'HeatCapacityGases', 'ViscosityLiquids', 'EnthalpyVaporizations'):
+        for obj, full in zip(getattr(correlations, name), getattr(expect, name)):
+            Tmin, Tmax = obj.T_limits[obj.method]
+            for T in np.linspace(Tmin, Tmax, 7)[1:-1]:
+                assert_close(obj.T_dependent_property(T), full.T_dependent_property(T), rtol=1e-6)
+
+    # Correlations which could not be fit are loaded in full
+    obj, full = correlations.HeatCapacitySolids[0], expect.HeatCapacitySolids[0]
+    assert obj.method == full.method
+    assert_close(obj(200.0), full(200.0), rtol=1e-13)
+
+def test_compiled_databank_fallback(databank):
+    # Not everything is in the databank, so the chemicals library is used
+    constants = ChemicalConstantsPackage.constants_from_IDs(['water', 'methane'], databank=databank)
+    assert constants == ChemicalConstantsPackage.constants_from_IDs(['water', 'methane'])
@@ -2116,6 +2116,60 @@ def test_dphi_sat_dT():
     assert_close(dphi_sat_dT_analytical, dphi_sat_dT_num, rtol=1e-7)
     assert_close(dphi_sat_dT_analytical, -0.0017161558583938723, rtol=1e-10)
 
+def test_saturation_fit(monkeypatch):
+    kwargs = dict(Tc=512.5, Pc=8084000.0, omega=0.559, c=-1e-6,
+                  alpha_coeffs=(0.694911381318495, 0.919907783415812, 1.70412689631515))
+    eos = PRTranslatedTwu(T=300, P=1e5, **kwargs)
+    assert eos._saturation_fit() is None
+    monkeypatch.setattr(PRTranslatedTwu, 'saturation_fit', True)
+    fit = eos._saturation_fit()
+    assert fit is not None
+    # Shared by objects of the same model
+    assert PRTranslatedTwu(T=400.0, P=1e6, **kwargs)._saturation_fit() is fit
+    assert PRTranslatedTwu(T=400.0, P=1e6, **dict(kwargs, c=0.0))._saturation_fit() is not fit
+    assert PR(T=300, P=1e5, Tc=512.5, Pc=8084000.0, omega=0.559)._saturation_fit() is None
+
+    for T in linspace(0.3*512.5, 0.9999*512.5, 15):
+        Psat = eos.Psat(T, polish=True)
+        sat = eos.to_TP(T, Psat)
+        assert_close(eos.Psat(T), Psat, rtol=1e-9)
+        assert_close(eos.Tsat(Psat), T, rtol=1e-9)
+        assert_close(eos.phi_sat(T, polish=False), sat.phi_l, rtol=1e-9)
+        assert_close(eos.V_l_sat(T), sat.V_l, rtol=1e-9)
+        assert_close(eos.V_g_sat(T), sat.V_g, rtol=1e-9)
+
+    # Outside the fit, the normal methods are used
+    T = 0.99999*512.5
+    values = [eos.Psat(T), eos.V_l_sat(T), eos.V_g_sat(T), eos.phi_sat(T, polish=False)]
+    monkeypatch.setattr(PRTranslatedTwu, 'saturation_fit', False)
+    assert values == [eos.Psat(T), eos.V_l_sat(T), eos.V_g_sat(T), eos.phi_sat(T, polish=False)]
+
+    # A tolerance which cannot be met disables the fit
+    monkeypatch.setattr(PRTranslatedTwu, 'saturation_fit', True)
+    monkeypatch.setattr(PRTranslatedTwu, 'saturation_fit_rtol', 1e-20)
+    assert eos._saturation_fit() is None
+    monkeypatch.undo()
+
+    import json
+    import thermo.eos
+    from collections import OrderedDict
+    # The model key is kept on the object but not serialized or compared
+    monkeypatch.setattr(PRTranslatedTwu, 'saturation_fit', True)
+    eos = PRTranslatedTwu(T=300, P=1e5, **kwargs)
+    eos.Psat(300.0)
+    assert '_saturation_fit_key' in eos.__dict__
+    assert '_saturation_fit_key' not in eos.as_json()
+    json.dumps(eos.as_json())
+    assert eos == PRTranslatedTwu(T=300, P=1e5, **kwargs)
+
+    # Only the most recently used fits are kept
+    monkeypatch.setattr(thermo.eos, '_saturation_fits', OrderedDict())
+    monkeypatch.setattr(PRTranslatedTwu, 'saturation_fit_models', 2)
+    fits = [PRTranslatedTwu(T=300, P=1e5, **dict(kwargs, c=c))._saturation_fit() for c in (0.0, -1e-6)]
+    assert eos._saturation_fit() is fits[1]
+    PRTranslatedTwu(T=300, P=1e5, **dict(kwargs, c=-2e-6))._saturation_fit()
+    assert len(thermo.eos._saturation_fits) == 2
+    assert PRTranslatedTwu(T=300, P=1e5, **dict(kwargs, c=0.0))._saturation_fit() is not fits[0]
 
 def test_PRTranslatedTwu():
     from thermo.eos import PRTranslated, PRTranslatedTwu, PR
@@ -2822,3 +2876,36 @@ def test_eos_alpha_fit_points_Chen_Yang():
     der = derivative(lambda T: thing.a_alpha_and_derivatives(T)[1], T, dx=T*3e-6)
     assert_close(der, alphas[2], rtol=1e-8)
 
+
+
+def test_evaluate_many():
+    props = ('V', 'Z', 'PIP', 'dP_dT', 'dP_dV', 'dV_dT', 'dV_dP', 'dT_dV', 'dT_dP',
+             'd2P_dT2', 'd2P_dV2', 'd2P_dTdV', 'H_dep', 'S_dep', 'G_dep', 'Cp_dep',
+             'Cv_dep', 'lnphi', 'phi', 'fugacity')
+    Ts, Ps = np.meshgrid(np.linspace(150.0, 900.0, 11), np.logspace(2, 8, 9))
+    kwargs = dict(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    # VDW and IG use the point by point fallbacks
+    for eos in [PR(**kwargs), SRK(**kwargs), TWUPR(**kwargs), PRSV2(kappa1=0.05, **kwargs),
+                PRTranslatedConsistent(**kwargs), MSRKTranslated(**kwargs), VDW(**kwargs),
+                IG(**kwargs)]:
+        res = eos.evaluate_many(Ts, Ps)
+        assert res['T'].shape == res['V_l'].shape == (Ts.size,)
+        for i, (T, P) in enumerate(zip(Ts.ravel().tolist(), Ps.ravel().tolist())):
+            obj = eos.to_TP(T, P)
+            assert res['phase'][i] == obj.phase
+            assert_close1d([res['a_alpha'][i], res['da_alpha_dT'][i], res['d2a_alpha_dT2'][i]],
+                           [obj.a_alpha, obj.da_alpha_dT, obj.d2a_alpha_dT2], rtol=1e-14)
+            for suffix in ('_l', '_g'):
+                if hasattr(obj, 'V' + suffix):
+                    for prop in props:
+                        assert_close(res[prop + suffix][i], getattr(obj, prop + suffix), rtol=1e-8, atol=1e-9)
+                else:
+                    assert all(np.isnan(res[prop + suffix][i]) for prop in props)
+
+    # Scalars are broadcast
+    res = PR(**kwargs).evaluate_many(300.0, [1e5, 1e6])
+    assert res['T'].tolist() == [300.0, 300.0]
+
+    from thermo.eos_mix import PRMIX
+    with pytest.raises(NotImplementedError):
+        PRMIX(Tcs=[507.6], Pcs=[3025000.0], omegas=[0.2975], zs=[1.0], T=300.0, P=1e5).evaluate_many([300.0], [1e5])
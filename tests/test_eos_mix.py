@@ -22,7 +22,7 @@ SOFTWARE.'''
 
 from numpy.testing import assert_allclose
 import pytest
-from chemicals.utils import normalize, hash_any_primitive
+from chemicals.utils import normalize, hash_any_primitive, dxs_to_dns
 from thermo.utils import TPD
 from thermo.eos import *
 from thermo.eos_mix import *
@@ -4341,6 +4341,23 @@ def test_PSRK_basic():
     assert_close1d(eos_fast.ge_model.xs, eos_fast.zs, rtol=1e-16)
     assert_close(eos_fast.V_l, eos_lower.V_l, rtol=1e-14)
 
+    # Composition derivatives and fugacities - checking vs numerical
+    def to_ni(ni, i):
+        ns = list(zs)
+        ns[i] = ni
+        tot = sum(ns)
+        return eos.to_TP_zs(T=T, P=P, zs=[n/tot for n in ns]), tot
+    da_alpha_dns_numerical = [derivative(lambda ni: to_ni(ni, i)[0].a_alpha, zs[i], dx=1e-6) for i in range(2)]
+    assert_close1d(eos.da_alpha_dns, da_alpha_dns_numerical, rtol=1e-8)
+    assert_close1d(eos.dna_alpha_dns, [eos.a_alpha + v for v in da_alpha_dns_numerical], rtol=1e-8)
+    assert_close1d(dxs_to_dns(eos.da_alpha_dzs, zs), eos.da_alpha_dns, rtol=1e-13)
+
+    def nlnphi(ni, i):
+        e, tot = to_ni(ni, i)
+        return tot*log(e.phi_l)
+    lnphis_numerical = [derivative(lambda ni: nlnphi(ni, i), zs[i], dx=1e-6) for i in range(2)]
+    assert_close1d(eos.fugacity_coefficients(eos.Z_l), lnphis_numerical, rtol=1e-8)
+
 def test_model_encode_json_gceosmix():
     kijs = [[0, 0.00076, 0.00171], [0.00076, 0, 0.00061], [0.00171, 0.00061, 0]]
     Tcs=[469.7, 507.4, 540.3]
@@ -4549,6 +4566,58 @@ def test_a_alpha_vectorized():
         a_alpha1 = obj.a_alpha_and_derivatives_vectorized(obj.T)[0]
         assert_close1d(a_alpha0, a_alpha1, rtol=1e-13)
 
+def test_a_alpha_and_derivatives_many():
+    from thermo.eos_mix import eos_mix_list
+    Ts = [1.0, 115.0, 300.0, 900.0]
+    for e in eos_mix_list:
+        obj = e(T=126.0, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.5, 0.5], kijs=[[0,.001],[0.001,0]])
+        res = obj.a_alpha_and_derivatives_many(Ts)
+        assert res[0].shape == (4, 2)
+        pures = obj.pures()
+        for j, T in enumerate(Ts):
+            for i, pure in enumerate(pures):
+                assert_close1d([r[j][i] for r in res], pure.a_alpha_and_derivatives_pure(T), rtol=1e-12)
+
+
+def test_mixin_alpha_functions_vectorized():
+    from thermo.eos_alpha_functions import TWU_a_alpha_common
+    T = 300.0
+    Tcs, ais = [512.5, 647.14], [1.0244, 0.6044]
+    coeffs = [[0.6949, 0.9199, 1.7041], [0.3959, 0.8609, 2.2039]]
+    expect = ([1.635506519, 1.036647795], [-0.003309267647, -0.001662943194], [4.323206375e-06, 4.3932e-06])
+    assert_close1d(Twu91_a_alphas_vectorized(T, Tcs, ais, coeffs), expect[0], rtol=1e-9)
+    out = ([0.0]*2, [0.0]*2, [0.0]*2)
+    res = Twu91_a_alpha_and_derivatives_vectorized(T, Tcs, ais, coeffs, *out)
+    assert all(r is o for r, o in zip(res, out))
+    for r, v in zip(res, expect):
+        assert_close1d(r, v, rtol=1e-9)
+
+    # Above and below the critical point
+    Tcs, ais = [507.6, 282.3], [2.2, 0.5]
+    coeffs = [[0.3, -0.2, 0.9, 1.0], [0.1, -0.3, 0.6, 1.0]]
+    expect = ([3.173902471, 0.481647733], [-0.005793912458, -0.001011777335], [1.508545586e-05, 2.748994814e-06])
+    assert_close1d(Mathias_Copeman_poly_a_alphas_vectorized(T, Tcs, ais, coeffs), expect[0], rtol=1e-9)
+    for r, v in zip(Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized(T, Tcs, ais, coeffs), expect):
+        assert_close1d(r, v, rtol=1e-9)
+
+    Tcs, ais = [507.6, 617.7], [2.6, 5.0]
+    coeffs = [[0.9, 0.3], [1.0, 0.4]]
+    expect = ([4.096781277, 9.689636717], [-0.009009129078, -0.02182121094], [2.9328e-05, 9.151111111e-05])
+    assert_close1d(Soave_1979_a_alphas_vectorized(T, Tcs, ais, coeffs), expect[0], rtol=1e-9)
+    for r, v in zip(Soave_1979_a_alpha_and_derivatives_vectorized(T, Tcs, ais, coeffs), expect):
+        assert_close1d(r, v, rtol=1e-9)
+
+    Tcs, omegas = [507.6, 190.56], [0.2975, 0.008]
+    for f0, f1, ais, PR in [(TwuPR95_a_alphas_vectorized, TwuPR95_a_alpha_and_derivatives_vectorized, [2.69, 0.2495], True),
+                            (TwuSRK95_a_alphas_vectorized, TwuSRK95_a_alpha_and_derivatives_vectorized, [2.57, 0.2304], False)]:
+        # Includes the low temperature transform
+        for T in (0.5, 300.0, 600.0):
+            expect = [TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=True, method='PR' if PR else 'SRK') for i in range(2)]
+            assert_close1d(f0(T, Tcs, ais, omegas), [v[0] for v in expect], rtol=1e-15)
+            res = f1(T, Tcs, ais, omegas)
+            for k in range(3):
+                assert_close1d(res[k], [v[k] for v in expect], rtol=1e-15)
+
 def test_MSRKMIXTranslated():
     eos = MSRKMIXTranslated(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.2, 0.8], kijs=[[0,0.03],[0.03,0]])
     assert_close1d(eos.a_alphas_vectorized(eos.T), eos.a_alphas, rtol=1e-13)
@@ -4768,3 +4837,80 @@ def test_numpy_properties_all_eos_mix():
             assert isinstance(eos_np.lnphis_g, np.ndarray)
             assert isinstance(eos.lnphis_g, list)
             
+
+def test_eos_mix_kijs_low_rank():
+    # A characterized oil with kijs only between the light components and the rest
+    N = 20
+    Tcs = [190.6 + 40.0*i for i in range(N)]
+    Pcs = [4.6e6 - 2e5*i for i in range(N)]
+    omegas = [0.01 + 0.06*i for i in range(N)]
+    zs = normalize([1.0 + (i % 3) for i in range(N)])
+    kijs = [[0.0]*N for _ in range(N)]
+    for i in range(2, N):
+        kijs[0][i] = kijs[i][0] = 0.02
+        kijs[1][i] = kijs[i][1] = 0.004*i
+    for scalar in (True, False):
+        if scalar:
+            kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, zs=zs, kijs=kijs)
+        else:
+            kwargs = dict(Tcs=np.array(Tcs), Pcs=np.array(Pcs), omegas=np.array(omegas), zs=np.array(zs), kijs=np.array(kijs))
+        dense = PRMIX(T=410.0, P=3e6, **kwargs)
+        assert not hasattr(dense, '_kijs_low_rank')
+        try:
+            PRMIX.low_rank_kijs = True
+            eos = PRMIX(T=400.0, P=3e6, **kwargs)
+            assert len(eos._kijs_low_rank[0]) == 4
+            new = eos.to_TP_zs_fast(T=410.0, P=3e6, zs=zs)
+            assert new._kijs_low_rank is eos._kijs_low_rank
+        finally:
+            del PRMIX.low_rank_kijs
+        assert_close1d([new.a_alpha, new.da_alpha_dT, new.d2a_alpha_dT2],
+                       [dense.a_alpha, dense.da_alpha_dT, dense.d2a_alpha_dT2], rtol=1e-13)
+        assert_close1d(new.a_alpha_j_rows, dense.a_alpha_j_rows, rtol=1e-13)
+        assert_close1d(new.da_alpha_dT_j_rows, dense.da_alpha_dT_j_rows, rtol=1e-13)
+        assert_close1d(new.fugacity_coefficients(new.Z_l), dense.fugacity_coefficients(dense.Z_l), rtol=1e-12)
+        assert_close1d(new.dlnphis_dT('l'), dense.dlnphis_dT('l'), rtol=1e-11)
+
+        # The factorization survives serialization
+        eos = PRMIX(T=400.0, P=3e6, **kwargs)
+        assert GCEOSMIX.from_json(json.loads(json.dumps(eos.as_json()))) == eos
+
+
+def test_lnphis_and_derivatives():
+    from thermo.eos_mix import eos_mix_list
+    kwargs = dict(T=115.0, P=1E6, Tcs=[126.1, 190.6, 305.32], Pcs=[33.94E5, 46.04E5, 4872000.0],
+                  omegas=[0.04, 0.011, 0.098], zs=[0.5, 0.3, 0.2],
+                  kijs=[[0, .03, 0.01], [0.03, 0, 0.002], [0.01, 0.002, 0]])
+    N = 3
+    for e in eos_mix_list:
+        for scalar in (True, False):
+            if not scalar and e in (PRMIXTranslatedConsistent, SRKMIXTranslatedConsistent):
+                # The default `cs` cannot yet be computed from arrays
+                continue
+            if scalar:
+                obj = e(**kwargs)
+            else:
+                obj = e(**{k: (np.array(v) if type(v) is list else v) for k, v in kwargs.items()})
+                assert not obj.scalar
+            for phase in ('l', 'g'):
+                try:
+                    Z = getattr(obj, 'Z_' + phase)
+                except AttributeError:
+                    continue
+                expect = (obj.fugacity_coefficients(Z), obj.dlnphis_dT(phase),
+                          obj.dlnphis_dP(phase), obj.dlnphis_dns(Z))
+                # Allocated by the method, then written into list and array buffers
+                for bufs in ((None, None, None, None),
+                             ([0.0]*N, [0.0]*N, [0.0]*N, [[0.0]*N for _ in range(N)]),
+                             (np.zeros(N), np.zeros(N), np.zeros(N), np.zeros((N, N)))):
+                    res = obj.lnphis_and_derivatives(phase, *bufs)
+                    for r, b in zip(res, bufs):
+                        if b is not None:
+                            assert r is b
+                    for r, v in zip(res[:3], expect[:3]):
+                        assert_close1d(r, v, rtol=1e-13, atol=1e-300)
+                    assert_close2d(res[3], expect[3], rtol=1e-12, atol=1e-14)
+
+                lnphis = [1.0]*N
+                assert obj.fugacity_coefficients(Z, lnphis) is lnphis
+                assert_close1d(lnphis, expect[0], rtol=1e-13, atol=1e-300)
@@ -26,7 +26,7 @@ from thermo.eos_mix import *
 from thermo.eos_alpha_functions import *
 from thermo.eos_mix_methods import *
 from fluids.constants import R
-from fluids.numerics import jacobian, hessian, assert_close, assert_close1d, assert_close2d, assert_close3d, derivative
+from fluids.numerics import jacobian, hessian, assert_close, assert_close1d, assert_close2d, assert_close3d, derivative, UnconvergedError
 from math import log, exp, sqrt
 import numpy as np
 from thermo.eos_mix_methods import a_alpha_quadratic_terms, a_alpha_and_derivatives_quadratic_terms
@@ -94,6 +94,51 @@ def test_a_alpha_and_derivatives_quadratic_terms():
     assert_close1d(da_alpha_dT_j_rows, [-0.0006723873746135188, -0.0010642935017889568], rtol=1e-14)
 
 
+def test_a_alpha_quadratic_terms_low_rank():
+    N = 20
+    a_alphas = [0.1 + 0.5*i for i in range(N)]
+    a_alpha_roots = [i**0.5 for i in a_alphas]
+    da_alpha_dTs = [-1e-4*(i + 1) for i in range(N)]
+    d2a_alpha_dT2s = [3e-7*(i + 1) for i in range(N)]
+    zs = [(i + 1.0)/(0.5*N*(N + 1)) for i in range(N)]
+
+    zeros = [[0.0]*N for _ in range(N)]
+    # kijs only between the two lightest components and the rest
+    light = [[0.0]*N for _ in range(N)]
+    for i in range(2, N):
+        light[0][i] = light[i][0] = 0.01*i
+        light[1][i] = light[i][1] = 0.05
+    for kijs, rank in [(zeros, 0), (light, 4)]:
+        lambdas, vectors = kijs_low_rank(kijs)
+        assert len(lambdas) == len(vectors) == rank
+
+        a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms_low_rank(a_alphas, a_alpha_roots, 299.0, zs, lambdas, vectors)
+        a_alpha_expect, a_alpha_j_rows_expect = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, 299.0, zs, kijs)
+        assert_close(a_alpha, a_alpha_expect, rtol=1e-13)
+        assert_close1d(a_alpha_j_rows, a_alpha_j_rows_expect, rtol=1e-13)
+
+        calc = a_alpha_and_derivatives_quadratic_terms_low_rank(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, lambdas, vectors)
+        expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, kijs)
+        assert_close1d(calc[:3], expect[:3], rtol=1e-13)
+        assert_close1d(calc[3], expect[3], rtol=1e-13)
+        assert_close1d(calc[4], expect[4], rtol=1e-13)
+
+    # A matrix of zeros is rank zero for any number of components
+    assert kijs_low_rank([[0.0]*7 for _ in range(7)]) == ([], [])
+    assert kijs_low_rank([[0.0]]) == ([], [])
+
+    # Not factored - too few components, a diagonal, not symmetric, too high a rank
+    assert kijs_low_rank([[0.0, 0.1], [0.1, 0.0]]) == (None, None)
+    diagonal = [[0.0]*N for _ in range(N)]
+    diagonal[3][3] = 0.1
+    assert kijs_low_rank(diagonal) == (None, None)
+    asymmetric = [[0.0]*N for _ in range(N)]
+    asymmetric[3][4] = 0.1
+    assert kijs_low_rank(asymmetric) == (None, None)
+    dense = [[0.0 if i == j else 0.001*(i + j) + 0.0001*i*j for j in range(N)] for i in range(N)]
+    assert kijs_low_rank(dense, max_rank=2) == (None, None)
+
+
 def test_a_alpha_aijs_composition_independent():
     kijs = [[0,.083],[0.083,0]]
     a_alphas = [0.2491099357671155, 0.6486495863528039]
@@ -117,4 +162,65 @@ def test_PR_lnphis_fastest():
 
     expect = eos.lnphis_g
     calc = PR_lnphis_fastest(eos.zs, eos.T, eos.P, 4, eos.kijs, False, True, eos.bs, eos.a_alphas, eos.a_alpha_roots)
-    assert_close1d(expect, calc, rtol=1e-14)
\ No newline at end of file
+    assert_close1d(expect, calc, rtol=1e-14)
+
+def test_eos_mix_Rachford_Rice():
+    assert_close(eos_mix_Rachford_Rice([0.5, 0.3, 0.2], [1.685, 0.742, 0.532], 3), 0.6907302627738544, rtol=1e-12)
+    # Negative flash solution
+    assert_close(eos_mix_Rachford_Rice([0.5, 0.5], [2.0, 0.9], 2), 4.5, rtol=1e-12)
+    assert eos_mix_Rachford_Rice([0.5, 0.5], [0.2, 0.9], 2) == -float('inf')
+    assert eos_mix_Rachford_Rice([0.5, 0.5], [2.0, 1.1], 2) == float('inf')
+
+
+def test_eos_mix_flash_TP_vs_FlashVL():
+    from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, FlashVL
+    Tcs, Pcs, omegas = [304.2, 507.6], [7376460.0, 3025000.0], [0.2252, 0.2975]
+    kijs = [[0.0, 0.11], [0.11, 0.0]]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[44.0095, 86.17536], CASs=['124-38-9', '110-54-3'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*8 + [30.0]))]*2
+    properties = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    zs = [0.5, 0.5]
+    Ts = [250.0, 300.0, 350.0, 400.0, 450.0]
+    Ps = [1e5, 1e6, 3e6, 6e6]
+    for eos, PR in [(PRMIX, True), (SRKMIX, False)]:
+        eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+        gas = CEOSGas(eos, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liq = CEOSLiquid(eos, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        flasher = FlashVL(constants, properties, liquid=liq, gas=gas)
+        Ts_all, Ps_all = [], []
+        for T in Ts:
+            for P in Ps:
+                Ts_all.append(T)
+                Ps_all.append(P)
+        VFs, xs_list, ys_list = eos_mix_flash_TP_many(Ts_all, Ps_all, [zs]*len(Ts_all), Tcs, Pcs, omegas, kijs, PR)
+        two_phase = 0
+        for T, P, VF, xs, ys in zip(Ts_all, Ps_all, VFs, xs_list, ys_list):
+            res = flasher.flash(T=T, P=P, zs=zs)
+            if res.phase_count == 2:
+                two_phase += 1
+                assert_close(VF, res.VF, rtol=1e-5)
+                assert_close1d(xs, res.liquid0.zs, rtol=1e-5)
+                assert_close1d(ys, res.gas.zs, rtol=1e-5)
+            else:
+                assert VF == res.VF
+                assert xs == ys == zs
+        assert two_phase > 5
+
+
+def test_eos_mix_flash_TP_single_phase_and_unconverged():
+    Tcs, Pcs, omegas = [304.2, 507.6], [7376460.0, 3025000.0], [0.2252, 0.2975]
+    kijs = [[0.0, 0.0], [0.0, 0.0]]
+    # A stable feed is the lower Gibbs energy root; the Wilson vapor score
+    # calls this state a gas
+    T, P, zs = 170.0, 38416.0, [.98, .02]
+    eos = PRMIX(T=T, P=P, zs=zs, Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    assert eos.G_dep_l < eos.G_dep_g
+    assert eos_mix_flash_TP(T, P, zs, Tcs, Pcs, omegas, kijs) == (0.0, zs, zs)
+    # With only one root, the Wilson vapor score is used
+    assert eos_mix_flash_TP(600.0, 1e5, [.5, .5], Tcs, Pcs, omegas, kijs)[0] == 1.0
+
+    # No unconverged split is returned
+    with pytest.raises(UnconvergedError):
+        eos_mix_flash_TP(300.0, 1e6, [.5, .5], Tcs, Pcs, omegas, kijs, maxiter=2)
+    with pytest.raises(UnconvergedError):
+        eos_mix_flash_TP(300.0, 1e6, [.5, .5], Tcs, Pcs, omegas, kijs, tol=0.0)
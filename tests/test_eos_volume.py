@@ -139,6 +139,27 @@ hard_solutions[(242.01282647944032, 6.892612104351147e-21, 2.208123871000126e-05
 hard_solutions[(4714.866363457429, 0.01, 2.8986924337681703e-05, 4.923467294821763e-05, -8.306951335097421e-10, 1.810368573677903e-13)] = ((-6.252127279461262e-05+0j), (1.328659984639961e-05+0j), (3920158.012884476+0j))
 
 
+def test_volume_solutions_halley_many():
+    import numpy as np
+    # Identical to the scalar solver, including the states it handles specially
+    params = np.array(hard_parameters)
+    Vs = volume_solutions_halley_many(*params.T)
+    assert Vs.shape == (len(hard_parameters), 3)
+    for row, args in zip(Vs, hard_parameters):
+        assert tuple(row.tolist()) == volume_solutions_halley(*args)
+
+    eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    Ts = np.array(linspace(50.0, 2000.0, 40)*40)
+    Ps = np.repeat(logspace(-5, 9, 40), 40)
+    a_alphas = np.array([eos.a_alpha_pure(T) for T in Ts])
+    Vs = volume_solutions_halley_many(Ts, Ps, eos.b, eos.delta, eos.epsilon, a_alphas)
+    for i in range(len(Ts)):
+        expect = volume_solutions_halley(float(Ts[i]), float(Ps[i]), eos.b, eos.delta, eos.epsilon, float(a_alphas[i]))
+        assert tuple(Vs[i].tolist()) == expect
+
+    assert volume_solutions_halley_many([], [], [], [], [], []).shape == (0, 3)
+
+
 # TODO important make mpmath cache answers here
 
 @pytest.mark.parametrize("params", hard_parameters)
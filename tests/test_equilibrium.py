@@ -35,7 +35,7 @@ from thermo.phase_change import *
 from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage
 from thermo.flash import FlashPureVLS, FlashVLN, FlashVL
 from thermo.bulk import *
-from thermo.equilibrium import EquilibriumState
+from thermo.equilibrium import EquilibriumState, CompactEquilibriumState
 
 
 def test_two_eos_pure_flash_all_properties():
@@ -1044,4 +1044,52 @@ def test_thermodynamic_derivatives_named_settings():
     v, v2 = (58.05522195758289, 272.55436171551884)
     assert_close(res.speed_of_sound(), v, rtol=1e-8)
     assert_close(res.bulk.speed_of_sound(), v, rtol=1e-8)
-    assert_close(res.liquid_bulk.speed_of_sound(), v2)
\ No newline at end of file
+    assert_close(res.liquid_bulk.speed_of_sound(), v2)
+
+def test_CompactEquilibriumState():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    for kwargs in [dict(T=300.0, P=1e6, zs=[.5, .5]), dict(T=400.0, P=1e6, zs=[.9, .1]),
+                   dict(P=1e6, VF=1.0, zs=[.5, .5]), dict(P=1e6, H=-10000.0, zs=[.5, .5])]:
+        full = flasher.flash(**kwargs)
+        res = flasher.flash(dest=CompactEquilibriumState, **kwargs)
+        assert type(res) is CompactEquilibriumState
+        assert not hasattr(res, '__dict__')
+        assert res.T == full.T
+        assert res.P == full.P
+        assert res.zs == full.zs
+        assert res.N == 2
+        assert res.betas == full.betas
+        assert res.VF == full.VF
+        assert (res.phase_count, res.gas_count, res.liquid_count, res.solid_count) == (
+            full.phase_count, full.gas_count, full.liquid_count, full.solid_count)
+        assert res.compositions == [p.zs for p in full.phases]
+        for prop in ('H', 'S', 'V', 'G', 'U', 'A'):
+            assert_close(getattr(res, prop)(), getattr(full, prop)(), rtol=1e-13)
+        assert res._state is None
+
+        # Other properties are calculated from the recreated state
+        assert_close(res.Cp(), full.Cp(), rtol=1e-13)
+        assert_close(res.H_mass(), full.H_mass(), rtol=1e-13)
+        state = res._state
+        assert type(state) is EquilibriumState
+        assert res.rehydrate() is state
+        assert [type(p) for p in state.phases] == [type(p) for p in full.phases]
+        for phase, phase_full in zip(state.phases, full.phases):
+            assert_close1d(phase.lnphis(), phase_full.lnphis(), rtol=1e-13)
+
+    with pytest.raises(AttributeError):
+        res._missing
+    with pytest.raises(ValueError):
+        CompactEquilibriumState(300.0, 1e6, [.5, .5], gas=None, liquids=[liq.to(T=300.0, P=1e6, zs=[.5, .5])],
+                                solids=[], betas=[1.0])
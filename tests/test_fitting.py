@@ -25,6 +25,7 @@ import pytest
 from thermo import fitting
 from thermo.fitting import *
 import os
+import numpy as np
 import pandas as pd
 from math import log, exp
 
@@ -139,3 +140,20 @@ def test_Twu91_check_params_Bell():
 
     for (c0, c1, c2) in zip(v[:, 2], v[:, 3], v[:, 4]):
         assert Twu91_check_params((c0, c1, c2))
+
+
+def test_fit_customized_processes_closure():
+    xs = np.linspace(1.0, 5.0, 10)
+    data = 2.0*xs + 1.0
+    def line(xs, m, b):
+        return m*xs + b
+    kwargs = dict(fitting_func=line, fit_parameters=['m', 'b'], use_fit_parameters=['m', 'b'],
+                  fit_method='lm', objective='MeanSquareErr', multiple_tries_max_objective='MeanRelErr',
+                  initial_guesses=[{'m': 1.0, 'b': 0.0}, {'m': 3.0, 'b': 2.0}], multiple_tries=True,
+                  multiple_tries_max_err=1e-30)
+    # The residuals are a local closure which cannot be sent to worker
+    # processes, so the guesses are fit in this process
+    res = fit_customized(xs, data, processes=2, **kwargs)
+    assert res == fit_customized(xs, data, **kwargs)
+    assert_close(res['m'], 2.0, rtol=1e-12)
+    assert_close(res['b'], 1.0, rtol=1e-12)
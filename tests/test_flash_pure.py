@@ -1066,6 +1066,25 @@ def test_EOS_dew_bubble_same_eos_id():
     res = flasher.flash(T=300, VF=.5)
     assert res.gas.eos_mix is res.liquid0.eos_mix
 
+
+def test_FlashPureVLS_ignores_warm_start_cache():
+    constants = ChemicalConstantsPackage(Tcs=[405.6], Pcs=[11277472.5], omegas=[0.25], MWs=[17.03052], CASs=['7664-41-7'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.444966286051841e-23, 9.444106746563928e-20,
+                            -1.2490299714587002e-15, 2.6693560979905865e-12, -2.5695131746723413e-09, 1.2022442523089315e-06,
+                            -0.00021492132731007108, 0.016616385291696574, 32.84274656062226]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    kwargs = dict(eos_kwargs=dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas),
+                 HeatCapacityGases=HeatCapacityGases)
+    liquid = CEOSLiquid(SRKMIX, T=330, P=1e5, zs=[1], **kwargs)
+    gas = CEOSGas(SRKMIX, T=330, P=1e5, zs=[1], **kwargs)
+    flasher = FlashPureVLS(constants, correlations, gas, [liquid], [])
+    expect = flasher.flash(T=300.0, P=1e5)
+    flasher.warm_start_cache = cache = WarmStartCache()
+    res = flasher.flash(T=300.0, P=1e5)
+    assert res.phase_count == 1
+    assert_close(res.H(), expect.H(), rtol=1e-13)
+    assert len(cache) == 0
+
 @pytest.mark.parametrize("hacks", [True, False])
 def test_VS_issue_PRSV(hacks):
     constants = ChemicalConstantsPackage(Tcs=[768.0], Pcs=[1070000.0], omegas=[0.8805], MWs=[282.54748], CASs=['112-95-8'])
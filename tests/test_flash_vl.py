@@ -445,3 +445,355 @@ def test_issue106_Michelson_stability_test_log_zero():
     assert res.phase_count == 1
     assert res.liquid0 is not None
     assert isinstance(res.liquid0, GibbsExcessLiquid)
+
+
+def test_grid_flash_table_hot_start_processes():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                         omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9'])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas,
+                  'kijs': [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]}
+    gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs)
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    zs = [0.965, 0.018, 0.017]
+    Ts = [110.0, 115.0, 120.0]
+    Ps = [1e5, 1.5e5, 2e5, 2.5e5]
+
+    values, failures, stats = flasher.grid_flash_table(zs, ['VF', 'T', 'P'], Ts=Ts, Ps=Ps, hot_start=False)
+    assert values.shape == (3, 4, 3)
+    assert failures == []
+    assert stats['points'] == 12
+    assert stats['points_per_second'] > 0
+    for i, T in enumerate(Ts):
+        for j, P in enumerate(Ps):
+            assert_close(values[i, j, 0], flasher.flash(T=T, P=P, zs=zs).VF, rtol=1e-13)
+            assert_close1d(values[i, j, 1:], [T, P], rtol=1e-13)
+
+    # Hot started rows converge to the same solutions
+    hot, _, _ = flasher.grid_flash_table(zs, ['VF', 'T', 'P'], Ts=Ts, Ps=Ps, hot_start=True)
+    assert_close2d(hot[:, :, 0], values[:, :, 0], rtol=1e-6)
+
+    # Rows can be distributed to worker processes
+    VFs, _, _ = flasher.grid_flash_table(zs, 'VF', Ts=Ts, Ps=Ps, processes=2)
+    assert_close2d(VFs, hot[:, :, 0], rtol=1e-13)
+
+    # Failed points are NaN and recorded
+    VFs, failures, stats = flasher.grid_flash_table(zs, 'VF', Ts=Ts, Ps=[-1.0, 1e5])
+    assert np.all(np.isnan(VFs[:, 0]))
+    assert not np.any(np.isnan(VFs[:, 1]))
+    assert stats['failures'] == len(failures) == 3
+    assert failures[0]['index'] == (0, 0)
+    assert failures[0]['specs'] == {'zs': zs, 'T': 110.0, 'P': -1.0}
+    assert failures[0]['error'] == 'ValueError'
+
+
+def test_flash_TP_batch_matches_flash():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    Ts = [300.0, 400.0, 250.0, 350.0]
+    Ps = [1e6, 1e6, 1e5, 3e6]
+    zs_matrix = [[0.5, 0.5], [0.9, 0.1], [0.2, 0.8], np.array([0.7, 0.3])]
+    res = flasher.flash_TP_batch(Ts, Ps, zs_matrix)
+    assert res['betas'].shape == (4, 2)
+    assert res['compositions'].shape == (4, 2, 2)
+    assert res['errors'] == [None]*4
+    # Two phase states are converged from the batch solution rather than
+    # the stability test, so they only match to the flash tolerance
+    for i in range(4):
+        state = flasher.flash(T=Ts[i], P=Ps[i], zs=list(zs_matrix[i]))
+        assert res['phase_count'][i] == state.phase_count
+        assert res['gas'][i] == (state.gas is not None)
+        assert_close1d(res['betas'][i][:state.phase_count], state.betas, rtol=1e-6)
+        assert np.all(np.isnan(res['betas'][i][state.phase_count:]))
+        for j, phase in enumerate(state.phases):
+            assert_close1d(res['compositions'][i][j], phase.zs, rtol=1e-6)
+        assert_close(res['H'][i], state.H(), rtol=1e-6)
+        assert_close(res['S'][i], state.S(), rtol=1e-6)
+        assert_close(res['V'][i], state.V(), rtol=1e-6)
+
+    # Flashing one state at a time gives the same results as flash
+    flasher._flash_TP_batch_guesses = lambda Ts, Ps, zs_matrix: None
+    res_loop = flasher.flash_TP_batch(Ts, Ps, zs_matrix)
+    del flasher._flash_TP_batch_guesses
+    for i in range(4):
+        state = flasher.flash(T=Ts[i], P=Ps[i], zs=list(zs_matrix[i]))
+        assert_close1d(res_loop['betas'][i][:state.phase_count], state.betas, rtol=1e-12)
+        assert_close(res_loop['H'][i], state.H(), rtol=1e-12)
+    assert res_loop['phase_count'].tolist() == res['phase_count'].tolist()
+    assert_close2d(res_loop['betas'], res['betas'], rtol=1e-6)
+
+    # Failed flashes do not stop the batch and their errors are recorded
+    res = flasher.flash_TP_batch([300.0, 300.0], [-1.0, 1e6], [[0.5, 0.5], [0.5, 0.5]])
+    assert res['phase_count'].tolist() == [0, 2]
+    assert np.isnan(res['H'][0])
+    assert np.all(np.isnan(res['compositions'][0]))
+    assert isinstance(res['errors'][0], ValueError)
+    assert res['errors'][1] is None
+
+    # Other errors are not hidden
+    with pytest.raises(TypeError):
+        flasher.flash_TP_batch([300.0], [1e6], [[0.5, None]])
+
+    # Phases with interaction parameters and the SRK EOS are batched as well
+    kijs = [[0.0, 0.02], [0.02, 0.0]]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+    gas = CEOSGas(SRKMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(SRKMIX, dict(eos_kwargs, kijs=np.array(kijs)), HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    assert flasher._flash_TP_batch_guesses(Ts, Ps, zs_matrix) is not None
+    res = flasher.flash_TP_batch(Ts, Ps, zs_matrix)
+    for i in range(4):
+        state = flasher.flash(T=Ts[i], P=Ps[i], zs=list(zs_matrix[i]))
+        assert res['phase_count'][i] == state.phase_count
+        assert_close1d(res['betas'][i][:state.phase_count], state.betas, rtol=1e-6)
+        assert_close(res['H'][i], state.H(), rtol=1e-6)
+
+    # Three phase flashes with FlashVLN
+    constants = ChemicalConstantsPackage(Tcs=[563.0, 647.14, 514.0], Pcs=[4414000.0, 22048320.0, 6137000.0], omegas=[0.59, 0.344, 0.635], MWs=[74.1216, 18.01528, 46.06844], CASs=['71-36-3', '7732-18-5', '64-17-5'])
+    properties = PropertyCorrelationsPackage(constants=constants,
+                                             HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724])),
+                                                                HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                                                                HeatCapacityGas(poly_fit=(50.0, 1000.0, [-1.162767978165682e-20, 5.4975285700787494e-17, -1.0861242757337942e-13, 1.1582703354362728e-10, -7.160627710867427e-08, 2.5392014654765875e-05, -0.004732593693568646, 0.5072291035198603, 20.037826650765965]))])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(SRKMIX, eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+    liq = CEOSLiquid(SRKMIX, eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    res = flashN.flash_TP_batch([361.0], [1e5], [[.25, 0.7, .05]])
+    state = flashN.flash(T=361, P=1e5, zs=[.25, 0.7, .05])
+    assert res['phase_count'][0] == state.phase_count == 3
+    assert_close1d(res['betas'][0], state.betas)
+    assert_close(res['H'][0], state.H())
+
+
+def test_warm_start_cache_FlashVL():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    cache = WarmStartCache(size=2)
+    flasher.warm_start_cache = cache
+
+    res = flasher.flash(T=300.0, P=1e6, zs=[.5, .5])
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+    assert 'warm_start' not in res.flash_convergence
+
+    # A nearby state in the same bin starts from the stored solution
+    res = flasher.flash(T=300.05, P=1.001e6, zs=[.501, .499])
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert res.flash_convergence['warm_start']
+    flasher.warm_start_cache = None
+    cold = flasher.flash(T=300.05, P=1.001e6, zs=[.501, .499])
+    flasher.warm_start_cache = cache
+    assert_close1d(res.betas, cold.betas, rtol=1e-6)
+    assert_close1d(res.gas.zs, cold.gas.zs, rtol=1e-6)
+    assert_close1d(res.liquid0.zs, cold.liquid0.zs, rtol=1e-6)
+    assert_close(res.H(), cold.H(), rtol=1e-6)
+
+    # Single phase solutions are not stored
+    res = flasher.flash(T=400.0, P=1e6, zs=[.9, .1])
+    assert res.phase_count == 1
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 1)
+
+    # Least recently used solutions are evicted
+    flasher.flash(T=290.0, P=1e6, zs=[.5, .5])
+    flasher.flash(T=280.0, P=1e6, zs=[.5, .5])
+    assert len(cache) == 2
+    assert cache.get(cache.key(300.0, 1e6, [.5, .5])) is None
+
+    # Batch flashes use the cache as well
+    res = flasher.flash_TP_batch([280.1, 290.1], [1e6, 1e6], [[.5, .5], [.5, .5]])
+    assert cache.hits == 3
+    assert res['phase_count'].tolist() == [2, 2]
+
+    # Warm started solutions must have a lower Gibbs energy than the feed
+    state = flasher.flash(T=300.0, P=1e6, zs=[.5, .5])
+    assert flasher._warm_start_G_lower(300.0, 1e6, [.5, .5], [gas, liq],
+                                       [state.gas, state.liquid0], state.betas)
+    split = [gas.to(T=400.0, P=1e6, zs=[.95, .05]), liq.to(T=400.0, P=1e6, zs=[.85, .15])]
+    assert not flasher._warm_start_G_lower(400.0, 1e6, [.9, .1], [gas, liq], split, [.5, .5])
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_hot_start_FlashVL_checks_gibbs(monkeypatch):
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    zs = [.5, .5]
+    prev = flasher.flash(T=280.0, P=1e6, zs=zs)
+    for T in [285.0, 290.0, 295.0, 300.0, 400.0]:
+        hot = flasher.flash(T=T, P=1e6, zs=zs, hot_start=prev)
+        cold = flasher.flash(T=T, P=1e6, zs=zs)
+        assert hot.phase_count == cold.phase_count
+        assert_close1d(hot.betas, cold.betas, rtol=1e-6)
+        assert_close(hot.H(), cold.H(), rtol=1e-6)
+        prev = hot
+
+    # A converged split of a stable single phase is not accepted
+    import thermo.flash.flash_vl
+    split = [liq.to(T=400.0, P=1e6, zs=[.85, .15]), gas.to(T=400.0, P=1e6, zs=[.95, .05])]
+    def fake_SS(**kwargs):
+        return 0.5, split[0].zs, split[1].zs, split[0], split[1], 1, 0.0
+    monkeypatch.setattr(thermo.flash.flash_vl, 'sequential_substitution_2P', fake_SS)
+    two_phase = flasher.flash(T=300.0, P=1e6, zs=zs)
+    hot = flasher.flash(T=400.0, P=1e6, zs=[.9, .1], hot_start=two_phase)
+    assert hot.phase_count == 1
+
+
+def test_phase_envelope_FlashVL():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    zs = [.5, .5]
+    res = flasher.phase_envelope(zs)
+    Ts, Ps, dews = res['T'], res['P'], res['dew']
+    assert Ts.shape == Ps.shape == dews.shape
+    assert res['Ks'].shape == (len(Ts), 2)
+    assert_close1d([Ps[0], Ps[-1]], [1e5, 1e5], rtol=1e-12)
+    # Dew points, then bubble points after the critical point
+    assert dews[0] and not dews[-1]
+    assert dews.tolist() == sorted(dews.tolist(), reverse=True)
+    assert res['iterations'] < 250
+
+    # Every point matches an independent flash
+    for T, P, dew, Ks in zip(Ts, Ps, dews, res['Ks']):
+        if P > 3.5e6:
+            continue
+        state = flasher.flash(T=T, VF=1 if dew else 0, zs=zs)
+        assert_close(state.P, P, rtol=1e-10)
+        incipient = state.liquid0 if dew else state.gas
+        assert_close1d(Ks, [incipient.zs[i]/zs[i] for i in range(2)], rtol=1e-7)
+
+    # Tracing with much smaller steps gives 422.0970085, 5882589.92
+    assert_close(res['T_critical'], 422.0970085, rtol=1e-5)
+    assert_close(res['P_critical'], 5882589.92, rtol=1e-5)
+    assert_close(res['T_cricondenbar'], 416.86534169, rtol=1e-9)
+    assert_close(res['P_cricondenbar'], 5959850.09027, rtol=1e-9)
+    assert_close(res['T_cricondentherm'], 426.38557189, rtol=1e-9)
+    assert_close(res['P_cricondentherm'], 5288537.58, rtol=1e-7)
+    assert res['P_cricondenbar'] >= Ps.max()
+    assert res['T_cricondentherm'] >= Ts.max()
+    state = flasher.flash(T=res['T_cricondenbar'], VF=0, zs=zs)
+    assert_close(state.P, res['P_cricondenbar'], rtol=1e-9)
+    assert_close(res['T_cricondentherm'], Ts.max(), rtol=1e-2)
+    assert res['T_cricondentherm'] > res['T_critical'] > res['T_cricondenbar']
+    assert res['P_cricondenbar'] > res['P_critical'] > res['P_cricondentherm']
+
+    # Multicomponent natural gas
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 369.83, 425.12, 469.7, 507.6],
+                                         Pcs=[4599000.0, 4872000.0, 4248000.0, 3796000.0, 3370000.0, 3025000.0],
+                                         omegas=[0.008, 0.098, 0.152, 0.193, 0.251, 0.2975],
+                                         MWs=[16.04246, 30.06904, 44.09562, 58.1222, 72.14878, 86.17536],
+                                         CASs=['74-82-8', '74-84-0', '74-98-6', '106-97-8', '109-66-0', '110-54-3'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*7 + [0.01, 35.0]))]*6
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    zs = [0.7, 0.1, 0.08, 0.05, 0.04, 0.03]
+    res = flasher.phase_envelope(zs)
+    assert res['complete']
+    assert_close(res['P'][-1], 1e5, rtol=1e-12)
+    assert_close(res['T_critical'], 300.565, rtol=1e-4)
+    assert_close(res['P_cricondenbar'], 13610381.68, rtol=1e-8)
+    assert_close(res['T_cricondentherm'], 356.2757616, rtol=1e-8)
+    for i in (5, len(res['T']) - 5):
+        state = flasher.flash(P=res['P'][i], VF=1 if res['dew'][i] else 0, zs=zs)
+        assert_close(state.T, res['T'][i], rtol=1e-9)
+
+
+def test_phase_envelope_FlashVL_incomplete():
+    # Methane to octane natural gas
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 369.83, 425.12, 469.7, 507.6, 540.2, 568.7],
+                                         Pcs=[4599000.0, 4872000.0, 4248000.0, 3796000.0, 3370000.0, 3025000.0, 2740000.0, 2490000.0],
+                                         omegas=[0.008, 0.098, 0.152, 0.193, 0.251, 0.2975, 0.3457, 0.394],
+                                         MWs=[16.04246, 30.06904, 44.09562, 58.1222, 72.14878, 86.17536, 100.20194, 114.22852],
+                                         CASs=['74-82-8', '74-84-0', '74-98-6', '106-97-8', '109-66-0', '110-54-3', '142-82-5', '111-65-9'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*7 + [0.01, 35.0]))]*8
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    zs = [0.8, 0.07, 0.04, 0.03, 0.02, 0.02, 0.01, 0.01]
+    # ChemSep PR kijs
+    kijs = [[0.0, -0.0059, 0.0119, 0.0185, 0.023, 0.04, 0.03, 0.0496],
+            [-0.0059, 0.0, 0.0011, 0.0089, 0.0078, -0.04, 0.0033, 0.0185],
+            [0.0119, 0.0011, 0.0, 0.0033, 0.0267, 0.0007, 0.0056, 0.0],
+            [0.0185, 0.0089, 0.0033, 0.0, 0.0174, -0.0056, 0.0033, 0.0074],
+            [0.023, 0.0078, 0.0267, 0.0174, 0.0, 0.0, 0.0074, 0.0],
+            [0.04, -0.04, 0.0007, -0.0056, 0.0, 0.0, -0.0078, 0.0],
+            [0.03, 0.0033, 0.0056, 0.0033, 0.0074, -0.0078, 0.0, 0.0],
+            [0.0496, 0.0185, 0.0, 0.0074, 0.0, 0.0, 0.0, 0.0]]
+
+    def flasher_with(kijs):
+        eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        return FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    # Without kijs the envelope closes through the critical point
+    flasher = flasher_with([[0.0]*8 for _ in range(8)])
+    res = flasher.phase_envelope(zs)
+    assert res['complete']
+    assert_close1d([res['P'][0], res['P'][-1]], [1e5, 1e5], rtol=1e-12)
+    assert res['dew'][0] and not res['dew'][-1]
+    assert isfinite(res['T_critical']) and isfinite(res['P_critical'])
+    assert res['T'].min() < res['T_critical'] < res['T_cricondentherm']
+    assert res['P_cricondentherm'] < res['P_critical'] < res['P_cricondenbar']
+    for i in (5, len(res['T']) - 5):
+        state = flasher.flash(P=res['P'][i], VF=1 if res['dew'][i] else 0, zs=zs)
+        assert_close(state.T, res['T'][i], rtol=1e-9)
+
+    # With them, no point can be solved near 251.7 K and 14 MPa, short of the
+    # critical point; the points traced are kept but flagged
+    res = flasher_with(kijs).phase_envelope(zs)
+    assert not res['complete']
+    assert res['P'][-1] > 1e7
+    assert isnan(res['T_critical']) and isnan(res['P_critical'])
+    # The cricondentherm and cricondenbar were passed before it stalled
+    assert_close(res['T_cricondentherm'], res['T'].max(), rtol=1e-2)
+    assert_close(res['P_cricondenbar'], res['P'].max(), rtol=1e-2)
+
+    # Methane-decane, whose dew curve rises without bound
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 611.7], Pcs=[4599000.0, 2110000.0], omegas=[0.008, 0.49],
+                                         MWs=[16.04246, 142.28168], CASs=['74-82-8', '124-18-5'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [0.0]*7 + [0.01, 35.0]))]*2
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas,
+                  'kijs': [[0.0, 0.0411], [0.0411, 0.0]]}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    res = flasher.phase_envelope([0.9, 0.1])
+    assert not res['complete']
+    assert res['P'].max() <= flasher.PHASE_ENVELOPE_P_MAX
+    assert len(res['T']) < 500
+    assert isnan(res['P_cricondenbar'])
@@ -1427,3 +1427,29 @@ def test_PH_TODO():
     flashN.flash(H=-1e4, P=2e5, zs=[.5, .5]).H()
 
     '''
+
+
+def test_warm_start_cache_three_phase():
+    constants = ChemicalConstantsPackage(Tcs=[563.0, 647.14, 514.0], Pcs=[4414000.0, 22048320.0, 6137000.0], omegas=[0.59, 0.344, 0.635], MWs=[74.1216, 18.01528, 46.06844], CASs=['71-36-3', '7732-18-5', '64-17-5'])
+    properties = PropertyCorrelationsPackage(constants=constants,
+                                             HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724])),
+                                                                HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                                                                HeatCapacityGas(poly_fit=(50.0, 1000.0, [-1.162767978165682e-20, 5.4975285700787494e-17, -1.0861242757337942e-13, 1.1582703354362728e-10, -7.160627710867427e-08, 2.5392014654765875e-05, -0.004732593693568646, 0.5072291035198603, 20.037826650765965]))])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(SRKMIX, eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+    liq = CEOSLiquid(SRKMIX, eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    flashN.warm_start_cache = cache = WarmStartCache()
+
+    res = flashN.flash(T=361, P=1e5, zs=[.25, 0.7, .05])
+    assert res.phase_count == 3
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    res = flashN.flash(T=361.1, P=1.0001e5, zs=[.251, 0.699, .05])
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert res.flash_convergence['warm_start']
+    flashN.warm_start_cache = None
+    cold = flashN.flash(T=361.1, P=1.0001e5, zs=[.251, 0.699, .05])
+    assert res.phase_count == cold.phase_count == 3
+    assert_close1d(res.betas, cold.betas, rtol=1e-6)
+    assert_close(res.H(), cold.H(), rtol=1e-6)
@@ -577,6 +577,15 @@ def test_NRTL_gammas_binaries_jac():
     '''
     
     
+def test_NRTL_gammas_binaries_vectorized():
+    xs = [0.252, 0.748, .7, .3, 1e-10, 1-1e-10, .4, .6]
+    args = (-0.1778376218266507, 1.9619291176333142, .2974, .35)
+    assert_close1d(NRTL_gammas_binaries_vectorized(np.array(xs), *args),
+                   NRTL_gammas_binaries(xs, *args), rtol=1e-13)
+    assert_close2d(NRTL_gammas_binaries_jac_vectorized(np.array(xs), *args),
+                   NRTL_gammas_binaries_jac(xs, *args), rtol=1e-12)
+
+
 def test_NRTL_regression_basics():
     # ethanol-water
     GE = UNIFAC.from_subgroups(T=298.15, xs=[.9, .1], chemgroups=[{1: 1, 2: 1, 14: 1}, {16: 1}])
@@ -604,6 +613,21 @@ def test_NRTL_regression_basics():
     assert stats['MAE'] < 0.001
 
 
+def test_NRTL_regression_processes():
+    GE = NRTL(T=300.0, xs=[.5, .5], tau_as=[[0, 1.2], [0.5, 0]], alpha_cs=[[0, .3], [.3, 0]])
+    pts = 20
+    xs_points = [[xi, 1-xi] for xi in linspace(0.01, 0.99, pts)]
+    many_gammas_expect = [GE.to_T_xs(T=GE.T, xs=xs_points[i]).gammas() for i in range(pts)]
+    kwargs = dict(gammas=many_gammas_expect, xs=xs_points, use_numba=False, symmetric_alphas=True,
+                  multiple_tries=True, multiple_tries_max_err=1e-30)
+    res, stats = NRTL.regress_binary_parameters(**kwargs)
+    res_parallel, stats_parallel = NRTL.regress_binary_parameters(processes=2, **kwargs)
+    assert res == res_parallel
+    assert_close(res['tau12'], 1.2, rtol=1e-9)
+    assert_close(res['tau21'], 0.5, rtol=1e-9)
+    assert_close(res['alpha12'], 0.3, rtol=1e-9)
+
+
 def test_NRTL_one_component():
     GE = NRTL(T=350.0, xs=[1.0], ABEFGHCD=([[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]]))
     for s in GE._point_properties:
@@ -612,4 +636,45 @@ def test_NRTL_one_component():
 
 def test_NRTL_can_return_zero_may_need_lngamma_call():
     obj = NRTL(T=8, xs=[0.999999, 2.5e-07, 2.5e-07, 2.5e-07, 2.5e-07], tau_as=[[0, -5.1549, 0, 0, 0], [5.8547, 0, -0.40926, 0, 0], [0, -0.39036, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]], tau_bs=[[0, 2270.62, 284.966, 0, 0], [229.497, 0, 1479.46, 0, 0], [-216.256, 447.003, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]], alpha_cs=[[0, 0.2, 0.3, 0, 0], [0.2, 0, 0.46, 0, 0], [0.3, 0.46, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]])
-    assert obj.gammas()[2] == 0
\ No newline at end of file
+    assert obj.gammas()[2] == 0
+def test_NRTL_evaluate_many():
+    from thermo.nrtl import nrtl_many_loop
+    from thermo.activity import GibbsExcess
+    alphas = [[[0.0, 2e-05], [0.2937, 7e-05], [0.2999, 0.0001]],
+     [[0.2937, 1e-05], [0.0, 4e-05], [0.3009, 8e-05]],
+     [[0.2999, 1e-05], [0.3009, 3e-05], [0.0, 5e-05]]]
+    taus = [[[6e-05, 0.0, 7e-05, 7e-05, 0.00788, 3.6e-07],
+      [3e-05, 624.868, 9e-05, 7e-05, 0.00472, 8.5e-07],
+      [3e-05, 398.953, 4e-05, 1e-05, 0.00279, 5.6e-07]],
+     [[1e-05, -29.167, 8e-05, 9e-05, 0.00256, 1e-07],
+      [2e-05, 0.0, 7e-05, 6e-05, 0.00587, 4.2e-07],
+      [0.0, -35.482, 8e-05, 4e-05, 0.00889, 8.2e-07]],
+     [[9e-05, -95.132, 6e-05, 1e-05, 0.00905, 5.2e-07],
+      [9e-05, 33.862, 2e-05, 6e-05, 0.00517, 1.4e-07],
+      [0.0001, 0.0, 6e-05, 2e-05, 0.00095, 7.4e-07]]]
+    GE = NRTL(300.0, [.2, .3, .5], taus, alphas)
+    Ts = [300.0, 343.15, 400.0, 343.15]
+    xs = [[.2, .3, .5], [.1, .1, .8], [.6, .3, .1], [1e-7, .5, .5-1e-7]]
+    res = GE.evaluate_many(Ts, xs)
+    assert_close1d(res['T'], Ts, rtol=0)
+    for i in range(len(Ts)):
+        obj = GE.to_T_xs(Ts[i], xs[i])
+        assert_close1d(res['gammas'][i], obj.gammas(), rtol=1e-12)
+        assert_close(res['GE'][i], obj.GE(), rtol=1e-12)
+        assert_close1d(res['dGE_dxs'][i], obj.dGE_dxs(), rtol=1e-12)
+
+    # Same answer from the base class implementation, a numpy model, and the loop version
+    for other in (GibbsExcess.evaluate_many(GE, Ts, xs),
+                  NRTL(300.0, np.array([.2, .3, .5]), np.array(taus), np.array(alphas)).evaluate_many(np.array(Ts), np.array(xs))):
+        for k in ('gammas', 'GE', 'dGE_dxs'):
+            assert_close2d(np.atleast_2d(other[k]), np.atleast_2d(res[k]), rtol=1e-12)
+    gammas, GEs, dGE_dxs = nrtl_many_loop(Ts, xs, len(Ts), 3, GE.tau_as, GE.tau_bs, GE.tau_es, GE.tau_fs,
+                                          GE.tau_gs, GE.tau_hs, GE.alpha_cs, GE.alpha_ds)
+    assert_close2d(gammas, res['gammas'], rtol=1e-12)
+    assert_close1d(GEs, res['GE'], rtol=1e-12)
+    assert_close2d(dGE_dxs, res['dGE_dxs'], rtol=1e-12)
+
+    # A single temperature applies to every composition
+    res = GE.evaluate_many(343.15, xs)
+    assert_close1d(res['T'], [343.15]*4, rtol=0)
+    assert_close1d(res['gammas'][2], GE.to_T_xs(343.15, xs[2]).gammas(), rtol=1e-12)
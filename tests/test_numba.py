@@ -27,7 +27,7 @@ import thermo
 from math import *
 from random import random
 from fluids.constants import *
-from fluids.numerics import assert_close, assert_close1d, assert_close2d, assert_close3d
+from fluids.numerics import assert_close, assert_close1d, assert_close2d, assert_close3d, UnconvergedError
 from numpy.testing import assert_allclose
 from chemicals import normalize, Rackett_fit, Antoine
 from thermo.test_utils import check_np_output_activity
@@ -221,6 +221,53 @@ def test_UNIFAC_numpy_output():
 
 
 
+@mark_as_numba
+def test_UNIFAC_lngammas_many_numba():
+    from thermo.unifac import DOUFIP2006, DOUFSG
+    T = 373.15
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    xs_matrix = np.array([[0.2, 0.3, 0.1, 0.4], [0.7, 0.1, 0.1, 0.1], [0.25, 0.25, 0.25, 0.25]])
+    model = thermo.unifac.UNIFAC.from_subgroups(T=T, xs=[0.2, 0.3, 0.1, 0.4], chemgroups=chemgroups, version=1,
+                                                interaction_data=DOUFIP2006, subgroups=DOUFSG)
+    modelnp = thermo.numba.unifac.UNIFAC.from_subgroups(T=T, xs=xs_matrix[0], chemgroups=chemgroups, version=1,
+                                                        interaction_data=DOUFIP2006, subgroups=DOUFSG)
+    expect = model.lngammas_many(xs_matrix.tolist())
+    assert_close2d(modelnp.lngammas_many(xs_matrix), expect, rtol=1e-13)
+
+    res = thermo.numba.unifac_lngammas_many_loop(xs_matrix, 3, 4, modelnp.N_groups, modelnp.vs, modelnp.rs, modelnp.qs,
+                                                 modelnp.Qs, modelnp.psis(), modelnp.lnGammas_subgroups_pure(),
+                                                 1, modelnp.rs_34)
+    assert isinstance(thermo.numba.unifac_lngammas_many_loop, numba.core.registry.CPUDispatcher)
+    assert type(res) is np.ndarray
+    assert_close2d(res, expect, rtol=1e-13)
+
+
+@mark_as_numba
+def test_activity_many_loop_numba():
+    Ts = np.array([300.0, 343.15, 400.0])
+    xs = np.array([[.2, .3, .5], [.1, .1, .8], [.6, .3, .1]])
+    tausB = np.array([[0.0, 235.0, -169.0], [-160, 0.0, -715.0], [11.2, 144.0, 0.0]])
+    tausA = np.array([[0.0, -1.05e-4, -2.5e-4], [3.9e-4, 0.0, 1.6e-4], [-1.123e-4, 6.5e-4, 0]])
+    zero = np.zeros((3, 3))
+    alpha_cs = np.array([[0.0, 0.2937, 0.2999], [0.2937, 0.0, 0.3009], [0.2999, 0.3009, 0.0]])
+    rs, qs = np.array([2.5735, 2.87, 1.4311]), np.array([2.336, 2.41, 1.432])
+
+    models = [(thermo.numba.nrtl_many_loop, thermo.nrtl.NRTL(T=300.0, xs=xs[0], tau_as=tausA, tau_bs=tausB, alpha_cs=alpha_cs),
+               (Ts, xs, 3, 3, tausA, tausB, zero, zero, zero, zero, alpha_cs, zero)),
+              (thermo.numba.wilson_many_loop, thermo.wilson.Wilson(T=300.0, xs=xs[0], lambda_as=tausA, lambda_bs=tausB),
+               (Ts, xs, 3, 3, tausA, tausB, zero, zero, zero, zero)),
+              (thermo.numba.uniquac_many_loop, thermo.uniquac.UNIQUAC(T=300.0, xs=xs[0], rs=rs, qs=qs, tau_as=tausA, tau_bs=tausB),
+               (Ts, xs, 3, 3, rs, qs, 10.0, tausA, tausB, zero, zero, zero, zero))]
+    for func, model, args in models:
+        assert isinstance(func, numba.core.registry.CPUDispatcher)
+        expect = model.evaluate_many(Ts, xs)
+        gammas, GEs, dGE_dxs = func(*args)
+        assert type(gammas) is np.ndarray
+        assert_close2d(gammas, expect['gammas'], rtol=1e-13)
+        assert_close1d(GEs, expect['GE'], rtol=1e-13)
+        assert_close2d(dGE_dxs, expect['dGE_dxs'], rtol=1e-13)
+
+
 @mark_as_numba
 def test_a_alpha_aijs_composition_independent_in_all():
     assert 'a_alpha_aijs_composition_independent' in thermo.numba.__all__
@@ -290,6 +337,31 @@ def test_a_alpha_and_derivatives_full():
     assert_close1d(d2a_alpha_dT2_ijs0, d2a_alpha_dT2_ijs, rtol=1e-13)
 
 
+@mark_as_numba
+def test_mixin_alpha_functions_vectorized_numba():
+    cases = [('Twu91', [512.5, 647.14], [1.0244, 0.6044], [[0.6949, 0.9199, 1.7041], [0.3959, 0.8609, 2.2039]]),
+             ('Soave_1979', [507.6, 617.7], [2.6, 5.0], [[0.9, 0.3], [1.0, 0.4]]),
+             ('Mathias_Copeman_poly', [507.6, 282.3], [2.2, 0.5], [[0.3, -0.2, 0.9, 1.0], [0.1, -0.3, 0.6, 1.0]]),
+             ('TwuPR95', [507.6, 190.56], [2.69, 0.2495], [0.2975, 0.008]),
+             ('TwuSRK95', [507.6, 190.56], [2.57, 0.2304], [0.2975, 0.008])]
+    for name, Tcs, ais, coeffs in cases:
+        f0 = getattr(thermo.numba.eos_alpha_functions, name + '_a_alphas_vectorized')
+        f1 = getattr(thermo.numba.eos_alpha_functions, name + '_a_alpha_and_derivatives_vectorized')
+        assert isinstance(f1, numba.core.registry.CPUDispatcher)
+        expect = getattr(thermo.eos_alpha_functions, name + '_a_alpha_and_derivatives_vectorized')
+        for T in (1.0, 300.0, 600.0):
+            res = f1(T, np.array(Tcs), np.array(ais), np.array(coeffs))
+            res0 = expect(T, Tcs, ais, coeffs)
+            assert_close1d(f0(T, np.array(Tcs), np.array(ais), np.array(coeffs)), res0[0], rtol=1e-13)
+            for v, v0 in zip(res, res0):
+                assert_close1d(v, v0, rtol=1e-13)
+
+    eos = thermo.numba.eos_mix.TWUPRMIX(T=300.0, P=1e5, Tcs=np.array([126.1, 190.6]), Pcs=np.array([33.94E5, 46.04E5]),
+                                        omegas=np.array([0.04, 0.011]), zs=np.array([0.5, 0.5]))
+    a_alphas = eos.a_alpha_and_derivatives_many([250.0, 300.0, 400.0])[0]
+    assert_close1d(a_alphas[1], eos.a_alphas, rtol=1e-13)
+
+
 @mark_as_numba
 def test_IAPWS95_numba():
     assert isinstance(thermo.numba.flash.iapws95_Psat, numba.core.registry.CPUDispatcher)
@@ -373,6 +445,15 @@ def test_volume_numba_solvers():
     assert slns[2] == 0
     assert_close(slns[0], 2.5908397553496098e-05, rtol=1e-15)
 
+@mark_as_numba
+def test_volume_solutions_halley_many_numba():
+    from .test_eos_volume import hard_parameters
+    params = np.array(hard_parameters)
+    Vs = thermo.numba.eos_volume.volume_solutions_halley_many(*params.T)
+    Vs_expect = thermo.eos_volume.volume_solutions_halley_many(*params.T)
+    assert Vs.shape == (len(hard_parameters), 3)
+    assert_close2d(Vs, Vs_expect, rtol=1e-12)
+
 from .test_eos_volume import hard_parameters, validate_volume
 @pytest.mark.parametrize("params", hard_parameters)
 @mark_as_numba
@@ -440,6 +521,27 @@ def test_lnphis_direct_and_sequential_substitution_2P_functional():
     assert_close(VF_calc, VF_expect, rtol=1e-6)
     assert_close1d(xs_calc, xs_expect)
     assert_close1d(ys_calc, ys_expect)
+
+
+@mark_as_numba
+def test_eos_mix_flash_TP_many_numba():
+    Tcs, Pcs, omegas = np.array([305.32, 469.7]), np.array([4872000.0, 3370000.0]), np.array([0.098, 0.251])
+    kijs = np.array([[0.0, 0.0078], [0.0078, 0.0]])
+    Ts = np.array([300.0, 300.0, 250.0, 400.0])
+    Ps = np.array([1.6e6, 1e5, 1e7, 4e6])
+    zs_list = np.array([[.5, .5], [.5, .5], [.3, .7], [.2, .8]])
+    for PR in (True, False):
+        VFs, xs_list, ys_list = thermo.numba.eos_mix_methods.eos_mix_flash_TP_many(Ts, Ps, zs_list, Tcs, Pcs, omegas, kijs, PR)
+        assert type(VFs) is np.ndarray
+        assert xs_list.shape == (4, 2)
+        VFs_expect, xs_expect, ys_expect = thermo.eos_mix_methods.eos_mix_flash_TP_many(Ts.tolist(), Ps.tolist(), zs_list.tolist(),
+                                                                                       Tcs.tolist(), Pcs.tolist(), omegas.tolist(), kijs.tolist(), PR)
+        assert_close1d(VFs, VFs_expect, rtol=1e-12)
+        assert_close2d(xs_list, xs_expect, rtol=1e-12)
+        assert_close2d(ys_list, ys_expect, rtol=1e-12)
+    assert 0.0 < VFs[0] < 1.0
+    with pytest.raises(UnconvergedError):
+        thermo.numba.eos_mix_methods.eos_mix_flash_TP(300.0, 1.6e6, zs_list[0], Tcs, Pcs, omegas, kijs, True, 2, 1e-13)
     
     
 @mark_as_numba
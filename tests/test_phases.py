@@ -1499,6 +1499,82 @@ def test_CEOS_hash_json_storage():
     assert phase == phase2
     assert hash(phase) == h0
 
+def test_CEOS_alpha_cache():
+    eos_kwargs = dict(Tcs=[305.32, 369.83, 425.12], Pcs=[4872000.0, 4248000.0, 3796000.0],
+                      omegas=[0.098, 0.152, 0.193], kijs=[[0.0, 0.01, 0.02], [0.01, 0.0, 0.0], [0.02, 0.0, 0.0]])
+    # Off by default
+    assert CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=eos_kwargs).alpha_cache is None
+    try:
+        CEOSGas.alpha_caching = CEOSLiquid.alpha_caching = True
+        gas = CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=eos_kwargs)
+        liquid = CEOSLiquid(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=eos_kwargs)
+        cache = gas.alpha_cache
+        assert cache is liquid.alpha_cache
+        # Shared by the values of the parameters, not the object holding them
+        assert CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=dict(eos_kwargs)).alpha_cache is cache
+        other_kwargs = dict(eos_kwargs, omegas=[0.098, 0.152, 0.2])
+        assert CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=other_kwargs).alpha_cache is not cache
+        cache.clear()
+
+        gas2 = gas.to_TP_zs(T=250.0, P=1e5, zs=[.5, .3, .2])
+        liq2 = liquid.to(T=250.0, P=5e6, zs=[.1, .2, .7])
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert liq2.alpha_cache is cache
+        assert liq2.eos_mix.a_alphas is gas2.eos_mix.a_alphas
+        assert liq2.eos_mix.d2a_alpha_dT2s is gas2.eos_mix.d2a_alpha_dT2s
+        # Only the pure component vectors are stored
+        assert cache.alphas[250.0] == (gas2.eos_mix.a_alphas, gas2.eos_mix.da_alpha_dTs, gas2.eos_mix.d2a_alpha_dT2s)
+
+        # Results are unchanged
+        liq_ref = CEOSLiquid(PRMIX, T=250.0, P=5e6, zs=[.1, .2, .7], eos_kwargs=eos_kwargs)
+        assert_close(liq2.H_dep(), liq_ref.H_dep(), rtol=1e-13)
+        assert_close(liq2.Cp_dep(), liq_ref.Cp_dep(), rtol=1e-13)
+        assert_close1d(liq2.lnphis(), liq_ref.lnphis(), rtol=1e-13)
+        assert_close2d(liq2.eos_mix.d2a_alpha_dT2_ijs, liq_ref.eos_mix.d2a_alpha_dT2_ijs, rtol=1e-13)
+
+        # Changing the parameters afterwards does not reuse stale values
+        mutable_kwargs = dict(eos_kwargs)
+        gas3 = CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=mutable_kwargs)
+        mutable_kwargs['omegas'] = [0.2, 0.2, 0.2]
+        gas4 = CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .3, .5], eos_kwargs=mutable_kwargs)
+        assert gas3.alpha_cache is cache
+        assert gas4.alpha_cache is not cache
+        gas4_250 = gas4.to_TP_zs(T=250.0, P=1e5, zs=[.5, .3, .2])
+        gas4_ref = CEOSGas(PRMIX, T=250.0, P=1e5, zs=[.5, .3, .2], eos_kwargs=mutable_kwargs)
+        assert_close1d(gas4_250.eos_mix.a_alphas, gas4_ref.eos_mix.a_alphas, rtol=1e-13)
+
+        # The cache is not part of the phase state
+        assert 'alpha_cache' not in liq2.__dict__
+        assert '_alpha_cache_key' not in liq2.as_json()
+        assert '_alpha_cache_key' not in liq2.__getstate__()
+        assert liq2 == Phase.from_json(json.loads(json.dumps(liq2.as_json())))
+        assert liq2 == pickle.loads(pickle.dumps(liq2))
+        assert pickle.loads(pickle.dumps(liq2)).alpha_cache is None
+
+        # Bounded size, least recently used temperatures are removed first
+        for i in range(2*gas.alpha_cache_size):
+            gas.to_TP_zs(T=260.0 + i, P=1e5, zs=[.2, .3, .5])
+        assert len(cache.alphas) == gas.alpha_cache_size
+        assert cache.get(250.0) is None
+
+        # Safe to share between threads
+        from concurrent.futures import ThreadPoolExecutor
+        Ts = [200.0 + 0.5*(i % 40) for i in range(400)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            phases = list(executor.map(lambda T: liquid.to_TP_zs(T=T, P=1e6, zs=[.2, .3, .5]), Ts))
+        for T, phase in zip(Ts[:40], phases[:40]):
+            ref = CEOSLiquid(PRMIX, T=T, P=1e6, zs=[.2, .3, .5], eos_kwargs=eos_kwargs)
+            assert_close1d(phase.eos_mix.a_alphas, ref.eos_mix.a_alphas, rtol=1e-13)
+
+        # Disabled
+        cache.clear()
+        CEOSGas.alpha_caching = False
+        gas.to_TP_zs(T=250.0, P=1e5, zs=[.5, .3, .2])
+        assert (cache.hits, cache.misses) == (0, 0)
+    finally:
+        CEOSGas.alpha_caching = CEOSLiquid.alpha_caching = False
+
+
 def test_IdealGas_hash_json_storage():
 
     HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [R*-9.9e-13, R*1.57e-09, R*7e-08, R*-0.000261, R*3.539])),
@@ -3042,10 +3118,27 @@ def test_lnphis_at_zs_eos_mix():
     
     assert_close1d(gas.lnphis_at_zs(zs), gas.lnphis(), rtol=1e-13)
     assert_close1d(liquid.lnphis_at_zs(zs), liquid.lnphis(), rtol=1e-13)
-    
-    
-    
-    
+
+    # PSRK; CO2, n-hexane
+    from thermo.unifac import UNIFAC, PSRKIP, PSRKSG
+    T, P, zs = 313.0, 1e6, [0.5, 0.5]
+    ge_model = UNIFAC.from_subgroups(T=T, xs=zs, chemgroups=[{117: 1}, {1:2, 2:4}], subgroups=PSRKSG,
+                                     interaction_data=PSRKIP, version=0)
+    eos_kwargs = dict(Tcs=[304.2, 507.4], Pcs=[7.37646e6, 3.014419e6], omegas=[0.2252, 0.2975],
+                      alpha_coeffs=[[-1.7039, 0.2515, 0.8252, 1.0], [2.9173, -1.4411, 1.1061, 1.0]],
+                      ge_model=ge_model, cs=[1e-6, 3e-6])
+    gas = CEOSGas(PSRK, eos_kwargs, T=T, P=P, zs=zs)
+    liquid = CEOSLiquid(PSRK, eos_kwargs, T=T, P=P, zs=zs)
+    assert gas.eos_mix.phase == 'l/g'
+
+    assert_close1d(lnphis_direct(zs, *gas.lnphis_args()), gas.lnphis(), rtol=1e-13)
+    assert_close1d(lnphis_direct(zs, *liquid.lnphis_args()), liquid.lnphis(), rtol=1e-13)
+
+    zs2 = [0.3, 0.7]
+    assert_close1d(gas.lnphis_at_zs(zs2), gas.to_TP_zs(T=T, P=P, zs=zs2).lnphis(), rtol=1e-13)
+    assert_close1d(liquid.lnphis_at_zs(zs2), liquid.to_TP_zs(T=T, P=P, zs=zs2).lnphis(), rtol=1e-13)
+
+
 def test_UNIFAC_lnphis_direct():
     from thermo.unifac import UFIP, UFSG, VTPRIP, VTPRSG, NISTKTUFIP, NISTKTUFSG, LUFIP, LUFSG, DOUFIP2016, DOUFSG, PSRKIP, PSRKSG
     from thermo.phases.phase_utils import lnphis_direct
@@ -3518,3 +3611,25 @@ def test_virial_phase_ternary_B_only_pitzer_curl_no_interactions():
     assert_close1d(gas_np.dnB_dns(), dnB_dns_expect, rtol=1e-13)
     assert isinstance(gas_np.dnB_dns(), np.ndarray)
 
+
+
+def test_lnphis_and_derivatives_ceos():
+    T, P, zs = 331.42, 90923,  [0.229, 0.175, 0.596]
+    eos_kwargs = {'Pcs': [4700000.0, 5330000.0, 8084000.0],
+     'Tcs': [508.1, 536.2, 512.5],
+     'omegas': [0.309, 0.21600000000000003, 0.5589999999999999],
+     'kijs': [[0, 0.038, 0.08], [0.038, 0, 0.021], [0.08, 0.021, 0]]}
+    for eos in (PRMIX, PRMIXTranslatedConsistent):
+        for phase in (CEOSGas(eos, eos_kwargs, T=T, P=P, zs=zs), CEOSLiquid(eos, eos_kwargs, T=T, P=P, zs=zs)):
+            bufs = ([0.0]*3, [0.0]*3, [0.0]*3, [[0.0]*3 for _ in range(3)])
+            res = phase.lnphis_and_derivatives(*bufs)
+            assert all(r is b for r, b in zip(res, bufs))
+            assert_close1d(res[0], phase.lnphis(), rtol=1e-13)
+            assert_close1d(res[1], phase.dlnphis_dT(), rtol=1e-13)
+            assert_close1d(res[2], phase.dlnphis_dP(), rtol=1e-13)
+            assert_close2d(res[3], phase.dlnphis_dns(), rtol=1e-12)
+
+            # The generic implementation on Phase gives the same results
+            res = Phase.lnphis_and_derivatives(phase)
+            assert_close1d(res[0], phase.lnphis(), rtol=1e-13)
+            assert_close2d(res[3], phase.dlnphis_dns(), rtol=1e-13)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2022, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+import os
+import sys
+import json
+import subprocess
+
+# Modules which are slow to import and must only be loaded when used
+import_budget_excluded = ['pandas', 'scipy', 'scipy.interpolate', 'concurrent.futures',
+                          'matplotlib', 'sympy', 'numba']
+
+def run_isolated(code, env=None):
+    # A fresh interpreter is required to see what an import actually loads
+    out = subprocess.check_output([sys.executable, '-c', code], env=env)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+# Import and first-lookup time limits, in seconds; about ten times what they
+# take on a developer machine so only a large regression fails
+import_thermo_time_budget = 1.5
+property_databank_time_budget = 4.0
+
+def best_isolated_time(code, runs=3):
+    # The code prints the seconds it took; the best of a few fresh
+    # interpreters is used to keep the check stable on a loaded machine
+    return min(run_isolated(code) for _ in range(runs))
+
+def test_import_thermo_budget():
+    loaded = run_isolated('''import sys, json
+import thermo
+from chemicals.data_reader import df_sources
+print(json.dumps([list(sys.modules), list(df_sources)]))''')
+    modules, tables = loaded
+    assert [m for m in import_budget_excluded if m in modules] == []
+    # No data is parsed by the import itself
+    assert tables == []
+
+    # Time only thermo itself, not the libraries it is built on
+    elapsed = best_isolated_time('''import json, time
+import numpy, fluids, chemicals
+start = time.perf_counter()
+import thermo
+print(json.dumps(time.perf_counter() - start))''')
+    assert elapsed < import_thermo_time_budget
+
+def test_property_databank_budget():
+    # Only the tables a property queries are parsed
+    tables = run_isolated('''import json
+from thermo import VaporPressure
+VaporPressure(CASRN='7732-18-5')
+from chemicals.data_reader import df_sources
+print(json.dumps(list(df_sources)))''')
+    assert 'webbook_constants.tsv' in tables
+    for name in ('Physical Constants of Organic Compounds.csv', 'wikidata_properties.tsv',
+                 'common_chemistry_data.tsv', 'joback_predictions.tsv'):
+        assert name not in tables
+
+    elapsed = best_isolated_time('''import json, time
+from thermo import VaporPressure
+start = time.perf_counter()
+VaporPressure(CASRN='7732-18-5')
+print(json.dumps(time.perf_counter() - start))''')
+    assert elapsed < property_databank_time_budget
+
+def test_CEOSLiquid_cache_opt_in(tmp_path):
+    code = '''import json, os
+import thermo
+print(json.dumps(sorted(os.listdir(os.path.dirname(thermo.phases.ceos.__file__) + '/__pycache__'))))'''
+    env = dict(os.environ)
+    env.pop('THERMO_CACHE_DIR', None)
+    assert not [f for f in run_isolated(code, env) if f.startswith('CEOSLiquid')]
+
+    stale = tmp_path / 'CEOSLiquid.00000000.dat'
+    stale.write_bytes(b'')
+    env['THERMO_CACHE_DIR'] = str(tmp_path)
+    for _ in range(2):
+        run_isolated(code, env)
+        cached = [f.name for f in tmp_path.iterdir()]
+        assert len(cached) == 1 and cached[0].startswith('CEOSLiquid.') and cached[0] != stale.name
@@ -21,7 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 import pytest
 from thermo.utils import TDependentProperty
-from fluids.numerics import assert_close
+from fluids.numerics import assert_close, assert_close1d
 from math import log
 
 def test_local_constant_method():
@@ -330,4 +330,108 @@ def test_t_dependent_property_exceptions():
                                   "component with CASRN '7732-18-5'")
             raise error
         
-    
\ No newline at end of file
+    
+
+def test_T_dependent_property_many():
+    import numpy as np
+    from thermo import VaporPressure, HeatCapacityGas
+    def scalar(f, *args):
+        v = f(*args)
+        return np.nan if v is None else v
+
+    coeffs = [0.008603558174828078, 0.007358688688856427, -0.016890323025782954, -0.005289197721114957, -0.0028824712174469625, 0.05130960832946553, -0.12709896610233662, 0.37774977659528036, -0.9595325030688526, 2.7931528759840174, 13.10149649770156]
+    poly_coeffs = [-3e-08, 5e-05, -0.02, 8.0]
+    objs = [VaporPressure(Tc=591.72, **{k: (309.0, 591.72, poly_coeffs)}) for k in ('exp_poly_fit', 'poly_fit')]
+    objs += [VaporPressure(Tc=591.72, **{k: (309.0, 591.72, coeffs)})
+             for k in ('exp_stablepoly_fit', 'exp_cheb_fit', 'stablepoly_fit', 'cheb_fit')]
+    objs += [VaporPressure(Tc=591.72, **{k: (309.0, 591.0, 591.72, poly_coeffs)})
+             for k in ('exp_poly_fit_ln_tau', 'poly_fit_ln_tau')]
+    objs += [VaporPressure(Tc=591.72, **{k: (309.0, 591.0, 591.72, coeffs)})
+             for k in ('exp_stablepoly_fit_ln_tau', 'exp_cheb_fit_ln_tau', 'stablepoly_fit_ln_tau', 'cheb_fit_ln_tau')]
+    # Correlations and tabular data, vectorizable and not
+    objs.append(VaporPressure(CASRN='7732-18-5', Tc=647.14, Pc=22048320.0, omega=0.344, Tb=373.124))
+    objs.append(HeatCapacityGas(CASRN='7732-18-5', MW=18.01528, similarity_variable=0.16652530518537598))
+
+    Ts = np.linspace(200.0, 700.0, 37).tolist()
+    for obj in objs:
+        for method in obj.all_methods:
+            obj.method = method
+            np.testing.assert_allclose(obj.T_dependent_property_many(Ts),
+                                       [scalar(obj.T_dependent_property, T) for T in Ts], rtol=1e-11)
+            for order in (1, 2):
+                np.testing.assert_allclose(obj.T_dependent_property_derivative_many(Ts, order),
+                                           [scalar(obj.T_dependent_property_derivative, T, order) for T in Ts], rtol=1e-9)
+            T1s, T2s = Ts[:-1], Ts[1:]
+            np.testing.assert_allclose(obj.T_dependent_property_integral_many(T1s, T2s),
+                                       [scalar(obj.T_dependent_property_integral, T1, T2) for T1, T2 in zip(T1s, T2s)], rtol=1e-9)
+            np.testing.assert_allclose(obj.T_dependent_property_integral_over_T_many(T1s, T2s),
+                                       [scalar(obj.T_dependent_property_integral_over_T, T1, T2) for T1, T2 in zip(T1s, T2s)], rtol=1e-9)
+
+    obj = VaporPressure(Tc=591.72, exp_cheb_fit=(309.0, 591.72, coeffs), extrapolation=None)
+    assert np.isnan(obj.T_dependent_property_many([300.0, 400.0])[0])
+    obj.RAISE_PROPERTY_CALCULATION_ERROR = True
+    with pytest.raises(RuntimeError):
+        obj.T_dependent_property_many([300.0, 400.0])
+
+
+def test_evaluator():
+    from thermo import VaporPressure, HeatCapacityGas
+    coeffs = [12.570668791524573, 3.1092695610681673, -0.5485217707981505, 0.11115875762247596, -0.01809803938553478, 0.003674911307077089, -0.00037626163070525465, 0.0001962813915017403, 6.120764548889213e-05, 3.602752453735203e-05]
+    objs = [VaporPressure(Tc=591.72, exp_cheb_fit=(309.0, 591.72, coeffs)),
+            VaporPressure(CASRN='7732-18-5', Tc=647.14, Pc=22048320.0, omega=0.344, Tb=373.124),
+            HeatCapacityGas(CASRN='7732-18-5', MW=18.01528, similarity_variable=0.16652530518537598)]
+    Ts = [200.0, 309.0, 350.0, 500.0, 591.72, 640.0, 1000.0, 5000.0]
+    for obj in objs:
+        for method in obj.all_methods:
+            obj.method = method
+            f = obj.evaluator()
+            assert f is obj.evaluator()
+            for T in Ts:
+                assert f(T) == obj.T_dependent_property(T)
+                obj.T_cached = None
+                assert obj(T) == obj.T_dependent_property(T)
+
+    # Changing the method or adding a new one rebinds the evaluator
+    obj = objs[0]
+    obj.method = 'EXP_CHEB_FIT'
+    f = obj.evaluator()
+    obj.add_method(100.0)
+    assert obj.evaluator() is not f
+    assert obj(300.0) == 100.0
+    assert '_evaluate' not in obj.as_json()
+
+    # Replacing the coefficients of the selected method rebinds it as well
+    obj = VaporPressure(Tc=591.72, exp_cheb_fit=(309.0, 591.72, coeffs))
+    f = obj.evaluator()
+    obj._set_exp_cheb_fit((309.0, 500.0, coeffs))
+    assert obj.evaluator() is not f
+    assert obj(550.0) == obj.T_dependent_property(550.0)
+
+
+def test_evaluator_pickle():
+    import pickle
+    from thermo import HeatCapacityGas
+    obj = HeatCapacityGas(CASRN='7732-18-5')
+    value = obj(300.0)
+    assert obj._evaluate is not None
+    obj2 = pickle.loads(pickle.dumps(obj))
+    assert obj2._evaluate is None
+    obj2.T_cached = None
+    assert obj2(300.0) == value
+
+
+def test_interpolate_many():
+    import numpy as np
+    from thermo import VaporPressure
+    obj = VaporPressure(load_data=False)
+    Ts = [300.0, 320.0, 340.0, 360.0, 380.0, 400.0]
+    Psats = [3536.8, 10546.5, 27188.0, 62093.1, 128880.0, 246630.0]
+    obj.add_tabular_data(Ts, Psats, name='data')
+
+    pts = [290.0, 300.0, 333.3, 371.0, 400.0, 410.0]
+    expect = [obj.interpolate(T, 'data') for T in pts]
+    assert_close1d(obj.interpolate_many(np.array(pts), 'data'), expect, rtol=1e-13)
+    assert_close1d([obj.interpolate(T, 'data') for T in Ts], Psats, rtol=1e-13)
+    # Only one spline is built per data set and set of transforms
+    assert len(obj.tabular_data_interpolators) == 1
+    assert_close1d(obj.T_dependent_property_many(np.array(pts[1:-1])), expect[1:-1], rtol=1e-13)
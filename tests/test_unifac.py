@@ -34,6 +34,11 @@ import types
 import pickle, json
 from thermo.test_utils import check_np_output_activity
 
+try:
+    import rdkit
+except:
+    rdkit = None
+
 '''
 Test suite currently takes ~0.2 seconds :)
 '''
@@ -1017,4 +1022,170 @@ def test_UNIFAC_large():
     GE.GE()
     GE.to_T_xs(T=310.0, xs=xs).gammas() # 16.7 ms at 200 components
 
-del test_UNIFAC_large
\ No newline at end of file
+del test_UNIFAC_large
+
+def test_UNIFAC_lngammas_many():
+    # (version, T, chemgroups) with the default parameters of each version
+    cases = [(0, 333.15, [{1:2, 2:4}, {1:1, 2:1, 18:1}, {1: 1, 2: 1, 14: 1}]),
+             (1, 373.15, [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]),
+             (2, 333.15, [{1:2, 2:4}, {1:1, 2:1, 18:1}, {1: 1, 2: 1, 14: 1}]),
+             (3, 328.15, [{1: 1, 18: 1}, {1: 1, 2: 1, 14: 1}]),
+             (4, 373.15, [{1: 1, 2: 1, 12: 1}, {1: 2, 2: 3}, {1: 2, 2: 6}, {1: 2, 2: 7}]),
+             (5, 330.0, [{1:1, 15:5, 19:1}, {15:4, 18:2}])]
+    for version, T, chemgroups in cases:
+        N = len(chemgroups)
+        xs_matrix = [normalize([1.0 + ((i*7 + j*3) % 5) + 1e-3*i for j in range(N)]) for i in range(25)]
+        xs_matrix.append(normalize([1e-12] + [1.0]*(N-1)))
+        GE = UNIFAC.from_subgroups(T=T, xs=xs_matrix[0], chemgroups=chemgroups, version=version)
+
+        expect = [GE.to_T_xs(T, xs).gammas() for xs in xs_matrix]
+        lngammas = GE.lngammas_many(xs_matrix)
+        assert type(lngammas) is np.ndarray
+        assert lngammas.shape == (len(xs_matrix), N)
+        assert_close2d(np.exp(lngammas), expect, rtol=1e-12)
+        assert_close2d(GE.gammas_many(np.array(xs_matrix)), expect, rtol=1e-12)
+
+        # Loop variant, including into a provided output
+        out = [[0.0]*N for _ in xs_matrix]
+        rs_34 = getattr(GE, 'rs_34', GE.rs)
+        res = unifac_lngammas_many_loop(xs_matrix, len(xs_matrix), N, GE.N_groups, GE.vs, GE.rs, GE.qs, GE.Qs,
+                                        GE.psis(), GE.lnGammas_subgroups_pure(), version, rs_34, out)
+        assert res is out
+        assert_close2d(out, lngammas, rtol=1e-12, atol=1e-14)
+
+def test_UNIFAC_psi_cache():
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    kwargs = dict(chemgroups=chemgroups, version=1, interaction_data=DOUFIP2016, subgroups=DOUFSG)
+    ref = UNIFAC.from_subgroups(T=373.15, xs=[0.2, 0.3, 0.1, 0.4], **kwargs)
+    assert UNIFAC.psi_cache is None
+    cache = UNIFACPsiCache(max_size=8)
+    try:
+        UNIFAC.psi_cache = cache
+        GE = UNIFAC.from_subgroups(T=373.15, xs=[0.2, 0.3, 0.1, 0.4], **kwargs)
+        for f in ('psis', 'dpsis_dT', 'd2psis_dT2', 'd3psis_dT3'):
+            getattr(GE, f)()
+        assert (cache.hits, cache.misses) == (0, 4)
+
+        # A separately created model with the same subgroups and different
+        # components order shares the matrices
+        GE2 = UNIFAC.from_subgroups(T=373.15, xs=[0.4, 0.1, 0.3, 0.2], chemgroups=chemgroups[::-1], version=1,
+                                    interaction_data=DOUFIP2016, subgroups=DOUFSG)
+        assert GE2.psi_hash() == GE.psi_hash()
+        assert GE2.model_hash() != GE.model_hash()
+        assert GE2.d3psis_dT3() is GE.d3psis_dT3()
+        assert GE2.psis() is GE.psis()
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert_close2d(GE2.dpsis_dT(), ref.dpsis_dT(), rtol=1e-15)
+        assert_close1d(GE2.gammas()[::-1], ref.gammas(), rtol=1e-13)
+        assert_close(GE2.dGE_dT(), ref.dGE_dT(), rtol=1e-13)
+
+        # Different parameters or version are not shared
+        GE3 = UNIFAC.from_subgroups(T=373.15, xs=[0.2, 0.3, 0.1, 0.4], chemgroups=chemgroups, version=1,
+                                    interaction_data=DOUFIP2006, subgroups=DOUFSG)
+        assert GE3.psi_hash() != GE.psi_hash()
+        assert GE3.psis() is not GE.psis()
+
+        # New temperatures through to_T_xs; the hash is carried over
+        stage = GE.to_T_xs(350.0, [0.25]*4)
+        assert stage._psi_hash == GE.psi_hash()
+        assert_close2d(stage.psis(), ref.to_T_xs(350.0, [0.25]*4).psis(), rtol=1e-15)
+        assert GE.to_T_xs(350.0, [0.1, 0.2, 0.3, 0.4]).psis() is stage.psis()
+
+        # The cache and the process dependent hash are not part of the model state
+        assert 'psi_cache' not in stage.__dict__
+        assert '_psi_hash' not in stage.as_json()
+        assert '_psi_hash' not in pickle.loads(pickle.dumps(stage)).__dict__
+        assert UNIFAC.from_json(json.loads(json.dumps(stage.as_json()))) == stage
+        assert pickle.loads(pickle.dumps(stage)) == stage
+        GE_np = UNIFAC.from_subgroups(T=373.15, xs=np.array([0.2, 0.3, 0.1, 0.4]), **kwargs)
+        GE_np.psis()
+        assert '_psi_hash' not in GE_np.as_json()
+        assert pickle.loads(pickle.dumps(GE_np)) == GE_np
+
+        # Bounded size, least recently used removed first
+        for i in range(2*cache.max_size):
+            GE.to_T_xs(300.0 + i, [0.25]*4).psis()
+        assert len(cache.entries) == cache.max_size
+        assert cache.get(GE.psi_hash(), 350.0) is None
+
+        # Temperature tolerance
+        cache.clear()
+        cache.T_tol = 1e-3
+        a = GE.to_T_xs(350.0, [0.25]*4).psis()
+        assert GE.to_T_xs(350.0 + 1e-5, [0.25]*4).psis() is a
+        assert GE.to_T_xs(351.0, [0.25]*4).psis() is not a
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # numpy models are stored separately
+        cache.clear()
+        cache.T_tol = 0.0
+        GE_np = UNIFAC.from_subgroups(T=373.15, xs=np.array([0.2, 0.3, 0.1, 0.4]), **kwargs)
+        GE.psis()
+        assert GE_np.psi_hash() != GE.psi_hash()
+        assert type(GE_np.psis()) is np.ndarray
+        assert_close2d(GE_np.psis(), GE.psis(), rtol=1e-15)
+    finally:
+        UNIFAC.psi_cache = None
+
+
+def test_UNIFACAssignmentCache(tmp_path):
+    path = str(tmp_path/'assignments.sqlite')
+    cache = UNIFACAssignmentCache(path)
+    ethanol = 'LFQSCWFLJHTTHZ-UHFFFAOYSA-N'
+    load_group_assignments_DDBST()
+    for catalog, data in (('UNIFAC', DDBST_UNIFAC_assignments), ('MODIFIED_UNIFAC', DDBST_MODIFIED_UNIFAC_assignments),
+                          ('PSRK', DDBST_PSRK_assignments)):
+        assert cache.lookup(ethanol, catalog) == data[ethanol]
+    assert cache.lookup(ethanol, 'NIST_UNIFAC') is None
+    assert cache.lookup('NOTAKEY', 'UNIFAC') is None
+    with pytest.raises(ValueError):
+        cache.lookup(ethanol, 'UNIFAC2')
+
+    # Stored SMILES are found without RDKit; failures are stored as None
+    cache.store(ethanol, {1: 1, 2: 1, 14: 1}, 'NIST_UNIFAC', smiles='CCO')
+    cache.store('XXXXXXXXXXXXXX-UHFFFAOYSA-N', None, 'NIST_UNIFAC', smiles='[Xx]')
+    cache.store(ethanol, None, 'UNIFAC', smiles='OCC')
+    assert cache.assign('CCO', 'NIST_UNIFAC') == {1: 1, 2: 1, 14: 1}
+    assert cache.assign('OCC', 'NIST_UNIFAC') == {1: 1, 2: 1, 14: 1}
+    assert cache.assign('OCC', 'UNIFAC') is None
+    assert (cache.hits, cache.misses) == (3, 0)
+    res = cache.assign_many(['CCO', '[Xx]', 'OCC', 'CCO'], 'NIST_UNIFAC')
+    assert res == [{1: 1, 2: 1, 14: 1}, None, {1: 1, 2: 1, 14: 1}, {1: 1, 2: 1, 14: 1}]
+    # Each molecule is looked up once
+    assert (cache.hits, cache.misses) == (5, 0)
+    cache.close()
+
+    # Persistent; not seeded again
+    cache = UNIFACAssignmentCache(path)
+    assert cache.lookup(ethanol, 'UNIFAC') is None
+    assert cache.assign_many(['CCO'], 'NIST_UNIFAC') == [{1: 1, 2: 1, 14: 1}]
+    cache.close()
+
+    cache = UNIFACAssignmentCache(':memory:', seed=False)
+    assert cache.lookup(ethanol, 'UNIFAC') is None
+    cache.close()
+
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_UNIFACAssignmentCache_fragment(tmp_path):
+    cache = UNIFACAssignmentCache(str(tmp_path/'assignments.sqlite'))
+    # In the DDBST data
+    assert cache.assign('CCO') == {1: 1, 2: 1, 14: 1}
+    assert cache.assign('OCC', 'MODIFIED_UNIFAC') == {1: 1, 2: 1, 14: 1}
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    cache.store('LFQSCWFLJHTTHZ-UHFFFAOYSA-N', None, 'UNIFAC')
+    assert cache.assign('C(O)C') is None
+    smiles = ['CCCCCCO', 'CCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCO', 'c1ccccc1', 'CCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCO']
+    serial = cache.assign_many(smiles, 'UNIFAC')
+    assert serial[1] == {1: 1, 2: 31, 14: 1}
+    assert serial[2] == {9: 6}
+    cache.close()
+
+    cache = UNIFACAssignmentCache(':memory:', seed=False)
+    assert cache.assign_many(smiles + ['not a smiles'], 'UNIFAC', processes=2) == serial + [None]
+    assert (cache.hits, cache.misses) == (0, 3)
+    assert cache.assign_many(smiles, 'UNIFAC', processes=2) == serial
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.close()
@@ -360,6 +360,18 @@ def test_Uniquac_numpy_output_correct_array_internal_ownership():
         assert obj.flags.c_contiguous
         assert obj.flags.owndata
         
+def test_UNIQUAC_gammas_binaries_vectorized():
+    xs = np.array([.1, .9, 0.3, 0.7, .85, .15, 1e-10, 1-1e-10])
+    rs, qs = np.array([2.1055, 0.9200]), np.array([1.972, 1.4])
+    assert_close1d(UNIQUAC_gammas_binaries_vectorized(xs, rs, qs, 0.5, 1.4),
+                   UNIQUAC_gammas_binaries(xs, rs, qs, 0.5, 1.4), rtol=1e-13)
+
+    def to_jac(taus):
+        return UNIQUAC_gammas_binaries_vectorized(xs, rs, qs, taus[0], taus[1]).tolist()
+    jac_num = jacobian(to_jac, [0.5, 1.4], scalar=False, perturbation=1e-7)
+    assert_close2d(UNIQUAC_gammas_binaries_jac_vectorized(xs, rs, qs, 0.5, 1.4), jac_num, rtol=1e-6, atol=1e-12)
+
+
 @pytest.mark.fitting
 def test_UNIQUAC_fitting_gamma_1_success_cases():
     pts = 10
@@ -402,3 +414,37 @@ def test_UNIQUAC_one_component():
         if hasattr(GE, s):
             res = getattr(GE, s)()
             # print(res, s)
+
+def test_UNIQUAC_evaluate_many():
+    from thermo.uniquac import uniquac_many_loop
+    from thermo.activity import GibbsExcess
+    rs = [2.5735, 2.87, 1.4311]
+    qs = [2.336, 2.41, 1.432]
+    tausA = [[0.0, -1.05e-4, -2.5e-4], [3.9e-4, 0.0, 1.6e-4], [-1.123e-4, 6.5e-4, 0]]
+    tausB = [[0.0, 235.0, -169.0], [-160, 0.0, -715.0], [11.2, 144.0, 0.0]]
+    tausC = [[0.0, -4.23e-4, 2.9e-4], [6.1e-4, 0.0, 8.2e-5], [-7.8e-4, 1.11e-4, 0]]
+    tausD = [[0.0, -3.94e-5, 2.22e-5], [8.5e-5, 0.0, 4.4e-5], [-7.9e-5, 3.22e-5, 0]]
+    tausE = [[0.0, -4.2e2, 8.32e2], [2.7e2, 0.0, 6.8e2], [3.7e2, 7.43e2, 0]]
+    tausF = [[0.0, 9.64e-8, 8.94e-8], [1.53e-7, 0.0, 1.11e-7], [7.9e-8, 2.276e-8, 0]]
+    ABCDEF = (tausA, tausB, tausC, tausD, tausE, tausF)
+    GE = UNIQUAC(T=331.42, xs=[0.229, 0.175, 0.596], rs=rs, qs=qs, ABCDEF=ABCDEF)
+    Ts = [300.0, 331.42, 400.0, 331.42]
+    xs = [[.2, .3, .5], [.1, .1, .8], [.6, .3, .1], [1e-7, .5, .5-1e-7]]
+    res = GE.evaluate_many(Ts, xs)
+    assert_close1d(res['T'], Ts, rtol=0)
+    for i in range(len(Ts)):
+        obj = GE.to_T_xs(Ts[i], xs[i])
+        assert_close1d(res['gammas'][i], obj.gammas(), rtol=1e-11)
+        assert_close(res['GE'][i], obj.GE(), rtol=1e-12)
+        assert_close1d(res['dGE_dxs'][i], obj.dGE_dxs(), rtol=1e-11)
+
+    # Same answer from the base class implementation, a numpy model, and the loop version
+    GEnp = UNIQUAC(T=331.42, xs=np.array([0.229, 0.175, 0.596]), rs=np.array(rs), qs=np.array(qs),
+                   ABCDEF=tuple(np.array(v) for v in ABCDEF))
+    for other in (GibbsExcess.evaluate_many(GE, Ts, xs), GEnp.evaluate_many(np.array(Ts), np.array(xs))):
+        for k in ('gammas', 'GE', 'dGE_dxs'):
+            assert_close2d(np.atleast_2d(other[k]), np.atleast_2d(res[k]), rtol=1e-11)
+    gammas, GEs, dGE_dxs = uniquac_many_loop(Ts, xs, len(Ts), 3, rs, qs, GE.z, *ABCDEF)
+    assert_close2d(gammas, res['gammas'], rtol=1e-12)
+    assert_close1d(GEs, res['GE'], rtol=1e-12)
+    assert_close2d(dGE_dxs, res['dGE_dxs'], rtol=1e-12)
@@ -149,3 +149,48 @@ def test_assert_component_balance():
 #
 #    dxdn_partials_expect = [[4.035568664220445, 8.694305121638651, 10.170128177986037, 6.183565242595064], [-3.990958119177865, -8.59819775633786, -10.057707360841516, -6.1152110550389445], [-6.5336500835989675, -14.076222199647844, -16.465604410121795, -10.011292289808026], [0.3347885354391007, 0.7212749120388615, 0.8437084346557562, 0.5129852184589438]]
 #    assert_close2d(d2xs_to_dxdn_partials(d2xs, xs), dxdn_partials_expect, rtol=1e-12)
+
+
+def test_Spline1D():
+    from scipy.interpolate import interp1d
+    xs = [0.3, 1.1, 1.7, 2.9, 3.2, 4.8, 5.5]
+    ys = [np.sin(x) + 0.1*x*x for x in xs]
+    pts = np.linspace(-1.0, 7.0, 41)
+
+    # Not-a-knot cubic within the data, linear extrapolation outside of it
+    spline = Spline1D(xs, ys)
+    cubic = interp1d(xs, ys, kind='cubic')
+    linear = interp1d(xs, ys, fill_value='extrapolate')
+    expect = [float(cubic(x)) if xs[0] <= x <= xs[-1] else float(linear(x)) for x in pts]
+    assert_close1d([spline(x) for x in pts], expect, rtol=1e-13)
+    assert_close1d(spline.evaluate_many(pts), expect, rtol=1e-13)
+    assert type(spline(2.0)) is float
+
+    # Decreasing points; linear only
+    spline = Spline1D(xs[::-1], ys[::-1], cubic=False)
+    assert_close1d(spline.evaluate_many(pts), linear(pts), rtol=1e-13)
+
+    # Four points are a single cubic
+    spline = Spline1D([1.0, 2.0, 3.0, 4.0], [1.0, 8.0, 27.0, 64.0])
+    assert_close(spline(2.5), 2.5**3, rtol=1e-13)
+
+
+def test_Spline2D():
+    xs = [1.0, 2.0, 3.0, 4.0, 5.0]
+    ys = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+    f = lambda x, y: x**3 + x*y*y - 2.0*y**3 + x*x*y*y*y
+    zs = [[f(x, y) for x in xs] for y in ys]
+
+    # Bicubic spline reproduces a bicubic exactly
+    spline = Spline2D(xs, ys, zs)
+    assert_close(spline(2.2, 33.0), f(2.2, 33.0), rtol=1e-12)
+    assert_close(spline(4.9, 11.0), f(4.9, 11.0), rtol=1e-12)
+
+    # Outside the grid, the bilinear interpolant at the edge is returned
+    linear = Spline2D(xs, ys, zs, cubic=False)
+    assert_close(linear(1.0, 15.0), 0.5*(zs[0][0] + zs[1][0]), rtol=1e-13)
+    assert_close(spline(0.0, 15.0), linear(1.0, 15.0), rtol=1e-13)
+    assert_close(spline(7.0, 70.0), zs[-1][-1], rtol=1e-13)
+
+    X, Y = np.meshgrid(np.linspace(0.0, 6.0, 7), np.linspace(5.0, 65.0, 9))
+    assert_close2d(spline.evaluate_many(X, Y), np.vectorize(spline)(X, Y), rtol=1e-13)
@@ -829,3 +829,41 @@ def test_wilson_gammas_binaries():
     
     all_gammas = wilson_gammas_binaries(xs, lambda12, lambda21)
     assert_close1d(all_gammas, gammas_object, rtol=1e-13)
+
+def test_wilson_gammas_binaries_vectorized():
+    xs = [0.252, 0.748, .7, .3, 1e-10, 1-1e-10, .4, .6]
+    assert_close1d(wilson_gammas_binaries_vectorized(np.array(xs), 0.8, 1.3),
+                   wilson_gammas_binaries(xs, 0.8, 1.3), rtol=1e-13)
+    assert_close2d(wilson_gammas_binaries_jac_vectorized(np.array(xs), 0.8, 1.3),
+                   wilson_gammas_binaries_jac(xs, 0.8, 1.3), rtol=1e-13)
+
+def test_Wilson_evaluate_many():
+    from thermo.wilson import wilson_many_loop
+    from thermo.activity import GibbsExcess
+    lambdasA = [[0.0, -0.2, 0.31], [0.15, 0.0, -0.1], [0.05, 0.4, 0.0]]
+    lambdasB = [[0.0, -35.3, 40.0], [-557.0, 0.0, -200.0], [-280.0, 95.5, 0.0]]
+    lambdasC = [[0.0, 9.58e-4, 9.93e-4], [9.45e-4, 0.0, 9.35e-4], [9.57e-4, 9.35e-4, 0.0]]
+    lambdasD = [[0.0, 3.86e-05, 3.62e-05], [3.88e-05, 0.0, 3.75e-05], [3.93e-05, 3.67e-05, 0.0]]
+    lambdasE = [[0.0, 474.0, 481.0], [478.0, 0.0, 460.0], [469.0, 493.0, 0.0]]
+    lambdasF = [[0.0, 8.27e-08, 8.78e-08], [8.28e-08, 0.0, 8.7e-08], [8.51e-08, 8.65e-08, 0.0]]
+    ABCDEF = (lambdasA, lambdasB, lambdasC, lambdasD, lambdasE, lambdasF)
+    GE = Wilson(T=300.0, xs=[.2, .3, .5], ABCDEF=ABCDEF)
+    Ts = [300.0, 343.15, 400.0, 343.15]
+    xs = [[.2, .3, .5], [.1, .1, .8], [.6, .3, .1], [1e-7, .5, .5-1e-7]]
+    res = GE.evaluate_many(Ts, xs)
+    assert_close1d(res['T'], Ts, rtol=0)
+    for i in range(len(Ts)):
+        obj = GE.to_T_xs(Ts[i], xs[i])
+        assert_close1d(res['gammas'][i], obj.gammas(), rtol=1e-12)
+        assert_close(res['GE'][i], obj.GE(), rtol=1e-12)
+        assert_close1d(res['dGE_dxs'][i], obj.dGE_dxs(), rtol=1e-12)
+
+    # Same answer from the base class implementation, a numpy model, and the loop version
+    GEnp = Wilson(T=300.0, xs=np.array([.2, .3, .5]), ABCDEF=tuple(np.array(v) for v in ABCDEF))
+    for other in (GibbsExcess.evaluate_many(GE, Ts, xs), GEnp.evaluate_many(np.array(Ts), np.array(xs))):
+        for k in ('gammas', 'GE', 'dGE_dxs'):
+            assert_close2d(np.atleast_2d(other[k]), np.atleast_2d(res[k]), rtol=1e-12)
+    gammas, GEs, dGE_dxs = wilson_many_loop(Ts, xs, len(Ts), 3, *ABCDEF)
+    assert_close2d(gammas, res['gammas'], rtol=1e-12)
+    assert_close1d(GEs, res['GE'], rtol=1e-12)
+    assert_close2d(dGE_dxs, res['dGE_dxs'], rtol=1e-12)
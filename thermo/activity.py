@@ -902,6 +902,56 @@ class GibbsExcess(object):
             pass
         return GibbsExcess.gammas(self)
 
+    def evaluate_many(self, Ts, xs_matrix):
+        r'''Method to calculate the activity coefficients, excess Gibbs energy
+        and its mole fraction derivatives at many temperatures and
+        compositions at once, with the same parameters as the existing
+        object.
+
+        This base implementation creates an object with :obj:`to_T_xs` for
+        each state; models with a vectorized implementation (:obj:`NRTL <thermo.nrtl.NRTL>`,
+        :obj:`Wilson <thermo.wilson.Wilson>` and
+        :obj:`UNIQUAC <thermo.uniquac.UNIQUAC>`) override it to evaluate every
+        state at once with array operations.
+
+        Parameters
+        ----------
+        Ts : ndarray[float]
+            Temperatures, one per composition or a single temperature for
+            every composition, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Results of each state; the keys are 'T', 'gammas' (one row per
+            composition and one column per component), 'GE' and 'dGE_dxs'
+            (one row per composition and one column per component), [-]
+
+        Notes
+        -----
+        Requires NumPy.
+
+        Examples
+        --------
+        >>> GE = IdealSolution(T=300.0, xs=[.1, .2, .3, .4])
+        >>> res = GE.evaluate_many([300.0, 400.0], [[.25, .25, .25, .25], [.1, .2, .3, .4]])
+        >>> res['gammas'].tolist(), res['GE'].tolist()
+        ([[1.0, 1.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0]], [0.0, 0.0])
+        '''
+        xs_matrix = array(xs_matrix, dtype=float)
+        M, N = xs_matrix.shape
+        Ts = np.broadcast_to(array(Ts, dtype=float), (M,))
+        gammas, GEs, dGE_dxs = zeros((M, N)), zeros(M), zeros((M, N))
+        scalar = self.scalar
+        for i, (T, xs) in enumerate(zip(Ts.tolist(), xs_matrix.tolist())):
+            obj = self.to_T_xs(T, xs if scalar else array(xs))
+            gammas[i] = obj.gammas()
+            GEs[i] = obj.GE()
+            dGE_dxs[i] = obj.dGE_dxs()
+        return {'T': Ts, 'gammas': gammas, 'GE': GEs, 'dGE_dxs': dGE_dxs}
+
     def dgammas_dns(self):
         r'''Calculate and return the mole number derivative of activity
         coefficients of a liquid phase using an activity coefficient model.
@@ -1032,7 +1082,7 @@ class GibbsExcess(object):
                    objective='MeanSquareErr', multiple_tries_max_objective='MeanRelErr', 
                    initial_guesses=initial_guesses, analytical_jac=analytical_jac,
                    solver_kwargs=None, use_numba=False, multiple_tries=False,
-                   do_statistics=True, multiple_tries_max_err=1e-5)
+                   do_statistics=True, multiple_tries_max_err=1e-5, processes=None)
         fit_kwargs.update(kwargs)
          
              
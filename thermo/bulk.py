@@ -1530,7 +1530,7 @@ class Bulk(Phase):
     def Cp_ideal_gas(self):
         HeatCapacityGases = self.correlations.HeatCapacityGases
         T = self.T
-        Cpigs_pure = [i.T_dependent_property(T) for i in HeatCapacityGases]
+        Cpigs_pure = [i.evaluator()(T) for i in HeatCapacityGases]
 
         Cp, zs = 0.0, self.zs
         for i in range(self.N):
@@ -61,8 +61,13 @@ __all__ = ['ChemicalConstantsPackage', 'PropertyCorrelationsPackage',
            'iapws_constants', 'iapws_correlations', 'lemmon2000_constants',
            'lemmon2000_correlations']
 
+import os
+from collections import OrderedDict
+from types import SimpleNamespace
+from pickle import dumps, loads, HIGHEST_PROTOCOL
 from fluids.constants import R
 
+from thermo import chemical
 from thermo.chemical import Chemical, get_chemical_constants
 from chemicals.identifiers import *
 from chemicals import identifiers
@@ -102,6 +107,18 @@ from thermo import serialize
 
 CAS_H2O = '7732-18-5'
 
+caching = False
+'''Whether or not :obj:`ChemicalConstantsPackage.from_IDs` and the related
+methods reuse the constants and correlations of chemicals they have already
+loaded in this process. Off by default.'''
+
+max_cached_chemicals = 1000
+'''Number of chemicals whose constants and correlations are kept by
+:obj:`ChemicalConstantsPackage.from_IDs`; the least recently used are
+discarded first.'''
+
+_from_IDs_cache = OrderedDict()
+
 
 
 warn_chemicals_msg ='''`chemicals <https://github.com/CalebBell/chemicals>`_ is a
@@ -120,6 +137,101 @@ warn_chemicals_msg ='''`chemicals <https://github.com/CalebBell/chemicals>`_ is
             It is not feasible to add individual components,
             so please submit a complete table of data from the source.'''
 
+_pure_correlations_order = ('VaporPressures', 'EnthalpyVaporizations', 'VolumeGases',
+                            'VolumeLiquids', 'VolumeSolids', 'HeatCapacityGases',
+                            'HeatCapacitySolids', 'HeatCapacityLiquids', 'EnthalpySublimations',
+                            'SurfaceTensions', 'SublimationPressures', 'PermittivityLiquids',
+                            'ViscosityLiquids', 'ViscosityGases', 'ThermalConductivityLiquids',
+                            'ThermalConductivityGases')
+
+def _pure_correlations(c, fit, names=_pure_correlations_order, correlations=None):
+    # Construct the pure component correlations `names`, in order, from the
+    # constants `c` (any object with the list attributes of
+    # ChemicalConstantsPackage that are used). `fit(i, name)` gives the extra
+    # keyword arguments of chemical `i`. Correlations other correlations
+    # depend on must already be in `correlations` or earlier in `names`.
+    if correlations is None:
+        correlations = {}
+    CASs = c.CASs
+    cmps = range(len(CASs))
+    for name in names:
+        if name == 'VaporPressures':
+            objs = [VaporPressure(Tb=c.Tbs[i], Tc=c.Tcs[i], Pc=c.Pcs[i], omega=c.omegas[i], CASRN=CASs[i],
+                                  **fit(i, name)) for i in cmps]
+        elif name == 'EnthalpyVaporizations':
+            objs = [EnthalpyVaporization(CASRN=CASs[i], Tb=c.Tbs[i], Tc=c.Tcs[i], Pc=c.Pcs[i], omega=c.omegas[i],
+                                         similarity_variable=c.similarity_variables[i],
+                                         **fit(i, name)) for i in cmps]
+        elif name == 'VolumeGases':
+            objs = []
+            for i in cmps:
+                try:
+                    eos = [PR(T=298.15, P=101325.0, Tc=c.Tcs[i], Pc=c.Pcs[i], omega=c.omegas[i])]
+                except:
+                    eos = None
+                objs.append(VolumeGas(MW=c.MWs[i], Tc=c.Tcs[i], Pc=c.Pcs[i], omega=c.omegas[i], dipole=c.dipoles[i],
+                                      eos=eos, CASRN=CASs[i], **fit(i, name)))
+        elif name == 'VolumeLiquids':
+            VaporPressures, VolumeGases = correlations['VaporPressures'], correlations['VolumeGases']
+            objs = [VolumeLiquid(MW=c.MWs[i], Tb=c.Tbs[i], Tc=c.Tcs[i], Pc=c.Pcs[i], Vc=c.Vcs[i], Zc=c.Zcs[i],
+                                 omega=c.omegas[i], dipole=c.dipoles[i], Psat=VaporPressures[i], CASRN=CASs[i],
+                                 eos=VolumeGases[i].eos, **fit(i, name)) for i in cmps]
+        elif name == 'VolumeSolids':
+            objs = [VolumeSolid(CASRN=CASs[i], MW=c.MWs[i], Tt=c.Tts[i], Vml_Tt=c.Vml_Tms[i],
+                                **fit(i, name)) for i in cmps]
+        elif name == 'HeatCapacityGases':
+            objs = [HeatCapacityGas(CASRN=CASs[i], MW=c.MWs[i], similarity_variable=c.similarity_variables[i],
+                                    **fit(i, name)) for i in cmps]
+        elif name == 'HeatCapacitySolids':
+            objs = [HeatCapacitySolid(CASRN=CASs[i], MW=c.MWs[i], similarity_variable=c.similarity_variables[i],
+                                      **fit(i, name)) for i in cmps]
+        elif name == 'HeatCapacityLiquids':
+            HeatCapacityGases = correlations['HeatCapacityGases']
+            objs = [HeatCapacityLiquid(CASRN=CASs[i], MW=c.MWs[i], similarity_variable=c.similarity_variables[i],
+                                       Tc=c.Tcs[i], omega=c.omegas[i], Cpgm=HeatCapacityGases[i],
+                                       **fit(i, name)) for i in cmps]
+        elif name == 'EnthalpySublimations':
+            HeatCapacityGases, HeatCapacitySolids = correlations['HeatCapacityGases'], correlations['HeatCapacitySolids']
+            EnthalpyVaporizations = correlations['EnthalpyVaporizations']
+            objs = [EnthalpySublimation(CASRN=CASs[i], Tm=c.Tms[i], Tt=c.Tts[i], Cpg=HeatCapacityGases[i],
+                                        Cps=HeatCapacitySolids[i], Hvap=EnthalpyVaporizations[i],
+                                        **fit(i, name)) for i in cmps]
+        elif name == 'SurfaceTensions':
+            VolumeLiquids, HeatCapacityLiquids = correlations['VolumeLiquids'], correlations['HeatCapacityLiquids']
+            objs = [SurfaceTension(CASRN=CASs[i], MW=c.MWs[i], Tb=c.Tbs[i], Tc=c.Tcs[i], Pc=c.Pcs[i], Vc=c.Vcs[i],
+                                   Zc=c.Zcs[i], omega=c.omegas[i], StielPolar=c.StielPolars[i], Hvap_Tb=c.Hvap_Tbs[i],
+                                   Vml=VolumeLiquids[i], Cpl=HeatCapacityLiquids[i],
+                                   **fit(i, name)) for i in cmps]
+        elif name == 'SublimationPressures':
+            objs = [SublimationPressure(CASRN=CASs[i], Tt=c.Tts[i], Pt=c.Pts[i], Hsub_t=c.Hsub_Tts[i],
+                                        **fit(i, name)) for i in cmps]
+        elif name == 'PermittivityLiquids':
+            objs = [PermittivityLiquid(CASRN=CASs[i], **fit(i, name)) for i in cmps]
+        elif name == 'ViscosityLiquids':
+            VaporPressures, VolumeLiquids = correlations['VaporPressures'], correlations['VolumeLiquids']
+            objs = [ViscosityLiquid(CASRN=CASs[i], MW=c.MWs[i], Tm=c.Tms[i], Tc=c.Tcs[i], Pc=c.Pcs[i], Vc=c.Vcs[i],
+                                    omega=c.omegas[i], Psat=VaporPressures[i], Vml=VolumeLiquids[i],
+                                    **fit(i, name)) for i in cmps]
+        elif name == 'ViscosityGases':
+            VolumeGases = correlations['VolumeGases']
+            objs = [ViscosityGas(CASRN=CASs[i], MW=c.MWs[i], Tc=c.Tcs[i], Pc=c.Pcs[i], Zc=c.Zcs[i], dipole=c.dipoles[i],
+                                 Vmg=VolumeGases[i], **fit(i, name)) for i in cmps]
+        elif name == 'ThermalConductivityLiquids':
+            objs = [ThermalConductivityLiquid(CASRN=CASs[i], MW=c.MWs[i], Tm=c.Tms[i], Tb=c.Tbs[i], Tc=c.Tcs[i],
+                                              Pc=c.Pcs[i], omega=c.omegas[i], Hfus=c.Hfus_Tms[i],
+                                              **fit(i, name)) for i in cmps]
+        elif name == 'ThermalConductivityGases':
+            VolumeGases, HeatCapacityGases = correlations['VolumeGases'], correlations['HeatCapacityGases']
+            ViscosityGases = correlations['ViscosityGases']
+            objs = [ThermalConductivityGas(CASRN=CASs[i], MW=c.MWs[i], Tb=c.Tbs[i], Tc=c.Tcs[i], Pc=c.Pcs[i],
+                                           Vc=c.Vcs[i], Zc=c.Zcs[i], omega=c.omegas[i], dipole=c.dipoles[i],
+                                           Vmg=VolumeGases[i], Cpgm=HeatCapacityGases[i], mug=ViscosityGases[i],
+                                           **fit(i, name)) for i in cmps]
+        else:
+            raise ValueError("Unknown correlation %s" %(name))
+        correlations[name] = objs
+    return correlations
+
 
 class ChemicalConstantsPackage(object):
     non_vector_properties = ('atomss', 'Carcinogens', 'CASs', 'Ceilings', 'charges',
@@ -447,7 +559,7 @@ class ChemicalConstantsPackage(object):
 
 
     @staticmethod
-    def constants_from_IDs(IDs):
+    def constants_from_IDs(IDs, databank=None):
         r'''Method to construct a new `ChemicalConstantsPackage` with loaded
         parameters from the `chemicals library <https://github.com/CalebBell/chemicals>`_,
         using whatever default methods and values happen to be in that library.
@@ -459,6 +571,10 @@ class ChemicalConstantsPackage(object):
             Identifying strings for each compound;
             most identifiers are accepted and all inputs are documented in
             :obj:`chemicals.identifiers.search_chemical`, [-]
+        databank : CompiledDatabank, optional
+            A compiled databank to load the chemicals from instead of the
+            `chemicals` library, when all of them are in it; see
+            :obj:`thermo.database.compile_databank`, [-]
 
         Returns
         -------
@@ -475,7 +591,7 @@ class ChemicalConstantsPackage(object):
         --------
         >>> constants = ChemicalConstantsPackage.constants_from_IDs(IDs=['water', 'hexane'])
         '''
-        return ChemicalConstantsPackage._from_IDs(IDs, correlations=False)
+        return ChemicalConstantsPackage._from_IDs(IDs, databank=databank, correlations=False)
 
     try:
         constants_from_IDs.__func__.__doc__ = constants_from_IDs.__func__.__doc__ %(warn_chemicals_msg)
@@ -483,7 +599,7 @@ class ChemicalConstantsPackage(object):
         pass
 
     @staticmethod
-    def correlations_from_IDs(IDs):
+    def correlations_from_IDs(IDs, databank=None):
         r'''Method to construct a new `PropertyCorrelationsPackage` with loaded
         parameters from the `chemicals library <https://github.com/CalebBell/chemicals>`_,
         using whatever default methods and values happen to be in that library.
@@ -495,6 +611,10 @@ class ChemicalConstantsPackage(object):
             Identifying strings for each compound;
             most identifiers are accepted and all inputs are documented in
             :obj:`chemicals.identifiers.search_chemical`, [-]
+        databank : CompiledDatabank, optional
+            A compiled databank to load the chemicals from instead of the
+            `chemicals` library, when all of them are in it; see
+            :obj:`thermo.database.compile_databank`, [-]
 
         Returns
         -------
@@ -511,14 +631,14 @@ class ChemicalConstantsPackage(object):
         --------
         >>> correlations = ChemicalConstantsPackage.constants_from_IDs(IDs=['ethanol', 'methanol'])
         '''
-        return ChemicalConstantsPackage._from_IDs(IDs, correlations=True)[1]
+        return ChemicalConstantsPackage._from_IDs(IDs, databank=databank, correlations=True)[1]
     try:
         correlations_from_IDs.__func__.__doc__ = correlations_from_IDs.__func__.__doc__ %(warn_chemicals_msg)
     except:
         pass
 
     @staticmethod
-    def from_IDs(IDs):
+    def from_IDs(IDs, databank=None):
         r'''Method to construct a new `ChemicalConstantsPackage` and
         `PropertyCorrelationsPackage` with loaded
         parameters from the `chemicals library <https://github.com/CalebBell/chemicals>`_,
@@ -531,6 +651,10 @@ class ChemicalConstantsPackage(object):
             Identifying strings for each compound;
             most identifiers are accepted and all inputs are documented in
             :obj:`chemicals.identifiers.search_chemical`, [-]
+        databank : CompiledDatabank, optional
+            A compiled databank to load the chemicals from instead of the
+            `chemicals` library, when all of them are in it; see
+            :obj:`thermo.database.compile_databank`, [-]
 
         Returns
         -------
@@ -541,6 +665,11 @@ class ChemicalConstantsPackage(object):
 
         Notes
         -----
+        If :obj:`thermo.chemical_package.caching` is enabled, a copy of the
+        constants and correlations of each chemical is kept after they are
+        loaded, and a new copy of them is returned when the chemical is
+        requested again; no objects are shared between packages. See
+        :obj:`ChemicalConstantsPackage.clear_cache`.
 
         .. warning::
             %s
@@ -549,7 +678,7 @@ class ChemicalConstantsPackage(object):
         --------
         >>> constants, correlations = ChemicalConstantsPackage.from_IDs(IDs=['water', 'decane'])
         '''
-        return ChemicalConstantsPackage._from_IDs(IDs, correlations=True)
+        return ChemicalConstantsPackage._from_IDs(IDs, databank=databank, correlations=True)
 
     try:
         from_IDs.__func__.__doc__ = from_IDs.__func__.__doc__ %(warn_chemicals_msg)
@@ -557,7 +686,106 @@ class ChemicalConstantsPackage(object):
         pass
 
     @staticmethod
-    def _from_IDs(IDs, correlations=False):
+    def clear_cache(IDs=None):
+        r'''Method to discard the constants and correlations kept by
+        :obj:`ChemicalConstantsPackage.from_IDs` and the related methods.
+        This should be called after changing the data in the `chemicals`
+        library, so the new data is used. Changing the objects returned by
+        those methods does not affect the copies which are kept, and a
+        compiled databank which is written again is detected automatically.
+
+        Parameters
+        ----------
+        IDs : list[str], optional
+            Identifying strings for each compound to discard; all compounds
+            are discarded if not provided, [-]
+
+        Examples
+        --------
+        >>> ChemicalConstantsPackage.clear_cache(['water'])
+        >>> ChemicalConstantsPackage.clear_cache()
+        '''
+        if IDs is None:
+            _from_IDs_cache.clear()
+            return
+        CASs = set(CAS_from_any(ID) for ID in IDs)
+        for key in list(_from_IDs_cache.keys()):
+            if key[0] in CASs:
+                del _from_IDs_cache[key]
+
+    @staticmethod
+    def _from_IDs(IDs, correlations=False, databank=None):
+        if databank is not None and not all(ID in databank for ID in IDs):
+            databank = None
+        if not caching:
+            return ChemicalConstantsPackage._load_IDs(IDs, correlations, databank)
+
+        # The cached pieces depend on where the data was loaded from
+        if databank is None:
+            source = (None, chemical.property_lock)
+            CASs = [CAS_from_any(ID) for ID in IDs]
+        else:
+            from thermo.database import databank_file
+            source = (databank.path, os.path.getmtime(os.path.join(databank.path, databank_file)),
+                      chemical.property_lock)
+            databank_CASs = databank.objects['CASs']
+            CASs = [databank_CASs[databank.index(ID)] for ID in IDs]
+
+        # The cache holds pickled copies only, so nothing returned from it is
+        # shared with another package or with the cache itself
+        entries, missing = {}, []
+        for CAS in CASs:
+            key = (CAS, source)
+            if key in entries:
+                continue
+            try:
+                entry = _from_IDs_cache[key]
+            except KeyError:
+                missing.append(CAS)
+                continue
+            if correlations and entry[1] is None:
+                missing.append(CAS)
+                continue
+            _from_IDs_cache.move_to_end(key)
+            entries[key] = entry
+
+        fresh = {}
+        if missing:
+            loaded = ChemicalConstantsPackage._load_IDs(missing, correlations, databank)
+            new_constants, new_correlations = loaded if correlations else (loaded, None)
+            for i, CAS in enumerate(missing):
+                values = {k: getattr(new_constants, k)[i] for k in ChemicalConstantsPackage.properties}
+                objs = None
+                if correlations:
+                    objs = {k: getattr(new_correlations, k)[i] for k in PropertyCorrelationsPackage.pure_correlations}
+                key = (CAS, source)
+                fresh[key] = (values, objs)
+                entries[key] = _from_IDs_cache[key] = (dumps(values, HIGHEST_PROTOCOL),
+                                                       None if objs is None else dumps(objs, HIGHEST_PROTOCOL))
+            while len(_from_IDs_cache) > max_cached_chemicals:
+                _from_IDs_cache.popitem(last=False)
+
+        gathered = []
+        for CAS in CASs:
+            key = (CAS, source)
+            try:
+                # Chemicals just loaded are handed out once as they are
+                gathered.append(fresh.pop(key))
+            except KeyError:
+                values, objs = entries[key]
+                gathered.append((loads(values), loads(objs) if correlations else None))
+
+        constants = ChemicalConstantsPackage(**{k: [entry[0][k] for entry in gathered]
+                                                for k in ChemicalConstantsPackage.properties})
+        if not correlations:
+            return constants
+        kwargs = {k: [entry[1][k] for entry in gathered] for k in PropertyCorrelationsPackage.pure_correlations}
+        return constants, PropertyCorrelationsPackage(constants, **kwargs)
+
+    @staticmethod
+    def _load_IDs(IDs, correlations=False, databank=None):
+        if databank is not None:
+            return databank.from_IDs(IDs, correlations=correlations)
 
         # Properties which were wrong from Mixture, Chemical: Parachor, solubility_parameter
         N = len(IDs)
@@ -594,9 +822,22 @@ class ChemicalConstantsPackage(object):
                 Zcs[i] = Vcs[i]*Pcs[i]/(R*Tcs[i])
             except:
                 pass
-        VaporPressures = [VaporPressure(Tb=Tbs[i], Tc=Tcs[i], Pc=Pcs[i], omega=omegas[i], CASRN=CASs[i],
-                                        poly_fit=get_chemical_constants(CASs[i], 'VaporPressure'))
-                            for i in range(N)]
+
+        def fit(i, name):
+            if name == 'VolumeGases':
+                return {}
+            key = name[:-2] if name.endswith('Gases') else name[:-1]
+            return {'poly_fit': get_chemical_constants(CASs[i], key)}
+
+        # Correlations are constructed as soon as the constants they need are
+        # known, as many constants are evaluated from them
+        c = SimpleNamespace(CASs=CASs, MWs=MWs, Tms=Tms, Tbs=Tbs, Tcs=Tcs, Pcs=Pcs, Vcs=Vcs,
+                            Zcs=Zcs, omegas=omegas, dipoles=dipoles, Tts=Tts, Pts=Pts,
+                            similarity_variables=similarity_variables)
+        built = _pure_correlations(c, fit, ('VaporPressures', 'EnthalpyVaporizations',
+                                            'VolumeGases', 'VolumeLiquids'))
+        VaporPressures, EnthalpyVaporizations = built['VaporPressures'], built['EnthalpyVaporizations']
+        VolumeGases, VolumeLiquids = built['VolumeGases'], built['VolumeLiquids']
         Psat_298s = [VaporPressures[i].T_dependent_property(298.15) for i in range(N)]
 
         phase_STPs = [identify_phase(T=298.15, P=101325., Tm=Tms[i], Tb=Tbs[i], Tc=Tcs[i], Psat=Psat_298s[i]) for i in range(N)]
@@ -613,11 +854,6 @@ class ChemicalConstantsPackage(object):
         Hfus_Tms = [Hfus(CAS) for CAS in CASs]
         Hfus_Tms_mass = [Hfus*1000.0/MW if Hfus is not None else None for Hfus, MW in zip(Hfus_Tms, MWs)]
 
-        EnthalpyVaporizations = [EnthalpyVaporization(CASRN=CAS, Tb=Tb, Tc=Tc, Pc=Pc, omega=omega, similarity_variable=sv,
-                                                      poly_fit=get_chemical_constants(CAS, 'EnthalpyVaporization'))
-                                 for CAS, Tb, Tc, Pc, sv, omega in zip(CASs, Tbs, Tcs, Pcs, similarity_variables, omegas)]
-
-
         Hvap_Tbs = [o.T_dependent_property(Tb) if Tb else None for o, Tb, in zip(EnthalpyVaporizations, Tbs)]
         Hvap_Tbs_mass =  [Hvap*1000.0/MW if Hvap is not None else None for Hvap, MW in zip(Hvap_Tbs, MWs)]
 
@@ -635,27 +871,12 @@ class ChemicalConstantsPackage(object):
 
 
 
-        enclosed_eoss = []
-        for i in range(N):
-            try:
-                enclosed_eoss.append([PR(T=298.15, P=101325.0, Tc=Tcs[i], Pc=Pcs[i], omega=omegas[i])])
-            except:
-                enclosed_eoss.append(None)
-        VolumeGases = [VolumeGas(MW=MWs[i], Tc=Tcs[i], Pc=Pcs[i],
-                                   omega=omegas[i], dipole=dipoles[i],
-                                   eos=enclosed_eoss[i], CASRN=CASs[i]) for i in range(N)]
         Vmg_STPs = [VolumeGases[i].TP_dependent_property(298.15, 101325.0)
                    for i in range(N)]
         rhog_STPs = [1.0/V if V is not None else None for V in Vmg_STPs]
         rhog_STPs_mass = [1e-3*MW/V if V is not None else None for V, MW in zip(Vmg_STPs, MWs)]
 
 
-        VolumeLiquids = [VolumeLiquid(MW=MWs[i], Tb=Tbs[i], Tc=Tcs[i],
-                          Pc=Pcs[i], Vc=Vcs[i], Zc=Zcs[i], omega=omegas[i], dipole=dipoles[i],
-                          Psat=VaporPressures[i], CASRN=CASs[i],
-                          eos=enclosed_eoss[i], poly_fit=get_chemical_constants(CASs[i], 'VolumeLiquid'))
-                         for i in range(N)]
-
         Vml_Tbs = [VolumeLiquids[i].T_dependent_property(Tbs[i]) if Tbs[i] is not None else None
                    for i in range(N)]
         Vml_Tms = [VolumeLiquids[i].T_dependent_property(Tms[i]) if Tms[i] is not None else None
@@ -669,7 +890,10 @@ class ChemicalConstantsPackage(object):
         rhol_STPs_mass = [1e-3*MW/V if V is not None else None for V, MW in zip(Vml_STPs, MWs)]
         rhol_60Fs_mass = [1e-3*MW/V if V is not None else None for V, MW in zip(Vml_60Fs, MWs)]
 
-        VolumeSolids = [VolumeSolid(CASRN=CASs[i], MW=MWs[i], Tt=Tts[i], Vml_Tt=Vml_Tms[i], poly_fit=get_chemical_constants(CASs[i], 'VolumeSolid')) for i in range(N)]
+        c.Vml_Tms = Vml_Tms
+        _pure_correlations(c, fit, ('VolumeSolids', 'HeatCapacityGases', 'HeatCapacitySolids',
+                                    'HeatCapacityLiquids', 'EnthalpySublimations'), built)
+        VolumeSolids, EnthalpySublimations = built['VolumeSolids'], built['EnthalpySublimations']
         Vms_Tms = [VolumeSolids[i].T_dependent_property(Tms[i]) if Tms[i] is not None else None for i in range(N)]
         rhos_Tms = [1.0/V if V is not None else None for V in Vms_Tms]
         rhos_Tms_mass = [1e-3*MW/V if V is not None else None for V, MW in zip(Vms_Tms, MWs)]
@@ -730,23 +954,6 @@ class ChemicalConstantsPackage(object):
 
 
 
-        HeatCapacityGases = [HeatCapacityGas(CASRN=CASs[i], MW=MWs[i], similarity_variable=similarity_variables[i],
-                                             poly_fit=get_chemical_constants(CASs[i], 'HeatCapacityGas')) for i in range(N)]
-
-        HeatCapacitySolids = [HeatCapacitySolid(CASRN=CASs[i], MW=MWs[i], similarity_variable=similarity_variables[i],
-                                                poly_fit=get_chemical_constants(CASs[i], 'HeatCapacitySolid')) for i in range(N)]
-        HeatCapacityLiquids = [HeatCapacityLiquid(CASRN=CASs[i], MW=MWs[i], similarity_variable=similarity_variables[i], Tc=Tcs[i], omega=omegas[i],
-                                                  Cpgm=HeatCapacityGases[i],
-                                                  poly_fit=get_chemical_constants(CASs[i], 'HeatCapacityLiquid')) for i in range(N)]
-
-
-        EnthalpySublimations = [EnthalpySublimation(CASRN=CASs[i], Tm=Tms[i], Tt=Tts[i],
-                                                       Cpg=HeatCapacityGases[i], Cps=HeatCapacitySolids[i],
-                                                       Hvap=EnthalpyVaporizations[i], poly_fit=get_chemical_constants(CASs[i], 'EnthalpySublimation'))
-                                for i in range(N)]
-
-
-
         Hsub_Tts = [EnthalpySublimations[i](Tts[i]) if Tts[i] is not None else None
                            for i in range(N)]
         Hsub_Tts_mass = [Hsub*1000.0/MW if Hsub is not None else None for Hsub, MW in zip(Hsub_Tts, MWs)]
@@ -797,9 +1004,14 @@ class ChemicalConstantsPackage(object):
 
         load_group_assignments_DDBST()
 
+        # Copied so changing a package's groups does not change the assignments
         UNIFAC_groups = [DDBST_UNIFAC_assignments.get(InChI_Keys[i], None) for i in range(N)]
         UNIFAC_Dortmund_groups = [DDBST_MODIFIED_UNIFAC_assignments.get(InChI_Keys[i], None) for i in range(N)]
         PSRK_groups = [DDBST_PSRK_assignments.get(InChI_Keys[i], None) for i in range(N)]
+        for groups in (UNIFAC_groups, UNIFAC_Dortmund_groups, PSRK_groups):
+            for i in range(N):
+                if groups[i] is not None:
+                    groups[i] = groups[i].copy()
 
         UNIFAC_Rs, UNIFAC_Qs = [None]*N, [None]*N
         for i in range(N):
@@ -813,10 +1025,8 @@ class ChemicalConstantsPackage(object):
         Van_der_Waals_volumes = [Van_der_Waals_volume(UNIFAC_Rs[i]) if UNIFAC_Rs[i] is not None else None for i in range(N)]
         Van_der_Waals_areas = [Van_der_Waals_area(UNIFAC_Qs[i]) if UNIFAC_Qs[i] is not None else None for i in range(N)]
 
-        SurfaceTensions = [SurfaceTension(CASRN=CASs[i], MW=MWs[i], Tb=Tbs[i], Tc=Tcs[i], Pc=Pcs[i], Vc=Vcs[i], Zc=Zcs[i],
-                          omega=omegas[i], StielPolar=StielPolars[i], Hvap_Tb=Hvap_Tbs[i], Vml=VolumeLiquids[i],
-                          Cpl=HeatCapacityLiquids[i], poly_fit=get_chemical_constants(CASs[i], 'SurfaceTension'))
-                                             for i in range(N)]
+        c.StielPolars, c.Hvap_Tbs = StielPolars, Hvap_Tbs
+        SurfaceTensions = _pure_correlations(c, fit, ('SurfaceTensions',), built)['SurfaceTensions']
 
         sigma_STPs = [SurfaceTensions[i].T_dependent_property(298.15) for i in range(N)]
         sigma_Tbs = [SurfaceTensions[i].T_dependent_property(Tbs[i]) if Tbs[i] is not None else None for i in range(N)]
@@ -884,34 +1094,10 @@ class ChemicalConstantsPackage(object):
         if not correlations:
             return constants
 
-        SublimationPressures = [SublimationPressure(CASRN=CASs[i], Tt=Tts[i], Pt=Pts[i], Hsub_t=Hsub_Tts[i],
-                                                    poly_fit=get_chemical_constants(CASs[i], 'SublimationPressure'))
-                                                    for i in range(N)]
-
-        PermittivityLiquids = [PermittivityLiquid(CASRN=CASs[i], poly_fit=get_chemical_constants(CASs[i], 'PermittivityLiquid')) for i in range(N)]
-
-        ViscosityLiquids = [ViscosityLiquid(CASRN=CASs[i], MW=MWs[i], Tm=Tms[i], Tc=Tcs[i], Pc=Pcs[i], Vc=Vcs[i], omega=omegas[i], Psat=VaporPressures[i],
-                                            Vml=VolumeLiquids[i], poly_fit=get_chemical_constants(CASs[i], 'ViscosityLiquid')) for i in range(N)]
-
-        ViscosityGases = [ViscosityGas(CASRN=CASs[i], MW=MWs[i], Tc=Tcs[i], Pc=Pcs[i], Zc=Zcs[i], dipole=dipoles[i],
-                                       Vmg=VolumeGases[i], poly_fit=get_chemical_constants(CASs[i], 'ViscosityGas')) for i in range(N)]
-
-        ThermalConductivityLiquids = [ThermalConductivityLiquid(CASRN=CASs[i], MW=MWs[i], Tm=Tms[i], Tb=Tbs[i], Tc=Tcs[i], Pc=Pcs[i],
-                                                                omega=omegas[i], Hfus=Hfus_Tms[i], poly_fit=get_chemical_constants(CASs[i], 'ThermalConductivityLiquid'))
-                                    for i in range(N)]
-
-        ThermalConductivityGases =[ThermalConductivityGas(CASRN=CASs[i], MW=MWs[i], Tb=Tbs[i], Tc=Tcs[i], Pc=Pcs[i], Vc=Vcs[i],
-                                                          Zc=Zcs[i], omega=omegas[i], dipole=dipoles[i], Vmg=VolumeGases[i],
-                                                          Cpgm=HeatCapacityGases[i], mug=ViscosityGases[i],
-                                                          poly_fit=get_chemical_constants(CASs[i], 'ThermalConductivityGas'))
-                                                          for i in range(N)]
-        properties = PropertyCorrelationsPackage(constants, VaporPressures=VaporPressures, SublimationPressures=SublimationPressures,
-                                                 VolumeGases=VolumeGases, VolumeLiquids=VolumeLiquids, VolumeSolids=VolumeSolids,
-                                                 HeatCapacityGases=HeatCapacityGases, HeatCapacityLiquids=HeatCapacityLiquids, HeatCapacitySolids=HeatCapacitySolids,
-                                                 ViscosityGases=ViscosityGases, ViscosityLiquids=ViscosityLiquids,
-                                                 ThermalConductivityGases=ThermalConductivityGases, ThermalConductivityLiquids=ThermalConductivityLiquids,
-                                                 EnthalpyVaporizations=EnthalpyVaporizations, EnthalpySublimations=EnthalpySublimations,
-                                                 SurfaceTensions=SurfaceTensions, PermittivityLiquids=PermittivityLiquids)
+        _pure_correlations(constants, fit, ('SublimationPressures', 'PermittivityLiquids',
+                                            'ViscosityLiquids', 'ViscosityGases', 'ThermalConductivityLiquids',
+                                            'ThermalConductivityGases'), built)
+        properties = PropertyCorrelationsPackage(constants, **built)
         return constants, properties
 
 
@@ -22,14 +22,20 @@ SOFTWARE.'''
 
 from __future__ import division
 
-__all__ = ['']
+__all__ = ['CompiledDatabank', 'compile_databank']
 
 import os
 import marshal
+from math import isnan, pi
+import numpy as np
+from numpy.polynomial.chebyshev import chebval
+from fluids.numerics import polynomial_offset_scale, trunc_log
+from chemicals.identifiers import CAS_from_any, CAS_to_int
 from chemicals.utils import log, exp
 from chemicals.utils import mixing_simple, none_and_length_check, Vm_to_rho
 from fluids.constants import N_A, k
 from thermo.utils import TDependentProperty, MixtureProperty
+from thermo.utils import CHEB_FIT, EXP_CHEB_FIT, CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU
 from thermo.chemical import ChemicalConstants
 
 
@@ -206,3 +212,348 @@ if not skip:
     if not from_json:
         marshal_rows = marshal.load(open(binary_path, 'rb'))
         loaded_chemicals = loadChemicalConstants(marshal_rows, rows=True)
+
+
+### Compiled, memory-mappable databank
+
+databank_fit_forms = (CHEB_FIT, EXP_CHEB_FIT, CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU)
+'''Forms the correlations of a compiled databank are stored in; the index
+into this tuple is stored as the first value of each coefficient block.'''
+
+databank_correlations = (('VaporPressures', EXP_CHEB_FIT),
+                         ('SublimationPressures', EXP_CHEB_FIT),
+                         ('VolumeLiquids', CHEB_FIT),
+                         ('VolumeSolids', CHEB_FIT),
+                         ('HeatCapacityGases', CHEB_FIT),
+                         ('HeatCapacityLiquids', CHEB_FIT),
+                         ('HeatCapacitySolids', CHEB_FIT),
+                         ('EnthalpyVaporizations', CHEB_FIT_LN_TAU),
+                         ('EnthalpySublimations', CHEB_FIT),
+                         ('ViscosityLiquids', EXP_CHEB_FIT),
+                         ('ViscosityGases', CHEB_FIT),
+                         ('ThermalConductivityLiquids', CHEB_FIT),
+                         ('ThermalConductivityGases', CHEB_FIT),
+                         ('SurfaceTensions', EXP_CHEB_FIT_LN_TAU),
+                         ('PermittivityLiquids', CHEB_FIT))
+'''Temperature-dependent correlations stored in a compiled databank, and the
+preferred form of their fits. Exponential forms fall back to the linear
+ones for properties which are not always positive, and the ln(tau) forms
+fall back to the plain ones when `Tc` is not known.'''
+
+databank_file = 'databank.npy'
+databank_objects_file = 'databank.marshal'
+
+def _cheb_fit_block(obj, form, coefficients, rtol):
+    # Fit the default method of `obj` by Chebyshev interpolation; returns the
+    # block [form index, Tmin, Tmax, Tc, coefficients...], or None if the
+    # method cannot be represented to within `rtol`
+    method = obj.method
+    if method is None:
+        return None
+    Tmin, Tmax = obj.T_limits[method]
+    Tc = getattr(obj, 'Tc', None)
+    ln_tau = form in (CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU)
+    if ln_tau and (Tc is None or Tmin >= Tc):
+        form = CHEB_FIT if form == CHEB_FIT_LN_TAU else EXP_CHEB_FIT
+        ln_tau = False
+    if ln_tau:
+        # Avoid fitting out to ln(0)
+        Tmax = min(Tmax, Tc*(1.0 - 1e-6))
+        xmin, xmax = trunc_log(1.0 - Tmin/Tc), trunc_log(1.0 - Tmax/Tc)
+    else:
+        Tc = float('nan')
+        xmin, xmax = Tmin, Tmax
+    if xmax == xmin:
+        return None
+    offset, scale = polynomial_offset_scale(xmin, xmax)
+
+    # Interpolate at the Chebyshev nodes, and check the fit at the extrema
+    # of the last polynomial which lie between them
+    nodes = np.cos(pi*(np.arange(coefficients) + 0.5)/coefficients)
+    checks = np.cos(pi*np.arange(coefficients + 1)/coefficients)
+    def sample(points):
+        xs = (points - offset)/scale
+        Ts = Tc*(1.0 - np.exp(xs)) if ln_tau else xs
+        return np.array([obj.calculate(T, method) for T in Ts.tolist()], dtype=float)
+    try:
+        values, expect = sample(nodes), sample(checks)
+    except:
+        return None
+    if not (np.all(np.isfinite(values)) and np.all(np.isfinite(expect))):
+        return None
+    exp_form = form in (EXP_CHEB_FIT, EXP_CHEB_FIT_LN_TAU)
+    if exp_form:
+        if np.all(values > 0.0):
+            values = np.log(values)
+        else:
+            form = CHEB_FIT_LN_TAU if ln_tau else CHEB_FIT
+            exp_form = False
+
+    # Chebyshev interpolation through the Chebyshev nodes is a discrete
+    # cosine transform of the values
+    ks = np.arange(coefficients) + 0.5
+    coeffs = np.array([2.0/coefficients*np.dot(values, np.cos(pi*j*ks/coefficients))
+                       for j in range(coefficients)])
+    coeffs[0] *= 0.5
+    fit = chebval(checks, coeffs)
+    if exp_form:
+        fit = np.exp(fit)
+    # Exponential fits are checked for relative error; the others relative to
+    # the largest value, as properties such as heat capacity go to zero
+    scale = np.abs(expect) if exp_form else np.max(np.abs(expect))
+    if not np.all(np.abs(fit - expect) <= rtol*scale):
+        return None
+    # Trailing coefficients which are together well below the tolerance only
+    # cost time to evaluate; they are stored as NaN
+    tail_tol = 0.1*rtol if exp_form else 0.1*rtol*scale
+    tails = np.cumsum(np.abs(coeffs[::-1]))[::-1]
+    N = 1
+    while N < coefficients and tails[N] > tail_tol:
+        N += 1
+    coeffs[N:] = np.nan
+    return [float(databank_fit_forms.index(form)), Tmin, Tmax, Tc] + coeffs.tolist()
+
+
+def compile_databank(IDs, path, coefficients=64, rtol=1e-6):
+    r'''Compile the constants and correlations of a set of chemicals into a
+    binary databank which can be memory-mapped with :obj:`CompiledDatabank`.
+    Values are computed with
+    :obj:`ChemicalConstantsPackage.from_IDs <thermo.chemical_package.ChemicalConstantsPackage.from_IDs>`.
+
+    The databank is a directory holding a NumPy structured array indexed by
+    the integer CAS number, with one float column for each numerical
+    constant and a fixed-width block for each correlation. The default
+    method of each temperature-dependent correlation is stored as a Chebyshev
+    fit over its range, if the fit reproduces it to within `rtol`; other
+    correlations are created from the full databanks when the databank is
+    loaded. The remaining constants (names, formulas, group
+    assignments, and so on) are stored in a marshal file next to it.
+
+    Parameters
+    ----------
+    IDs : list[str]
+        Identifying strings for each compound, [-]
+    path : str
+        Directory to write the databank to; created if it does not exist, [-]
+    coefficients : int, optional
+        Number of Chebyshev coefficients in each correlation block, [-]
+    rtol : float, optional
+        Relative tolerance a fit must meet at the extrema between its
+        interpolation points to be stored, [-]
+
+    Returns
+    -------
+    databank : CompiledDatabank
+        The memory-mapped databank, [-]
+    '''
+    from thermo.chemical_package import ChemicalConstantsPackage
+    constants, correlations = ChemicalConstantsPackage.from_IDs(IDs)
+    N = len(IDs)
+    CAS_ints = [CAS_to_int(CAS) for CAS in constants.CASs]
+    order = sorted(range(N), key=lambda i: CAS_ints[i])
+
+    float_props, object_props = [], []
+    for prop in ChemicalConstantsPackage.properties:
+        values = getattr(constants, prop)
+        if all(v is None or (type(v) in (float, int)) for v in values):
+            float_props.append(prop)
+        else:
+            object_props.append(prop)
+
+    dtype = [('CAS', np.int64)] + [(prop, np.float64) for prop in float_props]
+    dtype += [(name, np.float64, (4 + coefficients,)) for name, _ in databank_correlations]
+    table = np.zeros(N, dtype=dtype)
+    for row, i in enumerate(order):
+        table['CAS'][row] = CAS_ints[i]
+        for prop in float_props:
+            v = getattr(constants, prop)[i]
+            table[prop][row] = float('nan') if v is None else v
+        for name, form in databank_correlations:
+            block = _cheb_fit_block(getattr(correlations, name)[i], form, coefficients, rtol)
+            table[name][row] = float('nan') if block is None else block
+
+    objects = {prop: [getattr(constants, prop)[i] for i in order] for prop in object_props}
+    if not os.path.exists(path):
+        os.makedirs(path)
+    np.save(os.path.join(path, databank_file), table)
+    with open(os.path.join(path, databank_objects_file), 'wb') as f:
+        marshal.dump(objects, f)
+    return CompiledDatabank(path)
+
+
+class CompiledDatabank(object):
+    r'''Memory-mapped databank of chemical constants and correlations
+    written by :obj:`compile_databank`. The numerical data is shared through
+    the operating system's page cache between all processes which open the
+    same databank, and only the rows which are requested are read.
+
+    Parameters
+    ----------
+    path : str
+        Directory the databank was written to, [-]
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> databank = compile_databank(['water', 'ethanol'], tempfile.mkdtemp())
+    >>> 'ethanol' in databank, 'methane' in databank
+    (True, False)
+    >>> constants, correlations = databank.from_IDs(['water', 'ethanol'])
+    >>> constants.Tcs
+    [647.14, 514.0]
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.table = np.load(os.path.join(path, databank_file), mmap_mode='r')
+        self.CAS_ints = self.table['CAS']
+        self.correlation_names = [name for name, _ in databank_correlations
+                                  if name in self.table.dtype.names]
+        self.float_props = [name for name in self.table.dtype.names
+                            if name != 'CAS' and name not in self.correlation_names]
+        self.N = len(self.CAS_ints)
+
+    @property
+    def objects(self):
+        try:
+            return self._objects
+        except AttributeError:
+            pass
+        with open(os.path.join(self.path, databank_objects_file), 'rb') as f:
+            self._objects = objects = marshal.load(f)
+        # Common names and CAS numbers can be looked up without the
+        # identifiers database
+        index = {}
+        for i, CAS in enumerate(objects['CASs']):
+            index[CAS] = i
+        for i, name in enumerate(objects['names']):
+            index.setdefault(name.lower(), i)
+        self._ID_index = index
+        return objects
+
+    def index(self, ID):
+        r'''Return the row of a chemical in the databank.
+
+        Parameters
+        ----------
+        ID : str
+            Identifying string for the compound; common names and CAS
+            numbers of chemicals in the databank are looked up directly,
+            everything else through :obj:`chemicals.identifiers.CAS_from_any`, [-]
+
+        Returns
+        -------
+        index : int
+            Row of the chemical, [-]
+        '''
+        self.objects
+        try:
+            return self._ID_index[ID]
+        except KeyError:
+            pass
+        try:
+            return self._ID_index[ID.lower()]
+        except KeyError:
+            pass
+        CAS_int = CAS_to_int(CAS_from_any(ID))
+        i = int(np.searchsorted(self.CAS_ints, CAS_int))
+        if i < self.N and self.CAS_ints[i] == CAS_int:
+            return i
+        raise KeyError("%s is not in the databank" %(ID))
+
+    def __contains__(self, ID):
+        try:
+            self.index(ID)
+            return True
+        except:
+            return False
+
+    def constants(self, IDs):
+        r'''Construct a `ChemicalConstantsPackage` from the databank.
+
+        Parameters
+        ----------
+        IDs : list[str]
+            Identifying strings for each compound, [-]
+
+        Returns
+        -------
+        constants : ChemicalConstantsPackage
+            Constants of the chemicals, [-]
+        '''
+        from thermo.chemical_package import ChemicalConstantsPackage
+        rows = [self.index(ID) for ID in IDs]
+        table = self.table[rows]
+        kwargs = {}
+        for prop in self.float_props:
+            kwargs[prop] = [None if isnan(v) else v for v in table[prop].tolist()]
+        for prop, values in self.objects.items():
+            # Round trip so no dictionaries are shared with other packages
+            kwargs[prop] = marshal.loads(marshal.dumps([values[i] for i in rows]))
+        kwargs['charges'] = [int(v) if v is not None else v for v in kwargs['charges']]
+        return ChemicalConstantsPackage(**kwargs)
+
+    def correlation_fit(self, ID, name):
+        r'''Return the stored fit of a correlation as the keyword argument
+        accepted by the property object.
+
+        Parameters
+        ----------
+        ID : str
+            Identifying string for the compound, [-]
+        name : str
+            Name of the correlation in `PropertyCorrelationsPackage`, such as
+            'VaporPressures', [-]
+
+        Returns
+        -------
+        fit : dict
+            Keyword arguments for the property object, such as
+            {'load_data': False, 'exp_cheb_fit': (Tmin, Tmax, coeffs)}, or an
+            empty dictionary if no fit is stored, [-]
+        '''
+        block = self.table[name][self.index(ID)].tolist()
+        if isnan(block[0]):
+            return {}
+        form = databank_fit_forms[int(block[0])]
+        Tmin, Tmax, Tc = block[1:4]
+        coeffs = [c for c in block[4:] if not isnan(c)]
+        if form in (CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU):
+            return {'load_data': False, form.lower(): (Tmin, Tmax, Tc, coeffs)}
+        return {'load_data': False, form.lower(): (Tmin, Tmax, coeffs)}
+
+    def from_IDs(self, IDs, correlations=True):
+        r'''Construct a `ChemicalConstantsPackage` and a
+        `PropertyCorrelationsPackage` from the databank. Correlations with a
+        stored fit are created without loading any data files; they use the
+        fit as their default method, and keep the estimation methods which
+        only need the constants. Correlations without a stored fit are
+        created from the full databanks.
+
+        Parameters
+        ----------
+        IDs : list[str]
+            Identifying strings for each compound, [-]
+        correlations : bool, optional
+            Whether or not to construct the correlations, [-]
+
+        Returns
+        -------
+        constants : ChemicalConstantsPackage
+            Constants of the chemicals, [-]
+        correlations : PropertyCorrelationsPackage
+            Correlations of the chemicals (only if `correlations` is True), [-]
+        '''
+        from thermo.chemical_package import PropertyCorrelationsPackage, _pure_correlations
+        c = self.constants(IDs)
+        if not correlations:
+            return c
+        CASs = c.CASs
+        correlation_fit = self.correlation_fit
+
+        def fit(i, name):
+            if name == 'VolumeGases':
+                return {'load_data': False}
+            return correlation_fit(CASs[i], name)
+
+        properties = PropertyCorrelationsPackage(c, **_pure_correlations(c, fit))
+        return c, properties
@@ -263,11 +263,13 @@ __all__ = ['GCEOS', 'PR', 'SRK', 'PR78', 'PRSV', 'PRSV2', 'VDW', 'RK',
 
 __all__.extend(['main_derivatives_and_departures',
                 'main_derivatives_and_departures_VDW',
+                'main_derivatives_and_departures_many',
                 'eos_lnphi'])
 
 
+from collections import OrderedDict
 from cmath import log as clog
-from math import isnan, isinf
+from math import isnan, isinf, cos, pi
 from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              roots_cubic_a1, numpy as np, newton,
                              bisect, inf, polyder, chebder, is_micropython,
@@ -275,7 +277,7 @@ from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              horner, horner_and_der, horner_and_der2, derivative,
                              roots_cubic_a2, isclose, NoSolutionError,
                              roots_quartic, deflate_cubic_real_roots,
-                             catanh)
+                             catanh, polynomial_offset_scale)
 
 from fluids.constants import mmHg, R
 
@@ -291,7 +293,8 @@ from thermo.eos_volume import (volume_solutions_mpmath, volume_solutions_mpmath_
                                volume_solutions_halley, volume_solutions_fast,
                                volume_solutions_Cardano, volume_solutions_numpy,
                                volume_solutions_ideal, volume_solutions_a1, volume_solutions_a2,
-                               volume_solutions_doubledouble_float)
+                               volume_solutions_doubledouble_float,
+                               volume_solutions_halley_many)
 from thermo.eos_alpha_functions import (Poly_a_alpha, Twu91_a_alpha, Mathias_Copeman_poly_a_alpha,
                                         TwuSRK95_a_alpha, TwuPR95_a_alpha, Soave_1979_a_alpha,
                                         TWU_a_alpha_common)
@@ -390,6 +393,63 @@ def main_derivatives_and_departures_VDW(T, P, V, b, delta, epsilon, a_alpha,
     return (dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep)
 
 
+def main_derivatives_and_departures_many(T, P, V, b, delta, epsilon, a_alpha,
+                                         da_alpha_dT, d2a_alpha_dT2):
+    r'''Vectorized form of :obj:`main_derivatives_and_departures`, taking
+    and returning NumPy arrays (or scalars, broadcast together). The
+    real part of the complex inverse hyperbolic tangent of the scalar version
+    is calculated as :math:`\frac{1}{2}\ln\left|\frac{1+x}{1-x}\right|`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> res = main_derivatives_and_departures_many(np.array([299.0]), np.array([1e5]),
+    ... np.array([0.00013128]), 0.000109389, 0.00021537, -1.1964711e-08,
+    ... np.array([3.8056296]), np.array([-0.00603]), np.array([1.2e-5]))
+    >>> float(res[5][0]), float(res[6][0])
+    (-30320.77, -88.432)
+    '''
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        epsilon2 = epsilon + epsilon
+        x0 = 1.0/(V - b)
+        x1 = 1.0/(V*(V + delta) + epsilon)
+        x3 = R*T
+        x4 = x0*x0
+        x5 = V + V + delta
+        x6 = x1*x1
+        x7 = a_alpha*x6
+        x8 = P*V
+        x9 = delta*delta
+        x10 = x9 - epsilon2 - epsilon2
+        # Needed for ideal gas model
+        positive = x10 > 0.0
+        x11 = np.where(positive, 1.0/np.sqrt(np.where(positive, x10, 1.0)), 0.0)
+        x11_half = 0.5*x11
+
+        arg = x11*x5
+        x12 = x11*np.log(np.abs((1.0 + arg)/(1.0 - arg)))
+        x14 = 0.5*x5
+        x15 = epsilon2*x11
+        x16 = x11_half*x9
+        x17 = x5*x6
+        dP_dT = R*x0 - da_alpha_dT*x1
+        dP_dV = x5*x7 - x3*x4
+        d2P_dT2 = -d2a_alpha_dT2*x1
+
+        d2P_dV2 = (x7 + x3*x4*x0 - a_alpha*x5*x17*x1)
+        d2P_dV2 = d2P_dV2 + d2P_dV2
+
+        d2P_dTdV = da_alpha_dT*x17 - R*x4
+        H_dep = x12*(T*da_alpha_dT - a_alpha) - x3 + x8
+
+        t1 = (x3*x0/P)
+        S_dep = -R*np.log(t1) + da_alpha_dT*x12
+        x18 = x16 - x15
+        x19 = (x14 + x18)/(x14 - x18)
+        Cv_dep = T*d2a_alpha_dT2*x11*(np.log(x19))
+    return dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep
+
+
 def eos_lnphi(T, P, V, b, delta, epsilon, a_alpha):
     r'''Calculate the log fugacity coefficient of the general cubic equation
     of state form.
@@ -443,6 +503,88 @@ def eos_lnphi(T, P, V, b, delta, epsilon, a_alpha):
     return (P*V*RT_inv + log(RT/(P*(V-b))) - 1.0
             - 2.0*a_alpha*fancy*RT_inv*x0)
 
+# Chebyshev fits of the saturation curve, shared by all EOS objects with the
+# same model; keyed by ((class, Tc, Pc, omega, kwargs hash), Tr limits, rtol)
+# and kept in least recently used order
+_saturation_fits = OrderedDict()
+
+def _cheb_interpolate(f, n, rtol):
+    # Chebyshev interpolation of `f` over [-1, 1], doubling the number of nodes
+    # from `n` until the error at the extrema of the last polynomial, which
+    # include the ends of the range, is under `rtol` for every output. `f`
+    # returns a list of values. Trailing coefficients well under the
+    # tolerance are dropped. Returns None if the tolerance cannot be met.
+    while n <= 128:
+        values = [f(cos(pi*(k + 0.5)/n)) for k in range(n)]
+        checks = [cos(pi*k/n) for k in range(n + 1)]
+        expect = [f(x) for x in checks]
+        # Interpolation through the Chebyshev nodes is a discrete cosine
+        # transform of the values
+        fits = []
+        for i in range(len(values[0])):
+            coeffs = [2.0/n*sum(values[k][i]*cos(pi*j*(k + 0.5)/n) for k in range(n))
+                      for j in range(n)]
+            coeffs[0] *= 0.5
+            fits.append(coeffs)
+        if all(abs(chebval(x, coeffs) - expect[k][i]) <= rtol
+               for i, coeffs in enumerate(fits) for k, x in enumerate(checks)):
+            for i, coeffs in enumerate(fits):
+                tail, N = 0.0, n
+                while N > 1 and tail + abs(coeffs[N - 1]) < 0.1*rtol:
+                    tail += abs(coeffs[N - 1])
+                    N -= 1
+                fits[i] = coeffs[:N]
+            return fits
+        n *= 2
+    return None
+
+def _saturation_fit_build(eos, Tr_low, Tr_high, rtol):
+    # Fit ln(Psat/Pc), ln(phi_sat), ln(V_l_sat) and ln(V_g_sat) in
+    # s = sqrt(1 - Tr); the saturated volumes go as s near the critical point,
+    # so they are smooth in s but not in Tr. Tsat is fit as Tc/Tsat in
+    # ln(Psat/Pc), from the inverse of the ln(Psat/Pc) fit. Returns None if
+    # the rigorous solution fails anywhere in the range or the fits cannot
+    # meet `rtol`.
+    Tc, Pc = eos.Tc, eos.Pc
+    s_low, s_high = sqrt(1.0 - Tr_high), sqrt(1.0 - Tr_low)
+    offset, scale = polynomial_offset_scale(s_low, s_high)
+    def rigorous(x):
+        s = (x - offset)/scale
+        T = Tc*(1.0 - s*s)
+        P = eos.Psat(T, polish=True)
+        e = eos.to_TP(T, P)
+        return [log(P/Pc), log(e.phi_l), log(e.V_l), log(e.V_g)]
+    try:
+        fits = _cheb_interpolate(rigorous, 16, rtol)
+    except Exception:
+        return None
+    if fits is None:
+        return None
+
+    lnPr_coeffs = fits[0]
+    dlnPr_coeffs = chebder(lnPr_coeffs)
+    # x = 1 is s_high, the low temperature end
+    lnPr_low, lnPr_high = chebval(1.0, lnPr_coeffs), chebval(-1.0, lnPr_coeffs)
+    inv_offset, inv_scale = polynomial_offset_scale(lnPr_low, lnPr_high)
+    def inverse(y):
+        lnPr = (y - inv_offset)/inv_scale
+        # Newton's method in x, from ln(Pr) linear in 1/Tr through the
+        # critical point
+        Tr = 1.0/(1.0 + lnPr*(1.0/Tr_low - 1.0)/lnPr_low)
+        x = min(max(offset + scale*sqrt(max(1.0 - Tr, 0.0)), -1.0), 1.0)
+        for _ in range(100):
+            step = (chebval(x, lnPr_coeffs) - lnPr)/chebval(x, dlnPr_coeffs)
+            x = min(max(x - step, -1.0), 1.0)
+            if abs(step) < 1e-14:
+                break
+        s = (x - offset)/scale
+        return [1.0/(1.0 - s*s)]
+    inv_fits = _cheb_interpolate(inverse, 8, rtol)
+    if inv_fits is None:
+        return None
+    return (Tr_low, Tr_high, offset, scale, lnPr_low, lnPr_high, inv_offset,
+            inv_scale, inv_fits[0]) + tuple(fits)
+
 class GCEOS(object):
     r'''Class for solving a generic Pressure-explicit three-parameter cubic
     equation of state. Does not implement any parameters itself; must be
@@ -870,6 +1012,23 @@ class GCEOS(object):
     P_zero_g_cheb_limits = (0.0, 0.0)
     Psat_cheb_range = (0.0, 0.0)
 
+    saturation_fit = False
+    '''Whether or not to approximate `Psat`, `Tsat`, `phi_sat`, `V_l_sat` and
+    `V_g_sat` with Chebyshev fits of the rigorous saturation curve when they
+    are called with `polish=False`. The fits are built the first time they
+    are needed for a model, and shared by all objects of the same class with
+    the same `Tc`, `Pc`, `omega` and `kwargs`. Set on a class or on `GCEOS`
+    to enable it.'''
+    saturation_fit_rtol = 1e-9
+    '''Maximum relative error of the saturation fits; a model which cannot be
+    fit to this tolerance is not fit at all.'''
+    saturation_fit_Tr_limits = (0.3, 0.9999)
+    '''Range of reduced temperature covered by the saturation fits; outside
+    it the normal methods are used.'''
+    saturation_fit_models = 256
+    '''Maximum number of models whose saturation fits are kept; the least
+    recently used fits are discarded first.'''
+
     main_derivatives_and_departures = staticmethod(main_derivatives_and_departures)
 
     c1 = None
@@ -941,6 +1100,9 @@ class GCEOS(object):
             Hash of the object, [-]
         '''
         d = self.__dict__
+        if '_saturation_fit_key' in d:
+            d = d.copy()
+            del d['_saturation_fit_key']
         ans = hash_any_primitive((self.__class__.__name__, d))
         return ans
 
@@ -1029,6 +1191,7 @@ class GCEOS(object):
             del d['kwargs']
         except:
             pass
+        d.pop('_saturation_fit_key', None)
         d["py/object"] = self.__full_path__
         d['json_version'] = 1
         return d
@@ -1452,6 +1615,138 @@ class GCEOS(object):
 
 
 
+    def evaluate_many(self, Ts, Ps):
+        r'''Method to solve the pure component EOS at many temperatures and
+        pressures at once, without creating an object for each state. The
+        results are the same as those of the EOS objects at each state, as
+        are the names of the results.
+
+        The alpha function is evaluated once for each unique temperature;
+        the volumes are solved with
+        :obj:`volume_solutions_halley_many <thermo.eos_volume.volume_solutions_halley_many>`
+        and the derivatives and departure functions with
+        :obj:`main_derivatives_and_departures_many`. EOSs with other volume
+        or departure function solvers are evaluated one state at a time for
+        those steps.
+
+        Parameters
+        ----------
+        Ts : ndarray[float]
+            Temperatures, [K]
+        Ps : ndarray[float]
+            Pressures, [Pa]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Results of each state; the keys are 'T', 'P', 'phase' ('l', 'g',
+            'l/g', or '' if no volume was found), 'a_alpha', 'da_alpha_dT',
+            'd2a_alpha_dT2', and for each of the liquid and gas roots (with
+            suffixes '_l' and '_g') 'V', 'Z', 'PIP', 'dP_dT', 'dP_dV',
+            'dV_dT', 'dV_dP', 'dT_dV', 'dT_dP', 'd2P_dT2', 'd2P_dV2',
+            'd2P_dTdV', 'H_dep', 'S_dep', 'G_dep', 'Cp_dep', 'Cv_dep',
+            'lnphi', 'phi' and 'fugacity'. Values for roots which do not
+            exist at a state are NaN, [-]
+
+        Notes
+        -----
+        Inputs of different shapes are broadcast together and flattened.
+        The special handling of a state exactly at the critical point is not
+        performed.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+        >>> res = eos.evaluate_many(np.array([300.0, 400.0, 500.0]), np.array([1e5, 1e5, 1e6]))
+        >>> res['phase']
+        array(['l/g', 'l/g', 'g'], dtype='<U3')
+        >>> res['H_dep_g']
+        array([ -394.147,  -250.648, -1924.730])
+        >>> res['V_l'][0] == eos.V_l
+        True
+        '''
+        if self.multicomponent:
+            raise NotImplementedError("Only pure component EOSs are supported")
+        Ts, Ps = [np.ravel(v) for v in np.broadcast_arrays(np.asarray(Ts, dtype=float),
+                                                           np.asarray(Ps, dtype=float))]
+        n = Ts.size
+        b, delta, epsilon = self.b, self.delta, self.epsilon
+
+        T_unique, inverse = np.unique(Ts, return_inverse=True)
+        alphas = np.array([self.a_alpha_and_derivatives_pure(float(T)) for T in T_unique.tolist()])
+        alphas = alphas.reshape((T_unique.size, 3))[inverse.ravel()]
+        a_alphas, da_alpha_dTs, d2a_alpha_dT2s = alphas[:, 0], alphas[:, 1], alphas[:, 2]
+
+        if type(self).volume_solutions is volume_solutions_halley:
+            Vs = volume_solutions_halley_many(Ts, Ps, b, delta, epsilon, a_alphas)
+            good = Vs > b
+        else:
+            Vs = np.zeros((n, 3))
+            good = np.zeros((n, 3), dtype=bool)
+            for i in range(n):
+                for j, V in enumerate(self.volume_solutions(float(Ts[i]), float(Ps[i]), b, delta, epsilon,
+                                                            float(a_alphas[i]))):
+                    if V.real > b and (V.real == 0.0 or abs(V.imag/V.real) < 1E-12):
+                        Vs[i, j], good[i, j] = V.real, True
+        with np.errstate(invalid='ignore'):
+            V_max = np.where(good, Vs, -inf).max(axis=1)
+            V_min = np.where(good, Vs, inf).min(axis=1)
+        found = good.any(axis=1)
+        two = found & (V_min != V_max)
+        one = found & ~two
+
+        props = ('V', 'Z', 'PIP', 'dP_dT', 'dP_dV', 'dV_dT', 'dV_dP', 'dT_dV', 'dT_dP',
+                 'd2P_dT2', 'd2P_dV2', 'd2P_dTdV', 'H_dep', 'S_dep', 'G_dep', 'Cp_dep',
+                 'Cv_dep', 'lnphi', 'phi', 'fugacity')
+        generic = type(self).main_derivatives_and_departures is main_derivatives_and_departures
+
+        def evaluate(V):
+            V = np.where(found, V, np.nan)
+            if generic:
+                ders = main_derivatives_and_departures_many(Ts, Ps, V, b, delta, epsilon, a_alphas,
+                                                            da_alpha_dTs, d2a_alpha_dT2s)
+            else:
+                ders = np.full((n, 8), np.nan)
+                for i in np.nonzero(found)[0].tolist():
+                    ders[i] = self.main_derivatives_and_departures(
+                        float(Ts[i]), float(Ps[i]), float(V[i]), b, delta, epsilon, float(a_alphas[i]),
+                        float(da_alpha_dTs[i]), float(d2a_alpha_dT2s[i]))
+                ders = ders.T
+            dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep = ders
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                dV_dP = 1.0/dP_dV
+                dT_dP = 1.0/dP_dT
+                dV_dT = -dP_dT*dV_dP
+                dT_dV = 1.0/dV_dT
+                Z = Ps*V*R_inv/Ts
+                Cp_dep = Ts*dP_dT*dV_dT + Cv_dep - R
+                G_dep = H_dep - Ts*S_dep
+                PIP = V*(d2P_dTdV*dT_dP - d2P_dV2*dV_dP)
+                lnphi = G_dep*R_inv/Ts
+                phi = np.minimum(np.exp(lnphi), 1e308)
+                fugacity = Ps*phi
+            return (V, Z, PIP, dP_dT, dP_dV, dV_dT, dV_dP, dT_dV, dT_dP, d2P_dT2, d2P_dV2,
+                    d2P_dTdV, H_dep, S_dep, G_dep, Cp_dep, Cv_dep, lnphi, phi, fugacity)
+
+        high = evaluate(V_max)
+        low = evaluate(V_min) if two.any() else high
+        # 1 + 1e-14 - allow a few dozen unums of toleranve to keep ideal gas model a gas
+        one_liquid = one & (high[2] > 1.00000000000001)
+        one_gas = one & ~one_liquid
+        is_l, is_g = two | one_liquid, two | one_gas
+
+        phase = np.full(n, '', dtype='<U3')
+        phase[one_liquid] = 'l'
+        phase[one_gas] = 'g'
+        phase[two] = 'l/g'
+        results = {'T': Ts, 'P': Ps, 'phase': phase, 'a_alpha': a_alphas,
+                   'da_alpha_dT': da_alpha_dTs, 'd2a_alpha_dT2': d2a_alpha_dT2s}
+        for name, v_high, v_low in zip(props, high, low):
+            results[name + '_l'] = np.where(is_l, np.where(two, v_low, v_high), np.nan)
+            results[name + '_g'] = np.where(is_g, v_high, np.nan)
+        return results
+
     def a_alpha_and_derivatives(self, T, full=True, quick=True,
                                 pure_a_alphas=True):
         r'''Method to calculate :math:`a \alpha` and its first and second
@@ -2708,6 +3003,52 @@ class GCEOS(object):
         full_volumes = [i + 0.0j for i in full_volumes]
         return tuple(sorted(full_volumes, key=sort_fun))
 
+    def _saturation_fit(self):
+        # The saturation fit of this model, building it if needed; None if it
+        # is disabled or could not be built
+        if not self.saturation_fit or self.multicomponent:
+            return None
+        Tr_limits, rtol = self.saturation_fit_Tr_limits, self.saturation_fit_rtol
+        try:
+            model_key = self._saturation_fit_key
+        except AttributeError:
+            # `a`, `b`, `delta` and `epsilon` follow from these, so this
+            # identifies the model like `model_hash` at a fraction of the cost
+            kwargs = self.kwargs
+            model_key = self._saturation_fit_key = (self.__class__, self.Tc, self.Pc, self.omega,
+                                                    hash_any_primitive(kwargs) if kwargs else None)
+        key = (model_key, Tr_limits, rtol)
+        fits = _saturation_fits
+        try:
+            fit = fits[key]
+            fits.move_to_end(key)
+            return fit
+        except KeyError:
+            pass
+        fit = fits[key] = _saturation_fit_build(self, Tr_limits[0], Tr_limits[1], rtol)
+        while len(fits) > self.saturation_fit_models:
+            fits.popitem(last=False)
+        return fit
+
+    def _saturation_fit_value(self, T, i):
+        # Value of fitted logarithm `i` at `T`, or None if it is not available
+        fit = self._saturation_fit()
+        if fit is None:
+            return None
+        Tr = T/self.Tc
+        if not fit[0] <= Tr <= fit[1]:
+            return None
+        return chebval(sqrt(1.0 - Tr), fit[9 + i], fit[2], fit[3])
+
+    def _saturation_fit_Tsat(self, P):
+        # Tsat from the fit, or None if it is not available
+        fit = self._saturation_fit()
+        if fit is None:
+            return None
+        lnPr = log(P/self.Pc)
+        if not fit[4] <= lnPr <= fit[5]:
+            return None
+        return self.Tc/chebval(lnPr, fit[8], fit[6], fit[7])
 
     def Tsat(self, P, polish=False):
         r'''Generic method to calculate the temperature for a specified
@@ -2732,7 +3073,14 @@ class GCEOS(object):
         -----
         It is recommended not to run with `polish=True`, as that will make the
         calculation much slower.
+
+        If :obj:`saturation_fit` is enabled, the Chebyshev fit of `Psat` is
+        inverted instead of solving `Psat` when `polish` is False.
         '''
+        if not polish:
+            Tsat = self._saturation_fit_Tsat(P)
+            if Tsat is not None:
+                return Tsat
         fprime = False
         global curr_err
 
@@ -2889,6 +3237,9 @@ class GCEOS(object):
         No volume solution is needed when `polish=False`; the only external
         call is for the value of `a_alpha`.
 
+        If :obj:`saturation_fit` is enabled, a Chebyshev fit of the rigorous
+        vapor pressure is used instead when `polish` is False.
+
         References
         ----------
         .. [1] Soave, G. "Direct Calculation of Pure-Compound Vapour Pressures
@@ -2898,6 +3249,10 @@ class GCEOS(object):
         Tc, Pc = self.Tc, self.Pc
         if T == Tc:
             return Pc
+        if not polish:
+            lnPr = self._saturation_fit_value(T, 0)
+            if lnPr is not None:
+                return Pc*exp(lnPr)
         a_alpha = self.a_alpha_and_derivatives(T, full=False)
         alpha = a_alpha/self.a
         Tr = T/self.Tc
@@ -3203,7 +3558,14 @@ class GCEOS(object):
         Accuracy is generally around 1e-7. If Tr is under 0.32, the rigorous
         method is always used, but a solution may not exist if both phases
         cannot coexist. If Tr is above 1, likewise a solution does not exist.
+
+        If :obj:`saturation_fit` is enabled, a Chebyshev fit of the rigorous
+        result is used instead when `polish` is False.
         '''
+        if not polish:
+            lnphi = self._saturation_fit_value(T, 1)
+            if lnphi is not None:
+                return exp(lnphi)
         Tr = T/self.Tc
         if polish or not 0.32 <= Tr <= 1.0:
             e = self.to_TP(T=T, P=self.Psat(T, polish=True)) # True
@@ -3297,7 +3659,13 @@ class GCEOS(object):
         -----
         Computes `Psat`, and then uses `volume_solutions` to obtain the three
         possible molar volumes. The lowest value is returned.
+
+        If :obj:`saturation_fit` is enabled, a Chebyshev fit of the rigorous
+        result is used instead.
         '''
+        lnV = self._saturation_fit_value(T, 2)
+        if lnV is not None:
+            return exp(lnV)
         Psat = self.Psat(T)
         a_alpha = self.a_alpha_and_derivatives(T, full=False)
         Vs = self.volume_solutions(T, Psat, self.b, self.delta, self.epsilon, a_alpha)
@@ -3322,7 +3690,13 @@ class GCEOS(object):
         -----
         Computes `Psat`, and then uses `volume_solutions` to obtain the three
         possible molar volumes. The highest value is returned.
+
+        If :obj:`saturation_fit` is enabled, a Chebyshev fit of the rigorous
+        result is used instead.
         '''
+        lnV = self._saturation_fit_value(T, 3)
+        if lnV is not None:
+            return exp(lnV)
         Psat = self.Psat(T)
         a_alpha = self.a_alpha_and_derivatives(T, full=False)
         Vs = self.volume_solutions(T, Psat, self.b, self.delta, self.epsilon, a_alpha)
@@ -41,6 +41,11 @@ Vectorized Alpha Functions
 .. autofunction:: thermo.eos_alpha_functions.PRSV2_a_alphas_vectorized
 .. autofunction:: thermo.eos_alpha_functions.APISRK_a_alphas_vectorized
 .. autofunction:: thermo.eos_alpha_functions.RK_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Twu91_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_1979_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_Copeman_poly_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuPR95_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuSRK95_a_alphas_vectorized
 
 Vectorized Alpha Functions With Derivatives
 -------------------------------------------
@@ -50,6 +55,11 @@ Vectorized Alpha Functions With Derivatives
 .. autofunction:: thermo.eos_alpha_functions.PRSV2_a_alpha_and_derivatives_vectorized
 .. autofunction:: thermo.eos_alpha_functions.APISRK_a_alpha_and_derivatives_vectorized
 .. autofunction:: thermo.eos_alpha_functions.RK_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Twu91_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_1979_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuPR95_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuSRK95_a_alpha_and_derivatives_vectorized
 
 
 Class With Alpha Functions
@@ -202,6 +212,11 @@ __all__ = [
            'PRSV_a_alphas_vectorized', 'PRSV_a_alpha_and_derivatives_vectorized',
            'PRSV2_a_alphas_vectorized', 'PRSV2_a_alpha_and_derivatives_vectorized',
            'APISRK_a_alphas_vectorized', 'APISRK_a_alpha_and_derivatives_vectorized',
+           'Twu91_a_alphas_vectorized', 'Twu91_a_alpha_and_derivatives_vectorized',
+           'Soave_1979_a_alphas_vectorized', 'Soave_1979_a_alpha_and_derivatives_vectorized',
+           'Mathias_Copeman_poly_a_alphas_vectorized', 'Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized',
+           'TwuPR95_a_alphas_vectorized', 'TwuPR95_a_alpha_and_derivatives_vectorized',
+           'TwuSRK95_a_alphas_vectorized', 'TwuSRK95_a_alpha_and_derivatives_vectorized',
 
 'a_alpha_base', 'Poly_a_alpha', 'Soave_1972_a_alpha', 'Heyen_a_alpha',
 'Harmens_Knapp_a_alpha', 'Mathias_1983_a_alpha', 'Mathias_Copeman_untruncated_a_alpha',
@@ -225,7 +240,7 @@ from fluids.numerics import (horner, horner_and_der2, numpy as np)
 from chemicals.utils import log, exp, sqrt, copysign
 
 try:
-    array = np.array
+    array, zeros = np.array, np.zeros
 except:
     pass
 
@@ -1141,6 +1156,501 @@ def APISRK_a_alpha_and_derivatives_vectorized(T, Tcs, ais, S1s, S2s, a_alphas=No
         d2a_alpha_dT2s[i] = ais[i]*(-x4*(-x2*x7 + x5 + x7) + x6*x6)*c0
     return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
 
+def Twu91_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs, a_alphas=None):
+    r'''Calculates the `a_alpha` terms for the Twu (1991) alpha function
+    given the critical temperatures `Tcs`, constants `ais`, and
+    the three coefficients of each component in `alpha_coeffs`.
+
+    .. math::
+        a_i\alpha(T)_i = a_i \left(\frac{T}{T_{c,i}}\right)^{c_{3,i} \left(
+        c_{2,i} - 1\right)} e^{c_{1,i} \left(- \left(\frac{T}{T_{c,i}}
+        \right)^{c_{2,i} c_{3,i}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Twu91 coefficients `c1`, `c2`, and `c3` of each component, [-]
+    a_alphas : list[float], optional
+        Vector for pure component `a_alpha` terms in the cubic EOS to be
+        calculated and stored in, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Twu91_a_alphas_vectorized(300.0, Tcs=[512.5, 647.14], ais=[1.0244, 0.6044],
+    ... alpha_coeffs=[[0.6949, 0.9199, 1.7041], [0.3959, 0.8609, 2.2039]])
+    [1.635506519, 1.036647795]
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    for i in range(N):
+        c0, c1, c2 = alpha_coeffs[i][0], alpha_coeffs[i][1], alpha_coeffs[i][2]
+        Tr = T/Tcs[i]
+        a_alphas[i] = ais[i]*(Tr**(c2*(c1 - 1.0))*exp(c0*(1.0 - Tr**(c1*c2))))
+    return a_alphas
+
+def Twu91_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs, a_alphas=None,
+                                             da_alpha_dTs=None, d2a_alpha_dT2s=None):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Twu (1991) alpha function given the critical
+    temperatures `Tcs`, constants `ais`, and the three coefficients of each
+    component in `alpha_coeffs`.
+
+    .. math::
+        a_i\alpha(T)_i = a_i \left(\frac{T}{T_{c,i}}\right)^{c_{3,i} \left(
+        c_{2,i} - 1\right)} e^{c_{1,i} \left(- \left(\frac{T}{T_{c,i}}
+        \right)^{c_{2,i} c_{3,i}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Twu91 coefficients `c1`, `c2`, and `c3` of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Twu91_a_alpha_and_derivatives_vectorized(300.0, Tcs=[512.5, 647.14], ais=[1.0244, 0.6044],
+    ... alpha_coeffs=[[0.6949, 0.9199, 1.7041], [0.3959, 0.8609, 2.2039]])
+    ([1.635506519, 1.036647795], [-0.003309267647, -0.001662943194], [4.323206375e-06, 4.3932e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    if da_alpha_dTs is None:
+        da_alpha_dTs = [0.0]*N
+    if d2a_alpha_dT2s is None:
+        d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        c0, c1, c2 = alpha_coeffs[i][0], alpha_coeffs[i][1], alpha_coeffs[i][2]
+        Tr = T/Tcs[i]
+        x1 = c1 - 1.0
+        x2 = c2*x1
+        x3 = c1*c2
+        x4 = Tr**x3
+        x5 = ais[i]*Tr**x2*exp(-c0*(x4 - 1.0))
+        x6 = c0*x4
+        x7 = c1*x6
+        x8 = c2*x5
+        x9 = c1*c1*c2
+        a_alphas[i] = x5
+        da_alpha_dTs[i] = x8*(x1 - x7)*T_inv
+        d2a_alpha_dT2s[i] = (x8*(c0*c0*x4*x4*x9 - c1 + c2*x1*x1
+                                 - 2.0*x2*x7 - x6*x9 + x7 + 1.0)*T_inv*T_inv)
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Soave_1979_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs, a_alphas=None):
+    r'''Calculates the `a_alpha` terms for the Soave (1979) alpha function
+    given the critical temperatures `Tcs`, constants `ais`, and
+    the `M` and `N` coefficients of each component in `alpha_coeffs`.
+
+    .. math::
+        a_i\alpha(T)_i = a_i\left[1 + (1 - T_{r,i})\left(M_i + \frac{N_i}
+        {T_{r,i}}\right)\right]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Soave (1979) coefficients `M` and `N` of each component, [-]
+    a_alphas : list[float], optional
+        Vector for pure component `a_alpha` terms in the cubic EOS to be
+        calculated and stored in, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Soave_1979_a_alphas_vectorized(300.0, Tcs=[507.6, 617.7], ais=[2.6, 5.0],
+    ... alpha_coeffs=[[0.9, 0.3], [1.0, 0.4]])
+    [4.096781277, 9.689636717]
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    for i in range(N):
+        Tr = T/Tcs[i]
+        M, N_coeff = alpha_coeffs[i][0], alpha_coeffs[i][1]
+        a_alphas[i] = ais[i]*(1.0 + (1.0 - Tr)*(M + N_coeff/Tr))
+    return a_alphas
+
+def Soave_1979_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs, a_alphas=None,
+                                                  da_alpha_dTs=None, d2a_alpha_dT2s=None):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Soave (1979) alpha function given the critical
+    temperatures `Tcs`, constants `ais`, and the `M` and `N` coefficients of
+    each component in `alpha_coeffs`.
+
+    .. math::
+        a_i\alpha(T)_i = a_i\left[1 + (1 - T_{r,i})\left(M_i + \frac{N_i}
+        {T_{r,i}}\right)\right]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Soave (1979) coefficients `M` and `N` of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Soave_1979_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 617.7], ais=[2.6, 5.0],
+    ... alpha_coeffs=[[0.9, 0.3], [1.0, 0.4]])
+    ([4.096781277, 9.689636717], [-0.009009129078, -0.02182121094], [2.9328e-05, 9.151111111e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    if da_alpha_dTs is None:
+        da_alpha_dTs = [0.0]*N
+    if d2a_alpha_dT2s is None:
+        d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        a = ais[i]
+        M, N_coeff = alpha_coeffs[i][0], alpha_coeffs[i][1]
+        x0 = 1.0/Tcs[i]
+        x1 = T*x0 - 1.0
+        x2 = Tcs[i]*T_inv
+        x3 = M + N_coeff*x2
+        x4 = N_coeff*T_inv*T_inv
+        a_alphas[i] = a*(1.0 - x1*x3)
+        da_alpha_dTs[i] = a*(Tcs[i]*x1*x4 - x0*x3)
+        d2a_alpha_dT2s[i] = a*(2.0*x4*(1.0 - x1*x2))
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Mathias_Copeman_poly_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs, a_alphas=None):
+    r'''Calculates the `a_alpha` terms for the Mathias-Copeman alpha function
+    given the critical temperatures `Tcs`, constants `ais`, and
+    the polynomial coefficients of each component in `alpha_coeffs`. Above
+    the critical temperature, only the linear coefficient is used.
+
+    .. math::
+        a_i\alpha(T)_i = a_i\left[\text{poly}_i\left(1 - \sqrt{T_{r,i}}
+        \right)\right]^2
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Polynomial coefficients of each component, in the order used by
+        `horner` and ending with 1, [-]
+    a_alphas : list[float], optional
+        Vector for pure component `a_alpha` terms in the cubic EOS to be
+        calculated and stored in, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Mathias_Copeman_poly_a_alphas_vectorized(300.0, Tcs=[507.6, 282.3], ais=[2.2, 0.5],
+    ... alpha_coeffs=[[0.3, -0.2, 0.9, 1.0], [0.1, -0.3, 0.6, 1.0]])
+    [3.173902471, 0.481647733]
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    for i in range(N):
+        tau = 1.0 - sqrt(T/Tcs[i])
+        if T < Tcs[i]:
+            x0 = horner(alpha_coeffs[i], tau)
+            a_alphas[i] = x0*x0*ais[i]
+        else:
+            # [-2] is the index to get the second-last coefficient (c1)
+            c1 = alpha_coeffs[i][-2]
+            x = 1.0 + c1*tau
+            a_alphas[i] = ais[i]*x*x
+    return a_alphas
+
+def Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs, a_alphas=None,
+                                                            da_alpha_dTs=None, d2a_alpha_dT2s=None):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Mathias-Copeman alpha function given the critical
+    temperatures `Tcs`, constants `ais`, and the polynomial coefficients of
+    each component in `alpha_coeffs`. Above the critical temperature, only the
+    linear coefficient is used.
+
+    .. math::
+        a_i\alpha(T)_i = a_i\left[\text{poly}_i\left(1 - \sqrt{T_{r,i}}
+        \right)\right]^2
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Polynomial coefficients of each component, in the order used by
+        `horner` and ending with 1, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 282.3], ais=[2.2, 0.5],
+    ... alpha_coeffs=[[0.3, -0.2, 0.9, 1.0], [0.1, -0.3, 0.6, 1.0]])
+    ([3.173902471, 0.481647733], [-0.005793912458, -0.001011777335], [1.508545586e-05, 2.748994814e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    if da_alpha_dTs is None:
+        da_alpha_dTs = [0.0]*N
+    if d2a_alpha_dT2s is None:
+        d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        a = ais[i]
+        Tc = Tcs[i]
+        rt = sqrt(T/Tc)
+        tau = 1.0 - rt
+        if T < Tc:
+            x0, x1, x2 = horner_and_der2(alpha_coeffs[i], tau)
+            a_alphas[i] = x0*x0*a
+            da_alpha_dTs[i] = -a*(rt*x0*x1*T_inv)
+            d2a_alpha_dT2s[i] = a*((x0*x2/Tc + x1*x1/Tc + rt*x0*x1*T_inv)*0.5*T_inv)
+        else:
+            c1 = alpha_coeffs[i][-2]
+            x1 = 1.0/Tc
+            x3 = c1*(rt - 1.0) - 1.0
+            x4 = T_inv*rt*x3
+            a_alphas[i] = a*x3*x3
+            da_alpha_dTs[i] = a*c1*x4
+            d2a_alpha_dT2s[i] = a*0.5*c1*T_inv*(c1*x1 - x4)
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def TwuPR95_a_alphas_vectorized(T, Tcs, ais, omegas, a_alphas=None):
+    r'''Calculates the `a_alpha` terms for the Twu (1995) alpha function of
+    the Peng-Robinson EOS given the critical temperatures `Tcs`, constants
+    `ais`, and acentric factors `omegas`. See :obj:`TwuPR95_a_alpha` for the formula.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+    a_alphas : list[float], optional
+        Vector for pure component `a_alpha` terms in the cubic EOS to be
+        calculated and stored in, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> TwuPR95_a_alphas_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.69, 0.2495], omegas=[0.2975, 0.008])
+    [3.796754715, 0.2006149323]
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    for i in range(N):
+        a_alphas[i] = _Twu95_a_alpha(T, Tcs[i], omegas[i], ais[i], True)
+    return a_alphas
+
+def TwuPR95_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas, a_alphas=None,
+                                               da_alpha_dTs=None, d2a_alpha_dT2s=None):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Twu (1995) alpha function of the Peng-Robinson EOS
+    given the critical temperatures `Tcs`, constants `ais`, and acentric
+    factors `omegas`. See :obj:`TwuPR95_a_alpha` for the formula.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> TwuPR95_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.69, 0.2495], omegas=[0.2975, 0.008])
+    ([3.796754715, 0.2006149323], [-0.006942165343, -0.0003642983515], [2.345298362e-05, 1.33549483e-06])
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    if da_alpha_dTs is None:
+        da_alpha_dTs = [0.0]*N
+    if d2a_alpha_dT2s is None:
+        d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        a_alphas[i], da_alpha_dTs[i], d2a_alpha_dT2s[i] = _Twu95_a_alpha_and_derivatives(T, Tcs[i], omegas[i], ais[i], True)
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def TwuSRK95_a_alphas_vectorized(T, Tcs, ais, omegas, a_alphas=None):
+    r'''Calculates the `a_alpha` terms for the Twu (1995) alpha function of
+    the SRK EOS given the critical temperatures `Tcs`, constants
+    `ais`, and acentric factors `omegas`. See :obj:`TwuSRK95_a_alpha` for the formula.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+    a_alphas : list[float], optional
+        Vector for pure component `a_alpha` terms in the cubic EOS to be
+        calculated and stored in, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> TwuSRK95_a_alphas_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.57, 0.2304], omegas=[0.2975, 0.008])
+    [3.790416752, 0.1695655745]
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    for i in range(N):
+        a_alphas[i] = _Twu95_a_alpha(T, Tcs[i], omegas[i], ais[i], False)
+    return a_alphas
+
+def TwuSRK95_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas, a_alphas=None,
+                                                da_alpha_dTs=None, d2a_alpha_dT2s=None):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Twu (1995) alpha function of the SRK EOS
+    given the critical temperatures `Tcs`, constants `ais`, and acentric
+    factors `omegas`. See :obj:`TwuSRK95_a_alpha` for the formula.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> TwuSRK95_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.57, 0.2304], omegas=[0.2975, 0.008])
+    ([3.790416752, 0.1695655745], [-0.007399047834, -0.0004453374778], [2.332063403e-05, 1.89497672e-06])
+    '''
+    N = len(Tcs)
+    if a_alphas is None:
+        a_alphas = [0.0]*N
+    if da_alpha_dTs is None:
+        da_alpha_dTs = [0.0]*N
+    if d2a_alpha_dT2s is None:
+        d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        a_alphas[i], da_alpha_dTs[i], d2a_alpha_dT2s[i] = _Twu95_a_alpha_and_derivatives(T, Tcs[i], omegas[i], ais[i], False)
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
 def TWU_a_alpha_common(T, Tc, omega, a, full=True, method='PR'):
     r'''Function to calculate `a_alpha` and optionally its first and second
     derivatives for the TWUPR or TWUSRK EOS. Returns 'a_alpha', and
@@ -1177,9 +1687,47 @@ def TWU_a_alpha_common(T, Tc, omega, a, full=True, method='PR'):
     >>> # diff(alpha, T)
     >>> # diff(alpha, T, T)
     '''
+    if method == 'PR':
+        PR = True
+    elif method == 'SRK':
+        PR = False
+    else:
+        raise ValueError('Only `PR` and `SRK` are accepted as method')
+    if not full:
+        return _Twu95_a_alpha(T, Tc, omega, a, PR)
+    return _Twu95_a_alpha_and_derivatives(T, Tc, omega, a, PR)
+
+def _Twu95_a_alpha(T, Tc, omega, a, PR=True):
     # e-10 works
     min_a_alpha = 1e-3 # There are a LOT of formulas, and they do not like having zeros
     Tr = T/Tc
+    if Tr < 5e-3:
+        Tr = 4e-3 + (Tr - 0.0)*(1e-3)/5e-3
+    if PR:
+        if Tr < 1.0:
+            L0, M0, N0 = 0.125283, 0.911807, 1.948150
+            L1, M1, N1 = 0.511614, 0.784054, 2.812520
+        else:
+            L0, M0, N0 = 0.401219, 4.963070, -0.2
+            L1, M1, N1 = 0.024955, 1.248089, -8.
+    else:
+        if Tr < 1.0:
+            L0, M0, N0 = 0.141599, 0.919422, 2.496441
+            L1, M1, N1 = 0.500315, 0.799457, 3.291790
+        else:
+            L0, M0, N0 = 0.441411, 6.500018, -0.20
+            L1, M1, N1 = 0.032580,  1.289098, -8.0
+    alpha0 = Tr**(N0*(M0-1.))*exp(L0*(1.-Tr**(N0*M0)))
+    alpha1 = Tr**(N1*(M1-1.))*exp(L1*(1.-Tr**(N1*M1)))
+    alpha = alpha0 + omega*(alpha1 - alpha0)
+    a_alpha = a*alpha
+    if a_alpha < min_a_alpha:
+        a_alpha = min_a_alpha
+    return a_alpha
+
+def _Twu95_a_alpha_and_derivatives(T, Tc, omega, a, PR=True):
+    min_a_alpha = 1e-3
+    Tr = T/Tc
     if Tr < 5e-3:
         # not enough: Tr from (x) 0 to 2e-4 to (y) 1e-4 2e-4
         # trying: Tr from (x) 0 to 1e-3 to (y) 5e-4 1e-3
@@ -1187,72 +1735,59 @@ def TWU_a_alpha_common(T, Tc, omega, a, full=True, method='PR'):
 #        Tr = 5e-4 + (Tr - 0.0)*(5e-4)/1e-3
         Tr = 4e-3 + (Tr - 0.0)*(1e-3)/5e-3
         T = Tc*Tr
-
-    if method == 'PR':
+    if PR:
         if Tr < 1.0:
             L0, M0, N0 = 0.125283, 0.911807, 1.948150
             L1, M1, N1 = 0.511614, 0.784054, 2.812520
         else:
             L0, M0, N0 = 0.401219, 4.963070, -0.2
             L1, M1, N1 = 0.024955, 1.248089, -8.
-    elif method == 'SRK':
+    else:
         if Tr < 1.0:
             L0, M0, N0 = 0.141599, 0.919422, 2.496441
             L1, M1, N1 = 0.500315, 0.799457, 3.291790
         else:
             L0, M0, N0 = 0.441411, 6.500018, -0.20
             L1, M1, N1 = 0.032580,  1.289098, -8.0
-    else:
-        raise ValueError('Only `PR` and `SRK` are accepted as method')
-
-    if not full:
-        alpha0 = Tr**(N0*(M0-1.))*exp(L0*(1.-Tr**(N0*M0)))
-        alpha1 = Tr**(N1*(M1-1.))*exp(L1*(1.-Tr**(N1*M1)))
-        alpha = alpha0 + omega*(alpha1 - alpha0)
-        a_alpha = a*alpha
-        if a_alpha < min_a_alpha:
-            a_alpha = min_a_alpha
-        return a_alpha
-    else:
-        x0 = Tr
-        x1 = M0 - 1
-        x2 = N0*x1
-        x3 = x0**x2
-        x4 = M0*N0
-        x5 = x0**x4
-        x6 = exp(-L0*(x5 - 1.))
-        x7 = x3*x6
-        x8 = M1 - 1.
-        x9 = N1*x8
-        x10 = x0**x9
-        x11 = M1*N1
-        x12 = x0**x11
-        x13 = x2*x7
-        x14 = L0*M0*N0*x3*x5*x6
-        x15 = x13 - x14
-        x16 = exp(-L1*(x12 - 1))
-        x17 = -L1*M1*N1*x10*x12*x16 + x10*x16*x9 - x13 + x14
-        x18 = N0*N0
-        x19 = x18*x3*x6
-        x20 = x1**2*x19
-        x21 = M0**2
-        x22 = L0*x18*x3*x5*x6
-        x23 = x21*x22
-        x24 = 2*M0*x1*x22
-        x25 = L0**2*x0**(2*x4)*x19*x21
-        x26 = N1**2
-        x27 = x10*x16*x26
-        x28 = M1**2
-        x29 = L1*x10*x12*x16*x26
-        a_alpha = a*(-omega*(-x10*exp(L1*(-x12 + 1)) + x3*exp(L0*(-x5 + 1))) + x7)
-        da_alpha_dT = a*(omega*x17 + x15)/T
-        d2a_alpha_dT2 = a*(-(omega*(-L1**2*x0**(2.*x11)*x27*x28 + 2.*M1*x29*x8 + x17 + x20 - x23 - x24 + x25 - x27*x8**2 + x28*x29) + x15 - x20 + x23 + x24 - x25)/T**2)
-        if a_alpha < min_a_alpha:
-            a_alpha = min_a_alpha
-            da_alpha_dT = d2a_alpha_dT2 = 0.0
-            # Hydrogen at low T
+    x0 = Tr
+    x1 = M0 - 1
+    x2 = N0*x1
+    x3 = x0**x2
+    x4 = M0*N0
+    x5 = x0**x4
+    x6 = exp(-L0*(x5 - 1.))
+    x7 = x3*x6
+    x8 = M1 - 1.
+    x9 = N1*x8
+    x10 = x0**x9
+    x11 = M1*N1
+    x12 = x0**x11
+    x13 = x2*x7
+    x14 = L0*M0*N0*x3*x5*x6
+    x15 = x13 - x14
+    x16 = exp(-L1*(x12 - 1))
+    x17 = -L1*M1*N1*x10*x12*x16 + x10*x16*x9 - x13 + x14
+    x18 = N0*N0
+    x19 = x18*x3*x6
+    x20 = x1**2*x19
+    x21 = M0**2
+    x22 = L0*x18*x3*x5*x6
+    x23 = x21*x22
+    x24 = 2*M0*x1*x22
+    x25 = L0**2*x0**(2*x4)*x19*x21
+    x26 = N1**2
+    x27 = x10*x16*x26
+    x28 = M1**2
+    x29 = L1*x10*x12*x16*x26
+    a_alpha = a*(-omega*(-x10*exp(L1*(-x12 + 1)) + x3*exp(L0*(-x5 + 1))) + x7)
+    da_alpha_dT = a*(omega*x17 + x15)/T
+    d2a_alpha_dT2 = a*(-(omega*(-L1**2*x0**(2.*x11)*x27*x28 + 2.*M1*x29*x8 + x17 + x20 - x23 - x24 + x25 - x27*x8**2 + x28*x29) + x15 - x20 + x23 + x24 - x25)/T**2)
+    if a_alpha < min_a_alpha:
+        a_alpha = min_a_alpha
+        da_alpha_dT = d2a_alpha_dT2 = 0.0
+        # Hydrogen at low T
 #            a_alpha = da_alpha_dT = d2a_alpha_dT2 = 0.0
-        return a_alpha, da_alpha_dT, d2a_alpha_dT2
+    return a_alpha, da_alpha_dT, d2a_alpha_dT2
 
 
 def Twu91_alpha_pure(T, Tc, c0, c1, c2):
@@ -1604,47 +2139,18 @@ class Mathias_Copeman_a_alpha(a_alpha_base):
 class Mathias_Copeman_poly_a_alpha(a_alpha_base):
 
     def a_alphas_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas = []
-        for i in range(self.N):
-            tau = 1.0 - (T/Tcs[i])**0.5
-            if T < Tcs[i]:
-                x0 = horner(alpha_coeffs[i], tau)
-                a_alpha = x0*x0*ais[i]
-            else:
-                x = (1.0 + alpha_coeffs[i][-2]*tau)
-                a_alpha = ais[i]*x*x
-            a_alphas.append(a_alpha)
-        return a_alphas
+        N = self.N
+        a_alphas = [0.0]*N if self.scalar else zeros(N)
+        return Mathias_Copeman_poly_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs, a_alphas=a_alphas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [], [], []
-        for i in range(self.N):
-            a = ais[i]
-            Tc = Tcs[i]
-            rt = (T/Tc)**0.5
-            tau = 1.0 - rt
-            if T < Tc:
-                x0, x1, x2 = horner_and_der2(alpha_coeffs[i], tau)
-                a_alpha = x0*x0*a
-                da_alpha_dT = -a*(rt*x0*x1/T)
-                d2a_alpha_dT2 = a*((x0*x2/Tc + x1*x1/Tc + rt*x0*x1/T)/(2.0*T))
-            else:
-                # [-2] is the index to get the second-last coefficient (c1)! Wasted time on this before.
-                c1 = alpha_coeffs[i][-2]
-                x0 = 1.0/T
-                x1 = 1.0/Tc
-                x2 = rt#sqrt(T*x1)
-                x3 = c1*(x2 - 1.0) - 1.0
-                x4 = x0*x2*x3
-                a_alpha = a*x3*x3
-                da_alpha_dT = a*c1*x4
-                d2a_alpha_dT2 = a*0.5*c1*x0*(c1*x1 - x4)
-            a_alphas.append(a_alpha)
-            da_alpha_dTs.append(da_alpha_dT)
-            d2a_alpha_dT2s.append(d2a_alpha_dT2)
-        return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+        N = self.N
+        if self.scalar:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
+        else:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+        return Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs, a_alphas=a_alphas, da_alpha_dTs=da_alpha_dTs,
+                                                                       d2a_alpha_dT2s=d2a_alpha_dT2s)
 
     def a_alpha_pure(self, T):
         # alpha_coeffs [c3, c2, c1, 1] always
@@ -2002,16 +2508,9 @@ class Twu91_a_alpha(a_alpha_base):
         return a*Twu91_alpha_pure(T, Tc, c0, c1, c2)
 
     def a_alphas_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas = []
-        for i in range(self.N):
-            coeffs = alpha_coeffs[i]
-            Tr = T/Tcs[i]
-            a_alpha = ais[i]*(Tr**(coeffs[2]*(coeffs[1] - 1.0))*exp(coeffs[0]*(1.0 - (Tr)**(coeffs[1]*coeffs[2]))))
-            a_alphas.append(a_alpha)
-        if self.scalar:
-            return a_alphas
-        return array(a_alphas)
+        N = self.N
+        a_alphas = [0.0]*N if self.scalar else zeros(N)
+        return Twu91_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs, a_alphas=a_alphas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
         r'''Method to calculate the pure-component `a_alphas` and their first
@@ -2039,36 +2538,13 @@ class Twu91_a_alpha(a_alpha_base):
             Second temperature derivative of coefficient calculated by
             EOS-specific method, [J^2/mol^2/Pa/K**2]
         '''
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        N = len(ais)
-        a_alphas = [0.0]*N
-        da_alpha_dTs = [0.0]*N
-        d2a_alpha_dT2s = [0.0]*N
-        T_inv = 1.0/T
-        for i in range(N):
-            coeffs = alpha_coeffs[i]
-            c0, c1, c2 = coeffs[0], coeffs[1], coeffs[2]
-            Tr = T/Tcs[i]
-
-            x1 = c1 - 1.0
-            x2 = c2*x1
-            x3 = c1*c2
-            x4 = Tr**x3
-            x5 = ais[i]*Tr**x2*exp(-c0*(x4 - 1.0))
-            x6 = c0*x4
-            x7 = c1*x6
-            x8 = c2*x5
-            x9 = c1*c1*c2
-
-            d2a_alpha_dT2 = (x8*(c0*c0*x4*x4*x9 - c1 + c2*x1*x1
-                                 - 2.0*x2*x7 - x6*x9 + x7 + 1.0)*T_inv*T_inv)
-            a_alphas[i] = x5
-            da_alpha_dTs[i] = x8*(x1 - x7)*T_inv
-            d2a_alpha_dT2s[i] = d2a_alpha_dT2
-
+        N = self.N
         if self.scalar:
-            return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
-        return array(a_alphas), array(da_alpha_dTs), array(d2a_alpha_dT2s)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
+        else:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+        return Twu91_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs, a_alphas=a_alphas, da_alpha_dTs=da_alpha_dTs,
+                                                        d2a_alpha_dT2s=d2a_alpha_dT2s)
 
 
 class Soave_1993_a_alpha(a_alpha_base):
@@ -2349,25 +2825,18 @@ class TwuSRK95_a_alpha(a_alpha_base):
         return TWU_a_alpha_common(T, self.Tc, self.omega, self.a, full=False, method='SRK')
 
     def a_alphas_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        a_alphas = [TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=False, method='SRK')
-                for i in range(self.N)]
-        if self.scalar:
-            return a_alphas
-        return array(a_alphas)
+        N = self.N
+        a_alphas = [0.0]*N if self.scalar else zeros(N)
+        return TwuSRK95_a_alphas_vectorized(T, self.Tcs, self.ais, self.omegas, a_alphas=a_alphas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        r0, r1, r2 = [], [], []
-        for i in range(self.N):
-            v0, v1, v2 = TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=True, method='SRK')
-            r0.append(v0)
-            r1.append(v1)
-            r2.append(v2)
+        N = self.N
         if self.scalar:
-            return r0, r1, r2
-        return array(r0), array(r1), array(r2)
-
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
+        else:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+        return TwuSRK95_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.omegas, a_alphas=a_alphas, da_alpha_dTs=da_alpha_dTs,
+                                                           d2a_alpha_dT2s=d2a_alpha_dT2s)
 
 
 class TwuPR95_a_alpha(a_alpha_base):
@@ -2472,24 +2941,18 @@ class TwuPR95_a_alpha(a_alpha_base):
         return TWU_a_alpha_common(T, self.Tc, self.omega, self.a, full=False, method='PR')
 
     def a_alphas_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        a_alphas = [TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=False, method='PR')
-                for i in range(self.N)]
-        if self.scalar:
-            return a_alphas
-        return array(a_alphas)
+        N = self.N
+        a_alphas = [0.0]*N if self.scalar else zeros(N)
+        return TwuPR95_a_alphas_vectorized(T, self.Tcs, self.ais, self.omegas, a_alphas=a_alphas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        r0, r1, r2 = [], [], []
-        for i in range(self.N):
-            v0, v1, v2 = TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=True, method='PR')
-            r0.append(v0)
-            r1.append(v1)
-            r2.append(v2)
+        N = self.N
         if self.scalar:
-            return r0, r1, r2
-        return array(r0), array(r1), array(r2)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
+        else:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+        return TwuPR95_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.omegas, a_alphas=a_alphas, da_alpha_dTs=da_alpha_dTs,
+                                                          d2a_alpha_dT2s=d2a_alpha_dT2s)
 
 
 class Soave_1979_a_alpha(a_alpha_base):
@@ -2524,31 +2987,18 @@ class Soave_1979_a_alpha(a_alpha_base):
         return a*Soave_1979_alpha_pure(T, self.Tc, M, N)
 
     def a_alphas_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas = []
-        for i in range(self.N):
-            Tr = T/Tcs[i]
-            M, N = alpha_coeffs[i]
-            a_alphas.append(ais[i]*(1.0 + (1.0 - Tr)*(M + N/Tr)))
-        return a_alphas
+        N = self.N
+        a_alphas = [0.0]*N if self.scalar else zeros(N)
+        return Soave_1979_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs, a_alphas=a_alphas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        T_inv = 1.0/T
-        a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [], [], []
-        for i in range(self.N):
-            a = ais[i]
-            M, N = alpha_coeffs[i]
-            x0 = 1.0/Tcs[i]
-            x1 = T*x0 - 1.0
-            x2 = Tcs[i]*T_inv
-            x3 = M + N*x2
-            x4 = N*T_inv*T_inv
-
-            a_alphas.append(a*(1.0 - x1*x3))
-            da_alpha_dTs.append(a*(Tcs[i]*x1*x4 - x0*x3))
-            d2a_alpha_dT2s.append(a*(2.0*x4*(1.0 - x1*x2)))
-        return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+        N = self.N
+        if self.scalar:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
+        else:
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+        return Soave_1979_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs, a_alphas=a_alphas, da_alpha_dTs=da_alpha_dTs,
+                                                             d2a_alpha_dT2s=d2a_alpha_dT2s)
 
 
 a_alpha_bases = [Soave_1972_a_alpha, Heyen_a_alpha, Harmens_Knapp_a_alpha, Mathias_1983_a_alpha,
@@ -212,6 +212,9 @@ from thermo import serialize
 from thermo.eos_mix_methods import (a_alpha_aijs_composition_independent,
     a_alpha_aijs_composition_independent_support_zeros, a_alpha_and_derivatives, a_alpha_and_derivatives_full,
     a_alpha_quadratic_terms, a_alpha_and_derivatives_quadratic_terms,
+    kijs_low_rank, a_alpha_quadratic_terms_low_rank,
+    a_alpha_and_derivatives_quadratic_terms_low_rank,
+    PSRK_da_alpha_dns,
     G_dep_lnphi_d_helper, eos_mix_dV_dzs, VDW_lnphis, SRK_lnphis, eos_mix_db_dns, PR_translated_ddelta_dns,
     PR_translated_depsilon_dns, PR_depsilon_dns, PR_translated_d2epsilon_dzizjs,
     PR_d2epsilon_dninjs, PR_d3epsilon_dninjnks, PR_d2delta_dninjs, PR_d3delta_dninjnks,
@@ -276,6 +279,13 @@ class GCEOSMIX(GCEOS):
     translated = False
     '''Whether or not the model implements volume translation.
     '''
+    low_rank_kijs = False
+    '''Whether or not to factor constant `kijs` with :obj:`kijs_low_rank
+    <thermo.eos_mix_methods.kijs_low_rank>` and mix zero and low-rank `kijs`
+    in O(N*rank) operations. Only worth it for many components with few
+    interacting species, as for characterized oils. Set on a class or on
+    `GCEOSMIX` to enable it.
+    '''
 
     def subset(self, idxs, **state_specs):
         r'''Method to construct a new :obj:`GCEOSMIX` that removes all components
@@ -398,8 +408,12 @@ class GCEOSMIX(GCEOS):
         eos_name = d['py/object']
         del d['py/object']
         del d['json_version']
+        # The kijs factorization is always stored as lists
+        kijs_factored = d.pop('_kijs_low_rank', None)
         if not d['scalar']:
             d = serialize.naive_lists_to_arrays(d)
+        if kijs_factored is not None:
+            d['_kijs_low_rank'] = tuple(kijs_factored)
 
         try:
             d['raw_volumes'] = tuple(d['raw_volumes'])
@@ -425,11 +439,14 @@ class GCEOSMIX(GCEOS):
         new.__dict__ = d
         return new
 
-    def to_TP_zs_fast(self, T, P, zs, only_l=False, only_g=False, full_alphas=True):
+    def to_TP_zs_fast(self, T, P, zs, only_l=False, only_g=False, full_alphas=True,
+                      alphas=None):
         r'''Method to construct a new :obj:`GCEOSMIX` instance with the same
         parameters as the existing object. If both instances are at the same
         temperature, `a_alphas` and `da_alpha_dTs` and `d2a_alpha_dT2s` are
-        shared between the instances. It is always assumed the new object has
+        shared between the instances, as are the `a_alpha_ijs`,
+        `da_alpha_dT_ijs` and `d2a_alpha_dT2_ijs` matrices if they have been
+        calculated. It is always assumed the new object has
         a differet composition. Optionally, only one set of phase properties
         can be solved for, increasing speed. Additionally, if `full_alphas`
         is set to False no temperature derivatives of `a_alpha` will be
@@ -450,6 +467,10 @@ class GCEOSMIX(GCEOS):
         only_g : bool
             When true, if there is a liquid and a vapor root, only the vapor
             root (and properties) will be set.
+        alphas : tuple(list[float], list[float], list[float]), optional
+            Pure-component `a_alphas`, `da_alpha_dTs`, and `d2a_alpha_dT2s`
+            already calculated at `T` for these parameters, to be used
+            instead of calculating them, [-]
 
         Returns
         -------
@@ -476,6 +497,10 @@ class GCEOSMIX(GCEOS):
         new.ais = self.ais
         new.bs = self.bs
         new.scalar = self.scalar
+        try:
+            new._kijs_low_rank = self._kijs_low_rank
+        except AttributeError:
+            pass
 
         if copy_alphas:
             new.a_alphas = self.a_alphas
@@ -484,6 +509,16 @@ class GCEOSMIX(GCEOS):
                 new.d2a_alpha_dT2s = self.d2a_alpha_dT2s
             except:
                 pass
+            # The a_alpha_ij matrices are composition independent
+            try:
+                new._a_alpha_ijs = self._a_alpha_ijs
+                new._da_alpha_dT_ijs = self._da_alpha_dT_ijs
+                new._d2a_alpha_dT2_ijs = self._d2a_alpha_dT2_ijs
+            except AttributeError:
+                pass
+        elif alphas is not None:
+            new.a_alphas, new.da_alpha_dTs, new.d2a_alpha_dT2s = alphas
+            copy_alphas = True
 
         new.zs = zs
         new.T = T
@@ -1007,6 +1042,52 @@ class GCEOSMIX(GCEOS):
             return self.a_alpha_and_derivatives_numpy(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=full, quick=quick)
         return self.a_alpha_and_derivatives_py(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=full, quick=quick)
 
+    def a_alpha_and_derivatives_many(self, Ts):
+        r'''Method to calculate the pure-component `a_alphas` and their first
+        and second temperature derivatives at many temperatures at once, using
+        the EOS's vectorized alpha function. The results are stacked into
+        arrays with one row per temperature and one column per component.
+        This method does not alter the object's state.
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures, [K]
+
+        Returns
+        -------
+        a_alphas : ndarray[float]
+            Coefficient calculated by EOS-specific method; shape (len(Ts), N),
+            [J^2/mol^2/Pa]
+        da_alpha_dTs : ndarray[float]
+            Temperature derivative of coefficient calculated by EOS-specific
+            method; shape (len(Ts), N), [J^2/mol^2/Pa/K]
+        d2a_alpha_dT2s : ndarray[float]
+            Second temperature derivative of coefficient calculated by
+            EOS-specific method; shape (len(Ts), N), [J^2/mol^2/Pa/K**2]
+
+        Notes
+        -----
+        The alpha functions with a standalone vectorized implementation in
+        :obj:`thermo.eos_alpha_functions` are compiled when using
+        `thermo.numba`.
+
+        Examples
+        --------
+        >>> eos = PRMIX(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.5, 0.5], kijs=[[0,0],[0,0]])
+        >>> a_alphas, da_alpha_dTs, d2a_alpha_dT2s = eos.a_alpha_and_derivatives_many([115.0, 200.0, 300.0])
+        >>> a_alphas.shape
+        (3, 2)
+        >>> a_alphas[0].tolist() == eos.a_alphas_vectorized(115.0)
+        True
+        '''
+        Ts = np.asarray(Ts, dtype=float)
+        M, N = Ts.shape[0], self.N
+        a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((M, N)), zeros((M, N)), zeros((M, N))
+        for j, T in enumerate(Ts.tolist()):
+            a_alphas[j], da_alpha_dTs[j], d2a_alpha_dT2s[j] = self.a_alpha_and_derivatives_vectorized(T)
+        return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
 
 
 
@@ -1167,6 +1248,30 @@ class GCEOSMIX(GCEOS):
             self.a_alpha_roots = a_alpha_roots = [sqrt(i) for i in a_alphas]
         else:
             self.a_alpha_roots = a_alpha_roots = npsqrt(a_alphas)
+        # Zero and low rank kijs are mixed in O(N*rank); the factorization is
+        # done once, and shared by objects made with `to_TP_zs_fast`
+        kij_lambdas = None
+        if self.low_rank_kijs:
+            try:
+                kij_lambdas, kij_vectors = self._kijs_low_rank
+            except AttributeError:
+                self._kijs_low_rank = kij_lambdas, kij_vectors = kijs_low_rank(kijs)
+        if kij_lambdas is not None:
+            if scalar:
+                a_alpha_j_rows, da_alpha_dT_j_rows = [0.0]*N, [0.0]*N
+            else:
+                a_alpha_j_rows, da_alpha_dT_j_rows = zeros(N), zeros(N)
+            if full:
+                a_alpha, da_alpha_dT, d2a_alpha_dT2, self.a_alpha_j_rows, self.da_alpha_dT_j_rows = (
+                        a_alpha_and_derivatives_quadratic_terms_low_rank(a_alphas, a_alpha_roots, da_alpha_dTs,
+                                                                         d2a_alpha_dT2s, T, zs, kij_lambdas, kij_vectors,
+                                                                         a_alpha_j_rows=a_alpha_j_rows,
+                                                                         da_alpha_dT_j_rows=da_alpha_dT_j_rows))
+                return a_alpha, da_alpha_dT, d2a_alpha_dT2
+            a_alpha, self.a_alpha_j_rows = a_alpha_quadratic_terms_low_rank(a_alphas, a_alpha_roots, T, zs,
+                                                                            kij_lambdas, kij_vectors,
+                                                                            a_alpha_j_rows=a_alpha_j_rows)
+            return a_alpha
         if full:
             # Converting kijs into a matrix kills the performance! 5x slower than the performance of the functions.
             # converting the 1d arrays also takes as long as the function.
@@ -4293,7 +4398,7 @@ class GCEOSMIX(GCEOS):
         dG_dns = self.dG_dep_dns(Z)
         return dns_to_dn_partials(dG_dns, F)
 
-    def fugacity_coefficients(self, Z):
+    def fugacity_coefficients(self, Z, lnphis=None):
         r'''Generic formula for calculating log fugacity coefficients for each
         species in a mixture. Verified numerically. Applicable to all cubic
         equations of state which can be cast in the form used here.
@@ -4317,13 +4422,18 @@ class GCEOSMIX(GCEOS):
         ----------
         Z : float
             Compressibility of the mixture for a desired phase, [-]
+        lnphis : list[float], optional
+            Preallocated output to store the values in; a new list or array
+            is returned if not provided, [-]
 
         Returns
         -------
         log_phis : float
             Log fugacity coefficient for each species, [-]
         '''
-        zs = self.zs
+        return self._fugacity_coefficients(Z, self.dlnphi_dns(Z), lnphis)
+
+    def _fugacity_coefficients(self, Z, dlnphi_dns, lnphis=None):
         try:
             if Z == self.Z_l:
                 F = self.phi_l
@@ -4336,8 +4446,12 @@ class GCEOSMIX(GCEOS):
             logF = log(F)
         except:
             logF = -690.7755278982137
-        log_phis = dns_to_dn_partials(self.dlnphi_dns(Z), logF)
-        return log_phis if self.scalar else array(log_phis)
+        if lnphis is None:
+            log_phis = dns_to_dn_partials(dlnphi_dns, logF)
+            return log_phis if self.scalar else array(log_phis)
+        for i in range(self.N):
+            lnphis[i] = logF + dlnphi_dns[i]
+        return lnphis
 
 
     def _d2_G_dep_lnphi_d2_helper(self, V, d_Vs, d2Vs, dbs, d2bs, d_epsilons, d2_epsilons,
@@ -4582,6 +4696,132 @@ class GCEOSMIX(GCEOS):
         d2ns = self.d2lnphi_dninjs(Z)
         return d2ns_to_dn2_partials(d2ns, dns)
 
+    def lnphis_and_derivatives(self, phase, lnphis=None, dlnphis_dT=None,
+                               dlnphis_dP=None, dlnphis_dns=None):
+        r'''Calculates the log fugacity coefficients of each species along
+        with their temperature, pressure, and mole number derivatives in a
+        single call, storing the results in caller-owned buffers.
+
+        The mole number derivatives of molar volume and of the mixture log
+        fugacity coefficient are computed once and shared between the four
+        results, whereas :obj:`fugacity_coefficients`, :obj:`dlnphis_dT`,
+        :obj:`dlnphis_dP` and :obj:`dlnphis_dns` each calculate them again.
+        Newton solvers needing all four every iteration can allocate the
+        buffers once and pass them in on every call.
+
+        Parameters
+        ----------
+        phase : str
+            One of 'l' or 'g', [-]
+        lnphis : list[float], optional
+            Buffer for the log fugacity coefficients, [-]
+        dlnphis_dT : list[float], optional
+            Buffer for the temperature derivatives of the log fugacity
+            coefficients, [1/K]
+        dlnphis_dP : list[float], optional
+            Buffer for the pressure derivatives of the log fugacity
+            coefficients, [1/Pa]
+        dlnphis_dns : list[list[float]], optional
+            Buffer for the mole number derivatives of the log fugacity
+            coefficients, [-]
+
+        Returns
+        -------
+        lnphis : list[float]
+            Log fugacity coefficient for each species, [-]
+        dlnphis_dT : list[float]
+            Temperature derivatives of log fugacity coefficient for each
+            species, [1/K]
+        dlnphis_dP : list[float]
+            Pressure derivatives of log fugacity coefficient for each
+            species, [1/Pa]
+        dlnphis_dns : list[list[float]]
+            Mole number derivatives of log fugacity coefficient for each
+            species, [-]
+
+        Notes
+        -----
+        Buffers which are not provided are allocated as lists when the
+        object is in scalar mode and as NumPy arrays otherwise; either kind
+        of buffer may be passed in regardless of the mode. The buffers are
+        returned as well for convenience.
+
+        Examples
+        --------
+        >>> eos = PRMIXTranslatedConsistent(T=115.0, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.5, 0.5], kijs=[[0,0],[0,0]])
+        >>> lnphis, dlnphis_dns = [0.0]*2, [[0.0]*2 for _ in range(2)]
+        >>> res = eos.lnphis_and_derivatives('l', lnphis=lnphis, dlnphis_dns=dlnphis_dns)
+        >>> res[0] is lnphis
+        True
+        >>> lnphis
+        [0.465445, -1.936791]
+        >>> dlnphis_dns
+        [[-0.246889, 0.246889], [0.246889, -0.246889]]
+        '''
+        N, scalar = self.N, self.scalar
+        if phase == 'g':
+            Z, V_phase = self.Z_g, self.V_g
+        else:
+            Z, V_phase = self.Z_l, self.V_l
+        if lnphis is None:
+            lnphis = [0.0]*N if scalar else zeros(N)
+        if dlnphis_dT is None:
+            dlnphis_dT = [0.0]*N if scalar else zeros(N)
+        if dlnphis_dP is None:
+            dlnphis_dP = [0.0]*N if scalar else zeros(N)
+        if dlnphis_dns is None:
+            dlnphis_dns = [[0.0]*N for _ in range(N)] if scalar else zeros((N, N))
+
+        V = Z*self.T*R/self.P
+        db_dns, d2bs = self.db_dns, self.d2b_dninjs
+        ddelta_dns, d2delta_dninjs = self.ddelta_dns, self.d2delta_dninjs
+        depsilon_dns, d2epsilon_dninjs = self.depsilon_dns, self.d2epsilon_dninjs
+        da_alpha_dns, d2a_alpha_dninjs = self.da_alpha_dns, self.d2a_alpha_dninjs
+
+        dV_dns = self.dV_dns(Z)
+        dlnphi_dns = self._G_dep_lnphi_d_helper(Z, dbs=db_dns, depsilons=depsilon_dns,
+                                                ddelta=ddelta_dns, dVs=dV_dns,
+                                                da_alphas=da_alpha_dns, G=False)
+        d2Vs = self._d2V_dij_wrapper(V=V, d_Vs=dV_dns, dbs=db_dns, d2bs=d2bs,
+                                     d_epsilons=depsilon_dns, d2_epsilons=d2epsilon_dninjs,
+                                     d_deltas=ddelta_dns, d2_deltas=d2delta_dninjs,
+                                     da_alphas=da_alpha_dns, d2a_alphas=d2a_alpha_dninjs)
+        d2lnphi_dninjs = self._d2_G_dep_lnphi_d2_helper(V=V, d2Vs=d2Vs, d_Vs=dV_dns, dbs=db_dns, d2bs=d2bs,
+                                     d_epsilons=depsilon_dns, d2_epsilons=d2epsilon_dninjs,
+                                     d_deltas=ddelta_dns, d2_deltas=d2delta_dninjs,
+                                     da_alphas=da_alpha_dns, d2a_alphas=d2a_alpha_dninjs,
+                                     G=False)
+        for i in range(N):
+            row, d2_row, dlnphi_dni = dlnphis_dns[i], d2lnphi_dninjs[i], dlnphi_dns[i]
+            for j in range(N):
+                row[j] = d2_row[j] + dlnphi_dni + dlnphi_dns[j]
+
+        # EOSs with their own closed-form expressions keep using them; the
+        # generic ones are evaluated from the shared intermediates
+        cls = self.__class__
+        if cls.fugacity_coefficients is GCEOSMIX.fugacity_coefficients:
+            self._fugacity_coefficients(Z, dlnphi_dns, lnphis)
+        else:
+            self.fugacity_coefficients(Z, lnphis)
+
+        generic_dT = cls.dlnphis_dT is GCEOSMIX.dlnphis_dT
+        generic_dP = cls.dlnphis_dP is GCEOSMIX.dlnphis_dP
+        if generic_dT or generic_dP:
+            dnz = self._dnz_derivatives_and_departures(V_phase, n=True)
+        if generic_dT:
+            self._dlnphis_dT(phase, dV_dns, dnz[2], dlnphis_dT)
+        else:
+            values = self.dlnphis_dT(phase)
+            for i in range(N):
+                dlnphis_dT[i] = values[i]
+        if generic_dP:
+            self._dlnphis_dP(phase, dV_dns, dnz[3], dlnphis_dP)
+        else:
+            values = self.dlnphis_dP(phase)
+            for i in range(N):
+                dlnphis_dP[i] = values[i]
+        return lnphis, dlnphis_dT, dlnphis_dP, dlnphis_dns
+
     def dlnfugacities_dns(self, phase):
         r'''Generic formula for calculating the mole number derivaitves of
         log fugacities for each species in a mixture. Verified
@@ -5538,26 +5778,34 @@ class GCEOSMIX(GCEOS):
         >>> diff(diff(lnphi, P), n) # doctest:+SKIP
         P*Derivative(V(n, P), P, n)/(R*T) + Derivative(V(n, P), P, n)/V(n, P) - Derivative(V(n, P), P)*Derivative(V(n, P), n)/V(n, P)**2 - Derivative(V(n, P), P, n)/(V(n, P) - b(n)) - (-Derivative(V(n, P), n) + Derivative(b(n), n))*Derivative(V(n, P), P)/(V(n, P) - b(n))**2 + Derivative(V(n, P), n)/(R*T) - 4*(-2*delta(n)*Derivative(delta(n), n) + 4*Derivative(epsilon(n), n))*a_alpha(n, T)*Derivative(V(n, P), P)/(R*T*(1 - (2*V(n, P)/sqrt(delta(n)**2 - 4*epsilon(n)) + delta(n)/sqrt(delta(n)**2 - 4*epsilon(n)))**2)*(delta(n)**2 - 4*epsilon(n))**2) - 4*a_alpha(n, T)*Derivative(V(n, P), P, n)/(R*T*(1 - (2*V(n, P)/sqrt(delta(n)**2 - 4*epsilon(n)) + delta(n)/sqrt(delta(n)**2 - 4*epsilon(n)))**2)*(delta(n)**2 - 4*epsilon(n))) - 4*Derivative(V(n, P), P)*Derivative(a_alpha(n, T), n)/(R*T*(1 - (2*V(n, P)/sqrt(delta(n)**2 - 4*epsilon(n)) + delta(n)/sqrt(delta(n)**2 - 4*epsilon(n)))**2)*(delta(n)**2 - 4*epsilon(n))) - 4*(2*V(n, P)/sqrt(delta(n)**2 - 4*epsilon(n)) + delta(n)/sqrt(delta(n)**2 - 4*epsilon(n)))*(4*(-delta(n)*Derivative(delta(n), n) + 2*Derivative(epsilon(n), n))*V(n, P)/(delta(n)**2 - 4*epsilon(n))**(3/2) + 2*(-delta(n)*Derivative(delta(n), n) + 2*Derivative(epsilon(n), n))*delta(n)/(delta(n)**2 - 4*epsilon(n))**(3/2) + 4*Derivative(V(n, P), n)/sqrt(delta(n)**2 - 4*epsilon(n)) + 2*Derivative(delta(n), n)/sqrt(delta(n)**2 - 4*epsilon(n)))*a_alpha(n, T)*Derivative(V(n, P), P)/(R*T*(1 - (2*V(n, P)/sqrt(delta(n)**2 - 4*epsilon(n)) + delta(n)/sqrt(delta(n)**2 - 4*epsilon(n)))**2)**2*(delta(n)**2 - 4*epsilon(n))) + R*T*(P*Derivative(V(n, P), P)/(R*T) + V(n, P)/(R*T))*Derivative(V(n, P), n)/(P*V(n, P)**2) - R*T*(P*Derivative(V(n, P), P, n)/(R*T) + Derivative(V(n, P), n)/(R*T))/(P*V(n, P))
         '''
+        if phase == 'g':
+            V, Z = self.V_g, self.Z_g
+        else:
+            V, Z = self.V_l, self.Z_l
+        return self._dlnphis_dP(phase, self.dV_dns(Z),
+                                self._dnz_derivatives_and_departures(V)[3],
+                                [0.0]*self.N)
+
+    def _dlnphis_dP(self, phase, dV_dns, d2V_dPdns, dlnphis_dPs):
+        # Body of the generic `dlnphis_dP`, with the mole number derivatives
+        # of volume supplied by the caller so they can be shared with
+        # `dlnphis_dT` and `dlnphis_dns`; fills and returns `dlnphis_dPs`
         if phase == 'g':
             V = self.V_g
-            Z = self.Z_g
             dV_dP = self.dV_dP_g
             dG_dep_dP = (self.dH_dep_dP_g  - self.T*self.dS_dep_dP_g)/(R*self.T)
 
         else:
             V = self.V_l
-            Z = self.Z_l
             dV_dP = self.dV_dP_l
             dG_dep_dP = (self.dH_dep_dP_l  - self.T*self.dS_dep_dP_l)/(R*self.T)
 
         T = self.T
         P = self.P
-        dV_dns = self.dV_dns(Z)
         ddelta_dns = self.ddelta_dns
         depsilon_dns = self.depsilon_dns
         da_alpha_dns = self.da_alpha_dns
         db_dns = self.db_dns
-        d2V_dPdns = self._dnz_derivatives_and_departures(V)[3]# self.d2V_dPdn
 
         x0 = V
         x2 = 1/(R*T)
@@ -5585,7 +5833,6 @@ class GCEOSMIX(GCEOS):
 
         t50 = 1.0/(x0*x0)
 
-        dlnphis_dPs = []
         for i in range(self.N):
             # number dependent calculations
             x1 = dV_dns[i] # Derivative(x0, n)
@@ -5602,7 +5849,7 @@ class GCEOSMIX(GCEOS):
             - x13*x21*x25*(2*x1 - x11*x26 - x12*x26 + x23)/x17**2
             + x18*x19*x2*x20*x4 + x2*x5 + x20*x22*da_alpha_dns[i]
             - x22*x24*x25 + x3*x4 - x4/x9 - x6*x7 + x6*(x1 - db_dns[i])/x9**2)
-            dlnphis_dPs.append(dlnphi_dP + dG_dep_dP)
+            dlnphis_dPs[i] = dlnphi_dP + dG_dep_dP
         return dlnphis_dPs
 
 
@@ -5649,16 +5896,24 @@ class GCEOSMIX(GCEOS):
         >>> lnphi = simplify(G_dep/(R*T)) # doctest:+SKIP
         >>> diff(diff(lnphi, T), n) # doctest:+SKIP
         '''
+        if phase == 'g':
+            V, Z = self.V_g, self.Z_g
+        else:
+            V, Z = self.V_l, self.Z_l
+        return self._dlnphis_dT(phase, self.dV_dns(Z),
+                                self._dnz_derivatives_and_departures(V, n=True)[2],
+                                [0.0]*self.N)
+
+    def _dlnphis_dT(self, phase, dV_dns, d2V_dTdns, dlnphis_dTs):
+        # Body of the generic `dlnphis_dT`; see `_dlnphis_dP`
         T, P, zs, N = self.T, self.P, self.zs, self.N
         if phase == 'g':
             V = self.V_g
-            Z = self.Z_g
             dV_dT = self.dV_dT_g
             dG_dep_dT = (-T*self.dS_dep_dT_g - self.S_dep_g + self.dH_dep_dT_g)/(R*self.T)
             dG_dep_dT -= (-T*self.S_dep_g + self.H_dep_g)/(R*self.T*self.T)
         else:
             V = self.V_l
-            Z = self.Z_l
             dV_dT = self.dV_dT_l
             dG_dep_dT = (-T*self.dS_dep_dT_l - self.S_dep_l + self.dH_dep_dT_l)/(R*self.T)
             dG_dep_dT -= (-T*self.S_dep_l + self.H_dep_l)/(R*self.T*self.T)
@@ -5668,8 +5923,6 @@ class GCEOSMIX(GCEOS):
         # (-T*Derivative(S(T), T) - S(T) + Derivative(H(T), T))/(R*T) - (-T*S(T) + H(T))/(R*T**2)
         '''
 
-        d2V_dTdns = self._dnz_derivatives_and_departures(V, n=True)[2]
-        dV_dns = self.dV_dns(Z)
         db_dns = self.db_dns
         da_alpha_dns = self.da_alpha_dns
         da_alpha_dT_dns = self.da_alpha_dT_dns
@@ -5707,7 +5960,6 @@ class GCEOSMIX(GCEOS):
         x34 = x7*self.da_alpha_dT
         x35 = 8*x13*x29*x5/x17**2
 
-        dlnphis_dTs = []
         for i in range(N):
             x2 = d2V_dTdns[i]
             x8 = x2*x7
@@ -5727,7 +5979,7 @@ class GCEOSMIX(GCEOS):
             + x13*x28*x8 + x14*x23*x4 + x14*x28*x29 - x20*x35*x37/x25**2
             - x23*x7*da_alpha_dT_dns[i] - x26*x32*x35 - x3*x4*x6 - x30*x33
             - x30*x38 + x33*x34 + x34*x38 + x6*x8 - x2/x12 + x9*(x3 - db_dns[i])/x12**2)
-            dlnphis_dTs.append(dlnphi_dT + dG_dep_dT)
+            dlnphis_dTs[i] = dlnphi_dT + dG_dep_dT
         return dlnphis_dTs
 
     def dlnphis_dzs(self, Z):
@@ -6038,15 +6290,99 @@ class PSRKMixingRules(object):
 
     @property
     def da_alpha_dzs(self):
-        raise NotImplementedError("TODO")
+        r'''Helper method for calculating the composition derivatives of
+        `a_alpha` with the PSRK mixing rules. Note this is independent of the
+        phase.
+
+        .. math::
+            \left(\frac{\partial a \alpha}{\partial x_i}\right)_{T, P,
+            x_{i\ne j}} = \frac{a\alpha b_i}{b} + bRT\left[
+            \frac{(a\alpha)_i}{b_i RT} + \frac{1}{A}\left(\frac{1}{RT}
+            \frac{\partial G^E}{\partial x_i} + \ln b + \frac{b_i}{b}
+            - \ln b_i\right)\right]
+
+        Returns
+        -------
+        da_alpha_dzs : list[float]
+            Composition derivative of `alpha` of each component,
+            [kg*m^5/(mol^2*s^2)]
+
+        Notes
+        -----
+        This derivative is checked numerically.
+        '''
+        T, N, b, bs, a_alphas = self.T, self.N, self.b, self.bs, self.a_alphas
+        ge_model = self.ge_model
+        if T != ge_model.T:
+            ge_model = ge_model.to_T_xs(T, self.zs)
+        dGE_dxs = ge_model.dGE_dxs()
+        RT = R*T
+        RT_inv = 1.0/RT
+        b_inv = 1.0/b
+        log_b = log(b)
+        A_inv = self.A_inv
+        a_alpha_b = self.a_alpha*b_inv
+        bRT = b*RT
+        out = [a_alpha_b*bs[i] + bRT*(a_alphas[i]*RT_inv/bs[i]
+                                     + A_inv*(dGE_dxs[i]*RT_inv + log_b + bs[i]*b_inv - log(bs[i])))
+               for i in range(N)]
+        return out if self.scalar else array(out)
 
     @property
     def da_alpha_dns(self):
-        raise NotImplementedError("TODO")
+        r'''Helper method for calculating the mole number derivatives of
+        `a_alpha` with the PSRK mixing rules. Note this is independent of the
+        phase.
+
+        .. math::
+            \left(\frac{\partial a \alpha}{\partial n_i}\right)_{T, P,
+            n_{i\ne j}} = \frac{a\alpha (b_i - b)}{b} + bRT\left[
+            \frac{(a\alpha)_i}{b_i RT} - \sum_j \frac{z_j (a\alpha)_j}
+            {b_j RT} + \frac{1}{A}\left(\ln \gamma_i - \frac{G^E}{RT}
+            + \frac{b_i}{b} - 1 - \ln b_i + \sum_j z_j \ln b_j \right)
+            \right]
+
+        Returns
+        -------
+        da_alpha_dns : list[float]
+            Mole number derivative of `alpha` of each component,
+            [kg*m^5/(mol^3*s^2)]
+
+        Notes
+        -----
+        This derivative is checked numerically.
+        '''
+        T, N, b, bs, zs = self.T, self.N, self.b, self.bs, self.zs
+        ge_model = self.ge_model
+        if T != ge_model.T:
+            ge_model = ge_model.to_T_xs(T, zs)
+        lngammas = [log(g) for g in ge_model.gammas()]
+        RT_inv = R_inv/T
+        out = PSRK_da_alpha_dns(T, b, self.a_alpha, bs, self.a_alphas, zs, lngammas,
+                                ge_model.GE()*RT_inv, self.A_inv, N)
+        return out if self.scalar else array(out)
 
     @property
     def dna_alpha_dns(self):
-        raise NotImplementedError("TODO")
+        r'''Helper method for calculating the partial molar derivatives of
+        `a_alpha` with the PSRK mixing rules. Note this is independent of the
+        phase.
+
+        .. math::
+            \left(\frac{\partial n a \alpha}{\partial n_i}\right)_{T, P,
+            n_{i\ne j}} = a\alpha + \left(\frac{\partial a \alpha}
+            {\partial n_i}\right)_{T, P, n_{i\ne j}}
+
+        Returns
+        -------
+        dna_alpha_dns : list[float]
+            Partial molar derivative of `alpha` of each component,
+            [kg*m^5/(mol^2*s^2)]
+        '''
+        a_alpha = self.a_alpha
+        if self.scalar:
+            return [a_alpha + v for v in self.da_alpha_dns]
+        return a_alpha + self.da_alpha_dns
 
     @property
     def d2a_alpha_dzizjs(self):
@@ -6433,7 +6769,7 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
     except:
         pass
 
-    def fugacity_coefficients(self, Z):
+    def fugacity_coefficients(self, Z, lnphis=None):
         r'''Calculate and return the fugacity coefficients of the ideal-gas
         phase (0 by definition).
 
@@ -6441,13 +6777,20 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
         ----------
         Z : float
             Compressibility of the mixture for a desired phase, [-]
+        lnphis : list[float], optional
+            Preallocated output to store the values in; a new list or array
+            is returned if not provided, [-]
 
         Returns
         -------
         log_phis : float
             Log fugacity coefficient for each species, [-]
         '''
-        return self.zeros1d
+        if lnphis is None:
+            return self.zeros1d
+        for i in range(self.N):
+            lnphis[i] = 0.0
+        return lnphis
 
     def dlnphis_dT(self, phase):
         r'''Calculate and return the temperature derivative of fugacity
@@ -7105,7 +7448,7 @@ class PRMIX(GCEOSMIX, PR):
             d3a_alpha_dT3s[i] = v
         return d3a_alpha_dT3s
 
-    def fugacity_coefficients(self, Z):
+    def fugacity_coefficients(self, Z, lnphis=None):
         r'''Literature formula for calculating fugacity coefficients for each
         species in a mixture. Verified numerically. Applicable to most
         derivatives of the Peng-Robinson equation of state as well.
@@ -7127,6 +7470,9 @@ class PRMIX(GCEOSMIX, PR):
         ----------
         Z : float
             Compressibility of the mixture for a desired phase, [-]
+        lnphis : list[float], optional
+            Preallocated output to store the values in; a new list or array
+            is returned if not provided, [-]
 
         Returns
         -------
@@ -7165,9 +7511,17 @@ class PRMIX(GCEOSMIX, PR):
         try:
             t50 = 2.0*x4/(a_alpha*two_root_two_B)
         except ZeroDivisionError:
-            return [0.0]*self.N
+            if lnphis is None:
+                return [0.0]*self.N
+            for i in range(self.N):
+                lnphis[i] = 0.0
+            return lnphis
         t51 = (x4 + (Z - 1.0)*two_root_two_B)/(b*two_root_two_B)
 
+        if lnphis is not None:
+            for i in range(self.N):
+                lnphis[i] = bs[i]*t51 - x0 - t50*a_alpha_j_rows[i]
+            return lnphis
         if self.scalar:
             return [bs[i]*t51 - x0 - t50*a_alpha_j_rows[i]
                     for i in range(self.N)]
@@ -8827,7 +9181,7 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
         return SRK_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.ms,
                                                       a_alphas=a_alphas, da_alpha_dTs=da_alpha_dTs, d2a_alpha_dT2s=d2a_alpha_dT2s)
 
-    def fugacity_coefficients(self, Z):
+    def fugacity_coefficients(self, Z, lnphis=None):
         r'''Literature formula for calculating fugacity coefficients for each
         species in a mixture. Verified numerically. Applicable to most
         derivatives of the SRK equation of state as well.
@@ -8849,6 +9203,9 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
         ----------
         Z : float
             Compressibility of the mixture for a desired phase, [-]
+        lnphis : list[float], optional
+            Preallocated output to store the values in; a new list or array
+            is returned if not provided, [-]
 
         Returns
         -------
@@ -8856,8 +9213,10 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
             Log fugacity coefficient for each species, [-]
         '''
         N = self.N
+        if lnphis is None:
+            lnphis = [0.0]*N if self.scalar else zeros(N)
         return SRK_lnphis(self.T, self.P, Z, self.b, self.a_alpha, self.bs, self.a_alpha_j_rows, N,
-                          lnphis=[0.0]*N if self.scalar else zeros(N))
+                          lnphis=lnphis)
 
 
     def dlnphis_dT(self, phase):
@@ -9763,8 +10122,8 @@ class PSRK(Mathias_Copeman_poly_a_alpha, PSRKMixingRules, SRKMIXTranslated):
     Two of `T`, `P`, and `V` are needed to solve the EOS.
 
     .. warning::
-        This class is not complete! Fugacities and their derivatives among
-        others are not yet implemented.
+        This class is not complete! Fugacities are implemented, but their
+        derivatives among others are not yet implemented.
 
     .. math::
         P = \frac{RT}{V-b} - \frac{a\alpha(T)}{V(V+b)}
@@ -10243,7 +10602,7 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
             zero_array = zeros(self.N)
         return self.ais, zero_array, zero_array
 
-    def fugacity_coefficients(self, Z):
+    def fugacity_coefficients(self, Z, lnphis=None):
         r'''Literature formula for calculating fugacity coefficients for each
         species in a mixture. Verified numerically.
         Called by `fugacities` on initialization, or by a solver routine
@@ -10257,6 +10616,9 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
         ----------
         Z : float
             Compressibility of the mixture for a desired phase, [-]
+        lnphis : list[float], optional
+            Preallocated output to store the values in; a new list or array
+            is returned if not provided, [-]
 
         Returns
         -------
@@ -10269,8 +10631,10 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
            Butterworth-Heinemann, 1985.
         '''
         N = self.N
+        if lnphis is None:
+            lnphis = [0.0]*N if self.scalar else zeros(N)
         return VDW_lnphis(self.T, self.P, Z, self.b, self.a_alpha, self.bs, self.a_alpha_roots, N,
-                          lnphis=[0.0]*N if self.scalar else zeros(N))
+                          lnphis=lnphis)
 
     def dlnphis_dT(self, phase):
         r'''Formula for calculating the temperature derivaitve of
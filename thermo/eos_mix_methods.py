@@ -50,6 +50,12 @@ Faster implementations which do not store N^2 matrices:
 
 .. autofunction:: a_alpha_quadratic_terms
 .. autofunction:: a_alpha_and_derivatives_quadratic_terms
+
+Implementations for `kijs` which are zero or of low rank, in O(N*rank):
+
+.. autofunction:: kijs_low_rank
+.. autofunction:: a_alpha_quadratic_terms_low_rank
+.. autofunction:: a_alpha_and_derivatives_quadratic_terms_low_rank
 '''
 '''
 Direct fugacity calls
@@ -62,24 +68,42 @@ implemented
 
 .. autofunction:: PR_lnphis
 .. autofunction:: PR_lnphis_fastest
-
+.. autofunction:: PSRK_lnphis_fastest
+.. autofunction:: PSRK_a_alpha
+
+Two-Phase PT Flash
+------------------
+The flash algorithms in :obj:`thermo.flash` work with phase objects, which
+cannot be compiled by numba. For the Peng-Robinson and SRK equations of state,
+a functional PT flash built on the direct fugacity calls is available; it can
+be compiled in nopython mode and parallelized over many states by
+`thermo.numba`.
+
+.. autofunction:: eos_mix_flash_TP
+.. autofunction:: eos_mix_flash_TP_many
+.. autofunction:: eos_mix_stability_TP
+.. autofunction:: eos_mix_Rachford_Rice
 
 '''
 # TODO: put methods like "_fast_init_specific" in here so numba can accelerate them.
 from fluids.constants import R
-from fluids.numerics import numpy as np, catanh
-from math import sqrt, log
+from fluids.numerics import numpy as np, catanh, inf, UnconvergedError
+from math import sqrt, log, exp
 from thermo.eos import eos_lnphi
+from thermo.eos_alpha_functions import PR_a_alphas_vectorized, SRK_a_alphas_vectorized
 from thermo.eos_volume import volume_solutions_halley, volume_solutions_fast
 
 __all__ = ['a_alpha_aijs_composition_independent',
            'a_alpha_and_derivatives', 'a_alpha_and_derivatives_full',
            'a_alpha_quadratic_terms', 'a_alpha_and_derivatives_quadratic_terms',
+           'kijs_low_rank', 'a_alpha_quadratic_terms_low_rank',
+           'a_alpha_and_derivatives_quadratic_terms_low_rank',
            'PR_lnphis', 'VDW_lnphis', 'SRK_lnphis', 'eos_mix_lnphis_general',
            
            'VDW_lnphis_fastest', 'PR_lnphis_fastest',
            'SRK_lnphis_fastest', 'RK_lnphis_fastest',
            'PR_translated_lnphis_fastest',
+           'PSRK_lnphis_fastest', 'PSRK_a_alpha', 'PSRK_da_alpha_dns',
            
            'G_dep_lnphi_d_helper', 
            
@@ -109,7 +133,10 @@ __all__ = ['a_alpha_aijs_composition_independent',
            
            'eos_mix_db_dns', 'eos_mix_da_alpha_dns',
            
-           'eos_mix_dV_dzs', 'eos_mix_a_alpha_volume']
+           'eos_mix_dV_dzs', 'eos_mix_a_alpha_volume',
+
+           'PR_SRK_lnphis_fastest', 'eos_mix_Rachford_Rice',
+           'eos_mix_stability_TP', 'eos_mix_flash_TP', 'eos_mix_flash_TP_many']
 
 
 R2 = R*R
@@ -745,6 +772,267 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
     return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
 
 
+def kijs_low_rank(kijs, max_rank=None):
+    r'''Factors a symmetric matrix of interaction parameters with a zero
+    diagonal into a sum of `rank` outer products, so the mixing rules can be
+    evaluated in O(N*rank) instead of O(N^2) operations.
+
+    .. math::
+        k_{ij} = \sum_m \lambda_m u_{m,i} u_{m,j}
+
+    A matrix of zeros has rank zero. A matrix where only a few species
+    interact with the others, as when kijs are set only between the light
+    components and the rest of a characterized oil, has a rank of at most
+    twice the number of those species.
+
+    Parameters
+    ----------
+    kijs : list[list[float]]
+        Constant kijs, [-]
+    max_rank : int, optional
+        Highest rank worth factoring; defaults to the rank at which the
+        factored mixing rules stop being faster, `(N - 4)//4`, [-]
+
+    Returns
+    -------
+    lambdas : list[float]
+        Eigenvalues of `kijs` which are not zero, or None if `kijs` cannot be
+        factored, [-]
+    vectors : list[list[float]]
+        Eigenvectors of `kijs` for each eigenvalue, or None if `kijs` cannot
+        be factored, [-]
+
+    Notes
+    -----
+    Matrices which are not symmetric, have any diagonal value which is not
+    zero, or whose rank is over `max_rank` are not factored; other than a
+    matrix of zeros, which is always factored, nothing is factored if
+    `max_rank` is under 1, as with fewer than 8 components by default.
+    Eigenvalues are kept until the factored matrix matches `kijs` to within
+    1e-15.
+
+    Examples
+    --------
+    >>> kijs_low_rank([[0.0]*3 for _ in range(3)])
+    ([], [])
+    >>> kijs = [[0.0] + [0.1]*11] + [[0.1] + [0.0]*11 for _ in range(11)]
+    >>> lambdas, vectors = kijs_low_rank(kijs)
+    >>> len(lambdas)
+    2
+    '''
+    N = len(kijs)
+    K = np.array(kijs, dtype=float)
+    if not np.any(K):
+        return [], []
+    if max_rank is None:
+        max_rank = (N - 4)//4
+    if max_rank < 1:
+        return None, None
+    if np.any(np.diag(K) != 0.0) or np.any(K != K.T):
+        return None, None
+    ws, us = np.linalg.eigh(K)
+    order = np.argsort(-np.abs(ws))
+    ws, us = ws[order], us[:, order]
+    for rank in range(1, max_rank + 1):
+        approx = np.dot(us[:, :rank]*ws[:rank], us[:, :rank].T)
+        if np.max(np.abs(approx - K)) <= 1e-15:
+            return ws[:rank].tolist(), us[:, :rank].T.tolist()
+    return None, None
+
+def a_alpha_quadratic_terms_low_rank(a_alphas, a_alpha_roots, T, zs, lambdas,
+                                     vectors, a_alpha_j_rows=None, vec0=None):
+    r'''Calculates the `a_alpha` term for an equation of state along with the
+    vector quantities needed to compute the fugacities of the mixture, the
+    same as :obj:`a_alpha_quadratic_terms`, for a `kijs` matrix factored by
+    :obj:`kijs_low_rank`. This takes O(N*rank) operations.
+
+    .. math::
+        \sum_j z_j(a\alpha)_{ij} = \sqrt{(a\alpha)_i}\left(\sum_j
+        z_j\sqrt{(a\alpha)_j} - \sum_m \lambda_m u_{m,i}\sum_j u_{m,j}
+        z_j\sqrt{(a\alpha)_j}\right)
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    lambdas : list[float]
+        Eigenvalues of `kijs` from :obj:`kijs_low_rank`, [-]
+    vectors : list[list[float]]
+        Eigenvectors of `kijs` from :obj:`kijs_low_rank`, [-]
+    a_alpha_j_rows : list[float], optional
+        EOS attractive term row destimation vector (does not need
+        to be zeroed, should be provided to prevent allocations),
+        [J^2/mol^2/Pa]
+    vec0 : list[float], optional
+        Empty vector, used in internal calculations, provide to avoid
+        the allocations; does not need to be zeroed, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+
+    Examples
+    --------
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> a_alpha_quadratic_terms_low_rank(a_alphas, a_alpha_roots, 299.0, zs, [0.083, -0.083], [[0.5**0.5, 0.5**0.5], [0.5**0.5, -0.5**0.5]])
+    (0.58562139582, [0.35469988173, 0.61604757237])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+    if vec0 is None:
+        vec0 = [0.0]*N
+    s = 0.0
+    for i in range(N):
+        vec0[i] = a_alpha_roots[i]*zs[i]
+        s += vec0[i]
+    for i in range(N):
+        a_alpha_j_rows[i] = s
+    for m in range(len(lambdas)):
+        u = vectors[m]
+        t = 0.0
+        for i in range(N):
+            t += u[i]*vec0[i]
+        t *= lambdas[m]
+        for i in range(N):
+            a_alpha_j_rows[i] -= t*u[i]
+
+    a_alpha = 0.0
+    for i in range(N):
+        a_alpha += vec0[i]*a_alpha_j_rows[i]
+        a_alpha_j_rows[i] *= a_alpha_roots[i]
+    return a_alpha, a_alpha_j_rows
+
+
+def a_alpha_and_derivatives_quadratic_terms_low_rank(a_alphas, a_alpha_roots,
+                                                     da_alpha_dTs, d2a_alpha_dT2s,
+                                                     T, zs, lambdas, vectors,
+                                                     a_alpha_j_rows=None,
+                                                     da_alpha_dT_j_rows=None):
+    r'''Calculates the `a_alpha` term, and its first two temperature
+    derivatives, for an equation of state along with the
+    vector quantities needed to compute the fugacitie and temperature
+    derivatives of fugacities of the mixture, the same as
+    :obj:`a_alpha_and_derivatives_quadratic_terms`, for a `kijs` matrix
+    factored by :obj:`kijs_low_rank`. This takes O(N*rank) operations.
+
+    With :math:`r_i = \sqrt{(a\alpha)_i}`, the mixing rule is
+    :math:`a\alpha = \sum_i\sum_j z_i z_j (1 - k_{ij}) r_i r_j`, and its
+    temperature derivatives follow from those of :math:`r_i`:
+
+    .. math::
+        \frac{\partial r_i}{\partial T} = \frac{1}{2r_i}
+        \frac{\partial (a\alpha)_i}{\partial T}
+
+    .. math::
+        \frac{\partial^2 r_i}{\partial T^2} = \frac{1}{r_i}\left(\frac{1}{2}
+        \frac{\partial^2 (a\alpha)_i}{\partial T^2} - \left(\frac{\partial r_i}
+        {\partial T}\right)^2\right)
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    da_alpha_dTs : list[float]
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    lambdas : list[float]
+        Eigenvalues of `kijs` from :obj:`kijs_low_rank`, [-]
+    vectors : list[list[float]]
+        Eigenvectors of `kijs` from :obj:`kijs_low_rank`, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+    da_alpha_dT_j_rows : list[float]
+        Temperature derivative of EOS attractive term row sums, [J^2/mol^2/Pa/K]
+
+    Examples
+    --------
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> da_alpha_dTs = [-0.0005102028006086241, -0.0011131153520304886]
+    >>> d2a_alpha_dT2s = [1.8651128859234162e-06, 3.884331923127011e-06]
+    >>> a_alpha_and_derivatives_quadratic_terms_low_rank(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, [0.083, -0.083], [[0.5**0.5, 0.5**0.5], [0.5**0.5, -0.5**0.5]])
+    (0.58562139582, -0.001018667672, 3.56669817856e-06, [0.35469988173, 0.61604757237], [-0.000672387374, -0.001064293501])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+    if da_alpha_dT_j_rows is None:
+        da_alpha_dT_j_rows = [0.0]*N
+    # z_i*r_i, dr_i/dT, and z_i*d2r_i/dT2
+    vec0, vec1, vec2 = [0.0]*N, [0.0]*N, [0.0]*N
+    s0 = s1 = 0.0
+    for i in range(N):
+        root_inv = 1.0/a_alpha_roots[i]
+        dr = 0.5*da_alpha_dTs[i]*root_inv
+        vec0[i] = a_alpha_roots[i]*zs[i]
+        vec1[i] = dr
+        vec2[i] = (0.5*d2a_alpha_dT2s[i] - dr*dr)*root_inv*zs[i]
+        s0 += vec0[i]
+        s1 += dr*zs[i]
+
+    # The rows of (1 - kij) times z_j*r_j and z_j*dr_j/dT are accumulated in
+    # the outputs, then scaled
+    for i in range(N):
+        a_alpha_j_rows[i] = s0
+        da_alpha_dT_j_rows[i] = s1
+    for m in range(len(lambdas)):
+        u = vectors[m]
+        t0 = t1 = 0.0
+        for i in range(N):
+            t0 += u[i]*vec0[i]
+            t1 += u[i]*vec1[i]*zs[i]
+        t0 *= lambdas[m]
+        t1 *= lambdas[m]
+        for i in range(N):
+            a_alpha_j_rows[i] -= t0*u[i]
+            da_alpha_dT_j_rows[i] -= t1*u[i]
+
+    a_alpha = da_alpha_dT = d2a_alpha_dT2 = 0.0
+    for i in range(N):
+        w0, w1 = a_alpha_j_rows[i], da_alpha_dT_j_rows[i]
+        d2a_alpha_dT2 += vec2[i]*w0 + vec1[i]*zs[i]*w1
+        a_alpha_j_rows[i] = a_alpha_roots[i]*w0
+        da_alpha_dT_j_rows[i] = vec1[i]*w0 + a_alpha_roots[i]*w1
+        a_alpha += zs[i]*a_alpha_j_rows[i]
+        da_alpha_dT += zs[i]*da_alpha_dT_j_rows[i]
+    d2a_alpha_dT2 += d2a_alpha_dT2
+
+    return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
+
+
 
 
 def eos_mix_dV_dzs(T, P, Z, b, delta, epsilon, a_alpha, db_dzs, ddelta_dzs,
@@ -844,7 +1132,10 @@ def G_dep_lnphi_d_helper(T, P, b, delta, epsilon, a_alpha, N,
 
 def eos_mix_a_alpha_volume(gas, T, P, zs, kijs, b, delta, epsilon, a_alphas, a_alpha_roots, a_alpha_j_rows=None, vec0=None):
     a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs, a_alpha_j_rows, vec0)
+    Z = eos_mix_Z(gas, T, P, b, delta, epsilon, a_alpha)
+    return Z, a_alpha, a_alpha_j_rows
 
+def eos_mix_Z(gas, T, P, b, delta, epsilon, a_alpha):
     V0, V1, V2 = volume_solutions_halley(T, P, b, delta, epsilon, a_alpha)
     if not gas:
         # Prefer liquid, ensure V0 is the smalest root
@@ -859,8 +1150,7 @@ def eos_mix_a_alpha_volume(gas, T, P, zs, kijs, b, delta, epsilon, a_alphas, a_a
                 V0 = V1
             if V0 < V2 and V2 > b:
                 V0 = V2
-    Z = Z = P*V0/(R*T)
-    return Z, a_alpha, a_alpha_j_rows
+    return P*V0/(R*T)
 
 def eos_mix_db_dns(b, bs, N, out=None):
     if out is None:
@@ -1452,3 +1742,553 @@ def SRK_translated_lnphis_fastest(zs, T, P, N, kijs, l, g, b0s, bs, cs, a_alphas
                            a_alpha_roots, N, db_dns, da_alpha_dns, ddelta_dns, 
                            depsilon_dns, lnphis=lnphis)
 
+
+
+def PSRK_a_alpha(T, b, bs, a_alphas, zs, GE_RT, A_inv, N):
+    r'''Calculates the `a_alpha` term of the PSRK mixing rules from
+    the pure-component `a_alphas` and the excess Gibbs energy of the mixture.
+
+    .. math::
+        a\alpha = bRT \left[ \sum_i \frac{z_i (a\alpha)_i}{b_i RT}
+        + \frac{1}{A}\left(\frac{G^E}{RT} + \sum_i z_i \ln
+        \left(\frac{b}{b_i}\right) \right)\right]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    bs : list[float]
+        Pure component covolumes, [m^3/mol]
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    zs : list[float]
+        Mole fractions of each species
+    GE_RT : float
+        Dimensionless excess Gibbs energy of the mixture, [-]
+    A_inv : float
+        Inverse of the constant `A` of the mixing rules, [-]
+    N : int
+        Number of components, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+
+    Examples
+    --------
+    >>> PSRK_a_alpha(313.0, 7.548145e-05, [2.9707465e-05, 0.000121255439], [0.361992804, 3.63342898],
+    ...              [0.5, 0.5], 0.0752545976, 1.0/log(1.1/2.1), 2)
+    1.49828
+    '''
+    tot0, tot1 = 0.0, 0.0
+    for i in range(N):
+        bi_inv = 1.0/bs[i]
+        tot0 += zs[i]*a_alphas[i]*bi_inv
+        tot1 += zs[i]*log(b*bi_inv)
+    return b*(tot0 + R*T*A_inv*(GE_RT + tot1))
+
+def PSRK_da_alpha_dns(T, b, a_alpha, bs, a_alphas, zs, lngammas, GE_RT, A_inv, N, out=None):
+    if out is None:
+        out = [0.0]*N
+    RT = R*T
+    RT_inv = 1.0/RT
+    b_inv = 1.0/b
+    alpha_sum, lnb_sum = 0.0, 0.0
+    for i in range(N):
+        alpha_sum += zs[i]*a_alphas[i]/bs[i]
+        lnb_sum += zs[i]*log(bs[i])
+    alpha_sum *= RT_inv
+    t0 = lnb_sum - GE_RT - 1.0
+    bRT = b*RT
+    a_alpha_b = a_alpha*b_inv
+    for i in range(N):
+        bi = bs[i]
+        out[i] = (a_alpha_b*(bi - b)
+                  + bRT*(a_alphas[i]*RT_inv/bi - alpha_sum
+                         + A_inv*(lngammas[i] + bi*b_inv - log(bi) + t0)))
+    return out
+
+def PSRK_lnphis_fastest(zs, T, P, N, l, g, b0s, bs, cs, a_alphas, A_inv, lngammas,
+                        lnphis=None):
+    r'''Calculates the log fugacity coefficients of the PSRK equation of
+    state at a composition, given the pure-component `a_alphas` at `T` and
+    the log activity coefficients of the excess Gibbs energy model at the
+    same composition and temperature.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of each species
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    N : int
+        Number of components, [-]
+    l : bool
+        Whether or not to prefer the liquid root, [-]
+    g : bool
+        Whether or not to prefer the gas root, [-]
+    b0s : list[float]
+        Untranslated pure component covolumes, [m^3/mol]
+    bs : list[float]
+        Pure component covolumes, [m^3/mol]
+    cs : list[float]
+        Volume translation parameters, [m^3/mol]
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    A_inv : float
+        Inverse of the constant `A` of the mixing rules, [-]
+    lngammas : list[float]
+        Log activity coefficients, [-]
+    lnphis : list[float], optional
+        Array to store the results in, [-]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients, [-]
+    '''
+    b0, c, GE_RT = 0.0, 0.0, 0.0
+    for i in range(N):
+        b0 += b0s[i]*zs[i]
+        c += cs[i]*zs[i]
+        GE_RT += zs[i]*lngammas[i]
+    b = b0 - c
+    delta = c + c + b0
+    epsilon = c*(b0 + c)
+    a_alpha = PSRK_a_alpha(T, b, bs, a_alphas, zs, GE_RT, A_inv, N)
+    Z = eos_mix_Z(g, T, P, b, delta, epsilon, a_alpha)
+
+    db_dns = eos_mix_db_dns(b, bs, N, out=None)
+    da_alpha_dns = PSRK_da_alpha_dns(T, b, a_alpha, bs, a_alphas, zs, lngammas, GE_RT, A_inv, N, out=None)
+    depsilon_dns = SRK_translated_depsilon_dns(b0s, cs, b, c, N, out=None)
+    ddelta_dns = SRK_translated_ddelta_dns(b0s, cs, delta, N, out=None)
+    return eos_mix_lnphis_general(T, P, Z, b, delta, epsilon, a_alpha, bs,
+                           a_alphas, N, db_dns, da_alpha_dns, ddelta_dns,
+                           depsilon_dns, lnphis=lnphis)
+
+
+PR_c1R2 = 0.4572355289213821893834601962251837888504*R2
+PR_c2R = 0.0777960739038884559718447100373331839711*R
+SRK_c1R2 = 0.4274802335403414043909906940611707345513*R2
+SRK_c2R = 0.08664034996495772158907020242607611685675*R
+
+
+def PR_SRK_lnphis_fastest(PR, zs, T, P, N, kijs, gas, bs, a_alphas, a_alpha_roots,
+                          a_alpha_j_rows=None, vec0=None, lnphis=None):
+    if PR:
+        return PR_lnphis_fastest(zs, T, P, N, kijs, not gas, gas, bs, a_alphas,
+                                 a_alpha_roots, a_alpha_j_rows, vec0, lnphis)
+    return SRK_lnphis_fastest(zs, T, P, N, kijs, not gas, gas, bs, a_alphas,
+                              a_alpha_roots, a_alpha_j_rows, vec0, lnphis)
+
+
+def eos_mix_Rachford_Rice(zs, Ks, N, guess=0.5, maxiter=100):
+    r'''Solves the Rachford-Rice equation for the vapor fraction with a
+    safeguarded Newton's method. The search is bounded by the asymptotes
+    :math:`\frac{1}{1-K_{max}}` and :math:`\frac{1}{1-K_{min}}`, so the
+    solution of a negative flash (vapor fraction outside of [0, 1]) is
+    returned as well.
+
+    .. math::
+        \sum_i \frac{z_i(K_i-1)}{1 + \frac{V}{F}(K_i-1)} = 0
+
+    Parameters
+    ----------
+    zs : list[float]
+        Overall mole fractions, [-]
+    Ks : list[float]
+        Equilibrium K-values, [-]
+    N : int
+        Number of components, [-]
+    guess : float, optional
+        Initial guess for the vapor fraction, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+
+    Returns
+    -------
+    VF : float
+        Vapor fraction; -inf if all K-values are below one, inf if all
+        K-values are above one, [-]
+
+    Examples
+    --------
+    >>> eos_mix_Rachford_Rice([0.5, 0.3, 0.2], [1.685, 0.742, 0.532], 3)
+    0.6907302627738
+    '''
+    K_max = K_min = Ks[0]
+    for i in range(1, N):
+        if Ks[i] > K_max:
+            K_max = Ks[i]
+        if Ks[i] < K_min:
+            K_min = Ks[i]
+    if K_max <= 1.0:
+        return -inf
+    if K_min >= 1.0:
+        return inf
+    low = 1.0/(1.0 - K_max)
+    high = 1.0/(1.0 - K_min)
+    VF = guess
+    if VF <= low or VF >= high:
+        VF = 0.5*(low + high)
+    for _ in range(maxiter):
+        err, derr = 0.0, 0.0
+        for i in range(N):
+            Kim1 = Ks[i] - 1.0
+            t = 1.0/(1.0 + VF*Kim1)
+            zKt = zs[i]*Kim1*t
+            err += zKt
+            derr -= zKt*Kim1*t
+        # The objective function decreases monotonically with the vapor fraction
+        if err > 0.0:
+            low = VF
+        else:
+            high = VF
+        if derr == 0.0:
+            break
+        VF_new = VF - err/derr
+        if VF_new <= low or VF_new >= high:
+            VF_new = 0.5*(low + high)
+        if abs(VF_new - VF) <= 1e-15*(1.0 + abs(VF)):
+            VF = VF_new
+            break
+        VF = VF_new
+    return VF
+
+
+def eos_mix_stability_TP(PR, T, P, zs, N, kijs, bs, a_alphas, a_alpha_roots,
+                         Ks_Wilson, maxiter=100, tol=1e-12):
+    r'''Performs a Michelsen tangent plane distance stability test of a
+    cubic equation of state mixture at a specified temperature and pressure.
+    Two trial phases are tried, a vapor-like one initialized with
+    :math:`z_i K_i` and a liquid-like one initialized with
+    :math:`z_i/K_i`, and each is converged with successive substitution.
+
+    Parameters
+    ----------
+    PR : bool
+        Whether the Peng-Robinson (True) or SRK (False) EOS is used, [-]
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    N : int
+        Number of components, [-]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    bs : list[float]
+        Pure component covolumes, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [Pa*m^6/mol^2]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`, [Pa^0.5*m^3/mol]
+    Ks_Wilson : list[float]
+        Initial K-values, normally from Wilson's equation, [-]
+    maxiter : int, optional
+        Maximum number of iterations for each trial phase, [-]
+    tol : float, optional
+        Convergence tolerance on the sum of squared changes in
+        :math:`\ln W_i`, [-]
+
+    Returns
+    -------
+    unstable : bool
+        Whether or not the feed is unstable, [-]
+    Ks : list[float]
+        Initial K-values for a two-phase flash derived from the most
+        unstable trial phase; `Ks_Wilson` if the feed is stable, [-]
+    '''
+    lnphis_l = PR_SRK_lnphis_fastest(PR, zs, T, P, N, kijs, False, bs, a_alphas, a_alpha_roots)
+    lnphis_g = PR_SRK_lnphis_fastest(PR, zs, T, P, N, kijs, True, bs, a_alphas, a_alpha_roots)
+    G_l, G_g = 0.0, 0.0
+    for i in range(N):
+        G_l += zs[i]*lnphis_l[i]
+        G_g += zs[i]*lnphis_g[i]
+    lnphis_z = lnphis_l if G_l < G_g else lnphis_g
+
+    ds = [0.0]*N
+    for i in range(N):
+        if zs[i] > 0.0:
+            ds[i] = log(zs[i]) + lnphis_z[i]
+        else:
+            ds[i] = -1e100
+
+    Ks = [0.0]*N
+    for i in range(N):
+        Ks[i] = Ks_Wilson[i]
+    unstable = False
+    best_sum = 1.0
+    Ws = [0.0]*N
+    ws = [0.0]*N
+    lnWs = [0.0]*N
+    for trial in range(2):
+        gas = trial == 0
+        for i in range(N):
+            Ws[i] = zs[i]*Ks_Wilson[i] if gas else zs[i]/Ks_Wilson[i]
+            lnWs[i] = log(Ws[i]) if Ws[i] > 0.0 else -1e100
+        sum_Ws = 1.0
+        for _ in range(maxiter):
+            sum_Ws = 0.0
+            for i in range(N):
+                sum_Ws += Ws[i]
+            sum_inv = 1.0/sum_Ws
+            for i in range(N):
+                ws[i] = Ws[i]*sum_inv
+            lnphis_trial = PR_SRK_lnphis_fastest(PR, ws, T, P, N, kijs, gas, bs, a_alphas, a_alpha_roots)
+            err = 0.0
+            for i in range(N):
+                lnW = ds[i] - lnphis_trial[i]
+                diff = lnW - lnWs[i]
+                err += diff*diff
+                lnWs[i] = lnW
+                Ws[i] = exp(lnW)
+            if err < tol:
+                break
+        sum_Ws = 0.0
+        for i in range(N):
+            sum_Ws += Ws[i]
+        sum_inv = 1.0/sum_Ws
+        trivial = 0.0
+        for i in range(N):
+            ws[i] = Ws[i]*sum_inv
+            diff = ws[i] - zs[i]
+            trivial += diff*diff
+        # Negative tangent plane distance with a non-trivial trial phase
+        if sum_Ws > 1.0 + 1e-7 and trivial > 1e-8 and sum_Ws > best_sum:
+            unstable = True
+            best_sum = sum_Ws
+            for i in range(N):
+                # Unnormalized so the Rachford-Rice solution starts inside (0, 1)
+                if zs[i] > 0.0:
+                    Ks[i] = Ws[i]/zs[i] if gas else zs[i]/Ws[i]
+                else:
+                    Ks[i] = 1.0
+    return unstable, Ks
+
+
+def eos_mix_flash_TP(T, P, zs, Tcs, Pcs, omegas, kijs, PR=True,
+                     maxiter=5000, tol=1e-13):
+    r'''Performs a two-phase vapor-liquid flash of a Peng-Robinson or SRK
+    mixture at a specified temperature and pressure, entirely with
+    functions that `thermo.numba` compiles in nopython mode.
+
+    The feed is first checked with a Michelsen stability test
+    (:obj:`eos_mix_stability_TP`); if it is unstable, successive
+    substitution is performed on the K-values, with the Rachford-Rice
+    equation solved by :obj:`eos_mix_Rachford_Rice` and the fugacity
+    coefficients of each phase from :obj:`PR_lnphis_fastest` or
+    :obj:`SRK_lnphis_fastest`. A stable feed is identified as a liquid or
+    a gas by whichever volume root of the EOS has the lower Gibbs energy;
+    if the EOS has only one root at the feed conditions, the Wilson vapor
+    score of :obj:`thermo.phase_identification.vapor_score_Wilson` is used.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    Tcs : list[float]
+        Critical temperatures of all species, [K]
+    Pcs : list[float]
+        Critical pressures of all species, [Pa]
+    omegas : list[float]
+        Acentric factors of all species, [-]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    PR : bool, optional
+        Whether to use the Peng-Robinson (True) or SRK (False) EOS, [-]
+    maxiter : int, optional
+        Maximum number of successive substitution iterations, [-]
+    tol : float, optional
+        Convergence tolerance on the sum of squared changes in
+        :math:`\ln K_i`, [-]
+
+    Returns
+    -------
+    VF : float
+        Vapor fraction; exactly 0 or 1 for a single phase, [-]
+    xs : list[float]
+        Liquid mole fractions; the feed for a single phase, [-]
+    ys : list[float]
+        Gas mole fractions; the feed for a single phase, [-]
+
+    Raises
+    ------
+    UnconvergedError
+        If the successive substitution does not converge in `maxiter`
+        iterations
+
+    Notes
+    -----
+    This function is intended for calculations on large numbers of
+    states; :obj:`thermo.flash.FlashVL` remains the general, object-based
+    interface. Use it with `thermo.numba` for best performance.
+
+    Examples
+    --------
+    >>> VF, xs, ys = eos_mix_flash_TP(T=300.0, P=1e6, zs=[.5, .5],
+    ... Tcs=[304.2, 507.6], Pcs=[7376460.0, 3025000.0], omegas=[0.2252, 0.2975],
+    ... kijs=[[0.0, 0.0], [0.0, 0.0]])
+    >>> VF, xs, ys
+    (0.37212778, [0.21834417, 0.78165582], [0.97522349, 0.02477650])
+    '''
+    N = len(zs)
+    bs = [0.0]*N
+    ais = [0.0]*N
+    ms = [0.0]*N
+    Ks = [0.0]*N
+    P_inv = 1.0/P
+    for i in range(N):
+        Tc, Pc, omega = Tcs[i], Pcs[i], omegas[i]
+        if PR:
+            bs[i] = PR_c2R*Tc/Pc
+            ais[i] = PR_c1R2*Tc*Tc/Pc
+            ms[i] = omega*(-0.26992*omega + 1.54226) + 0.37464
+        else:
+            bs[i] = SRK_c2R*Tc/Pc
+            ais[i] = SRK_c1R2*Tc*Tc/Pc
+            ms[i] = omega*(1.574 - 0.176*omega) + 0.480
+        Ks[i] = Pc*P_inv*exp(5.37*(1.0 + omega)*(1.0 - Tc/T))
+    if PR:
+        a_alphas = PR_a_alphas_vectorized(T, Tcs, ais, ms)
+    else:
+        a_alphas = SRK_a_alphas_vectorized(T, Tcs, ais, ms)
+    a_alpha_roots = [0.0]*N
+    for i in range(N):
+        a_alpha_roots[i] = sqrt(a_alphas[i])
+
+    xs = [0.0]*N
+    ys = [0.0]*N
+
+    unstable, Ks = eos_mix_stability_TP(PR, T, P, zs, N, kijs, bs, a_alphas,
+                                        a_alpha_roots, Ks)
+    VF = 0.5
+    if unstable:
+        lnKs = [0.0]*N
+        for i in range(N):
+            lnKs[i] = log(Ks[i])
+        converged = False
+        for _ in range(maxiter):
+            # Negative flashes are allowed while iterating
+            VF = eos_mix_Rachford_Rice(zs, Ks, N, VF)
+            if VF == inf or VF == -inf:
+                unstable = False
+                break
+            for i in range(N):
+                xs[i] = zs[i]/(1.0 + VF*(Ks[i] - 1.0))
+                ys[i] = Ks[i]*xs[i]
+            lnphis_l = PR_SRK_lnphis_fastest(PR, xs, T, P, N, kijs, False, bs, a_alphas, a_alpha_roots)
+            lnphis_g = PR_SRK_lnphis_fastest(PR, ys, T, P, N, kijs, True, bs, a_alphas, a_alpha_roots)
+            err, trivial = 0.0, 0.0
+            for i in range(N):
+                lnK = lnphis_l[i] - lnphis_g[i]
+                diff = lnK - lnKs[i]
+                err += diff*diff
+                trivial += lnK*lnK
+                lnKs[i] = lnK
+                Ks[i] = exp(lnK)
+            if trivial < 1e-10:
+                unstable = False
+                break
+            if err < tol:
+                converged = True
+                break
+        if unstable and not converged:
+            raise UnconvergedError("End of successive substitution without convergence")
+        if unstable:
+            VF = eos_mix_Rachford_Rice(zs, Ks, N, VF)
+            if VF <= 0.0 or VF >= 1.0:
+                unstable = False
+            else:
+                for i in range(N):
+                    xs[i] = zs[i]/(1.0 + VF*(Ks[i] - 1.0))
+                    ys[i] = Ks[i]*xs[i]
+    if not unstable:
+        # The lower Gibbs energy root; both are the same with only one root
+        lnphis_l = PR_SRK_lnphis_fastest(PR, zs, T, P, N, kijs, False, bs, a_alphas, a_alpha_roots)
+        lnphis_g = PR_SRK_lnphis_fastest(PR, zs, T, P, N, kijs, True, bs, a_alphas, a_alpha_roots)
+        G_dep_diff = 0.0
+        for i in range(N):
+            G_dep_diff += zs[i]*(lnphis_g[i] - lnphis_l[i])
+        if G_dep_diff == 0.0:
+            score = 0.0
+            for i in range(N):
+                Kim1 = Pcs[i]*P_inv*exp(5.37*(1.0 + omegas[i])*(1.0 - Tcs[i]/T)) - 1.0
+                score += zs[i]*Kim1/(1.0 + 0.5*Kim1)
+            VF = 1.0 if score > 0.0 else 0.0
+        else:
+            VF = 1.0 if G_dep_diff < 0.0 else 0.0
+        for i in range(N):
+            xs[i] = ys[i] = zs[i]
+    return VF, xs, ys
+
+
+def eos_mix_flash_TP_many(Ts, Ps, zs_list, Tcs, Pcs, omegas, kijs, PR=True):
+    r'''Performs :obj:`eos_mix_flash_TP` for a batch of states. When
+    compiled by `thermo.numba`, the states are flashed in parallel with
+    `numba.prange`.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures, [K]
+    Ps : list[float]
+        Pressures, [Pa]
+    zs_list : list[list[float]]
+        Overall mole fractions of each state, [-]
+    Tcs : list[float]
+        Critical temperatures of all species, [K]
+    Pcs : list[float]
+        Critical pressures of all species, [Pa]
+    omegas : list[float]
+        Acentric factors of all species, [-]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    PR : bool, optional
+        Whether to use the Peng-Robinson (True) or SRK (False) EOS, [-]
+
+    Returns
+    -------
+    VFs : list[float]
+        Vapor fractions of each state, [-]
+    xs_list : list[list[float]]
+        Liquid mole fractions of each state, [-]
+    ys_list : list[list[float]]
+        Gas mole fractions of each state, [-]
+
+    Raises
+    ------
+    UnconvergedError
+        If the flash of any state does not converge
+
+    Examples
+    --------
+    >>> VFs, xs_list, ys_list = eos_mix_flash_TP_many(Ts=[300.0, 400.0], Ps=[1e6, 1e6],
+    ... zs_list=[[.5, .5], [.5, .5]], Tcs=[304.2, 507.6], Pcs=[7376460.0, 3025000.0],
+    ... omegas=[0.2252, 0.2975], kijs=[[0.0, 0.0], [0.0, 0.0]], PR=False)
+    >>> VFs
+    [0.37001920, 1.0]
+    '''
+    M = len(Ts)
+    N = len(Tcs)
+    VFs = [0.0]*M
+    xs_list = [None]*M # numba: delete
+    ys_list = [None]*M # numba: delete
+#    xs_list = np.zeros((M, N)) # numba: uncomment
+#    ys_list = np.zeros((M, N)) # numba: uncomment
+    for i in range(M): # numba: prange
+        VF, xs, ys = eos_mix_flash_TP(Ts[i], Ps[i], zs_list[i], Tcs, Pcs, omegas, kijs, PR)
+        VFs[i] = VF
+        xs_list[i] = xs
+        ys_list[i] = ys
+    return VFs, xs_list, ys_list
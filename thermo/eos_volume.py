@@ -63,6 +63,7 @@ Analytical Solvers
 Numerical Solvers
 -----------------
 .. autofunction:: volume_solutions_halley
+.. autofunction:: volume_solutions_halley_many
 .. autofunction:: volume_solutions_NR
 .. autofunction:: volume_solutions_NR_low_P
 
@@ -77,6 +78,7 @@ Higher-Precision Solvers
 from __future__ import division, print_function
 __all__ = ['volume_solutions_mpmath', 'volume_solutions_mpmath_float',
            'volume_solutions_NR', 'volume_solutions_NR_low_P', 'volume_solutions_halley',
+           'volume_solutions_halley_many',
            'volume_solutions_fast', 'volume_solutions_Cardano', 'volume_solutions_a1',
            'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal',
            'volume_solutions_doubledouble_float',
@@ -992,6 +994,195 @@ def volume_solutions_halley(T, P, b, delta, epsilon, a_alpha):
         return (V0, V1, V2)
     return (0.0, 0.0, 0.0)
 
+def volume_solutions_halley_many(Ts, Ps, bs, deltas, epsilons, a_alphas):
+    r'''Solves the cubic EOS for many states at once with the same algorithm as
+    :obj:`volume_solutions_halley`, and with the same results. With NumPy,
+    the iterations are performed on all states together; states which need
+    the special handling of extremely high `a_alpha` or extremely low
+    pressure are solved individually. When compiled by `thermo.numba`, the
+    states are solved in parallel with `numba.prange`.
+
+    Parameters
+    ----------
+    Ts : ndarray[float]
+        Temperatures, [K]
+    Ps : ndarray[float]
+        Pressures, [Pa]
+    bs : ndarray[float]
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    deltas : ndarray[float]
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    epsilons : ndarray[float]
+        Coefficients calculated by EOS-specific method, [m^6/mol^2]
+    a_alphas : ndarray[float]
+        Coefficients calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : ndarray[float]
+        Three possible molar volumes for each state, in the same order as
+        :obj:`volume_solutions_halley` with roots which were not found set
+        to zero; shape (n, 3), [m^3/mol]
+
+    Notes
+    -----
+    With NumPy, inputs of different shapes are broadcast together and then
+    flattened.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> Vs = volume_solutions_halley_many(np.array([300.0, 300.0]), np.array([1e5, 1e7]),
+    ... np.array([2.68e-5]*2), np.array([5.36e-5]*2), np.array([-7.18e-10]*2),
+    ... np.array([0.279]*2))
+    >>> Vs.shape
+    (2, 3)
+    >>> Vs[0].tolist() == list(volume_solutions_halley(300.0, 1e5, 2.68e-5, 5.36e-5, -7.18e-10, 0.279))
+    True
+    '''
+    return _volume_solutions_halley_numpy(Ts, Ps, bs, deltas, epsilons, a_alphas) # numba: delete
+    N = len(Ts)
+    Vs = np.zeros((N, 3))
+    for i in range(N): # numba: prange
+        V0, V1, V2 = volume_solutions_halley(Ts[i], Ps[i], bs[i], deltas[i], epsilons[i], a_alphas[i])
+        Vs[i, 0] = V0
+        Vs[i, 1] = V1
+        Vs[i, 2] = V2
+    return Vs
+
+def _volume_solutions_halley_numpy(Ts, Ps, bs, deltas, epsilons, a_alphas):
+    # Each step mirrors volume_solutions_halley with masks in place of
+    # branches, so the results are identical
+    Ts, Ps, bs, deltas, epsilons, a_alphas = [np.ravel(v) for v in np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (Ts, Ps, bs, deltas, epsilons, a_alphas)])]
+    n = Ts.size
+    Vs = np.zeros((n, 3))
+    with np.errstate(all='ignore'):
+        ideal = a_alphas/(bs*(bs + deltas) + epsilons) + Ps == Ps
+        Vs[ideal, 0] = bs[ideal] + R*Ts[ideal]/Ps[ideal]
+        individual = ~ideal & ((a_alphas > 1e4) | (Ps < 1e-2))
+        for i in np.nonzero(individual)[0].tolist():
+            Vs[i] = volume_solutions_halley(float(Ts[i]), float(Ps[i]), float(bs[i]),
+                                            float(deltas[i]), float(epsilons[i]), float(a_alphas[i]))
+        rows = np.nonzero(~(ideal | individual))[0]
+        T, P, b, delta, epsilon, a_alpha = (Ts[rows], Ps[rows], bs[rows], deltas[rows],
+                                            epsilons[rows], a_alphas[rows])
+
+        RT = R*T
+        RT_2 = RT + RT
+        a_alpha_2 = a_alpha + a_alpha
+        P_inv = 1.0/P
+
+        RT_inv = R_inv/T
+        P_RT_inv = P*RT_inv
+        B = etas = b*P_RT_inv
+        deltas_ = delta*P_RT_inv
+        thetas = a_alpha*P_RT_inv*RT_inv
+        epsilons_ = epsilon*P_RT_inv*P_RT_inv
+
+        b2 = (deltas_ - B - 1.0)
+        c2 = (thetas + epsilons_ - deltas_*(B + 1.0))
+        d2 = -(epsilons_*(B + 1.0) + thetas*etas)
+        RT_P = RT*P_inv
+
+        low_V, high_V = b*(1.0+8e-16), -RT_P*d2/c2
+        high_V = np.where(high_V <= low_V, b*1.000001, high_V)
+
+        V = high_V.copy()
+        # Iteration each state stopped at; -1 if it did not
+        stopped = np.full(rows.size, -1)
+        active = np.arange(rows.size)
+        for j in range(50):
+            Va, ba, delta_a, RT_a = V[active], b[active], delta[active], RT[active]
+            a_alpha_a = a_alpha[active]
+            x0_inv = 1.0/(Va - ba)
+            x1_inv = 1.0/(Va*(Va + delta_a) + epsilon[active])
+            x2 = Va + Va + delta_a
+            fval = RT_a*x0_inv - P[active] - a_alpha_a*x1_inv
+            negative = fval < 0.0
+            high_Va = np.where(negative, Va, high_V[active])
+            low_Va = np.where(negative, low_V[active], Va)
+            if j == 0:
+                # If we are in the first iteration we have not decided on a upper bound yet
+                first_high = RT_P[active]*10.0
+                first_high = np.where(first_high < 10.0*ba, 10.0*ba, first_high)
+                high_Va = np.where(negative, high_Va, first_high)
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alpha_a*x1_inv2
+            fder = x2*x3 - RT_a*x0_inv2
+            fder2 = RT_2[active]*x0_inv2*x0_inv - a_alpha_2[active]*x2*x2*x1_inv2*x1_inv + x3 + x3
+
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            rel_err = np.abs(fval*P_inv[active])
+            step_den = 1.0 - 0.5*step*fder2*fder_inv
+            step = np.where(step_den != 0.0, step/step_den, step)
+            V_new = Va - step
+            converged = np.abs(1.0 - V_new/Va) < 6e-16
+            if j > 25:
+                converged |= rel_err < 1e-12
+            outside = ~converged & ((V_new <= low_Va) | (V_new >= high_Va))
+            bisected = 0.5*(low_Va + high_Va)
+            V_new = np.where(outside, bisected, V_new)
+            # The interval cannot be further divided; keep the last volume
+            exhausted = outside & ((bisected == low_Va) | (bisected == high_Va))
+            V[active] = np.where(exhausted, Va, V_new)
+            high_V[active] = high_Va
+            low_V[active] = low_Va
+
+            done = converged | exhausted
+            stopped[active[done]] = j
+            active = active[~done]
+            if not active.size:
+                break
+
+        ok = (stopped != -1) & (stopped != 49)
+        rows, V, T, P, b, delta, epsilon, a_alpha = (rows[ok], V[ok], T[ok], P[ok], b[ok], delta[ok],
+                                                     epsilon[ok], a_alpha[ok])
+        RT, RT_2, a_alpha_2, P_RT_inv, RT_P = RT[ok], RT_2[ok], a_alpha_2[ok], P_RT_inv[ok], RT_P[ok]
+        b2, d2 = b2[ok], d2[ok]
+        Vs[rows, 0] = V
+
+        # Deflate the cubic as in deflate_cubic_real_roots
+        x0 = V*P_RT_inv
+        F = b2 + x0
+        G = -d2/x0
+        D = F*F - 4.0*G
+        real = D >= 0.0
+        D = np.sqrt(np.where(real, D, 0.0))
+        x1 = np.where(real, 0.5*(D - F), 0.0)
+        x2 = np.where(real, 0.5*(-F - D), 0.0)
+
+        # Highly ideal states have only one solution
+        main0 = R*T/(V - b)
+        main1 = a_alpha/(V*V + delta*V + epsilon)
+        main_diff = main0 - main1
+        one_root = ((x1 == 0.0) | (main0 + main1 == main0)
+                    | ((main_diff != 0.0) & (np.abs(1.0 - (main0 + main1)/main_diff) < 1e-12)))
+
+        keep = ~one_root
+        rows, P, b, delta, epsilon, a_alpha = rows[keep], P[keep], b[keep], delta[keep], epsilon[keep], a_alpha[keep]
+        RT, RT_2, a_alpha_2, RT_P = RT[keep], RT_2[keep], a_alpha_2[keep], RT_P[keep]
+        for col, x in ((1, x1[keep]), (2, x2[keep])):
+            # One Halley step on each deflated root
+            V = x*RT_P
+            t90 = V*(V + delta) + epsilon
+            x0_inv = 1.0/(V - b)
+            x1_inv = 1.0/t90
+            x2_ = V + V + delta
+            fval = -P + RT*x0_inv - a_alpha*x1_inv
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alpha*x1_inv2
+            fder = x2_*x3 - RT*x0_inv2
+            fder2 = RT_2*x0_inv2*x0_inv - a_alpha_2*x2_*x2_*x1_inv2*x1_inv + x3 + x3
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            polished = V - step/(1.0 - 0.5*step*fder2*fder_inv)
+            Vs[rows, col] = np.where((t90 != 0.0) & (fder != 0.0), polished, V)
+    return Vs
+
 def volume_solutions_fast(T, P, b, delta, epsilon, a_alpha):
     r'''Solution of this form of the cubic EOS in terms of volumes. Returns
     three values, all with some complex part. This is believed to be the
@@ -36,11 +36,17 @@ EquilibriumState
     :members:
     :undoc-members:
     :exclude-members: dH_dP_V, dH_dT_V, dH_dV_P, dH_dV_T, dS_dP_V, dS_dT, dS_dT_P, dS_dT_V
+
+CompactEquilibriumState
+=======================
+.. autoclass:: CompactEquilibriumState
+    :members:
 '''
 
 from __future__ import division
-__all__ = ['EquilibriumState']
+__all__ = ['EquilibriumState', 'CompactEquilibriumState']
 
+from array import array
 from fluids.constants import R, R_inv
 from fluids.core import thermal_diffusivity
 from chemicals.utils import log, exp, normalize, zs_to_ws, vapor_mass_quality, mixing_simple, Vm_to_rho, SG
@@ -1127,7 +1133,7 @@ class EquilibriumState(object):
 
         HeatCapacityGases = self.correlations.HeatCapacityGases
         T = self.T
-        Cpigs_pure = [i.T_dependent_property(T) for i in HeatCapacityGases]
+        Cpigs_pure = [i.evaluator()(T) for i in HeatCapacityGases]
 
         Cp, zs = 0.0, phase.zs
         for i in range(self.N):
@@ -2470,3 +2476,242 @@ try:
 except:
     pass
 del _add_attrs_doc
+
+
+class CompactEquilibriumState(object):
+    r'''Class to store the result of a flash calculation compactly, for when
+    many results are kept in memory. Only the temperature, pressure, phase
+    fractions, phase compositions, and the bulk `V`, `H` and `S` are stored,
+    in a single `array.array` with no per-instance `__dict__`; the phase
+    objects and their cached model parameters are not kept.
+
+    Any property which is not stored is calculated by recreating the
+    :obj:`EquilibriumState` the first time it is requested; its phases are
+    created from the phase models of the flasher at the stored temperature,
+    pressure, and compositions, so no flash calculation is repeated. The
+    recreated state is then kept.
+
+    The constructor has the same signature as :obj:`EquilibriumState`, so
+    this class can be passed as the `dest` argument of
+    :obj:`flash <thermo.flash.Flash.flash>`.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of state, [K]
+    P : float
+        Pressure of state, [Pa]
+    zs : list[float]
+        Overall mole fractions of all species in the state, [-]
+    gas : :obj:`Phase <thermo.phases.Phase>`
+        The calcualted gas phase object, if one was found, [-]
+    liquids : list[:obj:`Phase <thermo.phases.Phase>`]
+        A list of liquid phase objects, if any were found, [-]
+    solids : list[:obj:`Phase <thermo.phases.Phase>`]
+        A list of solid phase objects, if any were found, [-]
+    betas : list[float]
+        Molar phase fractions of every phase, ordered [`gas beta`,
+        `liquid beta0`, `liquid beta1`, ..., `solid beta0`, `solid beta1`, ...]
+    flash_specs : dict[str : float], optional
+        Not stored, [-]
+    flash_convergence : dict[str : float], optional
+        Not stored, [-]
+    constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`, optional
+        Package of chemical constants, [-]
+    correlations : :obj:`PropertyCorrelationsPackage <thermo.chemical_package.PropertyCorrelationsPackage>`, optional
+        Package of chemical T-dependent properties, [-]
+    flasher : :obj:`Flash <thermo.flash.Flash>` object
+        Flasher whose phase models the phases were calculated with; required,
+        [-]
+    settings : :obj:`BulkSettings <thermo.bulk.BulkSettings>`, optional
+        Object containing settings for calculating bulk and transport
+        properties, [-]
+
+    Notes
+    -----
+    The recreated state has no `flash_specs` or `flash_convergence`. The
+    constants, correlations and settings of the recreated state are those of
+    the flasher.
+
+    Examples
+    --------
+    >>> from thermo import *
+    >>> constants = ChemicalConstantsPackage(names=['carbon dioxide', 'hexane'], CASs=['124-38-9', '110-54-3'], MWs=[44.0095, 86.17536], omegas=[0.2252, 0.2975], Pcs=[7376460.0, 3025000.0], Tbs=[194.67, 341.87], Tcs=[304.2, 507.6], Tms=[216.65, 178.075])
+    >>> correlations = PropertyCorrelationsPackage(constants=constants, skip_missing=True,
+    ...                                            HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.1115474168865828e-21, 1.39156078498805e-17, -2.5430881416264243e-14, 2.4175307893014295e-11, -1.2437314771044867e-08, 3.1251954264658904e-06, -0.00021220221928610925, 0.000884685506352987, 29.266811602924644])),
+    ...                                                               HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.3740654453881647e-21, -8.344496203280677e-18, 2.2354782954548568e-14, -3.4659555330048226e-11, 3.410703030634579e-08, -2.1693611029230923e-05, 0.008373280796376588, -1.356180511425385, 175.67091124888998]))])
+    >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    >>> state = flasher.flash(P=1e5, T=196.0, zs=[0.5, 0.5], dest=CompactEquilibriumState)
+    >>> state.phase_count, state.betas
+    (2, [0.036068, 0.963931])
+    >>> state.H()
+    -33266.709
+
+    Properties which are not stored are calculated from the recreated state:
+
+    >>> state.bulk.Cp()
+    108.3164692
+    >>> state.liquid0.H()
+    -34376.4853
+    '''
+    __slots__ = ('flasher', '_values', '_layout', '_state')
+
+    __full_path__ = "%s.%s" %(__module__, __qualname__)
+
+    def __init__(self, T, P, zs,
+                 gas, liquids, solids, betas,
+                 flash_specs=None, flash_convergence=None,
+                 constants=None, correlations=None, flasher=None,
+                 settings=default_settings):
+        if flasher is None:
+            raise ValueError("A flasher is required to recreate the state")
+        state = EquilibriumState(T, P, zs, gas=gas, liquids=liquids, solids=solids,
+                                 betas=betas, constants=constants, correlations=correlations,
+                                 flasher=flasher, settings=settings)
+        templates = flasher.phases
+        hashes = [p.model_hash() for p in templates]
+        phases = state.phases
+        layout = [state.gas_count, state.liquid_count, state.solid_count]
+        for phase in phases:
+            try:
+                layout.append(hashes.index(phase.model_hash()))
+            except ValueError:
+                raise ValueError("Phase %s was not calculated with a phase model of the flasher" %(phase,))
+
+        values = array('d', (T, P, state.H(), state.S(), state.V()))
+        values.extend(zs)
+        values.extend(betas)
+        for phase in phases:
+            values.extend(phase.zs)
+        self.flasher = flasher
+        self._values = values
+        self._layout = bytes(layout)
+        self._state = None
+
+    def __repr__(self):
+        return '<CompactEquilibriumState, T=%.4f, P=%.4f, zs=%s, betas=%s>' %(
+            self.T, self.P, self.zs, self.betas)
+
+    def __getattr__(self, name):
+        # Only called for attributes which are not stored
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.rehydrate(), name)
+
+    def rehydrate(self):
+        r'''Method to recreate the full :obj:`EquilibriumState` of this
+        result, with its phase objects. The recreated state is kept and
+        returned on subsequent calls.
+
+        Returns
+        -------
+        state : :obj:`EquilibriumState`
+            Full equilibrium state, [-]
+        '''
+        state = self._state
+        if state is not None:
+            return state
+        flasher = self.flasher
+        T, P = self.T, self.P
+        templates = flasher.phases
+        gas_count, liquid_count, solid_count = self._layout[0], self._layout[1], self._layout[2]
+        phases = [templates[idx].to_TP_zs(T=T, P=P, zs=zs)
+                  for idx, zs in zip(self._layout[3:], self.compositions)]
+        gas = phases[0] if gas_count else None
+        liquids = phases[gas_count:gas_count + liquid_count]
+        solids = phases[gas_count + liquid_count:]
+        self._state = state = EquilibriumState(T, P, self.zs, gas=gas, liquids=liquids, solids=solids,
+                                               betas=self.betas, constants=flasher.constants,
+                                               correlations=flasher.correlations,
+                                               flasher=flasher, settings=flasher.settings)
+        return state
+
+    @property
+    def T(self):
+        r'''Temperature of the state, [K]'''
+        return self._values[0]
+
+    @property
+    def P(self):
+        r'''Pressure of the state, [Pa]'''
+        return self._values[1]
+
+    @property
+    def N(self):
+        r'''Number of components, [-]'''
+        return (len(self._values) - 5 - len(self._layout) + 3)//(len(self._layout) - 2)
+
+    @property
+    def zs(self):
+        r'''Overall mole fractions of all species in the state, [-]'''
+        return self._values[5:5 + self.N].tolist()
+
+    @property
+    def gas_count(self):
+        r'''Number of gas phases present (0 or 1), [-]'''
+        return self._layout[0]
+
+    @property
+    def liquid_count(self):
+        r'''Number of liquid phases present, [-]'''
+        return self._layout[1]
+
+    @property
+    def solid_count(self):
+        r'''Number of solid phases present, [-]'''
+        return self._layout[2]
+
+    @property
+    def phase_count(self):
+        r'''Number of phases present, [-]'''
+        return len(self._layout) - 3
+
+    @property
+    def betas(self):
+        r'''Molar phase fractions of every phase, in the same order as
+        :obj:`EquilibriumState.betas`, [-]'''
+        start = 5 + self.N
+        return self._values[start:start + self.phase_count].tolist()
+
+    @property
+    def compositions(self):
+        r'''Mole fractions of each phase, in the same order as
+        :obj:`betas <CompactEquilibriumState.betas>`, [-]'''
+        N, phase_count, values = self.N, self.phase_count, self._values
+        start = 5 + N + phase_count
+        return [values[start + i*N:start + (i + 1)*N].tolist() for i in range(phase_count)]
+
+    @property
+    def VF(self):
+        r'''Molar phase fraction of the gas phase; 0 if no gas phase is
+        present, [-]'''
+        if self._layout[0]:
+            return self._values[5 + self.N]
+        return 0.0
+
+    def H(self):
+        r'''Molar enthalpy of the state, [J/mol]'''
+        return self._values[2]
+
+    def S(self):
+        r'''Molar entropy of the state, [J/(mol*K)]'''
+        return self._values[3]
+
+    def V(self):
+        r'''Molar volume of the state, [m^3/mol]'''
+        return self._values[4]
+
+    def G(self):
+        r'''Molar Gibbs free energy of the state, [J/mol]'''
+        return self._values[2] - self._values[0]*self._values[3]
+
+    def U(self):
+        r'''Molar internal energy of the state, [J/mol]'''
+        return self._values[2] - self._values[1]*self._values[4]
+
+    def A(self):
+        r'''Molar Helmholtz energy of the state, [J/mol]'''
+        return self.U() - self._values[0]*self._values[3]
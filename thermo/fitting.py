@@ -26,7 +26,7 @@ __all__ = ['alpha_Twu91_objf', 'alpha_Twu91_objfc', 'fit_function',
            'Twu91_check_params', 'postproc_lmfit',
            'alpha_poly_objf', 'alpha_poly_objfc', 'poly_check_params',
            'fit_polynomial', 'poly_fit_statistics', 'fit_cheb_poly_auto',
-           'data_fit_statistics', 'fit_customized']
+           'data_fit_statistics', 'fit_customized', 'LeastSquaresResiduals']
 
 from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              roots_cubic_a1, numpy as np, newton,
@@ -42,6 +42,7 @@ from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              polynomial_offset_scale,
                              lmder, lmfit)
 from fluids.constants import R
+from pickle import dumps, PicklingError
 import fluids, thermo
 try:
     from numpy.polynomial.chebyshev import poly2cheb, cheb2poly, Chebyshev
@@ -592,13 +593,108 @@ def fit_function(fun, x0=None, args=None, check_fun=None, debug=False,
 
 
 
+class LeastSquaresResiduals(object):
+    r'''Residuals and Jacobian of a model evaluated at all data points at
+    once, for least-squares regression with :obj:`fit_customized`. The model
+    is called as ``func(xs, *args, *params)`` and should return the
+    calculated value at every data point as an array; `jac`, if provided, is
+    called the same way and should return the derivatives of those values
+    with respect to each parameter, one row per data point.
+
+    Unlike a closure, instances can be pickled (as long as `func` and `jac`
+    are module-level functions), which allows the multiple starting guesses
+    of :obj:`fit_customized` to be fit in worker processes. When `processes`
+    is given but the objective cannot be pickled, the guesses are fit one
+    after another in the calling process instead.
+
+    Parameters
+    ----------
+    func : callable
+        Model function, [-]
+    xs : ndarray
+        Independent variable of each data point, [-]
+    data : ndarray
+        Value of each data point, [-]
+    args : tuple, optional
+        Additional fixed arguments of `func` and `jac`, passed before the
+        parameters, [-]
+    jac : callable, optional
+        Analytical Jacobian of `func`, [-]
+    param_indices : tuple(int), optional
+        For each parameter of `func`, the index of the fit parameter it is
+        set to; used to fit several parameters of `func` as one value, e.g.
+        ``(0, 1, 2, 2)`` to fit the last two parameters of a four-parameter
+        model together. The columns of `jac` are summed accordingly, [-]
+
+    Examples
+    --------
+    >>> def line(xs, m, b):
+    ...     return m*xs + b
+    >>> fit = LeastSquaresResiduals(line, np.array([1.0, 2.0]), np.array([2.0, 3.0]), param_indices=(0, 0))
+    >>> fit.residuals([1.0]).tolist()
+    [0.0, 0.0]
+    '''
+    __slots__ = ('func', 'xs', 'data', 'args', 'jac_func', 'param_indices')
+
+    def __init__(self, func, xs, data, args=(), jac=None, param_indices=None):
+        self.func = func
+        self.xs = xs
+        self.data = data
+        self.args = tuple(args)
+        self.jac_func = jac
+        self.param_indices = param_indices
+
+    def model_params(self, params):
+        '''Parameters of the model function from the fit parameters.'''
+        param_indices = self.param_indices
+        if param_indices is None:
+            return tuple(params)
+        return tuple([params[i] for i in param_indices])
+
+    def calc(self, xs, *params):
+        '''Model values at `xs`, for the fit parameters `params`.'''
+        return self.func(xs, *(self.args + self.model_params(params)))
+
+    def jac(self, xs, *params):
+        '''Derivatives of the model values at `xs` with respect to each fit
+        parameter, for the fit parameters `params`.'''
+        jac = self.jac_func(xs, *(self.args + self.model_params(params)))
+        param_indices = self.param_indices
+        if param_indices is None:
+            return jac
+        reduced = np.zeros((jac.shape[0], max(param_indices) + 1))
+        for j, i in enumerate(param_indices):
+            reduced[:, i] += jac[:, j]
+        return reduced
+
+    def residuals(self, params):
+        '''Difference between the model and the data at every data point.'''
+        return self.calc(self.xs, *params) - self.data
+
+    def jacobian(self, params):
+        '''Jacobian of :obj:`residuals`.'''
+        return self.jac(self.xs, *params)
+
+
+def _fit_customized_lm_worker(args):
+    func, Dfun, p0, solver_kwargs = args
+    try:
+        if Dfun is not None:
+            return lmder(func, Dfun, p0, tuple(), False,
+                         0, 1.49012e-8, 1.49012e-8, 0.0, solver_kwargs['maxfev'],
+                         100, None)[0]
+        return leastsq(func, p0, Dfun=Dfun, **solver_kwargs)[0]
+    except:
+        return None
+
+
 def fit_customized(Ts, data, fitting_func, fit_parameters, use_fit_parameters, 
                    fit_method, objective, multiple_tries_max_objective, 
                    guesses=None, initial_guesses=None, analytical_jac=None,
                    solver_kwargs=None, use_numba=False, multiple_tries=False,
                    do_statistics=False, multiple_tries_max_err=1e-5,
                    func_wrapped_for_leastsq=None, jac_wrapped_for_leastsq=None,
-                   sigma=None):
+                   sigma=None, processes=None):
     if solver_kwargs is None: solver_kwargs = {}
     if use_numba:
         fit_func_dict = fluids.numba.numerics.fit_minimization_targets
@@ -700,22 +796,36 @@ def fit_customized(Ts, data, fitting_func, fit_parameters, use_fit_parameters,
             popt = None
             if type(multiple_tries) is int and len(array_init_guesses) > multiple_tries:
                 array_init_guesses = array_init_guesses[0:multiple_tries]
-            for p0 in array_init_guesses:
-                try:
-                    if lm_direct:
-                        if Dfun is not None:
-                            popt = lmder(func_wrapped_for_leastsq, Dfun, p0, tuple(), False,
-                                      0, 1.49012e-8, 1.49012e-8, 0.0, solver_kwargs['maxfev'],
-                                      100, None)[0]
-                        else:
-                            popt, _ = leastsq(func_wrapped_for_leastsq, p0, Dfun=Dfun, **solver_kwargs)
-
-                        pcov = None
-                    else:
-                        popt, pcov = curve_fit(fitting_func, Ts, data, sigma=sigma, p0=p0, jac=analytical_jac, 
+            if lm_direct:
+                lm_args = [(func_wrapped_for_leastsq, Dfun, p0, solver_kwargs) for p0 in array_init_guesses]
+                if processes is not None:
+                    try:
+                        dumps(lm_args)
+                    except (PicklingError, AttributeError, TypeError):
+                        # Closures cannot be sent to worker processes
+                        processes = None
+                if processes is None:
+                    # Lazily fit each guess in turn so the loop below can stop early
+                    popts = (_fit_customized_lm_worker(a) for a in lm_args)
+                else:
+                    # All guesses are fit in parallel; the objective functions
+                    # must be picklable (see `LeastSquaresResiduals`)
+                    from concurrent.futures import ProcessPoolExecutor
+                    with ProcessPoolExecutor(max_workers=processes) as executor:
+                        popts = list(executor.map(_fit_customized_lm_worker, lm_args))
+            else:
+                popts = array_init_guesses
+            for popt in popts:
+                if lm_direct:
+                    if popt is None:
+                        continue
+                    pcov = None
+                else:
+                    try:
+                        popt, pcov = curve_fit(fitting_func, Ts, data, sigma=sigma, p0=popt, jac=analytical_jac, 
                                                 method=fit_method, absolute_sigma=True, **solver_kwargs)
-                except:
-                    continue
+                    except:
+                        continue
                 calc = fitting_func(Ts, *popt)
                 curr_err = err_fun_multiple_guesses(data, calc)
                 if curr_err < multiple_tries_best_error:
@@ -55,9 +55,14 @@ Base Flash Class
 ----------------
 .. autoclass:: Flash
    :show-inheritance:
-   :members: flash, plot_TP
+   :members: flash, plot_TP, grid_flash_table
    :exclude-members:
 
+Warm Start Cache
+----------------
+.. autoclass:: WarmStartCache
+   :members: key, get, store, clear
+
 
 Specific Flash Algorithms
 =========================
@@ -67,15 +72,17 @@ future, but reading their source code may be helpful for instructive purposes.
 
 '''
 
-__all__ = ['Flash']
+__all__ = ['Flash', 'WarmStartCache']
 
 from fluids.constants import R
 from thermo.equilibrium import EquilibriumState
 from thermo.phase_identification import identify_sort_phases
 from thermo.utils import has_matplotlib
 from fluids.numerics import logspace, linspace, numpy as np
-from chemicals.utils import log10, floor
+from chemicals.utils import log, log10, floor
 from thermo import phases
+from time import perf_counter
+from collections import OrderedDict
 
 spec_to_iter_vars = {
      (True, False, False, True, False, False) : ('T', 'H', 'P'), # Iterating on P is slow, derivatives look OK
@@ -110,13 +117,224 @@ empty_flash_conv = {'iterations': 0, 'err': 0.0, 'stab_guess_name': None}
 one_in_list = [1.0]
 empty_list = []
 
+def grid_flash_specs(Ts=None, Ps=None, Vs=None, VFs=None, SFs=None, Hs=None,
+                     Ss=None, Us=None):
+    spec_keys = []
+    spec_iters = []
+    for key, values in (('T', Ts), ('P', Ps), ('V', Vs), ('H', Hs), ('S', Ss),
+                        ('U', Us), ('VF', VFs), ('SF', SFs)):
+        if values is not None:
+            spec_keys.append(key)
+            spec_iters.append(values)
+    if len(spec_keys) != 2:
+        raise ValueError("Exactly two flash specifications are required for a grid")
+    return spec_keys, spec_iters
+
+def grid_flash_row(flasher, zs, n0, key0, spec0, key1, specs1, props=None,
+                   store=True, hot_start=False):
+    # Flash one row of a grid; failures are returned as records so the row can
+    # be computed in another process
+    do_props = props is not None
+    scalar_props = isinstance(props, str)
+    row_flashes = [] if store else None
+    row_props = [] if do_props else None
+    failures = []
+    last = None
+    for n1, spec1 in enumerate(specs1):
+        flash_specs = {'zs': zs, key0: spec0, key1: spec1}
+        state = None
+        if hot_start and last is not None:
+            try:
+                state = flasher.flash(hot_start=last, **flash_specs)
+            except Exception:
+                pass
+        if state is None:
+            try:
+                state = flasher.flash(**flash_specs)
+            except Exception as e:
+                failures.append({'index': (n0, n1), 'specs': flash_specs,
+                                 'error': type(e).__name__, 'message': str(e)})
+        if state is not None:
+            last = state
+
+        if store:
+            row_flashes.append(state)
+        if do_props:
+            if state is None:
+                state_props = None if scalar_props else [None for s in props]
+            elif scalar_props:
+                state_props = _grid_flash_value(state, props)
+            else:
+                state_props = [_grid_flash_value(state, s) for s in props]
+            row_props.append(state_props)
+    return row_flashes, row_props, failures
+
+def _grid_flash_value(state, prop):
+    try:
+        return state.value(prop)
+    except Exception:
+        return None
+
+_grid_flash_worker_flasher = None
+
+def _grid_flash_worker_init(flasher):
+    global _grid_flash_worker_flasher
+    _grid_flash_worker_flasher = flasher
+
+def _grid_flash_worker_row(args):
+    return grid_flash_row(_grid_flash_worker_flasher, *args)
+
+class WarmStartCache(object):
+    r'''Size-bounded, least-recently-used store of converged multiphase
+    temperature and pressure flash solutions. Entries are keyed on a quantized
+    temperature, logarithm of pressure, and composition; a flash at a state
+    which quantizes to the same key as a previously converged multiphase
+    solution is started directly from its K values and phase fractions,
+    skipping the stability test and initial guesses.
+
+    Assign an instance to the `warm_start_cache` attribute of a
+    :obj:`FlashVL <thermo.flash.FlashVL>` or
+    :obj:`FlashVLN <thermo.flash.FlashVLN>` object to enable it; other
+    flashers ignore it.
+
+    Parameters
+    ----------
+    size : int, optional
+        Maximum number of solutions to store, [-]
+    T_step : float, optional
+        Width of each temperature bin, [K]
+    lnP_step : float, optional
+        Width of each bin of the natural logarithm of pressure; roughly a
+        relative pressure difference, [-]
+    zs_step : float, optional
+        Width of each mole fraction bin, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of flashes which were solved from a stored solution, [-]
+    misses : int
+        Number of flashes which were not solved from a stored solution, [-]
+
+    Notes
+    -----
+    A stored solution is only used if it converges to the same number of
+    phases, with all phase fractions strictly between zero and one (and away
+    from the boundaries where the flash would polish the solution), and whose
+    Gibbs energy is lower than that of the feed as a single phase; otherwise
+    the normal flash algorithm is used. As with the `hot_start` argument of
+    :obj:`flash <thermo.flash.Flash.flash>`, a warm started flash does not
+    check whether an additional phase would form.
+
+    Examples
+    --------
+    >>> cache = WarmStartCache(size=100)
+    >>> cache.key(300.0, 1e5, [0.5, 0.5]) == cache.key(300.1, 1.0001e5, [0.501, 0.499])
+    True
+    '''
+    def __init__(self, size=1000, T_step=0.5, lnP_step=0.01, zs_step=0.01):
+        self.size = size
+        self.T_step = T_step
+        self.lnP_step = lnP_step
+        self.zs_step = zs_step
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, T, P, zs):
+        r'''Compute the quantized key of a state.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        zs : list[float]
+            Mole fractions of each component, [-]
+
+        Returns
+        -------
+        key : tuple
+            Hashable key of the state, [-]
+        '''
+        zs_step = self.zs_step
+        return (int(round(T/self.T_step)), int(round(log(P)/self.lnP_step)),
+                tuple([int(round(zi/zs_step)) for zi in zs]))
+
+    def get(self, key):
+        r'''Retrieve the solution stored under a key, marking it as the most
+        recently used, or None if there is no solution stored.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the state, [-]
+
+        Returns
+        -------
+        entry : tuple or None
+            Whether or not the first phase is a gas, the phase objects, the
+            phase fractions, and either the K values of the first phase
+            relative to the second (for two phases) or the compositions of
+            each phase, [-]
+        '''
+        entries = self.entries
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+        return entry
+
+    def store(self, key, gas, phases, betas):
+        r'''Store a converged multiphase solution, evicting the least
+        recently used solution if the cache is full.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the state, [-]
+        gas : bool
+            Whether or not the first phase is a gas, [-]
+        phases : list[:obj:`Phase <thermo.phases.Phase>`]
+            Converged phases, [-]
+        betas : list[float]
+            Molar phase fractions, [-]
+        '''
+        compositions = [p.zs for p in phases]
+        if len(phases) == 2:
+            ys, xs = compositions
+            Ks = [ys[i]/xs[i] if xs[i] != 0.0 else 1.0 for i in range(len(xs))]
+        else:
+            Ks = None
+        entries = self.entries
+        entries[key] = (gas, list(phases), list(betas), Ks, compositions)
+        entries.move_to_end(key)
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        r'''Remove all stored solutions and reset the hit and miss counters.
+        '''
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
 class Flash(object):
     r'''Base class for performing flash calculations. All Flash objects need
     to inherit from this, and common methods can be added to it.'''
 
+    warm_start_cache = None
+
     def __init_subclass__(cls):
         cls.__full_path__ = "%s.%s" %(cls.__module__, cls.__qualname__)
 
+    def flash_TP_cached(self, T, P, zs):
+        # Flashers without multiphase warm starts ignore `warm_start_cache`
+        return self.flash_TPV(T=T, P=P, V=None, zs=zs)
+
     def flash(self, zs=None, T=None, P=None, VF=None, SF=None, V=None, H=None,
               S=None, G=None, U=None, A=None, solution=None, hot_start=None,
               retry=False, dest=None):
@@ -291,7 +509,11 @@ class Flash(object):
                 raise ValueError("Cannot flash with a solid fraction spec without at least one gas and liquid phase defined, as well as a solid phase")
 
         if ((T_spec and (P_spec or V_spec)) or (P_spec and V_spec)):
-            g, ls, ss, betas, flash_convergence = self.flash_TPV(T=T, P=P, V=V, zs=zs, solution=solution, hot_start=hot_start)
+            if (T_spec and P_spec and self.warm_start_cache is not None
+                    and hot_start is None and solution is None):
+                g, ls, ss, betas, flash_convergence = self.flash_TP_cached(T=T, P=P, zs=zs)
+            else:
+                g, ls, ss, betas, flash_convergence = self.flash_TPV(T=T, P=P, V=V, zs=zs, solution=solution, hot_start=hot_start)
             if g is not None:
                 id_phases = [g] + ls + ss
             else:
@@ -541,74 +763,20 @@ class Flash(object):
 
     def grid_flash(self, zs, Ts=None, Ps=None, Vs=None,
                    VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
-                   props=None, store=True):
-
-        flashes = []
-
-        T_spec = Ts is not None
-        P_spec = Ps is not None
-        V_spec = Vs is not None
-        H_spec = Hs is not None
-        S_spec = Ss is not None
-        U_spec = Us is not None
-        VF_spec = VFs is not None
-        SF_spec = SFs is not None
-
-        flash_specs = {'zs': zs}
-        spec_keys = []
-        spec_iters = []
-        if T_spec:
-            spec_keys.append('T')
-            spec_iters.append(Ts)
-        if P_spec:
-            spec_keys.append('P')
-            spec_iters.append(Ps)
-        if V_spec:
-            spec_keys.append('V')
-            spec_iters.append(Vs)
-        if H_spec:
-            spec_keys.append('H')
-            spec_iters.append(Hs)
-        if S_spec:
-            spec_keys.append('S')
-            spec_iters.append(Ss)
-        if U_spec:
-            spec_keys.append('U')
-            spec_iters.append(Us)
-        if VF_spec:
-            spec_keys.append('VF')
-            spec_iters.append(VFs)
-        if SF_spec:
-            spec_keys.append('SF')
-            spec_iters.append(SFs)
-
+                   props=None, store=True, hot_start=False, failures=None):
+        spec_keys, spec_iters = grid_flash_specs(Ts=Ts, Ps=Ps, Vs=Vs, VFs=VFs,
+                                                 SFs=SFs, Hs=Hs, Ss=Ss, Us=Us)
         do_props = props is not None
-        scalar_props = isinstance(props, str)
 
+        flashes = []
         calc_props = []
         for n0, spec0 in enumerate(spec_iters[0]):
-            if do_props:
-                row_props = []
-            if store:
-                row_flashes = []
-            for n1, spec1 in enumerate(spec_iters[1]):
-                flash_specs = {'zs': zs, spec_keys[0]: spec0, spec_keys[1]: spec1}
-                try:
-                    state = self.flash(**flash_specs)
-                except Exception as e:
-                    state = None
-                    print('Failed trying to flash %s, with exception %s.'%(flash_specs, e))
-
-                if store:
-                    row_flashes.append(state)
-                if do_props:
-                    if scalar_props:
-                        state_props = state.value(props)if state is not None else None
-                    else:
-                        state_props = [state.value(s) for s in props] if state is not None else [None for s in props]
-
-                    row_props.append(state_props)
-
+            row_flashes, row_props, row_failures = grid_flash_row(self, zs, n0, spec_keys[0], spec0,
+                                                                  spec_keys[1], spec_iters[1],
+                                                                  props=props, store=store,
+                                                                  hot_start=hot_start)
+            if failures is not None:
+                failures.extend(row_failures)
             if do_props:
                 calc_props.append(row_props)
             if store:
@@ -622,6 +790,117 @@ class Flash(object):
             return flashes
         return None
 
+    def grid_flash_table(self, zs, props, Ts=None, Ps=None, Vs=None,
+                         VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
+                         hot_start=True, processes=None):
+        r'''Method to flash a two-dimensional grid of specifications and return
+        the requested properties as NumPy arrays. Exactly two of the
+        specification arrays must be provided; the first specified (in the
+        order of the arguments) indexes the rows of the grid and the second the
+        columns.
+
+        Each row is flashed sequentially, and when `hot_start` is True each
+        point is started from the converged result of its neighbor in the row,
+        falling back to a normal flash if that is not successful. Rows are
+        independent of each other and can be distributed to a pool of worker
+        processes.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        props : str or list[str]
+            Name of the property or properties to evaluate on each
+            :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`;
+            these are retrieved with its `value` method, [-]
+        Ts : list[float], optional
+            Temperatures, [K]
+        Ps : list[float], optional
+            Pressures, [Pa]
+        Vs : list[float], optional
+            Molar volumes, [m^3/mol]
+        VFs : list[float], optional
+            Vapor fractions, [-]
+        SFs : list[float], optional
+            Solid fractions, [-]
+        Hs : list[float], optional
+            Molar enthalpies, [J/mol]
+        Ss : list[float], optional
+            Molar entropies, [J/(mol*K)]
+        Us : list[float], optional
+            Molar internal energies, [J/mol]
+        hot_start : bool, optional
+            Whether or not to start each flash from the previous converged
+            flash in the same row, [-]
+        processes : int, optional
+            Number of worker processes to flash the rows with; if None, the
+            calculation is performed in the current process, [-]
+
+        Returns
+        -------
+        values : ndarray
+            Calculated properties; of shape (N0, N1) if `props` is a string,
+            otherwise of shape (N0, N1, len(props)); points which could not be
+            flashed or whose property could not be calculated are NaN, [various]
+        failures : list[dict]
+            One record for each point which could not be flashed, with the
+            keys 'index' (the row and column of the point), 'specs' (the
+            arguments to the flash), 'error' (the name of the exception
+            class), and 'message', [-]
+        stats : dict
+            Information about the calculation, with the keys 'points',
+            'failures', 'time' [s], and 'points_per_second' [1/s], [-]
+
+        Notes
+        -----
+        The flasher is pickled once for each worker process, so the phase
+        models must support pickling when `processes` is specified.
+        '''
+        spec_keys, spec_iters = grid_flash_specs(Ts=Ts, Ps=Ps, Vs=Vs, VFs=VFs,
+                                                 SFs=SFs, Hs=Hs, Ss=Ss, Us=Us)
+        scalar_props = isinstance(props, str)
+        key0, key1 = spec_keys
+        specs0, specs1 = spec_iters
+        N0, N1 = len(specs0), len(specs1)
+        row_args = [(zs, n0, key0, spec0, key1, specs1, props, False, hot_start)
+                    for n0, spec0 in enumerate(specs0)]
+
+        start = perf_counter()
+        if processes is None:
+            rows = [grid_flash_row(self, *args) for args in row_args]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=processes,
+                                     initializer=_grid_flash_worker_init,
+                                     initargs=(self,)) as executor:
+                rows = list(executor.map(_grid_flash_worker_row, row_args))
+        elapsed = perf_counter() - start
+
+        shape = (N0, N1) if scalar_props else (N0, N1, len(props))
+        values = np.full(shape, np.nan)
+        failures = []
+        for n0, (_, row_props, row_failures) in enumerate(rows):
+            for n1, state_props in enumerate(row_props):
+                if state_props is None:
+                    continue
+                if scalar_props:
+                    state_props = [state_props]
+                for k, v in enumerate(state_props):
+                    try:
+                        v = float(v)
+                    except (TypeError, ValueError):
+                        continue
+                    if scalar_props:
+                        values[n0, n1] = v
+                    else:
+                        values[n0, n1, k] = v
+            failures.extend(row_failures)
+
+        points = N0*N1
+        stats = {'points': points, 'failures': len(failures), 'time': elapsed,
+                 'points_per_second': points/elapsed if elapsed > 0.0 else float('inf')}
+        return values, failures, stats
+
     def debug_grid_flash(self, zs, check0, check1, Ts=None, Ps=None, Vs=None,
                          VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
                          retry=False, verbose=True):
@@ -56,7 +56,8 @@ __all__ = [
     'nonlin_spec_NP',
     'TPV_solve_HSGUA_guesses_VL',
     'solve_P_VF_IG_K_composition_independent',
-    'solve_T_VF_IG_K_composition_independent'
+    'solve_T_VF_IG_K_composition_independent',
+    'phase_envelope_continuation',
 ]
 
 
@@ -71,7 +72,7 @@ from fluids.numerics import (UnconvergedError, trunc_exp, newton,
                              root, minimize, fsolve)
 from fluids.numerics import py_solve, trunc_log
 
-from chemicals.utils import (exp, log, copysign, normalize,
+from chemicals.utils import (exp, log, sqrt, copysign, normalize,
                              mixing_simple, property_mass_to_molar)
 from chemicals.heat_capacity import (Dadgostar_Shaw_integral, 
                                      Dadgostar_Shaw_integral_over_T, 
@@ -677,6 +678,11 @@ def nonlin_equilibrium_NP(T, P, zs, compositions_guesses, betas_guesses,
 
 
 
+    # Work arrays reused by every iteration
+    size = N*(phase_count-1)
+    errs = [0.0]*size
+    jac_arr = [[0.0]*size for i in range(size)] if jac else None
+
     global iterations, info
     iterations = 0
     info = []
@@ -691,7 +697,6 @@ def nonlin_equilibrium_NP(T, P, zs, compositions_guesses, betas_guesses,
         iter_comps = []
         iter_betas = []
         iter_phases = []
-        jac_arr = None
 
         remaining = zs
         for i in range(len(flows)):
@@ -731,18 +736,15 @@ def nonlin_equilibrium_NP(T, P, zs, compositions_guesses, betas_guesses,
         lnphis_ref = phase_ref.lnphis()
         dlnfugacities_ref = phase_ref.dlnfugacities_dns()
 
-        errs = []
-        for k in phase_iter_n1:
+        for k, kn in zip(phase_iter_n1, phase_iter_n1_0):
             phase = iter_phases[k]
             lnphis = phase.lnphis()
             xs = iter_comps[k]
             for i in cmps:
                 # This is identical to lnfugacity(i)^j - lnfugacity(i)^ref
-                gi = trunc_log(xs[i]/xs_ref[i]) + lnphis[i] - lnphis_ref[i]
-                errs.append(gi)
+                errs[kn*N + i] = trunc_log(xs[i]/xs_ref[i]) + lnphis[i] - lnphis_ref[i]
 
         if jac:
-            jac_arr = [[0.0]*N*(phase_count-1) for i in range(N*(phase_count-1))]
             for ni, nj in zip(phase_iter_n1, phase_iter_n1_0):
                 p = iter_phases[ni]
                 dlnfugacities = p.dlnfugacities_dns()
@@ -753,7 +755,7 @@ def nonlin_equilibrium_NP(T, P, zs, compositions_guesses, betas_guesses,
                             delta = 1.0 if nj == kj else 0.0
                             v_ref = dlnfugacities_ref[i][j]/beta_ref
                             jac_arr[nj*N + i][kj*N + j] = dlnfugacities[i][j]*delta/iter_betas[ni] + v_ref
-        info[:] = iter_betas, iter_comps, iter_phases, errs, jac_arr, flows
+        info[:] = iter_betas, iter_comps, iter_phases, errs, (jac_arr if jac else None), flows
         if jac:
             return errs, jac_arr
         return errs
@@ -1198,6 +1200,14 @@ def nonlin_2P_newton(T, P, zs, xs_guess, ys_guess, liquid_phase,
 
     Ks_guess = [ys[i]/xs[i] for i in cmps]
 
+    # Work arrays reused by every iteration
+    size = N + 1
+    J = [[0.0]*size for i in range(size)]
+    Fs = [0.0]*size
+    Ksm1 = [0.0]*N
+    RR_terms = [0.0]*N
+    zsKsRRinvs2 = [0.0]*N
+
     info = []
     def to_solve(lnKsVF):
         # Jacobian verified. However, very sketchy - mole fractions may want
@@ -1219,24 +1229,17 @@ def nonlin_2P_newton(T, P, zs, xs_guess, ys_guess, liquid_phase,
         lnphis_g = g.lnphis()
         lnphis_l = l.lnphis()
 
-        size = N + 1
-        J = [[None]*size for i in range(size)]
-
         d_lnphi_dxs = l.dlnphis_dzs()
         d_lnphi_dys = g.dlnphis_dzs()
 
-
-        J[N][N] = 1.0
-
         # Last column except last value; believed correct
         # Was not correct when compared to numerical solution
-        Ksm1 = [Ki - 1.0 for Ki in Ks]
-        RR_denoms_inv2 = []
-        for i in cmps:
-            t = 1.0 + VF*Ksm1[i]
-            RR_denoms_inv2.append(1.0/(t*t))
-
-        RR_terms = [zs[k]*Ksm1[k]*RR_denoms_inv2[k] for k in cmps]
+        for k in cmps:
+            Ksm1[k] = Ksm1_k = Ks[k] - 1.0
+            t = 1.0 + VF*Ksm1_k
+            RR_denom_inv2 = 1.0/(t*t)
+            RR_terms[k] = zs[k]*Ksm1_k*RR_denom_inv2
+            zsKsRRinvs2[k] = zs[k]*Ks[k]*RR_denom_inv2
         for i in cmps:
             value = 0.0
             d_lnphi_dxs_i, d_lnphi_dys_i = d_lnphi_dxs[i], d_lnphi_dys[i]
@@ -1246,7 +1249,6 @@ def nonlin_2P_newton(T, P, zs, xs_guess, ys_guess, liquid_phase,
 
 
         # Main body - expensive to compute! Lots of elements
-        zsKsRRinvs2 = [zs[j]*Ks[j]*RR_denoms_inv2[j] for j in cmps]
         one_m_VF = 1.0 - VF
         for i in cmps:
             Ji = J[i]
@@ -1269,9 +1271,9 @@ def nonlin_2P_newton(T, P, zs, xs_guess, ys_guess, liquid_phase,
         J[-1][-1] = dF_ncp1_dB
 
 
-        err_RR = Rachford_Rice_flash_error(VF, zs, Ks)
-        Fs = [lnKi - lnphi_l + lnphi_g for lnphi_l, lnphi_g, lnKi in zip(lnphis_l, lnphis_g, lnKs)]
-        Fs.append(err_RR)
+        for i in cmps:
+            Fs[i] = lnKs[i] - lnphis_l[i] + lnphis_g[i]
+        Fs[N] = Rachford_Rice_flash_error(VF, zs, Ks)
 
         info[:] = VF, xs, ys, l, g, Fs, J
         return Fs, J
@@ -2434,6 +2436,339 @@ def dew_P_Michelsen_Mollerup(P_guess, T, zs, liquid_phase, gas_phase,
     return P_guess, xs, l, g, iteration, abs(P_guess - P_guess_old)
 
 
+def _phase_envelope_err_jac(X, zs, bulk_phase, incipient_phase, errs, jac,
+                            incipient_buffers):
+    # Residuals and jacobian of the incipient phase equations in
+    # (lnK_1, ..., lnK_N, lnT, lnP), written into the first N + 1 rows of
+    # `errs` and `jac`; the bulk phase is at `zs`
+    N = len(zs)
+    T, P = exp(X[N]), exp(X[N+1])
+    ys = [zs[i]*exp(X[i]) for i in range(N)]
+    ys_sum = sum(ys)
+    ys_sum_inv = 1.0/ys_sum
+    bulk = bulk_phase.to_TP_zs(T=T, P=P, zs=zs)
+    inc = incipient_phase.to_TP_zs(T=T, P=P, zs=[y*ys_sum_inv for y in ys])
+
+    lnphis_bulk = bulk.lnphis()
+    dlnphis_dT_bulk, dlnphis_dP_bulk = bulk.dlnphis_dT(), bulk.dlnphis_dP()
+    lnphis_inc, dlnphis_dT_inc, dlnphis_dP_inc, dlnphis_dns_inc = inc.lnphis_and_derivatives(*incipient_buffers)
+
+    for i in range(N):
+        errs[i] = X[i] + lnphis_inc[i] - lnphis_bulk[i]
+        row, dlnphis_dns_inc_i = jac[i], dlnphis_dns_inc[i]
+        for j in range(N):
+            row[j] = dlnphis_dns_inc_i[j]*ys[j]*ys_sum_inv
+        row[i] += 1.0
+        row[N] = T*(dlnphis_dT_inc[i] - dlnphis_dT_bulk[i])
+        row[N+1] = P*(dlnphis_dP_inc[i] - dlnphis_dP_bulk[i])
+    errs[N] = ys_sum - 1.0
+    row = jac[N]
+    for j in range(N):
+        row[j] = ys[j]
+    return errs, jac
+
+def _phase_envelope_newton(X, spec_idx, spec_val, zs, bulk_phase, incipient_phase,
+                           maxiter=20, xtol=1e-10, max_step=1.0):
+    N = len(zs)
+    # Work arrays reused by every iteration; the last row is the specification
+    errs = [0.0]*(N + 2)
+    jac = [[0.0]*(N + 2) for _ in range(N + 2)]
+    jac[N+1][spec_idx] = 1.0
+    incipient_buffers = ([0.0]*N, [0.0]*N, [0.0]*N, [[0.0]*N for _ in range(N)])
+    X = list(X)
+    for iteration in range(maxiter):
+        _phase_envelope_err_jac(X, zs, bulk_phase, incipient_phase, errs, jac,
+                                incipient_buffers)
+        errs[N+1] = X[spec_idx] - spec_val
+        dX = py_solve(jac, [-v for v in errs])
+        step = max([abs(v) for v in dX])
+        if step != step:
+            raise UnconvergedError("Phase envelope Newton iteration failed")
+        if step > max_step:
+            dX = [v*max_step/step for v in dX]
+        for i in range(N + 2):
+            X[i] += dX[i]
+        if step < xtol:
+            if max([abs(X[i]) for i in range(N)]) < 1e-7:
+                raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal",
+                                           X[N], X[N+1], iteration, step)
+            return X, jac, iteration + 1
+    raise UnconvergedError("Phase envelope Newton iteration did not converge")
+
+def _hermite_cubic(u, y0, y1, m0, m1):
+    u2 = u*u
+    u3 = u2*u
+    return ((2.0*u3 - 3.0*u2 + 1.0)*y0 + (u3 - 2.0*u2 + u)*m0
+            + (3.0*u2 - 2.0*u3)*y1 + (u3 - u2)*m1)
+
+def _hermite_cubic_extremum(y0, y1, m0, m1):
+    # Position in [0, 1] where the derivative of the cubic is zero, or None
+    a = 6.0*y0 + 3.0*m0 - 6.0*y1 + 3.0*m1
+    b = -6.0*y0 - 4.0*m0 + 6.0*y1 - 2.0*m1
+    c = m0
+    if a == 0.0:
+        roots = [-c/b] if b != 0.0 else []
+    else:
+        disc = b*b - 4.0*a*c
+        if disc < 0.0:
+            return None
+        disc = sqrt(disc)
+        roots = [(-b + disc)/(2.0*a), (-b - disc)/(2.0*a)]
+    for u in roots:
+        if 0.0 <= u <= 1.0:
+            return u
+    return None
+
+# Errors which mean a point of a phase envelope could not be solved
+phase_envelope_errors = (UnconvergedError, TrivialSolutionError, ValueError,
+                         ZeroDivisionError, OverflowError)
+
+def phase_envelope_continuation(T, P, zs, lnKs, liquid_phase, gas_phase, dew=True,
+                                P_min=None, P_max=1e9, initial_step=0.05,
+                                max_step=0.5, min_step=1e-5, max_points=500,
+                                maxiter=20, xtol=1e-10, lnK_critical=0.05):
+    r'''Traces the two-phase boundary of a mixture of fixed composition by
+    natural-parameter continuation in the logarithms of the equilibrium
+    ratios, temperature and pressure, following Michelsen [1]_. Each point
+    is solved with Newton's method using the analytical derivatives
+    `dlnphis_dT`, `dlnphis_dP` and `dlnphis_dns` of the phases, and the
+    next point is predicted from the tangent of the curve. The specified
+    variable is the one changing fastest along the curve, and the step size
+    is adjusted according to how many iterations each point took.
+
+    Near the critical point, where every `lnK` goes to zero, the
+    specification is the largest `lnK`; a point is converged where it is
+    small, and the next step jumps across zero to a value of the same
+    magnitude on the other side; the phase objects are
+    then swapped, as the bulk phase changes from a gas to a liquid or the
+    reverse. The critical point is interpolated from the two points around
+    it, and the cricondenbar and cricondentherm are interpolated and then
+    solved for exactly.
+
+    The tracing stops early if it stalls, with the step size falling below
+    `min_step` because no next point can be solved, if the pressure exceeds
+    `P_max`, or after `max_points` points; the returned curve is then
+    marked as not complete.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of a converged starting point on the envelope, [K]
+    P : float
+        Pressure of a converged starting point on the envelope, [Pa]
+    zs : list[float]
+        Overall mole fractions, all of which must be positive, [-]
+    lnKs : list[float]
+        Logarithms of the ratios of the incipient phase mole fractions to the
+        overall mole fractions at the starting point, [-]
+    liquid_phase : :obj:`Phase <thermo.phases.Phase>`
+        Phase object to evaluate liquid compositions with, [-]
+    gas_phase : :obj:`Phase <thermo.phases.Phase>`
+        Phase object to evaluate gas compositions with, [-]
+    dew : bool
+        Whether the starting point is a dew point (bulk phase gas, incipient
+        phase liquid) or a bubble point, [-]
+    P_min : float, optional
+        Pressure at which to stop once the pressure decreases after passing
+        the cricondenbar; defaults to `P`, [Pa]
+    P_max : float, optional
+        Pressure above which to stop tracing, as a curve which is still
+        rising there does not close, [Pa]
+    initial_step : float
+        Step in the specified variable to take from the starting point, [-]
+    max_step : float
+        Largest step in the specified variable to take, [-]
+    min_step : float
+        Step size below which the tracing is stalled and stops if a point
+        cannot be solved, [-]
+    max_points : int
+        Maximum number of points to trace, [-]
+    maxiter : int
+        Maximum number of Newton iterations for each point, [-]
+    xtol : float
+        Convergence tolerance on the largest Newton step, [-]
+    lnK_critical : float
+        Magnitude of the largest `lnK` to converge a point at before jumping
+        across the critical point, and the smallest magnitude to jump to, [-]
+
+    Returns
+    -------
+    Ts : list[float]
+        Temperatures of the traced points, [K]
+    Ps : list[float]
+        Pressures of the traced points, [Pa]
+    lnKs : list[list[float]]
+        Logarithms of the equilibrium ratios at each point, [-]
+    dews : list[bool]
+        Whether each point is a dew point, [-]
+    criticals : list[tuple(float, float)]
+        Temperatures and pressures of the critical points passed, [K, Pa]
+    cricondenbar : tuple(float, float)
+        Temperature and pressure of the highest pressure point; NaN if the
+        highest pressure is at the end of an incomplete curve, [K, Pa]
+    cricondentherm : tuple(float, float)
+        Temperature and pressure of the highest temperature point; NaN if the
+        highest temperature is at the end of an incomplete curve, [K, Pa]
+    iterations : int
+        Total number of Newton iterations, [-]
+    complete : bool
+        Whether the curve was traced back down to `P_min`; False if the
+        tracing stalled, exceeded `P_max` or reached `max_points`, [-]
+
+    References
+    ----------
+    .. [1] Michelsen, Michael L. "Calculation of Phase Envelopes and Critical
+       Points for Multicomponent Mixtures." Fluid Phase Equilibria 4, no. 1
+       (1980): 1-10. https://doi.org/10.1016/0378-3812(80)80001-X.
+    '''
+    N = len(zs)
+    iT, iP = N, N + 1
+    lnP_min = log(P if P_min is None else P_min)
+    lnP_max = log(P_max)
+    phases = (gas_phase, liquid_phase) if dew else (liquid_phase, gas_phase)
+    X = [float(v) for v in lnKs] + [log(T), log(P)]
+    X, jac, iterations = _phase_envelope_newton(X, iP, X[iP], zs, phases[0], phases[1],
+                                                maxiter=maxiter, xtol=xtol)
+    points, tangents, dews, crossings = [X], [], [dew], []
+    e = [0.0]*(N + 1) + [1.0]
+
+    h = initial_step
+    done = complete = False
+    while True:
+        t = py_solve(jac, e)
+        if len(points) == 1:
+            orientation = t[iP]
+        else:
+            X_prev = points[-2]
+            orientation = sum([t[i]*(X[i] - X_prev[i]) for i in range(N + 2)])
+        t_max = max([abs(v) for v in t])
+        if orientation < 0.0:
+            t_max = -t_max
+        t = [v/t_max for v in t]
+        tangents.append(t)
+        if done or len(points) >= max_points:
+            break
+
+        while True:
+            X_pred = [X[i] + h*t[i] for i in range(N + 2)]
+            h_used = h
+            spec_idx = max(range(N + 2), key=lambda i: abs(t[i]))
+            crossing = final = False
+            k = max(range(N), key=lambda i: abs(X[i]))
+            if t[k]*X[k] < 0.0 and (X_pred[k]*X[k] <= 0.0 or abs(X_pred[k]) < lnK_critical):
+                if abs(X[k]) > 2.0*lnK_critical:
+                    # Approach the critical point first, so the jump is short
+                    target = copysign(lnK_critical, X[k])
+                else:
+                    # Jump across the critical point
+                    target = -max(abs(X[k]), lnK_critical)*copysign(1.0, X[k])
+                    crossing = True
+                h_used = (target - X[k])/t[k]
+                X_pred = [X[i] + h_used*t[i] for i in range(N + 2)]
+                spec_idx = k
+            elif t[iP] < 0.0 and X_pred[iP] < lnP_min:
+                h_used = (lnP_min - X[iP])/t[iP]
+                X_pred = [X[i] + h_used*t[i] for i in range(N + 2)]
+                spec_idx, final = iP, True
+            elif X_pred[iP] > lnP_max:
+                done = True
+                break
+            if crossing:
+                phases = (phases[1], phases[0])
+            try:
+                X_new, jac, its = _phase_envelope_newton(X_pred, spec_idx, X_pred[spec_idx], zs,
+                                                         phases[0], phases[1], maxiter=maxiter,
+                                                         xtol=xtol)
+                iterations += its
+                # Converging far from the prediction means jumping to another branch
+                if max([abs(X_new[i] - X_pred[i]) for i in range(N + 2)]) > max(h_used, lnK_critical):
+                    raise UnconvergedError("Phase envelope point far from prediction")
+            except phase_envelope_errors:
+                if crossing:
+                    phases = (phases[1], phases[0])
+                h *= 0.5
+                if h < min_step:
+                    done = True
+                    break
+                continue
+            if crossing:
+                dew = not dew
+                crossings.append(len(points))
+            X = X_new
+            points.append(X)
+            dews.append(dew)
+            if its <= 3:
+                h = min(h*1.5, max_step)
+            elif its > 5:
+                h *= 0.6
+            done = complete = final
+            break
+        if done and len(tangents) == len(points):
+            break
+
+    criticals = []
+    for j in crossings:
+        X0, X1, t0, t1 = points[j-1], points[j], tangents[j-1], tangents[j]
+        k = max(range(N), key=lambda i: abs(X0[i]))
+        dx = X1[k] - X0[k]
+        u = -X0[k]/dx
+        lnTc = _hermite_cubic(u, X0[iT], X1[iT], t0[iT]/t0[k]*dx, t1[iT]/t1[k]*dx)
+        lnPc = _hermite_cubic(u, X0[iP], X1[iP], t0[iP]/t0[k]*dx, t1[iP]/t1[k]*dx)
+        criticals.append((exp(lnTc), exp(lnPc)))
+
+    def extremum(idx, param_idx):
+        # Maximum of points[idx] along the curve; interpolated, then solved by
+        # the secant method on the slope with points[param_idx] specified
+        j = max(range(len(points)), key=lambda i: points[i][idx])
+        total = 0
+        if not complete and j == len(points) - 1:
+            # Still increasing where the tracing stopped
+            return (float('nan'), float('nan')), total
+        best = (exp(points[j][iT]), exp(points[j][iP]))
+        for a, b in ((j-1, j), (j, j+1)):
+            if a < 0 or b >= len(points) or b in crossings:
+                continue
+            X0, X1, t0, t1 = points[a], points[b], tangents[a], tangents[b]
+            dx = X1[param_idx] - X0[param_idx]
+            if t0[param_idx]*t1[param_idx] <= 0.0 or dx == 0.0:
+                continue
+            u = _hermite_cubic_extremum(X0[idx], X1[idx], t0[idx]/t0[param_idx]*dx,
+                                        t1[idx]/t1[param_idx]*dx)
+            if u is None:
+                continue
+            X_ext = [X0[i] + u*(X1[i] - X0[i]) for i in range(N + 2)]
+            ph = (gas_phase, liquid_phase) if dews[a] else (liquid_phase, gas_phase)
+            x_old, slope_old = X0[param_idx], t0[idx]/t0[param_idx]
+            try:
+                for _ in range(maxiter):
+                    X_ext, jac_ext, its = _phase_envelope_newton(X_ext, param_idx, X_ext[param_idx], zs,
+                                                                 ph[0], ph[1], maxiter=maxiter, xtol=xtol)
+                    total += its
+                    t_ext = py_solve(jac_ext, e)
+                    x, slope = X_ext[param_idx], t_ext[idx]/t_ext[param_idx]
+                    if slope == slope_old:
+                        break
+                    x_new = x - slope*(x - x_old)/(slope - slope_old)
+                    x_old, slope_old = x, slope
+                    if abs(x_new - x) < xtol:
+                        break
+                    X_ext = [X_ext[i] + (x_new - x)*t_ext[i]/t_ext[param_idx] for i in range(N + 2)]
+            except phase_envelope_errors:
+                continue
+            if X_ext[idx] >= points[j][idx]:
+                return (exp(X_ext[iT]), exp(X_ext[iP])), total
+        return best, total
+
+    cricondenbar, its = extremum(iP, iT)
+    iterations += its
+    cricondentherm, its = extremum(iT, iP)
+    iterations += its
+    Ts = [exp(X[iT]) for X in points]
+    Ps = [exp(X[iP]) for X in points]
+    lnKs = [X[:N] for X in points]
+    return Ts, Ps, lnKs, dews, criticals, cricondenbar, cricondentherm, iterations, complete
+
+
 # spec, iter_var, fixed_var
 strs_to_ders = {('H', 'T', 'P'): 'dH_dT_P',
                 ('S', 'T', 'P'): 'dS_dT_P',
@@ -45,18 +45,29 @@ from .flash_utils import (
     TPV_solve_HSGUA_guesses_VL,
     SHAW_ELEMENTAL, IDEAL_WILSON,
     nonlin_spec_NP,
+    phase_envelope_continuation,
 )
 from .flash_pure_vls  import FlashPureVLS
 from chemicals.utils import log
-from chemicals.exceptions import TrivialSolutionError
-from fluids.numerics import secant, trunc_log, UnconvergedError
+from chemicals.rachford_rice import flash_inner_loop
+from chemicals.exceptions import TrivialSolutionError, PhaseCountReducedError
+from fluids.numerics import (secant, trunc_log, UnconvergedError, OscillationError,
+                             NotBoundedError, numpy as np)
 from thermo.property_package import StabilityTester
+from thermo.phase_identification import identify_sort_phases
 from thermo.bulk import default_settings
 from thermo.coolprop import CPiP_min
+from thermo.eos_mix import PRMIX, SRKMIX
+from thermo.eos_mix_methods import eos_mix_flash_TP, eos_mix_flash_TP_many
 from thermo import phases
 
 __all__ = ['FlashVL']
 
+# Errors of a single state which do not stop a batch of flashes
+flash_TP_batch_errors = (UnconvergedError, OscillationError, NotBoundedError,
+                         TrivialSolutionError, PhaseCountReducedError,
+                         ValueError, ZeroDivisionError, OverflowError)
+
 class FlashVL(Flash):
     r'''Class for performing flash calculations on one and
     two phase vapor and liquid multicomponent systems. Use :obj:`FlashVLN` for
@@ -160,6 +171,24 @@ class FlashVL(Flash):
         numerically; this would need to be set to False if the phase objects
         used in the flash do not have complete analytical derivatives
         implemented, [-]
+    PHASE_ENVELOPE_INITIAL_STEP : float
+        Step in the logarithm of the fastest changing variable to take from
+        the starting point of :obj:`phase_envelope`, [-]
+    PHASE_ENVELOPE_MAX_STEP : float
+        Largest step in the logarithm of the fastest changing variable to take
+        between two points of :obj:`phase_envelope`, [-]
+    PHASE_ENVELOPE_MAXITER : int
+        Maximum number of Newton iterations for each point of
+        :obj:`phase_envelope`, [-]
+    PHASE_ENVELOPE_XTOL : float
+        Convergence tolerance on the largest Newton step for each point of
+        :obj:`phase_envelope`, [-]
+    PHASE_ENVELOPE_P_MAX : float
+        Pressure above which :obj:`phase_envelope` stops tracing, [Pa]
+    warm_start_cache : :obj:`WarmStartCache <thermo.flash.WarmStartCache>`
+        Optional store of converged multiphase solutions which temperature and
+        pressure flashes are started from when a stored solution is at nearly
+        the same conditions; None (the default) to disable, [-]
 
 
     Notes
@@ -303,6 +332,12 @@ class FlashVL(Flash):
     HSGUA_NEWTON_ANALYTICAL_JAC = True
     TPV_HSGUA_SECANT_MAXITER = 1000
 
+    PHASE_ENVELOPE_INITIAL_STEP = 0.05
+    PHASE_ENVELOPE_MAX_STEP = 0.5
+    PHASE_ENVELOPE_MAXITER = 20
+    PHASE_ENVELOPE_XTOL = 1e-10
+    PHASE_ENVELOPE_P_MAX = 1e9
+
     solids = None
     skip_solids = True
     K_composition_independent = False
@@ -725,9 +760,9 @@ class FlashVL(Flash):
                 a = 1
 
     def flash_TPV(self, T, P, V, zs=None, solution=None, hot_start=None):
-        if hot_start is not None:
+        if hot_start is not None and hot_start.gas is not None and hot_start.liquid_count:
             try:
-                VF_guess, xs, ys = hot_start.beta_gas, hot_start.liquid0.zs, hot_start.gas.zs
+                VF_guess, xs, ys = hot_start.gas_beta, hot_start.liquid0.zs, hot_start.gas.zs
                 liquid, gas = self.liquid, self.gas
 
                 V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(
@@ -737,14 +772,353 @@ class FlashVL(Flash):
                     V_over_F_guess=VF_guess
                 )
                 assert 0.0 <= V_over_F <= 1.0
-                return g, [l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err}
+                betas = [V_over_F, 1.0 - V_over_F]
+                # The stability test is skipped, so the split must at least
+                # lower the Gibbs energy of the feed
+                if self._warm_start_G_lower(T, P, zs, [liquid, gas], [g, l], betas):
+                    return g, [l], [], betas, {'iterations': iteration, 'err': err}
             except Exception as e:
-                print('FAILED from hot start TP')
                 pass
 
 
         return self.flash_TP_stability_test(T, P, zs, self.liquid, self.gas, solution=solution)
 
+    def flash_TP_cached(self, T, P, zs):
+        cache = self.warm_start_cache
+        key = cache.key(T, P, zs)
+        entry = cache.get(key)
+        if entry is not None:
+            sln = self.flash_TP_warm_start(T, P, zs, entry)
+            if sln is not None:
+                cache.hits += 1
+                return sln
+        cache.misses += 1
+        sln = self.flash_TPV(T=T, P=P, V=None, zs=zs)
+        g, ls, ss, betas, _ = sln
+        if len(betas) > 1 and not ss:
+            cache.store(key, g is not None, [g] + ls if g is not None else ls, betas)
+        return sln
+
+    def flash_TP_warm_start(self, T, P, zs, entry):
+        gas, phases, betas, Ks, compositions = entry
+        if len(phases) != 2:
+            return None
+        try:
+            VF_guess, xs, ys = flash_inner_loop(zs, Ks)
+            V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(
+                T=T, P=P, V=None, zs=zs, xs_guess=xs, ys_guess=ys,
+                liquid_phase=phases[1], gas_phase=phases[0],
+                maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL,
+                V_over_F_guess=VF_guess)
+        except Exception:
+            return None
+        if V_over_F < self.PT_SS_POLISH_VF or V_over_F > 1.0 - self.PT_SS_POLISH_VF:
+            return None
+        betas = [V_over_F, 1.0 - V_over_F]
+        if not self._warm_start_G_lower(T, P, zs, phases, [g, l], betas):
+            return None
+        flash_convergence = {'iterations': iteration, 'err': err, 'warm_start': True}
+        if gas:
+            return g, [l], [], betas, flash_convergence
+        return None, [g, l], [], betas, flash_convergence
+
+    def _warm_start_G_lower(self, T, P, zs, models, sln_phases, betas):
+        # Whether a warm started solution has a lower Gibbs energy than the
+        # feed as the most stable of `models`; this rejects solutions which
+        # converged to a split of a stable single phase. Only the mixing and
+        # departure terms are compared as the ideal gas terms are equal.
+        G_sln = 0.0
+        for beta, phase in zip(betas, sln_phases):
+            xs, lnphis = phase.zs, phase.lnphis()
+            for i in range(self.N):
+                if xs[i] > 0.0:
+                    G_sln += beta*xs[i]*(log(xs[i]) + lnphis[i])
+        for model in models:
+            lnphis = model.to(T=T, P=P, zs=zs).lnphis()
+            G_feed = 0.0
+            for i in range(self.N):
+                if zs[i] > 0.0:
+                    G_feed += zs[i]*(log(zs[i]) + lnphis[i])
+            if G_feed <= G_sln:
+                return False
+        return True
+
+    def flash_TP_batch(self, Ts, Ps, zs_matrix):
+        r'''Method to perform many temperature and pressure flashes, each at
+        its own composition, and return the results as a dictionary of arrays
+        instead of :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+        objects. The same phase equilibrium algorithms as
+        :obj:`flash <thermo.flash.Flash.flash>` are used and the phases are
+        identified and sorted in the same way, but no equilibrium state or
+        bulk objects are created.
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures of each state, [K]
+        Ps : list[float]
+            Pressures of each state, [Pa]
+        zs_matrix : list[list[float]]
+            Mole fractions of each component, for each state, [-]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Results of the flashes; the keys are 'phase_count' (number of
+            phases, 0 if the flash failed), 'gas' (whether or not the first
+            phase is a gas), 'betas' (molar phase fractions in the same order as
+            :obj:`EquilibriumState.betas <thermo.equilibrium.EquilibriumState>`,
+            of shape (M, `max_phases`)), 'compositions' (mole fractions of
+            each phase in the same order, of shape (M, `max_phases`, N)),
+            and the bulk properties 'H' [J/mol], 'S' [J/(mol*K)] and
+            'V' [m^3/mol], each of shape (M,); values which do not exist are
+            NaN, and 'errors', a list with the exception which stopped each
+            flash or None if it succeeded, [-]
+
+        Notes
+        -----
+        When the gas and liquid are both :obj:`CEOSGas <thermo.phases.CEOSGas>`
+        and :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` phases of the same
+        :obj:`PRMIX <thermo.eos_mix.PRMIX>` or :obj:`SRKMIX <thermo.eos_mix.SRKMIX>`
+        model, all of the states are first solved together by
+        :obj:`eos_mix_flash_TP_many <thermo.eos_mix_methods.eos_mix_flash_TP_many>`,
+        which does not create any phase objects. Only the phases of the
+        solution are then created, and two phase solutions are converged to
+        the normal tolerances of this flasher; states whose solution cannot be
+        used are flashed normally. Other models are flashed one state at a
+        time.
+
+        A flash which fails with a convergence or numerical error does not
+        stop the calculation; its `phase_count` is set to zero, all of its
+        values are NaN, and the error is stored in 'errors'. Other exceptions
+        are raised.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+        >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+        >>> HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+        ...                      HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+        >>> correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        >>> flasher = FlashVL(constants, correlations, gas=gas, liquid=liquid)
+        >>> res = flasher.flash_TP_batch([300.0, 400.0], [1e6, 1e6], [[0.5, 0.5], [0.9, 0.1]])
+        >>> res['phase_count'], res['gas']
+        (array([2, 1]), array([ True,  True]))
+        >>> res['betas']
+        array([[0.33499, 0.66500],
+               [1.     ,     nan]])
+        >>> res['H'].tolist()
+        [-14778.419, 6319.048]
+        '''
+        M, N, max_phases = len(Ts), self.N, self.max_phases
+        constants, correlations, settings = self.constants, self.correlations, self.settings
+        skip_solids = self.skip_solids
+
+        Ts = [float(T) for T in Ts]
+        Ps = [float(P) for P in Ps]
+        zs_matrix = [zs if isinstance(zs, list) else [float(v) for v in zs] for zs in zs_matrix]
+        guesses = self._flash_TP_batch_guesses(Ts, Ps, zs_matrix)
+
+        phase_counts = np.zeros(M, dtype=int)
+        gas_present = np.zeros(M, dtype=bool)
+        betas_arr = np.full((M, max_phases), np.nan)
+        comps_arr = np.full((M, max_phases, N), np.nan)
+        Hs = np.full(M, np.nan)
+        Ss = np.full(M, np.nan)
+        Vs = np.full(M, np.nan)
+        errors = [None]*M
+        for i in range(M):
+            T, P, zs = Ts[i], Ps[i], zs_matrix[i]
+            try:
+                sln = None
+                if guesses is not None and guesses[i] is not None:
+                    sln = self._flash_TP_batch_polish(T, P, zs, *guesses[i])
+                if sln is None:
+                    if self.warm_start_cache is not None:
+                        sln = self.flash_TP_cached(T=T, P=P, zs=zs)
+                    else:
+                        sln = self.flash_TPV(T=T, P=P, V=None, zs=zs)
+                g, ls, ss, betas, _ = sln
+                id_phases = [g] + ls + ss if g is not None else ls + ss
+                g, ls, ss, betas = identify_sort_phases(id_phases, betas, constants,
+                                                        correlations, settings=settings,
+                                                        skip_solids=skip_solids)
+                sorted_phases = [g] + ls + ss if g is not None else ls + ss
+                H = S = V = 0.0
+                for j, phase in enumerate(sorted_phases):
+                    beta = betas[j]
+                    H += beta*phase.H()
+                    S += beta*phase.S()
+                    V += beta*phase.V()
+            except flash_TP_batch_errors as e:
+                errors[i] = e
+                continue
+            phase_counts[i] = len(sorted_phases)
+            gas_present[i] = g is not None
+            for j, phase in enumerate(sorted_phases):
+                betas_arr[i, j] = betas[j]
+                comps_arr[i, j, :] = phase.zs
+            Hs[i], Ss[i], Vs[i] = H, S, V
+        return {'phase_count': phase_counts, 'gas': gas_present, 'betas': betas_arr,
+                'compositions': comps_arr, 'H': Hs, 'S': Ss, 'V': Vs, 'errors': errors}
+
+    def _flash_TP_batch_guesses(self, Ts, Ps, zs_matrix):
+        # Solve every state at once with the functional flash when both phases
+        # are the same plain Peng-Robinson or SRK equation of state; returns
+        # None if the phase models are not supported, otherwise a list with a
+        # (VF, xs, ys) tuple or None (no usable guess) for each state
+        gas, liquid = self.gas, self.liquid
+        if (self.warm_start_cache is not None or type(gas) is not phases.CEOSGas
+                or type(liquid) is not phases.CEOSLiquid):
+            return None
+        eos_class, eos_kwargs = gas.eos_class, gas.eos_kwargs
+        if (eos_class is not PRMIX and eos_class is not SRKMIX) or liquid.eos_class is not eos_class:
+            return None
+        if not set(eos_kwargs).issubset(('Tcs', 'Pcs', 'omegas', 'kijs')):
+            return None
+        if liquid.eos_kwargs is not eos_kwargs:
+            if set(liquid.eos_kwargs) != set(eos_kwargs):
+                return None
+            for k, v in eos_kwargs.items():
+                if not np.array_equal(v, liquid.eos_kwargs[k]):
+                    return None
+        N = self.N
+        Tcs, Pcs, omegas = list(eos_kwargs['Tcs']), list(eos_kwargs['Pcs']), list(eos_kwargs['omegas'])
+        kijs = eos_kwargs.get('kijs', None)
+        kijs = [[0.0]*N for _ in range(N)] if kijs is None else [list(r) for r in kijs]
+        PR = eos_class is PRMIX
+        try:
+            VFs, xs_list, ys_list = eos_mix_flash_TP_many(Ts, Ps, zs_matrix, Tcs, Pcs, omegas, kijs, PR)
+            return list(zip(VFs, xs_list, ys_list))
+        except flash_TP_batch_errors:
+            pass
+        # One bad state stops the batch call; guess the rest one at a time
+        guesses = []
+        for T, P, zs in zip(Ts, Ps, zs_matrix):
+            try:
+                guesses.append(eos_mix_flash_TP(T, P, zs, Tcs, Pcs, omegas, kijs, PR))
+            except flash_TP_batch_errors:
+                guesses.append(None)
+        return guesses
+
+    def _flash_TP_batch_polish(self, T, P, zs, VF, xs, ys):
+        # Build the phase objects of a state from a guess of the functional
+        # flash; two phase guesses are converged with the usual tolerances.
+        # None is returned when the guess cannot be used.
+        if VF == 0.0 or VF == 1.0:
+            liquid = self.liquid.to(T=T, P=P, zs=zs)
+            gas = self.gas.to(T=T, P=P, zs=zs)
+            if self.ideal_gas_basis:
+                G_liq, G_gas = liquid.G_dep(), gas.G_dep()
+            else:
+                G_liq, G_gas = liquid.G(), gas.G()
+            if G_liq < G_gas or (G_liq == G_gas and liquid.phase == 'l'):
+                return None, [liquid], [], [1.0], {'iterations': 0, 'err': 0.0, 'stab_info': None}
+            return gas, [], [], [1.0], {'iterations': 0, 'err': 0.0, 'stab_info': None}
+        try:
+            V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(
+                T=T, P=P, V=None, zs=zs, xs_guess=xs, ys_guess=ys,
+                liquid_phase=self.liquid, gas_phase=self.gas,
+                maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL, V_over_F_guess=VF)
+        except flash_TP_batch_errors:
+            return None
+        if not (0.0 < V_over_F < 1.0):
+            return None
+        return g, [l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err}
+
+    def phase_envelope(self, zs, P_start=1e5, max_points=500):
+        r'''Method to trace the phase envelope of a mixture, the dew and bubble
+        point curves which meet at the critical point. The envelope is started
+        from the dew point at `P_start` and followed with increasing pressure
+        through the cricondentherm, critical point and cricondenbar, and then
+        down the bubble point curve until `P_start` is reached again.
+
+        Each point is solved from the previous one by natural-parameter
+        continuation in `lnK`, `lnT` and `lnP` with Newton's method and the
+        analytical derivatives of the phase models; see
+        :obj:`phase_envelope_continuation <thermo.flash.flash_utils.phase_envelope_continuation>`.
+        Only the first point needs a dew point flash, and a point near the
+        critical point is as easy to converge as any other.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, all of which must be positive,
+            [-]
+        P_start : float, optional
+            Pressure the envelope starts and ends at, [Pa]
+        max_points : int, optional
+            Maximum number of points to trace, [-]
+
+        Returns
+        -------
+        results : dict[str, ndarray or float]
+            Traced envelope; the keys are 'T' [K] and 'P' [Pa] of each point,
+            'Ks' (ratios of the incipient phase mole fractions to `zs`, of
+            shape (M, N)), 'dew' (whether each point is a dew point rather
+            than a bubble point), the points 'T_critical', 'P_critical',
+            'T_cricondenbar', 'P_cricondenbar', 'T_cricondentherm' and
+            'P_cricondentherm' (NaN if no critical point was passed),
+            'iterations', the total number of Newton iterations, and
+            'complete', whether the envelope was traced back down to
+            `P_start`, [-]
+
+        Notes
+        -----
+        The phase models must implement `dlnphis_dT`, `dlnphis_dP` and
+        `dlnphis_dns`, as the cubic equation of state phases
+        :obj:`CEOSGas <thermo.phases.CEOSGas>` and
+        :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` do.
+
+        The tracing can stop before the envelope closes; if no next point can
+        be solved (as can happen near the critical point of some mixtures
+        with many components), the pressure exceeds
+        :obj:`PHASE_ENVELOPE_P_MAX <FlashVL>`, or `max_points` is reached.
+        The points traced are returned with 'complete' set to False, and
+        any of the critical point, cricondenbar and cricondentherm which
+        were not passed are NaN.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+        >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+        >>> HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+        ...                      HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+        >>> correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        >>> flasher = FlashVL(constants, correlations, gas=gas, liquid=liquid)
+        >>> res = flasher.phase_envelope([0.5, 0.5])
+        >>> res['T_critical'], res['P_critical']
+        (422.09, 5882615.)
+        >>> res['T_cricondenbar'], res['P_cricondenbar']
+        (416.86, 5959850.0)
+        >>> res['T_cricondentherm'], res['P_cricondentherm']
+        (426.38, 5288537.5)
+        >>> len(res['T']), res['iterations'], res['complete']
+        (37, 164, True)
+        '''
+        T, l, g, _, _ = self.flash_PVF(P=P_start, VF=1.0, zs=zs)
+        lnKs = [log(xi/zi) for xi, zi in zip(l.zs, zs)]
+        (Ts, Ps, lnKs, dews, criticals, cricondenbar, cricondentherm,
+         iterations, complete) = phase_envelope_continuation(T, P_start, zs, lnKs, self.liquid, self.gas,
+                                                   dew=True, P_max=self.PHASE_ENVELOPE_P_MAX,
+                                                   initial_step=self.PHASE_ENVELOPE_INITIAL_STEP,
+                                                   max_step=self.PHASE_ENVELOPE_MAX_STEP,
+                                                   max_points=max_points,
+                                                   maxiter=self.PHASE_ENVELOPE_MAXITER,
+                                                   xtol=self.PHASE_ENVELOPE_XTOL)
+        T_critical, P_critical = criticals[0] if criticals else (float('nan'), float('nan'))
+        return {'T': np.array(Ts), 'P': np.array(Ps), 'Ks': np.exp(np.array(lnKs)),
+                'dew': np.array(dews), 'T_critical': T_critical, 'P_critical': P_critical,
+                'T_cricondenbar': cricondenbar[0], 'P_cricondenbar': cricondenbar[1],
+                'T_cricondentherm': cricondentherm[0], 'P_cricondentherm': cricondentherm[1],
+                'iterations': iterations, 'complete': complete}
+
     def flash_TPV_HSGUA(self, fixed_val, spec_val, fixed_var='P', spec='H',
                         iter_var='T', zs=None, solution=None,
                         selection_fun_1P=None, hot_start=None):
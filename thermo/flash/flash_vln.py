@@ -335,6 +335,31 @@ class FlashVLN(FlashVL):
                                                 'stab_guess_name': None}
 
 
+    def flash_TP_warm_start(self, T, P, zs, entry):
+        gas, phases, betas, Ks, compositions = entry
+        if len(phases) == 2:
+            return FlashVL.flash_TP_warm_start(self, T, P, zs, entry)
+        try:
+            betas, compositions, phases, iteration, err = sequential_substitution_NP(
+                T, P, zs, [list(comp) for comp in compositions], list(betas), phases,
+                maxiter=self.SS_NP_MAXITER, tol=self.SS_NP_TOL,
+                trivial_solution_tol=self.SS_NP_TRIVIAL_TOL)
+        except Exception:
+            return None
+        for beta in betas:
+            if beta <= 0.0 or beta >= 1.0:
+                return None
+        if not self._warm_start_G_lower(T, P, zs, entry[1], phases, betas):
+            return None
+        flash_convergence = {'iterations': iteration, 'err': err, 'warm_start': True}
+        if gas:
+            return phases[0], phases[1:], [], betas, flash_convergence
+        return None, phases, [], betas, flash_convergence
+
+    def _flash_TP_batch_guesses(self, Ts, Ps, zs_matrix):
+        # The functional flash only finds one liquid phase
+        return None
+
     def flash_TP_K_composition_idependent(self, T, P, zs):
         if self.max_phases == 1:
             phase = self.phases[0].to(T=T, P=P, zs=zs)
@@ -130,6 +130,7 @@ from chemicals.utils import (to_num, property_molar_to_mass, none_and_length_che
 from chemicals.identifiers import CAS_to_int
 from chemicals import heat_capacity
 from chemicals import miscdata
+from chemicals.data_reader import data_source
 from chemicals.miscdata import lookup_VDI_tabular_data
 
 from thermo import electrochem
@@ -318,7 +319,7 @@ class HeatCapacityGas(TDependentProperty):
             CASRN = self.CASRN
             CASRN_int = None if not CASRN else CAS_to_int(CASRN)
 
-            jb_df = miscdata.joback_predictions
+            jb_df = data_source('joback_predictions.tsv')
             if CASRN_int in jb_df.index:
                 Cpg3 = float(jb_df.at[CASRN_int, 'Cpg3'])
                 if not isnan(Cpg3):
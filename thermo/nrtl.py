@@ -33,7 +33,7 @@ NRTL Class
 ==========
 
 .. autoclass:: NRTL
-    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, alphas, Gs, dGs_dT, d2Gs_dT2, d3Gs_dT3
+    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, alphas, Gs, dGs_dT, d2Gs_dT2, d3Gs_dT3, evaluate_many
     :undoc-members:
     :show-inheritance:
     :exclude-members: gammas
@@ -46,6 +46,8 @@ NRTL Functional Calculations
 NRTL Regression Calculations
 ============================
 .. autofunction:: NRTL_gammas_binaries
+.. autofunction:: NRTL_gammas_binaries_vectorized
+.. autofunction:: NRTL_gammas_binaries_jac_vectorized
 
 '''
 
@@ -54,8 +56,11 @@ from math import log, exp
 from fluids.constants import R
 from fluids.numerics import numpy as np, trunc_exp
 from thermo.activity import GibbsExcess
+from thermo.fitting import LeastSquaresResiduals
 
-__all__ = ['NRTL', 'NRTL_gammas', 'NRTL_gammas_binaries', 'NRTL_gammas_binaries_jac']
+__all__ = ['NRTL', 'NRTL_gammas', 'NRTL_gammas_binaries', 'NRTL_gammas_binaries_jac',
+           'nrtl_many', 'nrtl_many_loop', 'NRTL_gammas_binaries_vectorized',
+           'NRTL_gammas_binaries_jac_vectorized']
 
 try:
     array, zeros, ones, delete, npsum, nplog = np.array, np.zeros, np.ones, np.delete, np.sum, np.log
@@ -446,6 +451,67 @@ def nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
         d2GE_dTdxs[i] = -R*(T*tot1 - others)
     return d2GE_dTdxs
 
+def nrtl_many(Ts, xs, A, B, E, F, G, H, c, d):
+    # Same calculations as `nrtl_gammas`, `nrtl_GE` and `nrtl_dGE_dxs`, done
+    # for every row of `xs` (each at its own temperature) at once with array
+    # broadcasting; requires NumPy
+    xs = array(xs, dtype=float)
+    Ts = np.broadcast_to(array(Ts, dtype=float), xs.shape[:1])
+    T = Ts[:, None, None]
+    taus = (array(A, dtype=float) + array(B, dtype=float)/T
+            + array(E, dtype=float)*np.log(T) + array(F, dtype=float)*T
+            + array(G, dtype=float)/(T*T) + array(H, dtype=float)*(T*T))
+    alphas = array(c, dtype=float) + array(d, dtype=float)*T
+    Gs = np.exp(-alphas*taus)
+
+    xj_Gs_jis_inv = 1.0/np.einsum('mj,mji->mi', xs, Gs)
+    vec1 = np.einsum('mj,mji->mi', xs, Gs*taus)*xj_Gs_jis_inv
+    vec0 = xs*xj_Gs_jis_inv
+    lngammas = vec1 + np.einsum('mj,mij->mi', vec0, Gs*(taus - vec1[:, None, :]))
+
+    RT = R*Ts
+    GEs = RT*(xs*vec1).sum(axis=1)
+    dGE_dxs = RT[:, None]*lngammas
+    return np.exp(lngammas), GEs, dGE_dxs
+
+def nrtl_many_loop(Ts, xs, M, N, A, B, E, F, G, H, c, d, gammas=None,
+                   GEs=None, dGE_dxs=None):
+    # Loop form of `nrtl_many` reusing one set of work arrays for every row
+    # of `xs`; this is the variant compiled by `thermo.numba`
+    if gammas is None:
+        gammas = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas = zeros((M, N)) # numba: uncomment
+    if dGE_dxs is None:
+        dGE_dxs = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs = zeros((M, N)) # numba: uncomment
+    if GEs is None:
+        GEs = [0.0]*M
+
+    taus = [[0.0]*N for _ in range(N)] # numba: delete
+    alphas = [[0.0]*N for _ in range(N)] # numba: delete
+    Gs = [[0.0]*N for _ in range(N)] # numba: delete
+#    taus = zeros((N, N)) # numba: uncomment
+#    alphas = zeros((N, N)) # numba: uncomment
+#    Gs = zeros((N, N)) # numba: uncomment
+    xj_Gs_jis = [0.0]*N
+    xj_Gs_jis_inv = [0.0]*N
+    xj_Gs_taus_jis = [0.0]*N
+    vec0 = [0.0]*N
+    vec1 = [0.0]*N
+    for row in range(M):
+        T = Ts[row]
+        xs_row = xs[row]
+        nrtl_taus(T, N, A, B, E, F, G, H, taus)
+        nrtl_alphas(T, N, c, d, alphas)
+        nrtl_Gs(N, alphas, taus, Gs)
+        nrtl_xj_Gs_jis_and_Gs_taus_jis(N, xs_row, Gs, taus, xj_Gs_jis, xj_Gs_taus_jis)
+        for i in range(N):
+            xj_Gs_jis_inv[i] = 1.0/xj_Gs_jis[i]
+        nrtl_gammas(xs_row, N, Gs, taus, xj_Gs_jis_inv, xj_Gs_taus_jis, gammas[row], vec0, vec1)
+        GEs[row] = nrtl_GE(N, T, xs_row, xj_Gs_taus_jis, xj_Gs_jis_inv)
+        nrtl_dGE_dxs(N, T, xs_row, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, dGE_dxs[row])
+    return gammas, GEs, dGE_dxs
+
 class NRTL(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the NRTL equation. This model is capable of representing VL and LL
@@ -805,6 +871,54 @@ class NRTL(GibbsExcess):
         self._gammas = nrtl_gammas(xs, N, Gs, taus, xj_Gs_jis_inv, xj_Gs_taus_jis, gammas)
         return gammas
 
+    def evaluate_many(self, Ts, xs_matrix):
+        r'''Method to calculate the activity coefficients, excess Gibbs energy
+        and its mole fraction derivatives with the NRTL model at many
+        temperatures and compositions at once, with the same parameters as
+        the existing object. Every state is evaluated at once with array
+        broadcasting by :obj:`nrtl_many`, which is much faster than creating
+        an object with :obj:`to_T_xs` for each state.
+
+        Parameters
+        ----------
+        Ts : ndarray[float]
+            Temperatures, one per composition or a single temperature for
+            every composition, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Results of each state; the keys are 'T', 'gammas' (one row per
+            composition and one column per component), 'GE' and 'dGE_dxs'
+            (one row per composition and one column per component), [-]
+
+        Notes
+        -----
+        Requires NumPy. :obj:`nrtl_many_loop` is an equivalent function
+        written with loops, which `thermo.numba` compiles.
+
+        Examples
+        --------
+        >>> from scipy.constants import calorie, R
+        >>> N = 2
+        >>> tausA = tausE = tausF = tausG = tausH = alphaD = [[0.0]*N for i in range(N)]
+        >>> tausB = [[0, -121.2691/R*calorie], [1337.8574/R*calorie, 0]]
+        >>> alphaC =  [[0, 0.2974],[.2974, 0]]
+        >>> ABEFGHCD = (tausA, tausB, tausE, tausF, tausG, tausH, alphaC, alphaD)
+        >>> GE = NRTL(T=343.15, xs=[0.252, 0.748], ABEFGHCD=ABEFGHCD)
+        >>> res = GE.evaluate_many([343.15, 353.15], [[0.252, 0.748], [0.5, 0.5]])
+        >>> res['gammas'].tolist()
+        [[1.93605165145, 1.15366304520], [1.22944586, 1.48409937]]
+        '''
+        xs_matrix = array(xs_matrix, dtype=float)
+        Ts = np.broadcast_to(array(Ts, dtype=float), xs_matrix.shape[:1])
+        gammas, GEs, dGE_dxs = nrtl_many(Ts, xs_matrix, self.tau_as, self.tau_bs,
+                                         self.tau_es, self.tau_fs, self.tau_gs,
+                                         self.tau_hs, self.alpha_cs, self.alpha_ds)
+        return {'T': Ts, 'gammas': gammas, 'GE': GEs, 'dGE_dxs': dGE_dxs}
+
 
     def taus(self):
         r'''Calculate and return the `tau` terms for the NRTL model for a
@@ -1632,29 +1746,9 @@ class NRTL(GibbsExcess):
         if use_numba:
             from thermo.numba import NRTL_gammas_binaries as work_func, NRTL_gammas_binaries_jac as jac_func
         else:
-            work_func = NRTL_gammas_binaries
-            jac_func = NRTL_gammas_binaries_jac
-        
-        # Allocate all working memory
-        pts = len(xs)
-        gammas_iter = zeros(pts*2)
-        jac_iter = zeros((pts*2, 4))
+            work_func = NRTL_gammas_binaries_vectorized
+            jac_func = NRTL_gammas_binaries_jac_vectorized
 
-        # Plain objective functions
-        if symmetric_alphas:
-            def fitting_func(xs, tau12, tau21, alpha):
-                return work_func(xs, tau12, tau21, alpha, alpha, gammas_iter)
-            
-            def analytical_jac(xs, tau12, tau21, alpha):
-                return delete(jac_func(xs, tau12, tau21, alpha, alpha, jac_iter), 3, axis=1)
-    
-        else:
-            def fitting_func(xs, tau12, tau21, alpha12, alpha21):
-                return work_func(xs, tau12, tau21, alpha12, alpha21, gammas_iter)
-            
-            def analytical_jac(xs, tau12, tau21, alpha12, alpha21):
-                return jac_func(xs, tau12, tau21, alpha12, alpha21, jac_iter)
-    
         # The extend calls has been tested to be the fastest compared to numpy and list comprehension
         xs_working = []
         for xsi in xs:
@@ -1665,40 +1759,26 @@ class NRTL(GibbsExcess):
             
         xs_working = array(xs_working)
         gammas_working = array(gammas_working)
-        
-        # Objective functions for leastsq maximum speed
-        if symmetric_alphas:
-            def func_wrapped_for_leastsq(params):
-                return work_func(xs_working, params[0], params[1], params[2], params[2], gammas_iter) - gammas_working
-    
-            def jac_wrapped_for_leastsq(params):
-                out = jac_func(xs_working, params[0], params[1], params[2], params[2], jac_iter)
-                new_out = delete(out, 3, axis=1)
-                new_out[:, 2] = out[:, 2] + out[:, 3]
-                return new_out
-        
-        else:
-            def func_wrapped_for_leastsq(params):
-                return work_func(xs_working, params[0], params[1], params[2], params[3], gammas_iter) - gammas_working
-    
-            def jac_wrapped_for_leastsq(params):
-                return jac_func(xs_working, params[0], params[1], params[2], params[3], jac_iter)
-        
+
+        # Objective functions evaluating every point at once; with symmetric
+        # alphas, alpha12 and alpha21 are both set to the third fit parameter
         if symmetric_alphas:
             use_fit_parameters = ['tau12', 'tau21', 'alpha12']
+            param_indices = (0, 1, 2, 2)
         else:
             use_fit_parameters = ['tau12', 'tau21', 'alpha12', 'alpha21']
-        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=fitting_func,
+            param_indices = None
+        residuals = LeastSquaresResiduals(work_func, xs_working, gammas_working, jac=jac_func,
+                                          param_indices=param_indices)
+        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=residuals.calc,
                                                       fit_parameters=use_fit_parameters,
                                                       use_fit_parameters=use_fit_parameters,
                                                       initial_guesses=cls._gamma_parameter_guesses,
-                                                        analytical_jac=jac_func,
-                                                       # analytical_jac=None,
+                                                      analytical_jac=residuals.jac,
                                                       use_numba=use_numba,
                                                       do_statistics=do_statistics,
-                                                      func_wrapped_for_leastsq=func_wrapped_for_leastsq,
-                                                        jac_wrapped_for_leastsq=jac_wrapped_for_leastsq,
-                                                       # jac_wrapped_for_leastsq=None,
+                                                      func_wrapped_for_leastsq=residuals.residuals,
+                                                      jac_wrapped_for_leastsq=residuals.jacobian,
                                                       **kwargs)
 
     # Larger value on the right always (tau)
@@ -1888,6 +1968,138 @@ def NRTL_gammas_binaries_jac(xs, tau12, tau21, alpha12, alpha21, calc=None):
         gamma1_row[3] = -x25*x27*(x23 - 1.0)
     return calc
 
+def NRTL_gammas_binaries_vectorized(xs, tau12, tau21, alpha12, alpha21):
+    r'''Calculates activity coefficients at fixed `tau` and `alpha` values for
+    a binary system at a series of mole fractions, for all of the points at
+    once with array operations. This is the same calculation as
+    :obj:`NRTL_gammas_binaries`, but is much faster for large numbers of
+    points; it requires NumPy.
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        [-]
+    tau12 : float
+        `tau` parameter for 12, [-]
+    tau21 : float
+        `tau` parameter for 21, [-]
+    alpha12 : float
+        `alpha` parameter for 12, [-]
+    alpha21 : float
+        `alpha` parameter for 21, [-]
+
+    Returns
+    -------
+    gammas : ndarray[float]
+        Activity coefficient for each species in the liquid mixture,
+        indexed the same as `xs`, [-]
+
+    Examples
+    --------
+    >>> NRTL_gammas_binaries_vectorized(np.array([.1, .9, 0.3, 0.7, .85, .15]), 0.1759, 0.7991, .2, .3).tolist()
+    [2.121421, 1.011342, 1.52177, 1.09773, 1.016062, 1.841391]
+    '''
+    if tau12 < MIN_TAU_NRTL:
+        tau12 = MIN_TAU_NRTL
+    if tau21 < MIN_TAU_NRTL:
+        tau21 = MIN_TAU_NRTL
+    if alpha12 < MIN_ALPHA_NRTL:
+        alpha12 = MIN_ALPHA_NRTL
+    if alpha21 < MIN_ALPHA_NRTL:
+        alpha21 = MIN_ALPHA_NRTL
+    x0 = array(xs, dtype=float)[::2]
+    x1 = 1.0 - x0
+
+    G01 = exp(-alpha12*tau12)
+    G10 = exp(-alpha21*tau21)
+    c0 = 1.0/(x0 + x1*G10)
+    c0 *= c0
+    c1 = 1.0/(x1 + x0*G01)
+    c1 *= c1
+
+    gammas = np.empty(2*x0.size)
+    # Limited as in `trunc_exp`
+    gammas[::2] = np.exp(np.minimum(x1*x1*(G10*G10*tau21*c0 + G01*tau12*c1), 709.78))
+    gammas[1::2] = np.exp(np.minimum(x0*x0*(G01*G01*tau12*c1 + G10*tau21*c0), 709.78))
+    return gammas
+
+def NRTL_gammas_binaries_jac_vectorized(xs, tau12, tau21, alpha12, alpha21):
+    r'''Calculates the derivatives of the activity coefficients calculated by
+    :obj:`NRTL_gammas_binaries_vectorized` with respect to `tau12`, `tau21`,
+    `alpha12` and `alpha21`, for all of the points at once with array
+    operations; it requires NumPy.
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        [-]
+    tau12 : float
+        `tau` parameter for 12, [-]
+    tau21 : float
+        `tau` parameter for 21, [-]
+    alpha12 : float
+        `alpha` parameter for 12, [-]
+    alpha21 : float
+        `alpha` parameter for 21, [-]
+
+    Returns
+    -------
+    jac : ndarray[float]
+        Derivatives of each activity coefficient with respect to `tau12`,
+        `tau21`, `alpha12` and `alpha21`; one row per activity coefficient,
+        indexed the same as `xs`, [-]
+
+    Examples
+    --------
+    >>> NRTL_gammas_binaries_jac_vectorized(np.array([.3, .7, .4, .6]), 2, 3, .2, .4)[0].tolist()
+    [1.17899163, -0.26111310, -3.35381191, -6.74117164]
+    '''
+    if tau12 < MIN_TAU_NRTL:
+        tau12 = MIN_TAU_NRTL
+    if tau21 < MIN_TAU_NRTL:
+        tau21 = MIN_TAU_NRTL
+    if alpha12 < MIN_ALPHA_NRTL:
+        alpha12 = MIN_ALPHA_NRTL
+    if alpha21 < MIN_ALPHA_NRTL:
+        alpha21 = MIN_ALPHA_NRTL
+    x0 = array(xs, dtype=float)[::2]
+    x1 = 1.0 - x0
+    x0_2, x1_2 = x0*x0, x1*x1
+
+    G01 = exp(-alpha12*tau12)
+    G10 = exp(-alpha21*tau21)
+    a_inv = 1.0/(x0 + x1*G10)
+    b_inv = 1.0/(x1 + x0*G01)
+    a2_inv, b2_inv = a_inv*a_inv, b_inv*b_inv
+    gamma0 = np.exp(np.minimum(x1_2*(G10*G10*tau21*a2_inv + G01*tau12*b2_inv), 709.78))
+    gamma1 = np.exp(np.minimum(x0_2*(G01*G01*tau12*b2_inv + G10*tau21*a2_inv), 709.78))
+
+    # Derivatives of the log of the activity coefficients with respect to
+    # G12 and G21, then chained to `tau` and `alpha` with
+    # dG/dtau = -alpha*G and dG/dalpha = -tau*G
+    dlngamma0_dG01 = x1_2*tau12*(x1 - x0*G01)*b2_inv*b_inv
+    dlngamma0_dG10 = 2.0*x1_2*tau21*G10*x0*a2_inv*a_inv
+    dlngamma1_dG10 = x0_2*tau21*(x0 - x1*G10)*a2_inv*a_inv
+    dlngamma1_dG01 = 2.0*x0_2*tau12*G01*x1*b2_inv*b_inv
+
+    jac = np.empty((2*x0.size, 4))
+    jac0, jac1 = jac[::2], jac[1::2]
+    jac0[:, 0] = gamma0*(x1_2*G01*b2_inv - alpha12*G01*dlngamma0_dG01)
+    jac0[:, 1] = gamma0*(x1_2*G10*G10*a2_inv - alpha21*G10*dlngamma0_dG10)
+    jac0[:, 2] = -gamma0*tau12*G01*dlngamma0_dG01
+    jac0[:, 3] = -gamma0*tau21*G10*dlngamma0_dG10
+    jac1[:, 0] = gamma1*(x0_2*G01*G01*b2_inv - alpha12*G01*dlngamma1_dG01)
+    jac1[:, 1] = gamma1*(x0_2*G10*a2_inv - alpha21*G10*dlngamma1_dG10)
+    jac1[:, 2] = -gamma1*tau12*G01*dlngamma1_dG01
+    jac1[:, 3] = -gamma1*tau21*G10*dlngamma1_dG10
+    return jac
+
 def NRTL_gammas(xs, taus, alphas):
     r'''Calculates the activity coefficients of each species in a mixture
     using the Non-Random Two-Liquid (NRTL) method, given their mole fractions,
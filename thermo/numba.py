@@ -98,8 +98,23 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                     'TPV_double_solve_1P',
                     'TPV_solve_HSGUA_guesses_VL',
                     'cm_flash_tol',
+                    'kijs_low_rank',
                     'chemgroups_to_matrix',
                     'load_unifac_ip',
+                    'unifac_lngammas_many',
+                    'nrtl_many', 'wilson_many', 'uniquac_many',
+                    'NRTL_gammas_binaries_vectorized', 'NRTL_gammas_binaries_jac_vectorized',
+                    'wilson_gammas_binaries_vectorized', 'wilson_gammas_binaries_jac_vectorized',
+                    'regular_solution_gammas_binaries_vectorized',
+                    'regular_solution_gammas_binaries_jac_vectorized',
+                    'UNIQUAC_gammas_binaries_vectorized', 'UNIQUAC_gammas_binaries_jac_vectorized',
+                    '_fit_customized_lm_worker',
+                    '_unifac_groups_to_str',
+                    '_unifac_str_to_groups',
+                    '_unifac_rdkit_Chem',
+                    '_unifac_inchikey',
+                    '_unifac_fragment',
+                    '_unifac_fragment_worker',
                     'FlashPureVLS',
                     ] + chemicals.numba.numba_blacklisted)
 
@@ -123,6 +138,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
         mod.__dict__.update(__funcs)
 
     to_change = ['eos.volume_solutions_halley',
+                 'eos_volume.volume_solutions_halley_many',
                  
                  'eos_mix_methods.a_alpha_quadratic_terms',
                  
@@ -140,6 +156,11 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
              'eos_mix_methods.RK_lnphis_fastest',
              'eos_mix_methods.PR_translated_lnphis_fastest',
              'eos_mix_methods.SRK_translated_lnphis_fastest',
+             'eos_mix_methods.PR_SRK_lnphis_fastest',
+             'eos_mix_methods.eos_mix_Rachford_Rice',
+             'eos_mix_methods.eos_mix_stability_TP',
+             'eos_mix_methods.eos_mix_flash_TP',
+             'eos_mix_methods.eos_mix_flash_TP_many',
              'eos_mix_methods.G_dep_lnphi_d_helper',
              'eos_mix_methods.PR_translated_ddelta_dzs',
              'eos_mix_methods.PR_translated_ddelta_dns',
@@ -188,6 +209,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'wilson.wilson_dGE_dxs', 'wilson.wilson_d2GE_dxixjs',
                  'wilson.wilson_d3GE_dxixjxks', 'wilson.wilson_gammas',
                  'wilson.wilson_gammas_binaries', 'wilson.wilson_gammas_binaries_jac',
+                 'wilson.wilson_many_loop',
 
                  'uniquac.UNIQUAC',
                  'uniquac.uniquac_phis',
@@ -198,6 +220,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'uniquac.uniquac_dGE_dxs',
                  'uniquac.uniquac_d2GE_dTdxs',
                  'uniquac.UNIQUAC_gammas_binaries',
+                 'uniquac.uniquac_many_loop',
 
                  'nrtl.NRTL',
                  'nrtl.nrtl_gammas',
@@ -218,6 +241,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'nrtl.nrtl_d2GE_dTdxs',
                  'nrtl.NRTL_gammas_binaries',
                  'nrtl.NRTL_gammas_binaries_jac',
+                 'nrtl.nrtl_many_loop',
 
                 'unifac.unifac_psis',
                 'unifac.unifac_dpsis_dT',
@@ -267,6 +291,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                 'unifac.unifac_d3lngammas_c_dxixjxks',
                 'unifac.UNIFAC',
                 'unifac.unifac_gammas_at_T',
+                'unifac.unifac_lngammas_many_loop',
 
                  'activity.gibbs_excess_gammas', 'activity.gibbs_excess_dHE_dxs',
                  'activity.gibbs_excess_dgammas_dns', 'activity.gibbs_excess_dgammas_dT',
@@ -285,6 +310,16 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'eos_alpha_functions.PRSV2_a_alpha_and_derivatives_vectorized',
                  'eos_alpha_functions.APISRK_a_alphas_vectorized',
                  'eos_alpha_functions.APISRK_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Twu91_a_alphas_vectorized',
+                 'eos_alpha_functions.Twu91_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Soave_1979_a_alphas_vectorized',
+                 'eos_alpha_functions.Soave_1979_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Mathias_Copeman_poly_a_alphas_vectorized',
+                 'eos_alpha_functions.Mathias_Copeman_poly_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.TwuPR95_a_alphas_vectorized',
+                 'eos_alpha_functions.TwuPR95_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.TwuSRK95_a_alphas_vectorized',
+                 'eos_alpha_functions.TwuSRK95_a_alpha_and_derivatives_vectorized',
 
                  'phases.iapws_phase.IAPWS95', 'phases.iapws_phase.IAPWS95Liquid', 'phases.iapws_phase.IAPWS95Gas',
                  'phases.air_phase.DryAirLemmon',
@@ -70,6 +70,7 @@ from chemicals.utils import log, isnan
 from chemicals.utils import property_molar_to_mass, mixing_simple, none_and_length_check
 from chemicals.dippr import EQ106
 from chemicals import miscdata
+from chemicals.data_reader import data_source
 from chemicals.miscdata import lookup_VDI_tabular_data
 from chemicals import phase_change
 from chemicals.phase_change import *
@@ -666,9 +667,10 @@ class EnthalpySublimation(TDependentProperty):
         CASRN = self.CASRN
         CASRN_int = None if not CASRN else CAS_to_int(CASRN)
         if load_data:
-            if CASRN_int in miscdata.webbook_data.index and not isnan(float(miscdata.webbook_data.at[CASRN_int, 'Hsub'])):
+            df_wb = data_source('webbook_constants.tsv')
+            if CASRN_int in df_wb.index and not isnan(float(df_wb.at[CASRN_int, 'Hsub'])):
                 methods.append(WEBBOOK_HSUB)
-                self.webbook_Hsub = float(miscdata.webbook_data.at[CASRN_int, 'Hsub'])
+                self.webbook_Hsub = float(df_wb.at[CASRN_int, 'Hsub'])
                 if self.Tm is not None:
                     T_limits[WEBBOOK_HSUB] = (self.Tm, self.Tm)
 
@@ -70,6 +70,9 @@ Liquid Phases
    :members: __init__
    :exclude-members: __init__
 
+.. autoclass:: CEOSAlphaCache
+   :members: get, add, clear
+
 Activity Based Liquids
 ======================
 .. autoclass:: GibbsExcessLiquid
@@ -21,20 +21,155 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 '''
-__all__ = ['CEOSLiquid', 'CEOSGas']
+__all__ = ['CEOSLiquid', 'CEOSGas', 'CEOSAlphaCache']
 import os
+from collections import OrderedDict
+from threading import Lock
 from fluids.constants import R
 from fluids.numerics import trunc_exp, numpy as np
-from chemicals.utils import log
+from chemicals.utils import log, hash_any_primitive
 from thermo.eos_mix import IGMIX, eos_mix_full_path_dict, eos_mix_full_path_reverse_dict
 from thermo.phases.phase_utils import PR_lnphis_fastest, lnphis_direct
 from thermo.heat_capacity import HeatCapacityGas
+from thermo.unifac import UNIFAC
 from thermo.phases.phase import Phase
 try:
     zeros = np.zeros
 except:
     pass
 
+class CEOSAlphaCache(object):
+    r'''Class for sharing the temperature-dependent parts of a cubic
+    equation of state between :obj:`CEOSGas` and :obj:`CEOSLiquid` phases
+    with the same `eos_class` and `eos_kwargs` values. The pure-component
+    `a_alphas` and their first and second temperature derivatives are stored
+    by temperature; when a phase is created at a temperature in the cache,
+    they are used instead of being recalculated.
+
+    Instances should not be created directly; they are obtained from the
+    :obj:`CEOSGas.alpha_cache` property of a phase, which is only available
+    when :obj:`CEOSGas.alpha_caching` is enabled.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of temperatures to store; the least recently used
+        temperature is discarded first, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups which found a stored temperature, [-]
+    misses : int
+        Number of lookups which did not find a stored temperature, [-]
+
+    Examples
+    --------
+    >>> from thermo.eos_mix import PRMIX
+    >>> CEOSGas.alpha_caching = CEOSLiquid.alpha_caching = True
+    >>> eos_kwargs = dict(Tcs=[305.32, 369.83], Pcs=[4872000.0, 4248000.0], omegas=[0.098, 0.152])
+    >>> gas = CEOSGas(PRMIX, T=300.0, P=1e5, zs=[.2, .8], eos_kwargs=eos_kwargs)
+    >>> liquid = CEOSLiquid(PRMIX, T=300.0, P=1e5, zs=[.2, .8], eos_kwargs=eos_kwargs)
+    >>> gas.alpha_cache is liquid.alpha_cache
+    True
+    >>> liquid.alpha_cache.clear()
+    >>> new_gas = gas.to_TP_zs(T=250.0, P=1e5, zs=[.5, .5])
+    >>> new_liq = liquid.to_TP_zs(T=250.0, P=2e6, zs=[.1, .9])
+    >>> new_liq.eos_mix.a_alphas is new_gas.eos_mix.a_alphas
+    True
+    >>> (liquid.alpha_cache.hits, liquid.alpha_cache.misses)
+    (1, 1)
+    >>> CEOSGas.alpha_caching = CEOSLiquid.alpha_caching = False
+    '''
+    __slots__ = ('max_size', 'hits', 'misses', 'alphas', 'lock')
+
+    def __init__(self, max_size=16):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.alphas = OrderedDict()
+        self.lock = Lock()
+
+    def __repr__(self):
+        return '<CEOSAlphaCache %d temperatures, hits=%d, misses=%d>' %(
+            len(self.alphas), self.hits, self.misses)
+
+    def get(self, T):
+        r'''Method to look up the stored pure-component `a_alphas` and
+        their temperature derivatives at a temperature.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+
+        Returns
+        -------
+        alphas : tuple(list[float], list[float], list[float]) or None
+            `a_alphas`, `da_alpha_dTs`, and `d2a_alpha_dT2s` at `T` if they
+            are stored, otherwise None [-]
+        '''
+        with self.lock:
+            alphas = self.alphas.get(T)
+            if alphas is None:
+                self.misses += 1
+            else:
+                self.alphas.move_to_end(T)
+                self.hits += 1
+        return alphas
+
+    def add(self, eos_mix):
+        r'''Method to store the pure-component `a_alphas` and their
+        temperature derivatives of a mixture EOS object by its temperature,
+        unless that temperature is already stored. The EOS object itself is
+        not kept.
+
+        Parameters
+        ----------
+        eos_mix : :obj:`thermo.eos_mix.GCEOSMIX`
+            EOS object with `a_alphas` and their temperature derivatives
+            calculated, [-]
+        '''
+        try:
+            alphas = (eos_mix.a_alphas, eos_mix.da_alpha_dTs, eos_mix.d2a_alpha_dT2s)
+        except AttributeError:
+            return
+        T = eos_mix.T
+        with self.lock:
+            if T not in self.alphas:
+                self.alphas[T] = alphas
+                while len(self.alphas) > self.max_size:
+                    self.alphas.popitem(last=False)
+
+    def clear(self):
+        r'''Method to remove all stored values and reset the hit
+        statistics.
+        '''
+        with self.lock:
+            self.alphas.clear()
+            self.hits = self.misses = 0
+
+_alpha_caches = OrderedDict()
+_alpha_caches_lock = Lock()
+max_alpha_caches = 64
+'''Maximum number of :obj:`CEOSAlphaCache` objects kept, one per
+distinct set of `eos_class` and `eos_kwargs` values.'''
+
+def _alpha_cache_key(eos_class, eos_kwargs):
+    return hash_any_primitive((eos_class.__name__, eos_kwargs))
+
+def _get_alpha_cache(key, max_size):
+    with _alpha_caches_lock:
+        try:
+            _alpha_caches.move_to_end(key)
+            return _alpha_caches[key]
+        except KeyError:
+            pass
+        _alpha_caches[key] = cache = CEOSAlphaCache(max_size)
+        while len(_alpha_caches) > max_alpha_caches:
+            _alpha_caches.popitem(last=False)
+    return cache
+
 class CEOSGas(Phase):
     r'''Class for representing a cubic equation of state gas phase
     as a phase object. All departure
@@ -97,6 +232,49 @@ class CEOSGas(Phase):
     model_attributes = ('Hfs', 'Gfs', 'Sfs', 'eos_class',
                         'eos_kwargs') + pure_references
 
+    alpha_caching = False
+    '''Whether or not to share `a_alphas` and their temperature derivatives
+    through :obj:`CEOSGas.alpha_cache` when new phases are created with
+    :obj:`CEOSGas.to_TP_zs` or :obj:`CEOSGas.to`. Mostly worth it for
+    alpha functions which are expensive to evaluate, as for PRSV2. Set on
+    both :obj:`CEOSGas` and :obj:`CEOSLiquid` to enable it; only phases
+    constructed afterwards use the cache.'''
+    alpha_cache_size = 16
+    '''Maximum number of temperatures stored in each
+    :obj:`CEOSAlphaCache`.'''
+
+    @property
+    def alpha_cache(self):
+        r''':obj:`CEOSAlphaCache` shared by all :obj:`CEOSGas` and
+        :obj:`CEOSLiquid` phases created with the same `eos_class` and
+        `eos_kwargs` values, or None if the phase was not created with
+        :obj:`CEOSGas.alpha_caching` enabled. It is looked up by a hash of
+        those values taken when the phase was constructed, which is not
+        included in the hash or serialization of the phase.
+        '''
+        try:
+            key = self._alpha_cache_key
+        except AttributeError:
+            return None
+        return _get_alpha_cache(key, self.alpha_cache_size)
+
+    def __getstate__(self):
+        # The alpha cache key is only valid in the process it was calculated in
+        state = self.__dict__.copy()
+        state.pop('_alpha_cache_key', None)
+        return state
+
+    def __hash__(self):
+        self.model_hash(False)
+        self.model_hash(True)
+        self.state_hash()
+        return hash_any_primitive((self.__class__.__name__, self.__getstate__()))
+
+    def as_json(self):
+        d = Phase.as_json(self)
+        d.pop('_alpha_cache_key', None)
+        return d
+
     @property
     def phase(self):
         phase = self.eos_mix.phase
@@ -170,6 +348,11 @@ class CEOSGas(Phase):
             self.P = P
             self.zs = zs
             self.eos_mix = eos_mix = self.eos_class(T=T, P=P, zs=zs, **self.eos_kwargs)
+            if self.alpha_caching and not ideal_gas:
+                # Keyed by the values the EOS was created with, so a later
+                # change to `eos_kwargs` cannot return stale alphas
+                self._alpha_cache_key = _alpha_cache_key(eos_class, eos_kwargs)
+                self.alpha_cache.add(eos_mix)
         else:
             zs = [1.0/N]*N
             self.eos_mix = eos_mix = self.eos_class(T=298.15, P=101325.0, zs=zs, **self.eos_kwargs)
@@ -231,16 +414,14 @@ class CEOSGas(Phase):
             other_eos.solve_missing_volumes()
             new.eos_mix = other_eos
         else:
-            try:
-                new.eos_mix = self.eos_mix.to_TP_zs_fast(T=T, P=P, zs=zs, only_g=True,
-                                                         full_alphas=True) # optimize alphas?
-                                                         # Be very careful doing this in the future - wasted
-                                                         # 1 hour on this because the heat capacity calculation was wrong
-            except AttributeError:
-                new.eos_mix = self.eos_class(T=T, P=P, zs=zs, **self.eos_kwargs)
+            new.eos_mix = self._eos_mix_at_TP_zs(T, P, zs)
 
         new.eos_class = self.eos_class
         new.eos_kwargs = self.eos_kwargs
+        try:
+            new._alpha_cache_key = self._alpha_cache_key
+        except AttributeError:
+            pass
 
         new.HeatCapacityGases = self.HeatCapacityGases
         new._Cpgs_data = self._Cpgs_data
@@ -260,17 +441,28 @@ class CEOSGas(Phase):
 
         return new
 
+    def _eos_mix_at_TP_zs(self, T, P, zs):
+        source = self.eos_mix
+        cache = self.alpha_cache if (self.alpha_caching and T != source.T) else None
+        alphas = cache.get(T) if cache is not None else None
+        try:
+            eos_mix = source.to_TP_zs_fast(T=T, P=P, zs=zs, only_g=True,
+                                           full_alphas=True, alphas=alphas) # optimize alphas?
+                                           # Be very careful doing this in the future - wasted
+                                           # 1 hour on this because the heat capacity calculation was wrong
+        except AttributeError:
+            eos_mix = self.eos_class(T=T, P=P, zs=zs, **self.eos_kwargs)
+        if cache is not None and alphas is None:
+            cache.add(eos_mix)
+        return eos_mix
+
     def to(self, zs, T=None, P=None, V=None):
         new = self.__class__.__new__(self.__class__)
         new.zs = zs
 
         if T is not None:
             if P is not None:
-                try:
-                    new.eos_mix = self.eos_mix.to_TP_zs_fast(T=T, P=P, zs=zs, only_g=True,
-                                                             full_alphas=True)
-                except AttributeError:
-                    new.eos_mix = self.eos_class(T=T, P=P, zs=zs, **self.eos_kwargs)
+                new.eos_mix = self._eos_mix_at_TP_zs(T, P, zs)
             elif V is not None:
                 try:
                     new.eos_mix = self.eos_mix.to(T=T, V=V, zs=zs, fugacities=False)
@@ -290,6 +482,10 @@ class CEOSGas(Phase):
 
         new.eos_class = self.eos_class
         new.eos_kwargs = self.eos_kwargs
+        try:
+            new._alpha_cache_key = self._alpha_cache_key
+        except AttributeError:
+            pass
 
         new.HeatCapacityGases = self.HeatCapacityGases
         new._Cpgs_data = self._Cpgs_data
@@ -350,6 +546,11 @@ class CEOSGas(Phase):
             a_alpha_j_rows, vec0 = [0.0]*N, [0.0]*N
         else:
             a_alpha_j_rows, vec0 = zeros(N), zeros(N)
+        if self.eos_class.model_id == 10300:
+            ge_model = eos_mix.ge_model
+            return (10300, self.T, self.P, N, self.is_liquid, self.is_gas, eos_mix.b0s,
+                    eos_mix.bs, eos_mix.cs, eos_mix.a_alphas, eos_mix.A_inv,
+                    ge_model.model_id) + ge_model.lnphis_args()
         if eos_mix.translated:
             return (self.eos_class.model_id, self.T, self.P, self.N, eos_mix.kijs, self.is_liquid, self.is_gas,
                    eos_mix.b0s, eos_mix.bs, eos_mix.cs, eos_mix.a_alphas, eos_mix.a_alpha_roots, a_alpha_j_rows, vec0)
@@ -360,6 +561,9 @@ class CEOSGas(Phase):
     def lnphis_at_zs(self, zs):
         eos_mix = self.eos_mix
         # if eos_mix.__class__.__name__ in ('PRMIX', 'VDWMIX', 'SRKMIX', 'RKMIX'):
+        if self.eos_class.model_id == 10300 and not isinstance(eos_mix.ge_model, UNIFAC):
+            # Only UNIFAC has a direct implementation for PSRK
+            return self.to_TP_zs(self.T, self.P, zs).lnphis()
         return lnphis_direct(zs, *self.lnphis_args())
         # return self.to_TP_zs(self.T, self.P, zs).lnphis()
 
@@ -423,6 +627,47 @@ class CEOSGas(Phase):
         except:
             return eos_mix.dlnphis_dns(eos_mix.Z_l)
 
+    def lnphis_and_derivatives(self, lnphis=None, dlnphis_dT=None,
+                               dlnphis_dP=None, dlnphis_dns=None):
+        r'''Method to calculate the log of fugacity coefficients of each
+        component in the phase along with their temperature, pressure and
+        mole number derivatives in one call, storing them in the provided
+        buffers. The calculation is performed by
+        :obj:`thermo.eos_mix.GCEOSMIX.lnphis_and_derivatives`.
+
+        Parameters
+        ----------
+        lnphis : list[float], optional
+            Buffer for the log fugacity coefficients, [-]
+        dlnphis_dT : list[float], optional
+            Buffer for the first temperature derivative of log fugacity
+            coefficients, [1/K]
+        dlnphis_dP : list[float], optional
+            Buffer for the first pressure derivative of log fugacity
+            coefficients, [1/Pa]
+        dlnphis_dns : list[list[float]], optional
+            Buffer for the mole number derivatives of log fugacity
+            coefficients, [-]
+
+        Returns
+        -------
+        lnphis : list[float]
+            Log fugacity coefficients, [-]
+        dlnphis_dT : list[float]
+            First temperature derivative of log fugacity coefficients, [1/K]
+        dlnphis_dP : list[float]
+            First pressure derivative of log fugacity coefficients, [1/Pa]
+        dlnphis_dns : list[list[float]]
+            Mole number derivatives of log fugacity coefficients, [-]
+        '''
+        eos_mix = self.eos_mix
+        try:
+            return eos_mix.lnphis_and_derivatives('g', lnphis, dlnphis_dT,
+                                                  dlnphis_dP, dlnphis_dns)
+        except AttributeError:
+            return eos_mix.lnphis_and_derivatives('l', lnphis, dlnphis_dT,
+                                                  dlnphis_dP, dlnphis_dns)
+
     def dlnphis_dzs(self):
         # Confirmed to be mole fraction derivatives - taked with sum not 1 -
         # of the log fugacity coefficients!
@@ -1011,30 +1256,38 @@ else:
     try:
         CEOSLiquid
     except:
-        loaded_data = False
-        # Cost is ~10 ms - must be pasted in the future!
-        try:  # pragma: no cover
-            from appdirs import user_data_dir, user_config_dir
-            data_dir = user_config_dir('thermo')
-        except ImportError:  # pragma: no cover
-            data_dir = ''
-        if data_dir:
+        # Building CEOSLiquid costs ~50 ms. If the THERMO_CACHE_DIR environment
+        # variable names a directory, the compiled code is kept there, keyed
+        # by the source of this file and the Python version
+        compiled_CEOSLiquid = None
+        cache_dir = os.environ.get('THERMO_CACHE_DIR')
+        if cache_dir:
             import marshal
+            from importlib.util import MAGIC_NUMBER
+            from zlib import crc32
             try:
-                1/0
-                f = open(os.path.join(data_dir, 'CEOSLiquid.dat'), 'rb')
-                compiled_CEOSLiquid = marshal.load(f)
-                f.close()
-                loaded_data = True
+                with open(__file__, 'rb') as f:
+                    source_key = crc32(MAGIC_NUMBER + f.read())
+                cache_name = 'CEOSLiquid.%08x.dat' %(source_key)
+                with open(os.path.join(cache_dir, cache_name), 'rb') as f:
+                    compiled_CEOSLiquid = marshal.load(f)
             except:
                 pass
-            if not loaded_data:
-                compiled_CEOSLiquid = compile(build_CEOSLiquid(), '<string>', 'exec')
-                f = open(os.path.join(data_dir, 'CEOSLiquid.dat'), 'wb')
-                marshal.dump(compiled_CEOSLiquid, f)
-                f.close()
-        else:
+        if compiled_CEOSLiquid is None:
             compiled_CEOSLiquid = compile(build_CEOSLiquid(), '<string>', 'exec')
+            if cache_dir:
+                try:
+                    # Files from other versions of this module are removed
+                    for name in os.listdir(cache_dir):
+                        if name.startswith('CEOSLiquid.') and name.endswith('.dat'):
+                            os.remove(os.path.join(cache_dir, name))
+                    cache_path = os.path.join(cache_dir, cache_name)
+                    tmp_path = '%s.%d' %(cache_path, os.getpid())
+                    with open(tmp_path, 'wb') as f:
+                        marshal.dump(compiled_CEOSLiquid, f)
+                    os.replace(tmp_path, cache_path)
+                except:
+                    pass
         exec(compiled_CEOSLiquid)
         # exec(build_CEOSLiquid())
 
@@ -652,7 +652,7 @@ class GibbsExcessLiquid(Phase):
 
         self._Psats = Psats = []
         for i in self.VaporPressures:
-            Psats.append(i.T_dependent_property(T))
+            Psats.append(i.evaluator()(T))
 
         if self.has_henry_components:
             henry_components = self.henry_components
@@ -976,7 +976,7 @@ class GibbsExcessLiquid(Phase):
         if self.Vms_sat_poly_fit:
             return self._Vms_sat_at(T, self._Vms_sat_data, range(self.N))
         VolumeLiquids = self.VolumeLiquids
-        return [VolumeLiquids[i].T_dependent_property(T) for i in range(self.N)]
+        return [VolumeLiquids[i].evaluator()(T) for i in range(self.N)]
 
     def Vms_sat(self):
         try:
@@ -1009,7 +1009,7 @@ class GibbsExcessLiquid(Phase):
         VolumeLiquids = self.VolumeLiquids
 #        Psats = self.Psats()
 #        self._Vms_sat = [VolumeLiquids[i](T, Psats[i]) for i in range(self.N)]
-        self._Vms_sat = [VolumeLiquids[i].T_dependent_property(T) for i in range(self.N)]
+        self._Vms_sat = [VolumeLiquids[i].evaluator()(T) for i in range(self.N)]
         return self._Vms_sat
 
     @staticmethod
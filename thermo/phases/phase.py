@@ -516,6 +516,58 @@ class Phase(object):
         '''
         raise NotImplementedError("Must be implemented by subphases")
 
+    def lnphis_and_derivatives(self, lnphis=None, dlnphis_dT=None,
+                               dlnphis_dP=None, dlnphis_dns=None):
+        r'''Method to calculate the log of fugacity coefficients of each
+        component in the phase along with their temperature, pressure and
+        mole number derivatives, storing them in the provided buffers.
+        Phases able to share intermediate calculations between the four
+        results override this; the default calls :obj:`lnphis`,
+        :obj:`dlnphis_dT`, :obj:`dlnphis_dP` and `dlnphis_dns`.
+
+        Parameters
+        ----------
+        lnphis : list[float], optional
+            Buffer for the log fugacity coefficients, [-]
+        dlnphis_dT : list[float], optional
+            Buffer for the first temperature derivative of log fugacity
+            coefficients, [1/K]
+        dlnphis_dP : list[float], optional
+            Buffer for the first pressure derivative of log fugacity
+            coefficients, [1/Pa]
+        dlnphis_dns : list[list[float]], optional
+            Buffer for the mole number derivatives of log fugacity
+            coefficients, [-]
+
+        Returns
+        -------
+        lnphis : list[float]
+            Log fugacity coefficients, [-]
+        dlnphis_dT : list[float]
+            First temperature derivative of log fugacity coefficients, [1/K]
+        dlnphis_dP : list[float]
+            First pressure derivative of log fugacity coefficients, [1/Pa]
+        dlnphis_dns : list[list[float]]
+            Mole number derivatives of log fugacity coefficients, [-]
+        '''
+        N = self.N
+        values = (self.lnphis(), self.dlnphis_dT(), self.dlnphis_dP())
+        outs = [lnphis, dlnphis_dT, dlnphis_dP]
+        for k in range(3):
+            if outs[k] is None:
+                outs[k] = [0.0]*N
+            out, value = outs[k], values[k]
+            for i in range(N):
+                out[i] = value[i]
+        d2 = self.dlnphis_dns()
+        if dlnphis_dns is None:
+            dlnphis_dns = [[0.0]*N for _ in range(N)]
+        for i in range(N):
+            row, d2_row = dlnphis_dns[i], d2[i]
+            for j in range(N):
+                row[j] = d2_row[j]
+        return outs[0], outs[1], outs[2], dlnphis_dns
+
     def H(self):
         r'''Method to calculate and return the enthalpy of the phase.
         The reference state for most subclasses is an ideal-gas enthalpy of
@@ -3276,7 +3328,7 @@ class Phase(object):
             return self._Cpigs
 
         T = self.T
-        self._Cpigs = [i.T_dependent_property(T) for i in self.HeatCapacityGases]
+        self._Cpigs = [i.evaluator()(T) for i in self.HeatCapacityGases]
         return self._Cpigs
 
     def Cpig_integrals_pure(self):
@@ -3381,7 +3433,7 @@ class Phase(object):
             return self._Cpls
 
         T = self.T
-        self._Cpls = [i.T_dependent_property(T) for i in self.HeatCapacityLiquids]
+        self._Cpls = [i.evaluator()(T) for i in self.HeatCapacityLiquids]
         return self._Cpls
 
     def _Cpl_integrals_pure(self):
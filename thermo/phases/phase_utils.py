@@ -35,7 +35,8 @@ from thermo.eos import eos_full_path_dict
 from thermo.eos_mix import eos_mix_full_path_dict
 from thermo.eos_mix_methods import (PR_lnphis_fastest, PR_translated_lnphis_fastest,
                                     SRK_lnphis_fastest, SRK_translated_lnphis_fastest, 
-                                    RK_lnphis_fastest,  VDW_lnphis_fastest)
+                                    RK_lnphis_fastest,  VDW_lnphis_fastest,
+                                    PSRK_lnphis_fastest)
 from thermo.activity import IdealSolution
 from thermo.wilson import Wilson
 from thermo.unifac import UNIFAC, unifac_gammas_at_T
@@ -70,6 +71,15 @@ def activity_lnphis(zs, model, T, P, N, lnPsats, Poyntings, phis_sat, *activity_
         lnphis[i] = log(gammas[i]*Poyntings[i]*phis_sat[i]*P_inv) + lnPsats[i]
     return lnphis
 
+def PSRK_lnphis(zs, model, T, P, N, l, g, b0s, bs, cs, a_alphas, A_inv, ge_model_id,
+                *activity_args):
+    if 500 <= ge_model_id <= 599:
+        gammas = unifac_gammas_at_T(zs, N, *activity_args)
+    else:
+        raise ValueError("Model not implemented")
+    for i in range(N):
+        gammas[i] = log(gammas[i])
+    return PSRK_lnphis_fastest(zs, T, P, N, l, g, b0s, bs, cs, a_alphas, A_inv, gammas)
 
 def lnphis_direct(zs, model, T, P, N, *args):
     if model == 10200 or model == 10201 or model == 10204 or model == 10205 or model == 10206:
@@ -89,6 +99,8 @@ def lnphis_direct(zs, model, T, P, N, *args):
         for i in range(N):
             lnphis[i] = 0.0
         return lnphis
+    elif model == 10300: # numba: delete
+        return PSRK_lnphis(zs, model, T, P, N, *args) # numba: delete
     elif 20000 <= model <= 29999: # numba: delete
         return activity_lnphis(zs, model, T, P, N, *args) # numba: delete
     raise ValueError("Model not implemented")
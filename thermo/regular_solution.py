@@ -40,12 +40,15 @@ Regular Solution Class
 Regular Solution Regression Calculations
 ========================================
 .. autofunction:: regular_solution_gammas_binaries
+.. autofunction:: regular_solution_gammas_binaries_vectorized
+.. autofunction:: regular_solution_gammas_binaries_jac_vectorized
 
 '''
 
 from __future__ import division
 from fluids.numerics import numpy as np, trunc_exp
 from thermo.activity import GibbsExcess
+from thermo.fitting import LeastSquaresResiduals
 from chemicals.utils import exp, log
 from fluids.constants import R, R_inv
 
@@ -56,7 +59,9 @@ except (ImportError, AttributeError):
 
 __all__ = ['RegularSolution', 'regular_solution_gammas', 
            'regular_solution_gammas_binaries',
-           'regular_solution_gammas_binaries_jac']
+           'regular_solution_gammas_binaries_jac',
+           'regular_solution_gammas_binaries_vectorized',
+           'regular_solution_gammas_binaries_jac_vectorized']
 
 
 def regular_solution_Hi_sums(SPs, Vs, xsVs, coeffs, N, Hi_sums=None):
@@ -697,29 +702,10 @@ class RegularSolution(GibbsExcess):
             from thermo.numba import regular_solution_gammas_binaries as work_func, regular_solution_gammas_binaries_jac as jac_func
             Vs, SPs, Ts = array(Vs), array(SPs), array(Ts)
         else:
-            work_func = regular_solution_gammas_binaries
-            jac_func = regular_solution_gammas_binaries_jac
-        
-        # Allocate all working memory
-        pts = len(xs)
-        gammas_iter = zeros(pts*2)
-        jac_iter = zeros((pts*2, 2))
+            work_func = regular_solution_gammas_binaries_vectorized
+            jac_func = regular_solution_gammas_binaries_jac_vectorized
+            Ts = array(Ts)
 
-        # Plain objective functions
-        if symmetric:
-            def fitting_func(xs, lambda12):
-                return work_func(xs, Vs, SPs, Ts, lambda12, lambda12, gammas_iter)
-            
-            def analytical_jac(xs, lambda12):
-                return jac_func(xs, Vs, SPs, Ts, lambda12, lambda12, jac_iter).sum(axis=1)
-    
-        else:
-            def fitting_func(xs, lambda12, lambda21):
-                return work_func(xs, Vs, SPs, Ts, lambda12, lambda21, gammas_iter)
-            
-            def analytical_jac(xs, lambda12, lambda21):
-                return jac_func(xs, Vs, SPs, Ts, lambda12, lambda21, jac_iter)
-    
         # The extend calls has been tested to be the fastest compared to numpy and list comprehension
         xs_working = []
         for xsi in xs:
@@ -730,35 +716,26 @@ class RegularSolution(GibbsExcess):
             
         xs_working = array(xs_working)
         gammas_working = array(gammas_working)
-        
-        # Objective functions for leastsq maximum speed
-        if symmetric:
-            def func_wrapped_for_leastsq(params):
-                return work_func(xs_working, Vs, SPs, Ts, params[0], params[0], gammas_iter) - gammas_working
-    
-            def jac_wrapped_for_leastsq(params):
-                return jac_func(xs_working, Vs, SPs, Ts, params[0], params[0], jac_iter).sum(axis=1)
-        
-        else:
-            def func_wrapped_for_leastsq(params):
-                return work_func(xs_working, Vs, SPs, Ts, params[0], params[1], gammas_iter) - gammas_working
-    
-            def jac_wrapped_for_leastsq(params):
-                return jac_func(xs_working, Vs, SPs, Ts, params[0], params[1], jac_iter)
-        
+
+        # Objective functions evaluating every point at once; when symmetric,
+        # lambda12 and lambda21 are both set to the one fit parameter
         if symmetric:
             use_fit_parameters = ['lambda12']
+            param_indices = (0, 0)
         else:
             use_fit_parameters = ['lambda12', 'lambda21']
-        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=fitting_func,
+            param_indices = None
+        residuals = LeastSquaresResiduals(work_func, xs_working, gammas_working, args=(Vs, SPs, Ts),
+                                          jac=jac_func, param_indices=param_indices)
+        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=residuals.calc,
                                                       fit_parameters=use_fit_parameters,
                                                       use_fit_parameters=use_fit_parameters,
                                                       initial_guesses=cls._gamma_parameter_guesses,
-                                                       analytical_jac=jac_func,
+                                                      analytical_jac=residuals.jac,
                                                       use_numba=use_numba,
                                                       do_statistics=do_statistics,
-                                                      func_wrapped_for_leastsq=func_wrapped_for_leastsq,
-                                                       jac_wrapped_for_leastsq=jac_wrapped_for_leastsq,
+                                                      func_wrapped_for_leastsq=residuals.residuals,
+                                                      jac_wrapped_for_leastsq=residuals.jacobian,
                                                       **kwargs)
     _gamma_parameter_guesses = [#{'lambda12': 1.0, 'lambda21': 1.0}, # 1 is always tried!
                                 {'lambda12': 1e7, 'lambda21': -1e7},
@@ -922,3 +899,136 @@ def regular_solution_gammas_binaries_jac(xs, Vs, SPs, Ts, lambda12, lambda21, ja
         jac[i2 + 1][0] = x9 
         jac[i2 + 1][1] = x9
     return jac
+
+def regular_solution_gammas_binaries_vectorized(xs, Vs, SPs, Ts, lambda12, lambda21):
+    r'''Calculates activity coefficients with the regular solution model at
+    fixed `lambda` values for a binary system at a series of mole fractions
+    at specified temperatures, for all of the points at once with array
+    operations. This is the same calculation as
+    :obj:`regular_solution_gammas_binaries`, but is much faster for large
+    numbers of points; it requires NumPy.
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        size pts*2
+        [-]
+    Vs : list[float]
+        Molar volumes of each of the two components, [m^3/mol]
+    SPs : list[float]
+        Solubility parameters of each of the two components, [Pa^0.5]
+    Ts : ndarray[float]
+        Temperatures of each composition point; half the length of `xs`, [K]
+    lambda12 : float
+        `lambda` parameter for 12, [-]
+    lambda21 : float
+        `lambda` parameter for 21, [-]
+
+    Returns
+    -------
+    gammas : ndarray[float]
+        Activity coefficient for each species in the liquid mixture,
+        indexed the same as `xs`, [-]
+
+    Examples
+    --------
+    >>> regular_solution_gammas_binaries_vectorized(np.array([.1, .9, 0.3, 0.7, .85, .15]), Vs=[7.421e-05, 8.068e-05], SPs=[19570.2, 18864.7], Ts=np.array([300.0, 400.0, 500.0]), lambda12=0.1759, lambda21=0.7991).tolist()
+    [6818.90697, 1.105437, 62.6628, 2.01184, 1.181434, 137.6232]
+    '''
+    if lambda12 < MIN_LAMBDA_REGULAR_SOLUTION:
+        lambda12 = MIN_LAMBDA_REGULAR_SOLUTION
+    if lambda21 < MIN_LAMBDA_REGULAR_SOLUTION:
+        lambda21 = MIN_LAMBDA_REGULAR_SOLUTION
+    if lambda12 > MAX_LAMBDA_REGULAR_SOLUTION:
+        lambda12 = MAX_LAMBDA_REGULAR_SOLUTION
+    if lambda21 > MAX_LAMBDA_REGULAR_SOLUTION:
+        lambda21 = MAX_LAMBDA_REGULAR_SOLUTION
+    x0 = array(xs, dtype=float)[::2]
+    x1 = 1.0 - x0
+    SP0, SP1 = SPs
+    V0, V1 = Vs
+    c0 = (SP0-SP1)
+    term = (c0*c0 + lambda12*SP0*SP1 + lambda21*SP0*SP1)*R_inv/array(Ts, dtype=float)
+
+    x0V0 = x0*V0
+    x1V1 = x1*V1
+    den_inv = 1.0/(x0V0 + x1V1)
+    phi0, phi1 = x0V0*den_inv, x1V1*den_inv
+
+    gammas = np.empty(2*x0.size)
+    # Limited as in `trunc_exp`
+    gammas[::2] = np.exp(np.minimum(V0*phi1*phi1*term, 709.78))
+    gammas[1::2] = np.exp(np.minimum(V1*phi0*phi0*term, 709.78))
+    return gammas
+
+def regular_solution_gammas_binaries_jac_vectorized(xs, Vs, SPs, Ts, lambda12, lambda21):
+    r'''Calculates the derivatives of the activity coefficients calculated by
+    :obj:`regular_solution_gammas_binaries_vectorized` with respect to
+    `lambda12` and `lambda21`, for all of the points at once with array
+    operations; it requires NumPy.
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        size pts*2
+        [-]
+    Vs : list[float]
+        Molar volumes of each of the two components, [m^3/mol]
+    SPs : list[float]
+        Solubility parameters of each of the two components, [Pa^0.5]
+    Ts : ndarray[float]
+        Temperatures of each composition point; half the length of `xs`, [K]
+    lambda12 : float
+        `lambda` parameter for 12, [-]
+    lambda21 : float
+        `lambda` parameter for 21, [-]
+
+    Returns
+    -------
+    jac : ndarray[float]
+        Derivatives of each activity coefficient with respect to `lambda12`
+        and `lambda21`; one row per activity coefficient, indexed the same
+        as `xs`, [-]
+
+    Examples
+    --------
+    >>> regular_solution_gammas_binaries_jac_vectorized(np.array([.1, .9]), Vs=[7.421e-05, 8.068e-05], SPs=[19570.2, 18864.7], Ts=np.array([300.0]), lambda12=0.1759, lambda21=0.7991).tolist()
+    [[61651.767, 61651.767], [0.113494956, 0.113494956]]
+    '''
+    if lambda12 < MIN_LAMBDA_REGULAR_SOLUTION:
+        lambda12 = MIN_LAMBDA_REGULAR_SOLUTION
+    if lambda21 < MIN_LAMBDA_REGULAR_SOLUTION:
+        lambda21 = MIN_LAMBDA_REGULAR_SOLUTION
+    if lambda12 > MAX_LAMBDA_REGULAR_SOLUTION:
+        lambda12 = MAX_LAMBDA_REGULAR_SOLUTION
+    if lambda21 > MAX_LAMBDA_REGULAR_SOLUTION:
+        lambda21 = MAX_LAMBDA_REGULAR_SOLUTION
+    x0 = array(xs, dtype=float)[::2]
+    x1 = 1.0 - x0
+    SP0, SP1 = SPs
+    V0, V1 = Vs
+
+    x2 = SP0*SP1
+    c99 = (SP0 - SP1)
+    c100 = (lambda12*x2 + lambda21*x2 + c99*c99)
+    c0 = (V0*x0 + V1*x1)
+    x3 = R_inv/(array(Ts, dtype=float)*c0*c0)
+    x4 = x3*c100
+    x5 = V0*V1*V1*x1*x1
+    x6 = x2*x3
+    x7 = x5*x6*np.exp(np.minimum(x4*x5, 709.78))
+    x8 = V0*V0*V1*x0*x0
+    x9 = x6*x8*np.exp(np.minimum(x4*x8, 709.78))
+
+    # Both parameters multiply the same term
+    jac = np.empty((2*x0.size, 2))
+    jac[::2, 0] = jac[::2, 1] = x7
+    jac[1::2, 0] = jac[1::2, 1] = x9
+    return jac
+
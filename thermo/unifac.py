@@ -36,6 +36,9 @@ Main Model (Object-Oriented)
 .. autoclass:: UNIFAC
     :members:
 
+.. autoclass:: UNIFACPsiCache
+    :members:
+
 Main Model (Functional)
 -----------------------
 .. autofunction:: UNIFAC_gammas
@@ -49,6 +52,12 @@ Misc Functions
 .. autofunction:: chemgroups_to_matrix
 .. autofunction:: load_group_assignments_DDBST
 
+Group Assignment Cache
+----------------------
+.. autoclass:: UNIFACAssignmentCache
+    :members:
+.. autodata:: unifac_assignment_catalogs
+
 Data for Original UNIFAC
 ------------------------
 .. autodata:: UFSG
@@ -145,11 +154,13 @@ __all__ = ['UNIFAC_gammas','UNIFAC', 'UNIFAC_psi', 'DOUFMG', 'DOUFSG', 'UFSG', '
             'LUFSG', 'NISTUFSG', 'NISTUFMG',
            'VTPRSG', 'VTPRMG', 'NISTKTUFSG', 'NISTKTUFMG',
            'LUFMG', 'PSRKMG',
-           'unifac_gammas_at_T']
+           'unifac_gammas_at_T', 'unifac_lngammas_many', 'unifac_lngammas_many_loop',
+           'UNIFACPsiCache', 'UNIFACAssignmentCache', 'unifac_assignment_catalogs']
 import os
+from collections import OrderedDict
 from fluids.constants import R
 from fluids.numerics import numpy as np
-from chemicals.utils import log, exp, dxs_to_dns, can_load_data, PY37
+from chemicals.utils import log, exp, dxs_to_dns, can_load_data, PY37, hash_any_primitive
 from thermo.activity import GibbsExcess
 
 try:
@@ -2614,6 +2625,324 @@ def load_group_assignments_DDBST():
                     storage[key] = d_data
 
 
+unifac_assignment_catalogs = {'UNIFAC': UFSG, 'MODIFIED_UNIFAC': DOUFSG,
+                              'PSRK': PSRKSG, 'NIST_UNIFAC': NISTUFSG}
+'''Subgroup catalogs which :obj:`UNIFACAssignmentCache` stores assignments
+for, by name.'''
+
+def _unifac_groups_to_str(groups):
+    # Same format as a column of the DDBST assignments file
+    return ' '.join('%d %d' %(k, v) for k, v in sorted(groups.items()))
+
+def _unifac_str_to_groups(s):
+    if s is None:
+        return None
+    v = s.split()
+    return {int(v[i]): int(v[i+1]) for i in range(0, len(v), 2)}
+
+def _unifac_rdkit_Chem():
+    from thermo.group_contribution import group_contribution_base
+    group_contribution_base.load_rdkit_modules()
+    return group_contribution_base.Chem
+
+def _unifac_inchikey(smiles):
+    Chem = _unifac_rdkit_Chem()
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        return None
+    return Chem.MolToInchiKey(mol)
+
+def _unifac_fragment(smiles, catalog, rdkitmol=None):
+    from thermo.group_contribution.group_contribution_base import smarts_fragment_priority
+    groups = [g for g in unifac_assignment_catalogs[catalog].values() if g.smarts is not None]
+    if not groups:
+        return None
+    if rdkitmol is None:
+        ans = smarts_fragment_priority(groups, smi=smiles)
+    else:
+        ans = smarts_fragment_priority(groups, rdkitmol=rdkitmol)
+    # A SMILES which cannot be parsed returns three values
+    if len(ans) != 5 or not ans[3]:
+        return None
+    return ans[0]
+
+def _unifac_fragment_worker(args):
+    return _unifac_fragment(*args)
+
+class UNIFACAssignmentCache(object):
+    r'''Class for storing UNIFAC subgroup assignments of molecules in a
+    persistent SQLite database, so each molecule only has to be fragmented
+    with its SMARTS patterns once. Assignments are stored by the InChI key of
+    the molecule, so different SMILES strings of the same molecule share an
+    assignment; the SMILES strings which have been looked up are also stored
+    so they can be found again without RDKit.
+
+    New databases are seeded from the bundled DDBST assignments for the
+    'UNIFAC', 'MODIFIED_UNIFAC' and 'PSRK' catalogs (see
+    :obj:`load_group_assignments_DDBST`). Molecules which are not in the
+    database are fragmented with
+    :obj:`thermo.group_contribution.group_contribution_base.smarts_fragment_priority`,
+    and the result - including a failure to fragment - is stored.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the database file; created if it does not exist. Defaults to
+        a file in the thermo user data directory, or an in-memory database
+        if that is not available, [-]
+    seed : bool, optional
+        Whether or not to seed a new database with the DDBST assignments, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of molecules whose assignment was found in the database, [-]
+    misses : int
+        Number of molecules which had to be fragmented, [-]
+
+    Notes
+    -----
+    The catalogs available are listed in :obj:`unifac_assignment_catalogs`.
+    The 'NIST_UNIFAC' subgroups have no SMARTS patterns, so assignments for
+    that catalog can only be stored with :obj:`UNIFACAssignmentCache.store`.
+
+    RDKit is required to look up a SMILES string which is not in the
+    database yet.
+
+    Examples
+    --------
+    >>> cache = UNIFACAssignmentCache(':memory:')
+    >>> cache.lookup('LFQSCWFLJHTTHZ-UHFFFAOYSA-N', 'MODIFIED_UNIFAC')
+    {1: 1, 2: 1, 14: 1}
+    >>> cache.store('LFQSCWFLJHTTHZ-UHFFFAOYSA-N', {1: 1, 2: 1, 14: 1}, 'NIST_UNIFAC', smiles='CCO')
+    >>> cache.assign('CCO', 'NIST_UNIFAC'), cache.hits
+    ({1: 1, 2: 1, 14: 1}, 1)
+    >>> cache.close()
+    '''
+    __slots__ = ('path', 'connection', 'hits', 'misses')
+
+    def __init__(self, path=None, seed=True):
+        import sqlite3
+        if path is None:
+            from thermo.base import data_dir
+            path = os.path.join(data_dir, 'UNIFAC assignments.sqlite') if data_dir else ':memory:'
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.connection = con = sqlite3.connect(path)
+        con.execute('CREATE TABLE IF NOT EXISTS assignments (key TEXT NOT NULL, catalog TEXT NOT NULL, '
+                    'groups TEXT, PRIMARY KEY (key, catalog))')
+        con.execute('CREATE TABLE IF NOT EXISTS smiles (smiles TEXT PRIMARY KEY, key TEXT NOT NULL)')
+        con.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)')
+        if seed and con.execute("SELECT 1 FROM meta WHERE name = 'DDBST'").fetchone() is None:
+            self._seed()
+        con.commit()
+
+    def __repr__(self):
+        return '<UNIFACAssignmentCache %s, hits=%d, misses=%d>' %(self.path, self.hits, self.misses)
+
+    def _seed(self):
+        load_group_assignments_DDBST()
+        con = self.connection
+        for catalog, data in (('UNIFAC', DDBST_UNIFAC_assignments),
+                              ('MODIFIED_UNIFAC', DDBST_MODIFIED_UNIFAC_assignments),
+                              ('PSRK', DDBST_PSRK_assignments)):
+            # Never replace assignments which were stored before seeding
+            con.executemany('INSERT OR IGNORE INTO assignments VALUES (?, ?, ?)',
+                            [(k, catalog, _unifac_groups_to_str(v)) for k, v in data.items()])
+        con.execute("INSERT OR REPLACE INTO meta VALUES ('DDBST', '1')")
+
+    def _check_catalog(self, catalog):
+        if catalog not in unifac_assignment_catalogs:
+            raise ValueError("Unknown catalog %s; options are %s" %(catalog, list(unifac_assignment_catalogs.keys())))
+
+    def _smiles_key(self, smiles):
+        row = self.connection.execute('SELECT key FROM smiles WHERE smiles = ?', (smiles,)).fetchone()
+        return None if row is None else row[0]
+
+    def _lookup(self, key, catalog):
+        row = self.connection.execute('SELECT groups FROM assignments WHERE key = ? AND catalog = ?',
+                                      (key, catalog)).fetchone()
+        if row is None:
+            return False, None
+        return True, _unifac_str_to_groups(row[0])
+
+    def lookup(self, key, catalog='UNIFAC'):
+        r'''Method to retrieve a stored assignment by InChI key, without
+        fragmenting the molecule if it is not stored.
+
+        Parameters
+        ----------
+        key : str
+            InChI key of the molecule, [-]
+        catalog : str, optional
+            Name of the subgroup catalog, [-]
+
+        Returns
+        -------
+        groups : dict[int: int] or None
+            Subgroup counts of the molecule, or None if it is not stored or
+            could not be fragmented, [-]
+        '''
+        self._check_catalog(catalog)
+        return self._lookup(key, catalog)[1]
+
+    def store(self, key, groups, catalog='UNIFAC', smiles=None):
+        r'''Method to store the assignment of a molecule, replacing any
+        existing assignment in the same catalog.
+
+        Parameters
+        ----------
+        key : str
+            InChI key of the molecule, [-]
+        groups : dict[int: int] or None
+            Subgroup counts of the molecule, or None to record that it cannot
+            be fragmented, [-]
+        catalog : str, optional
+            Name of the subgroup catalog, [-]
+        smiles : str, optional
+            SMILES string of the molecule, stored so it can be looked up
+            without RDKit, [-]
+        '''
+        self._check_catalog(catalog)
+        con = self.connection
+        con.execute('INSERT OR REPLACE INTO assignments VALUES (?, ?, ?)',
+                    (key, catalog, None if groups is None else _unifac_groups_to_str(groups)))
+        if smiles is not None:
+            con.execute('INSERT OR REPLACE INTO smiles VALUES (?, ?)', (smiles, key))
+        con.commit()
+
+    def assign(self, smiles, catalog='UNIFAC'):
+        r'''Method to obtain the subgroup assignment of a molecule, from the
+        database if it is stored or otherwise by fragmenting it, in which case
+        the result is stored.
+
+        Parameters
+        ----------
+        smiles : str
+            SMILES string of the molecule, [-]
+        catalog : str, optional
+            Name of the subgroup catalog, [-]
+
+        Returns
+        -------
+        groups : dict[int: int] or None
+            Subgroup counts of the molecule, or None if it could not be parsed
+            or fragmented, [-]
+        '''
+        self._check_catalog(catalog)
+        con = self.connection
+        key = self._smiles_key(smiles)
+        mol = None
+        if key is None:
+            Chem = _unifac_rdkit_Chem()
+            mol = Chem.MolFromSmiles(smiles)
+            if mol is None:
+                return None
+            key = Chem.MolToInchiKey(mol)
+            con.execute('INSERT OR REPLACE INTO smiles VALUES (?, ?)', (smiles, key))
+        found, groups = self._lookup(key, catalog)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+            groups = _unifac_fragment(smiles, catalog, rdkitmol=mol)
+            con.execute('INSERT OR REPLACE INTO assignments VALUES (?, ?, ?)',
+                        (key, catalog, None if groups is None else _unifac_groups_to_str(groups)))
+        con.commit()
+        return groups
+
+    def assign_many(self, smiles, catalog='UNIFAC', processes=None, chunksize=16):
+        r'''Method to obtain the subgroup assignments of many molecules, the
+        same as calling :obj:`UNIFACAssignmentCache.assign` on each of them.
+        The molecules which are not stored can be parsed and fragmented by a
+        pool of worker processes; all results are stored in one transaction.
+
+        Parameters
+        ----------
+        smiles : list[str]
+            SMILES strings of the molecules, [-]
+        catalog : str, optional
+            Name of the subgroup catalog, [-]
+        processes : int, optional
+            Number of worker processes; if None, the calculation is performed
+            in the current process, [-]
+        chunksize : int, optional
+            Number of molecules sent to a worker process at a time, [-]
+
+        Returns
+        -------
+        groups : list[dict[int: int] or None]
+            Subgroup counts of each molecule, or None for those which could
+            not be parsed or fragmented, [-]
+        '''
+        self._check_catalog(catalog)
+        con = self.connection
+        unique = list(dict.fromkeys(smiles))
+        keys = {}
+        unknown = []
+        for smi in unique:
+            key = self._smiles_key(smi)
+            if key is None:
+                unknown.append(smi)
+            else:
+                keys[smi] = key
+
+        executor = None
+        if processes is not None and unknown:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=processes)
+        try:
+            if unknown:
+                if executor is None:
+                    new_keys = [_unifac_inchikey(smi) for smi in unknown]
+                else:
+                    new_keys = list(executor.map(_unifac_inchikey, unknown, chunksize=chunksize))
+                rows = []
+                for smi, key in zip(unknown, new_keys):
+                    if key is not None:
+                        keys[smi] = key
+                        rows.append((smi, key))
+                con.executemany('INSERT OR REPLACE INTO smiles VALUES (?, ?)', rows)
+
+            groups_by_key = {}
+            to_fragment = []
+            for smi in unique:
+                key = keys.get(smi)
+                if key is None or key in groups_by_key:
+                    continue
+                found, groups = self._lookup(key, catalog)
+                if found:
+                    self.hits += 1
+                    groups_by_key[key] = groups
+                else:
+                    self.misses += 1
+                    groups_by_key[key] = None
+                    to_fragment.append((smi, key))
+
+            if to_fragment:
+                args = [(smi, catalog) for smi, _ in to_fragment]
+                if executor is None:
+                    fragmented = [_unifac_fragment(*a) for a in args]
+                else:
+                    fragmented = list(executor.map(_unifac_fragment_worker, args, chunksize=chunksize))
+                rows = []
+                for (_, key), groups in zip(to_fragment, fragmented):
+                    groups_by_key[key] = groups
+                    rows.append((key, catalog, None if groups is None else _unifac_groups_to_str(groups)))
+                con.executemany('INSERT OR REPLACE INTO assignments VALUES (?, ?, ?)', rows)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        con.commit()
+        return [groups_by_key.get(keys.get(smi)) for smi in smiles]
+
+    def close(self):
+        r'''Method to close the database connection.
+        '''
+        self.connection.close()
+
+
 def UNIFAC_RQ(groups, subgroup_data=None):
     r'''Calculates UNIFAC parameters R and Q for a chemical, given a dictionary
     of its groups, as shown in [1]_. Most UNIFAC methods use the same subgroup
@@ -4031,6 +4360,96 @@ def unifac_gammas_at_T(xs, N, N_groups, vs, rs, qs, Qs,
             gammas[i] = exp(lngammas_r[i] + lngammas_c[i])
     return gammas
 
+def unifac_lngammas_many(xs, N, N_groups, vs, rs, qs, Qs, psis,
+                         lnGammas_subgroups_pure, version, rs_34):
+    # Same calculation as `unifac_gammas_at_T`, done for every row of `xs`
+    # at once with matrix operations; requires NumPy
+    xs = array(xs, dtype=float)
+    vs = array(vs, dtype=float)
+    Qs = array(Qs, dtype=float)
+    psis = array(psis, dtype=float)
+
+    # The normalization of Xs cancels out in Thetas
+    Thetas = np.dot(xs, vs.T)*Qs
+    Thetas /= Thetas.sum(axis=1)[:, None]
+    Theta_Psi_sums = np.dot(Thetas, psis)
+    lnGammas_subgroups = Qs*(1.0 - np.dot(Thetas/Theta_Psi_sums, psis.T)
+                             - np.log(Theta_Psi_sums))
+    lngammas_r_pure = (vs*array(lnGammas_subgroups_pure, dtype=float)).sum(axis=0)
+    lngammas = np.dot(lnGammas_subgroups, vs)
+    lngammas -= lngammas_r_pure
+
+    if version != 3:
+        rs = array(rs, dtype=float)
+        qs = array(qs, dtype=float)
+        Vis = rs/np.dot(xs, rs)[:, None]
+        if version == 1 or version == 4:
+            rs_34 = array(rs_34, dtype=float)
+            Vis_modified = rs_34/np.dot(xs, rs_34)[:, None]
+        else:
+            Vis_modified = Vis
+        if version == 4:
+            lngammas += np.log(Vis_modified) + 1.0 - Vis_modified
+        else:
+            Vi_Fi = Vis*(np.dot(xs, qs)[:, None]/qs)
+            lngammas += (1.0 - Vis_modified + np.log(Vis_modified)
+                         - 5.0*qs*(1.0 - Vi_Fi + np.log(Vi_Fi)))
+    return lngammas
+
+def unifac_lngammas_many_loop(xs, M, N, N_groups, vs, rs, qs, Qs, psis,
+                              lnGammas_subgroups_pure, version, rs_34,
+                              lngammas=None):
+    # Loop form of `unifac_lngammas_many` reusing one set of work arrays for
+    # every row of `xs`; this is the variant compiled by `thermo.numba`
+    if lngammas is None:
+        lngammas = [[0.0]*N for _ in range(M)] # numba: delete
+#        lngammas = zeros((M, N)) # numba: uncomment
+    skip_comb = version == 3
+
+    lngammas_r_pure = [0.0]*N
+    for i in range(N):
+        tot = 0.0
+        for k in range(N_groups):
+            tot += vs[k][i]*lnGammas_subgroups_pure[k][i]
+        lngammas_r_pure[i] = tot
+
+    Xs = [0.0]*N_groups
+    Thetas = [0.0]*N_groups
+    Theta_Psi_sums = [0.0]*N_groups
+    Theta_Psi_sum_invs = [0.0]*N_groups
+    lnGammas_subgroups = [0.0]*N_groups
+    Vis = [0.0]*N
+    Fis = [0.0]*N
+    Vis_modified = [0.0]*N
+    lngammas_c = [0.0]*N
+    for row in range(M):
+        xs_row = xs[row]
+        unifac_Xs(N, N_groups, xs_row, vs, Xs)
+        unifac_Thetas(N_groups, Xs, Qs, Thetas)
+        unifac_Theta_Psi_sums(N_groups, Thetas, psis, Theta_Psi_sums)
+        for k in range(N_groups):
+            Theta_Psi_sum_invs[k] = 1.0/Theta_Psi_sums[k]
+        unifac_lnGammas_subgroups(N, N_groups, Qs, psis, Thetas, Theta_Psi_sums,
+                                  Theta_Psi_sum_invs, lnGammas_subgroups)
+        out = lngammas[row]
+        for i in range(N):
+            tot = -lngammas_r_pure[i]
+            for k in range(N_groups):
+                tot += vs[k][i]*lnGammas_subgroups[k]
+            out[i] = tot
+        if not skip_comb:
+            unifac_Vis(rs, xs_row, N, Vis)
+            unifac_Vis(qs, xs_row, N, Fis)
+            if version == 1 or version == 4:
+                unifac_Vis(rs_34, xs_row, N, Vis_modified)
+            else:
+                for i in range(N):
+                    Vis_modified[i] = Vis[i]
+            unifac_lngammas_c(N, version, qs, Fis, Vis, Vis_modified, lngammas_c)
+            for i in range(N):
+                out[i] += lngammas_c[i]
+    return lngammas
+
 def unifac_dgammas_dxs(N, xs, gammas, dlngammas_r_dxs, dlngammas_c_dxs, dgammas_dxs=None):
     if dgammas_dxs is None:
         dgammas_dxs = [[0.0]*N for _ in range(N)] # numba: delete
@@ -4250,6 +4669,136 @@ def unifac_d3lngammas_c_dxixjxks(N, version, qs, Fis, dFis_dxs, d2Fis_dxixjs, d3
                         row[m] = val
     return d3lngammas_c_dxixjxks
 
+class UNIFACPsiCache(object):
+    r'''Class for sharing the temperature-dependent :math:`\Psi` matrices
+    and their temperature derivatives between :obj:`UNIFAC` objects which
+    have the same `version` and interaction parameters - that is, the
+    same subgroups from the same interaction data set. The matrices are
+    stored by temperature; an object created at a stored temperature (for
+    example, another stage of a distillation column, or the same stage on
+    the next iteration) uses the stored matrices instead of recalculating
+    the exponentials.
+
+    Caching is opt-in; an instance of this class must be set to the
+    :obj:`UNIFAC.psi_cache` attribute to enable it.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of parameter set and temperature combinations to
+        store; the least recently used is discarded first, [-]
+    T_tol : float, optional
+        Temperature tolerance; temperatures are rounded to the nearest
+        multiple of `T_tol` when looking up stored matrices, so objects
+        within `T_tol` of each other may share them. The default of zero
+        requires an exact match, [K]
+
+    Attributes
+    ----------
+    hits : int
+        Number of matrix lookups which found a stored matrix, [-]
+    misses : int
+        Number of matrix lookups which did not find a stored matrix, [-]
+
+    Examples
+    --------
+    >>> from thermo.unifac import UFIP, UFSG
+    >>> UNIFAC.psi_cache = UNIFACPsiCache(max_size=64)
+    >>> kwargs = dict(chemgroups=[{1:2, 2:4}, {1:1, 2:1, 18:1}], version=0, interaction_data=UFIP, subgroups=UFSG)
+    >>> stage_1 = UNIFAC.from_subgroups(T=333.15, xs=[0.5, 0.5], **kwargs)
+    >>> stage_2 = UNIFAC.from_subgroups(T=333.15, xs=[0.2, 0.8], **kwargs)
+    >>> stage_1.psis() is stage_2.psis()
+    True
+    >>> (UNIFAC.psi_cache.hits, UNIFAC.psi_cache.misses)
+    (1, 1)
+    >>> UNIFAC.psi_cache = None
+    '''
+    __slots__ = ('max_size', 'T_tol', 'hits', 'misses', 'entries')
+
+    def __init__(self, max_size=256, T_tol=0.0):
+        self.max_size = max_size
+        self.T_tol = T_tol
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+
+    def __repr__(self):
+        return '<UNIFACPsiCache %d entries, hits=%d, misses=%d>' %(
+            len(self.entries), self.hits, self.misses)
+
+    def _key(self, psi_hash, T):
+        T_tol = self.T_tol
+        if T_tol:
+            T = round(T/T_tol)
+        return (psi_hash, T)
+
+    def get(self, psi_hash, T, order=0):
+        r'''Method to look up a stored :math:`\Psi` matrix or one of its
+        temperature derivatives.
+
+        Parameters
+        ----------
+        psi_hash : int
+            Hash of the parameters the matrices depend on, from
+            :obj:`UNIFAC.psi_hash`, [-]
+        T : float
+            Temperature, [K]
+        order : int, optional
+            Temperature derivative order, 0 to 3, [-]
+
+        Returns
+        -------
+        psis : list[list[float]] or None
+            Stored matrix if there is one, otherwise None [-]
+        '''
+        key = self._key(psi_hash, T)
+        entries = self.entries
+        try:
+            entry = entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        v = entry[order]
+        if v is None:
+            self.misses += 1
+        else:
+            entries.move_to_end(key)
+            self.hits += 1
+        return v
+
+    def add(self, psi_hash, T, psis, order=0):
+        r'''Method to store a :math:`\Psi` matrix or one of its temperature
+        derivatives.
+
+        Parameters
+        ----------
+        psi_hash : int
+            Hash of the parameters the matrices depend on, from
+            :obj:`UNIFAC.psi_hash`, [-]
+        T : float
+            Temperature, [K]
+        psis : list[list[float]]
+            Matrix to store, [-]
+        order : int, optional
+            Temperature derivative order, 0 to 3, [-]
+        '''
+        key = self._key(psi_hash, T)
+        entries = self.entries
+        try:
+            entry = entries[key]
+        except KeyError:
+            entries[key] = entry = [None, None, None, None]
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+        entry[order] = psis
+
+    def clear(self):
+        r'''Method to remove all stored matrices and reset the hit
+        statistics.
+        '''
+        self.entries.clear()
+        self.hits = self.misses = 0
+
 class UNIFAC(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the UNIFAC equation. This model is capable of representing VL and LL
@@ -4521,6 +5070,55 @@ class UNIFAC(GibbsExcess):
 
     _model_attributes = ('rs', 'qs', 'psi_a', 'psi_b', 'psi_c', 'version')
 
+    psi_cache = None
+    '''Optional :obj:`UNIFACPsiCache` shared by all :obj:`UNIFAC` objects,
+    used to look up and store the `psi` matrices and their temperature
+    derivatives; it is not part of the state of the model, and not included
+    in its hash or serialization. Set to None (the default) to disable.'''
+
+    def psi_hash(self):
+        r'''Basic method to calculate a hash of the parameters the `psi`
+        matrices depend on - `version` and the `psi` coefficients of the
+        subgroups. Objects with the same subgroups and interaction
+        parameters have the same hash whatever their components are.
+
+        Note that the hashes should only be compared on the same system
+        running in the same process!
+
+        Returns
+        -------
+        psi_hash : int
+            Hash of the object's `psi` parameters, [-]
+        '''
+        try:
+            return self._psi_hash
+        except AttributeError:
+            pass
+        # Much faster than hash_any_primitive; this is done once per model
+        if self.scalar:
+            to_hash = tuple(tuple(row) for v in (self.psi_a, self.psi_b, self.psi_c) for row in v)
+        else:
+            to_hash = tuple(array(v, dtype=float).tobytes() for v in (self.psi_a, self.psi_b, self.psi_c))
+        self._psi_hash = hash((self.version, self.scalar, self.N_groups, to_hash))
+        return self._psi_hash
+
+    def __getstate__(self):
+        # The `psi` hash is only valid in the process it was calculated in
+        state = self.__dict__.copy()
+        state.pop('_psi_hash', None)
+        return state
+
+    def __hash__(self):
+        d = self.__dict__
+        if '_psi_hash' in d:
+            d = self.__getstate__()
+        return hash_any_primitive((self.__class__.__name__, d))
+
+    def as_json(self):
+        d = GibbsExcess.as_json(self)
+        d.pop('_psi_hash', None)
+        return d
+
     def __repr__(self):  # pragma: no cover
 
         psi_abc = (self.psi_a, self.psi_b, self.psi_c)
@@ -4672,6 +5270,11 @@ class UNIFAC(GibbsExcess):
 
         new._Thetas_pure = self._Thetas_pure
         new._Xs_pure = self._Xs_pure
+        try:
+            new._psi_hash = self._psi_hash
+        except AttributeError:
+            if self.psi_cache is not None:
+                new._psi_hash = self.psi_hash()
         if T == self.T:
             # interaction parameters that depend on T only
             try:
@@ -4827,6 +5430,12 @@ class UNIFAC(GibbsExcess):
         except AttributeError:
             pass
         T, N_groups = self.T, self.N_groups
+        cache = self.psi_cache
+        if cache is not None:
+            psis = cache.get(self.psi_hash(), T, 0)
+            if psis is not None:
+                self._psis = psis
+                return psis
 #        mT_inv = -1.0/T
         psi_a, psi_b, psi_c = self.psi_a, self.psi_b, self.psi_c
         if self.scalar:
@@ -4835,6 +5444,8 @@ class UNIFAC(GibbsExcess):
             psis = zeros((N_groups, N_groups))
 
         self._psis = unifac_psis(T, N_groups, self.version, psi_a, psi_b, psi_c, psis)
+        if cache is not None:
+            cache.add(self.psi_hash(), T, psis, 0)
         return psis
 
     def dpsis_dT(self):
@@ -4880,12 +5491,18 @@ class UNIFAC(GibbsExcess):
             return self._dpsis_dT
         except AttributeError:
             pass
+        T, N_groups = self.T, self.N_groups
+        cache = self.psi_cache
+        if cache is not None:
+            dpsis_dT = cache.get(self.psi_hash(), T, 1)
+            if dpsis_dT is not None:
+                self._dpsis_dT = dpsis_dT
+                return dpsis_dT
         try:
             psis = self._psis
         except AttributeError:
             psis = self.psis()
 
-        T, N_groups = self.T, self.N_groups
         psi_a, psi_b, psi_c = self.psi_a, self.psi_b, self.psi_c
 
         if self.scalar:
@@ -4894,6 +5511,8 @@ class UNIFAC(GibbsExcess):
             dpsis_dT = zeros((N_groups, N_groups))
 
         self._dpsis_dT = unifac_dpsis_dT(T, N_groups, self.version, psi_a, psi_b, psi_c, psis, dpsis_dT)
+        if cache is not None:
+            cache.add(self.psi_hash(), T, dpsis_dT, 1)
         return dpsis_dT
 
     def d2psis_dT2(self):
@@ -4946,12 +5565,18 @@ class UNIFAC(GibbsExcess):
             return self._d2psis_dT2
         except AttributeError:
             pass
+        T, N_groups = self.T, self.N_groups
+        cache = self.psi_cache
+        if cache is not None:
+            d2psis_dT2 = cache.get(self.psi_hash(), T, 2)
+            if d2psis_dT2 is not None:
+                self._d2psis_dT2 = d2psis_dT2
+                return d2psis_dT2
         try:
             psis = self._psis
         except AttributeError:
             psis = self.psis()
 
-        T, N_groups = self.T, self.N_groups
         psi_a, psi_b, psi_c = self.psi_a, self.psi_b, self.psi_c
 
         if self.scalar:
@@ -4960,6 +5585,8 @@ class UNIFAC(GibbsExcess):
             d2psis_dT2 = zeros((N_groups, N_groups))
 
         self._d2psis_dT2 = unifac_d2psis_dT2(T, N_groups, self.version, psi_a, psi_b, psi_c, psis, d2psis_dT2)
+        if cache is not None:
+            cache.add(self.psi_hash(), T, d2psis_dT2, 2)
         return d2psis_dT2
 
 
@@ -5022,12 +5649,18 @@ class UNIFAC(GibbsExcess):
             return self._d3psis_dT3
         except AttributeError:
             pass
+        T, N_groups = self.T, self.N_groups
+        cache = self.psi_cache
+        if cache is not None:
+            d3psis_dT3 = cache.get(self.psi_hash(), T, 3)
+            if d3psis_dT3 is not None:
+                self._d3psis_dT3 = d3psis_dT3
+                return d3psis_dT3
         try:
             psis = self._psis
         except AttributeError:
             psis = self.psis()
 
-        T, N_groups = self.T, self.N_groups
         psi_a, psi_b, psi_c = self.psi_a, self.psi_b, self.psi_c
 
         if self.scalar:
@@ -5036,6 +5669,8 @@ class UNIFAC(GibbsExcess):
             d3psis_dT3 = zeros((N_groups, N_groups))
 
         self._d3psis_dT3 = unifac_d3psis_dT3(T, N_groups, self.version, psi_a, psi_b, psi_c, psis, d3psis_dT3)
+        if cache is not None:
+            cache.add(self.psi_hash(), T, d3psis_dT3, 3)
         return d3psis_dT3
 
     def Vis(self):
@@ -7295,6 +7930,73 @@ class UNIFAC(GibbsExcess):
         self._gammas = gammas
         return gammas
 
+    def lngammas_many(self, xs_matrix):
+        r'''Calculates the log of the activity coefficients with the UNIFAC
+        model at many compositions, all at the temperature of this object.
+        The temperature-dependent terms :obj:`psis` and
+        :obj:`lnGammas_subgroups_pure` are calculated once and the
+        composition-dependent ones are evaluated for every composition at
+        once with matrix operations, which is much faster than creating an
+        object with :obj:`to_T_xs` for each composition.
+
+        Parameters
+        ----------
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        lngammas : ndarray
+            Log activity coefficients, one row per composition and one
+            column per component [-]
+
+        Notes
+        -----
+        Requires NumPy. :obj:`unifac_lngammas_many_loop` is an equivalent
+        function written with loops, which `thermo.numba` compiles.
+
+        Examples
+        --------
+        >>> from thermo.unifac import UFIP, UFSG
+        >>> GE = UNIFAC.from_subgroups(chemgroups=[{1:2, 2:4}, {1:1, 2:1, 18:1}], T=60+273.15, xs=[0.5, 0.5], version=0, interaction_data=UFIP, subgroups=UFSG)
+        >>> GE.lngammas_many([[0.5, 0.5], [0.2, 0.8]])
+        array([[0.355996, 0.310901],
+               [0.840230, 0.047996]])
+        '''
+        try:
+            rs_34 = self.rs_34
+        except AttributeError:
+            rs_34 = self.rs
+        return unifac_lngammas_many(xs_matrix, self.N, self.N_groups, self.vs,
+                                    self.rs, self.qs, self.Qs, self.psis(),
+                                    self.lnGammas_subgroups_pure(),
+                                    self.version, rs_34)
+
+    def gammas_many(self, xs_matrix):
+        r'''Calculates the activity coefficients with the UNIFAC model at
+        many compositions, all at the temperature of this object; see
+        :obj:`lngammas_many`.
+
+        Parameters
+        ----------
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        gammas : ndarray
+            Activity coefficients, one row per composition and one column per
+            component [-]
+
+        Examples
+        --------
+        >>> from thermo.unifac import UFIP, UFSG
+        >>> GE = UNIFAC.from_subgroups(chemgroups=[{1:2, 2:4}, {1:1, 2:1, 18:1}], T=60+273.15, xs=[0.5, 0.5], version=0, interaction_data=UFIP, subgroups=UFSG)
+        >>> GE.gammas_many([[0.5, 0.5], [0.2, 0.8]]).tolist()
+        [[1.427602, 1.364654], [2.316902, 1.049167]]
+        '''
+        return npexp(self.lngammas_many(xs_matrix))
+
     def dgammas_dT(self):
         r'''Calculates the first temperature derivative of activity
         coefficients with the UNIFAC model.
@@ -35,7 +35,7 @@ UNIQUAC Class
 .. autoclass:: UNIQUAC
     :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs,
               d2GE_dxixjs, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, phis, 
-              thetas, regress_binary_parameters
+              thetas, regress_binary_parameters, evaluate_many
     :undoc-members:
     :show-inheritance:
     :exclude-members:
@@ -43,15 +43,23 @@ UNIQUAC Class
 UNIQUAC Functional Calculations
 ===============================
 .. autofunction:: UNIQUAC_gammas
+
+UNIQUAC Regression Calculations
+===============================
+.. autofunction:: UNIQUAC_gammas_binaries_vectorized
+.. autofunction:: UNIQUAC_gammas_binaries_jac_vectorized
 '''
 
 from __future__ import division
 from math import log, exp
 from fluids.numerics import numpy as np, trunc_exp
 from fluids.constants import R
-from thermo.activity import GibbsExcess, interaction_exp, dinteraction_exp_dT, d2interaction_exp_dT2, d3interaction_exp_dT3
+from thermo.activity import GibbsExcess, interaction_exp, dinteraction_exp_dT, d2interaction_exp_dT2, d3interaction_exp_dT3, gibbs_excess_gammas
+from thermo.fitting import LeastSquaresResiduals
 
-__all__ = ['UNIQUAC', 'UNIQUAC_gammas', 'UNIQUAC_gammas_binary', 'UNIQUAC_gammas_binaries']
+__all__ = ['UNIQUAC', 'UNIQUAC_gammas', 'UNIQUAC_gammas_binary', 'UNIQUAC_gammas_binaries',
+           'uniquac_many', 'uniquac_many_loop', 'UNIQUAC_gammas_binaries_vectorized',
+           'UNIQUAC_gammas_binaries_jac_vectorized']
 
 try:
     array, zeros, npsum, nplog = np.array, np.zeros, np.sum, np.log
@@ -305,6 +313,93 @@ def uniquac_d2GE_dTdxs(N, T, xs, qs, taus, phis, phis_inv, dphis_dxs, thetas, dt
         d2GE_dTdxs[i] = R*(-T*Ttot + tot)
     return d2GE_dTdxs
 
+def uniquac_many(Ts, xs, rs, qs, z, A, B, C, D, E, F):
+    # Same calculations as `uniquac_GE` and `uniquac_dGE_dxs` and the gammas
+    # derived from them, done for every row of `xs` (each at its own
+    # temperature) at once with array broadcasting; requires NumPy.
+    # dGE_dxs is calculated directly without the `dphis_dxs` and
+    # `dthetas_dxs` matrices, making it O(N^2) per composition.
+    xs = array(xs, dtype=float)
+    Ts = np.broadcast_to(array(Ts, dtype=float), xs.shape[:1])
+    rs = array(rs, dtype=float)
+    qs = array(qs, dtype=float)
+    T = Ts[:, None, None]
+    taus = np.exp(array(A, dtype=float) + array(B, dtype=float)/T
+                  + array(C, dtype=float)*np.log(T) + array(D, dtype=float)*T
+                  + array(E, dtype=float)/(T*T) + array(F, dtype=float)*(T*T))
+
+    rsxs_sum = np.dot(xs, rs)[:, None]
+    qsxs_sum = np.dot(xs, qs)[:, None]
+    phis = xs*rs/rsxs_sum
+    thetas = xs*qs/qsxs_sum
+    thetaj_taus_jis = np.einsum('mj,mji->mi', thetas, taus)
+    log_phis_xs = np.log(phis/xs)
+    log_thetas_phis = np.log(thetas/phis)
+    log_thetaj_taus_jis = np.log(thetaj_taus_jis)
+    z_2 = 0.5*z
+
+    RT = R*Ts
+    GEs = RT*(xs*(log_phis_xs + qs*(z_2*log_thetas_phis - log_thetaj_taus_jis))).sum(axis=1)
+    # sum_i theta_i tau_ki/sum_j theta_j tau_ji
+    vec0 = np.einsum('mi,mki->mk', thetas/thetaj_taus_jis, taus)
+    dGE_dxs = (log_phis_xs - rs*(xs.sum(axis=1)[:, None]/rsxs_sum)
+               + z_2*(qs*log_thetas_phis + rs*(qsxs_sum/rsxs_sum) - qs)
+               + qs*(1.0 - log_thetaj_taus_jis - vec0))
+    dGE_dxs *= RT[:, None]
+
+    xdx_totF = GEs - (xs*dGE_dxs).sum(axis=1)
+    gammas = np.exp((dGE_dxs + xdx_totF[:, None])/RT[:, None])
+    return gammas, GEs, dGE_dxs
+
+def uniquac_many_loop(Ts, xs, M, N, rs, qs, z, A, B, C, D, E, F, gammas=None,
+                      GEs=None, dGE_dxs=None):
+    # Loop form of `uniquac_many` reusing one set of work arrays for every row
+    # of `xs`; this is the variant compiled by `thermo.numba`
+    if gammas is None:
+        gammas = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas = zeros((M, N)) # numba: uncomment
+    if dGE_dxs is None:
+        dGE_dxs = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs = zeros((M, N)) # numba: uncomment
+    if GEs is None:
+        GEs = [0.0]*M
+
+    taus = [[0.0]*N for _ in range(N)] # numba: delete
+#    taus = zeros((N, N)) # numba: uncomment
+    phis = [0.0]*N
+    thetas = [0.0]*N
+    thetaj_taus_jis = [0.0]*N
+    vec0 = [0.0]*N
+    z_2 = 0.5*z
+    for row in range(M):
+        T = Ts[row]
+        xs_row = xs[row]
+        interaction_exp(T, N, A, B, C, D, E, F, taus)
+        phis, rsxs_sum_inv = uniquac_phis(N, xs_row, rs, phis)
+        thetas, qsxs_sum_inv = uniquac_phis(N, xs_row, qs, thetas)
+        uniquac_thetaj_taus_jis(N, taus, thetas, thetaj_taus_jis)
+        GE = uniquac_GE(T, N, z, xs_row, qs, phis, thetas, thetaj_taus_jis)
+        GEs[row] = GE
+
+        xs_sum = 0.0
+        for i in range(N):
+            xs_sum += xs_row[i]
+            vec0[i] = thetas[i]/thetaj_taus_jis[i]
+        c0 = xs_sum*rsxs_sum_inv
+        c1 = z_2*rsxs_sum_inv/qsxs_sum_inv
+        RT = R*T
+        dGE_dxs_row = dGE_dxs[row]
+        for k in range(N):
+            tausk = taus[k]
+            tot = 0.0
+            for i in range(N):
+                tot += vec0[i]*tausk[i]
+            dGE_dxs_row[k] = RT*(log(phis[k]/xs_row[k]) - rs[k]*c0
+                                 + z_2*qs[k]*log(thetas[k]/phis[k]) + rs[k]*c1
+                                 + qs[k]*(1.0 - z_2 - log(thetaj_taus_jis[k]) - tot))
+        gibbs_excess_gammas(xs_row, dGE_dxs_row, GE, T, gammas[row])
+    return gammas, GEs, dGE_dxs
+
 class UNIQUAC(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the UNIQUAC equation. This model is capable of representing VL and LL
@@ -1321,6 +1416,50 @@ class UNIQUAC(GibbsExcess):
         self._dGE_dxs = dGE_dxs
         return dGE_dxs
 
+    def evaluate_many(self, Ts, xs_matrix):
+        r'''Method to calculate the activity coefficients, excess Gibbs energy
+        and its mole fraction derivatives with the UNIQUAC model at many
+        temperatures and compositions at once, with the same parameters as
+        the existing object. Every state is evaluated at once with array
+        broadcasting by :obj:`uniquac_many`, which is much faster than
+        creating an object with :obj:`to_T_xs` for each state.
+
+        Parameters
+        ----------
+        Ts : ndarray[float]
+            Temperatures, one per composition or a single temperature for
+            every composition, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Results of each state; the keys are 'T', 'gammas' (one row per
+            composition and one column per component), 'GE' and 'dGE_dxs'
+            (one row per composition and one column per component), [-]
+
+        Notes
+        -----
+        Requires NumPy. :obj:`uniquac_many_loop` is an equivalent function
+        written with loops, which `thermo.numba` compiles.
+
+        Examples
+        --------
+        >>> tau_bs = [[0.0, -87.46005814161899], [-55.288075960115854, 0.0]]
+        >>> GE = UNIQUAC(T=343.15, xs=[0.252, 0.748], rs=[2.11, 0.92], qs=[1.97, 1.4], tau_bs=tau_bs)
+        >>> res = GE.evaluate_many([343.15, 353.15], [[0.252, 0.748], [0.5, 0.5]])
+        >>> res['gammas'].tolist()
+        [[1.977454, 1.1397696], [1.2619663, 1.4696008]]
+        '''
+        xs_matrix = array(xs_matrix, dtype=float)
+        Ts = np.broadcast_to(array(Ts, dtype=float), xs_matrix.shape[:1])
+        gammas, GEs, dGE_dxs = uniquac_many(Ts, xs_matrix, self.rs, self.qs, self.z,
+                                            self.tau_coeffs_A, self.tau_coeffs_B,
+                                            self.tau_coeffs_C, self.tau_coeffs_D,
+                                            self.tau_coeffs_E, self.tau_coeffs_F)
+        return {'T': Ts, 'gammas': gammas, 'GE': GEs, 'dGE_dxs': dGE_dxs}
+
     def d2GE_dTdxs(self):
         r'''Calculate and return the temperature derivative of mole fraction
         derivatives of excess Gibbs energy using the UNIQUAC model.
@@ -1683,19 +1822,11 @@ class UNIQUAC(GibbsExcess):
         '''
         if use_numba:
             from thermo.numba import UNIQUAC_gammas_binaries as work_func
-            rs = array(rs)
-            qs = array(qs)
         else:
-            work_func = UNIQUAC_gammas_binaries
-        
-        def fitting_func(xs, tau12, tau21):
-            # Capture rs, qs unfortunately is necessary. Works nicely with numba though.
-            # try:
-            return work_func(xs, rs, qs, tau12, tau21)
-            # except:
-            #     print(xs.tolist(), tau12, tau21)
-        
-        
+            work_func = UNIQUAC_gammas_binaries_vectorized
+        rs = np.array(rs)
+        qs = np.array(qs)
+
         pts = len(xs)
         xs_working = []
         for i in range(pts):
@@ -1709,13 +1840,19 @@ class UNIQUAC(GibbsExcess):
         xs_working = np.array(xs_working)
         gammas_working = np.array(gammas_working)
 
-        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=fitting_func,
+        # Objective functions evaluating every point at once; the Jacobian is
+        # analytical and vectorized in either case
+        residuals = LeastSquaresResiduals(work_func, xs_working, gammas_working, args=(rs, qs),
+                                          jac=UNIQUAC_gammas_binaries_jac_vectorized)
+        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=residuals.calc,
                                                       fit_parameters=['tau12', 'tau21'],
                                                       use_fit_parameters=['tau12', 'tau21'],
                                                       initial_guesses=cls._gamma_parameter_guesses,
-                                                      analytical_jac=None,
+                                                      analytical_jac=residuals.jac,
                                                       use_numba=use_numba,
                                                       do_statistics=do_statistics,
+                                                      func_wrapped_for_leastsq=residuals.residuals,
+                                                      jac_wrapped_for_leastsq=residuals.jacobian,
                                                       **kwargs)
          
     
@@ -1756,6 +1893,148 @@ def UNIQUAC_gammas_binaries(xs, rs, qs, tau12, tau21, calc=None):
         calc[i*2+1] = g1
     return calc
 
+def UNIQUAC_gammas_binaries_vectorized(xs, rs, qs, tau12, tau21):
+    r'''Calculates activity coefficients at fixed `tau` values for a binary
+    system at a series of mole fractions with the UNIQUAC model, for all of
+    the points at once with array operations. This is the same calculation
+    as `UNIQUAC_gammas_binaries`, but is much faster for large numbers of
+    points; it requires NumPy.
+
+    .. math::
+        \ln \gamma_i = \ln \frac{\phi_i}{x_i} + \frac{z}{2}q_i\ln
+        \frac{\theta_i}{\phi_i} + l_i - \frac{\phi_i}{x_i}\sum_j x_j l_j
+        + q_i\left(1 - \ln \sum_j \theta_j \tau_{ji} - \sum_j \frac{\theta_j
+        \tau_{ij}}{\sum_k \theta_k \tau_{kj}}\right)
+
+    .. math::
+        l_i = \frac{z}{2}(r_i - q_i) - (r_i - 1)
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        [-]
+    rs : list[float]
+        Van der Waals volume parameters for each species, [-]
+    qs : list[float]
+        Surface area parameters for each species, [-]
+    tau12 : float
+        `tau` parameter for 12, [-]
+    tau21 : float
+        `tau` parameter for 21, [-]
+
+    Returns
+    -------
+    gammas : ndarray[float]
+        Activity coefficient for each species in the liquid mixture,
+        indexed the same as `xs`, [-]
+
+    Examples
+    --------
+    >>> UNIQUAC_gammas_binaries_vectorized(np.array([.1, .9, 0.3, 0.7, .85, .15]), [2.1055, 0.9200], [1.972, 1.400], 0.9, 0.6).tolist()
+    [4.265745, 1.034102, 1.927424, 1.249770, 1.016540, 2.594131]
+    '''
+    if tau12 < MIN_TAU_UNIQUAC:
+        tau12 = MIN_TAU_UNIQUAC
+    if tau21 < MIN_TAU_UNIQUAC:
+        tau21 = MIN_TAU_UNIQUAC
+    x1 = array(xs, dtype=float)[::2]
+    x2 = 1.0 - x1
+    r1, r2 = rs
+    q1, q2 = qs
+    l1 = 5.0*(r1 - q1) - (r1 - 1.0)
+    l2 = 5.0*(r2 - q2) - (r2 - 1.0)
+
+    rx_inv = 1.0/(r1*x1 + r2*x2)
+    qx_inv = 1.0/(q1*x1 + q2*x2)
+    phi1_x1, phi2_x2 = r1*rx_inv, r2*rx_inv
+    theta1, theta2 = q1*x1*qx_inv, q2*x2*qx_inv
+    theta1_phi1, theta2_phi2 = q1*qx_inv/(r1*rx_inv), q2*qx_inv/(r2*rx_inv)
+    T1 = theta1 + theta2*tau21
+    T2 = theta1*tau12 + theta2
+    xl = x1*l1 + x2*l2
+
+    gammas = np.empty(2*x1.size)
+    # Limited as in `trunc_exp`
+    gammas[::2] = np.exp(np.minimum(np.log(phi1_x1) + 5.0*q1*np.log(theta1_phi1) + l1 - phi1_x1*xl
+                         + q1*(1.0 - np.log(T1) - theta1/T1 - theta2*tau12/T2), 709.78))
+    gammas[1::2] = np.exp(np.minimum(np.log(phi2_x2) + 5.0*q2*np.log(theta2_phi2) + l2 - phi2_x2*xl
+                          + q2*(1.0 - np.log(T2) - theta1*tau21/T1 - theta2/T2), 709.78))
+    return gammas
+
+def UNIQUAC_gammas_binaries_jac_vectorized(xs, rs, qs, tau12, tau21):
+    r'''Calculates the derivatives of the activity coefficients calculated by
+    :obj:`UNIQUAC_gammas_binaries_vectorized` with respect to `tau12` and
+    `tau21`, for all of the points at once with array operations; it
+    requires NumPy. Only the residual part of the model depends on `tau`:
+
+    .. math::
+        \frac{\partial \gamma_1}{\partial \tau_{12}} = -\gamma_1\frac{q_1
+        \theta_2^2}{(\theta_1\tau_{12} + \theta_2)^2}, \quad
+        \frac{\partial \gamma_1}{\partial \tau_{21}} = -\gamma_1\frac{q_1
+        \theta_2^2\tau_{21}}{(\theta_1 + \theta_2\tau_{21})^2}
+
+    .. math::
+        \frac{\partial \gamma_2}{\partial \tau_{12}} = -\gamma_2\frac{q_2
+        \theta_1^2\tau_{12}}{(\theta_1\tau_{12} + \theta_2)^2}, \quad
+        \frac{\partial \gamma_2}{\partial \tau_{21}} = -\gamma_2\frac{q_2
+        \theta_1^2}{(\theta_1 + \theta_2\tau_{21})^2}
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        [-]
+    rs : list[float]
+        Van der Waals volume parameters for each species, [-]
+    qs : list[float]
+        Surface area parameters for each species, [-]
+    tau12 : float
+        `tau` parameter for 12, [-]
+    tau21 : float
+        `tau` parameter for 21, [-]
+
+    Returns
+    -------
+    jac : ndarray[float]
+        Derivatives of each activity coefficient with respect to `tau12`
+        and `tau21`; one row per activity coefficient, indexed the same as
+        `xs`, [-]
+
+    Examples
+    --------
+    >>> UNIQUAC_gammas_binaries_jac_vectorized(np.array([.1, .9]), [2.1055, 0.9200], [1.972, 1.400], 0.9, 0.6).tolist()
+    [[-6.463077, -8.819138], [-0.02452134, -0.06196369]]
+    '''
+    gammas = UNIQUAC_gammas_binaries_vectorized(xs, rs, qs, tau12, tau21)
+    if tau12 < MIN_TAU_UNIQUAC:
+        tau12 = MIN_TAU_UNIQUAC
+    if tau21 < MIN_TAU_UNIQUAC:
+        tau21 = MIN_TAU_UNIQUAC
+    x1 = array(xs, dtype=float)[::2]
+    x2 = 1.0 - x1
+    q1, q2 = qs
+    qx_inv = 1.0/(q1*x1 + q2*x2)
+    theta1, theta2 = q1*x1*qx_inv, q2*x2*qx_inv
+    T1_inv = 1.0/(theta1 + theta2*tau21)
+    T2_inv = 1.0/(theta1*tau12 + theta2)
+    c1 = theta1*theta1*T1_inv*T1_inv
+    c2 = theta2*theta2*T2_inv*T2_inv
+    c3 = theta2*theta2*T1_inv*T1_inv
+    c4 = theta1*theta1*T2_inv*T2_inv
+
+    gamma1, gamma2 = gammas[::2], gammas[1::2]
+    jac = np.empty((gammas.size, 2))
+    jac[::2, 0] = -gamma1*q1*c2
+    jac[::2, 1] = -gamma1*q1*tau21*c3
+    jac[1::2, 0] = -gamma2*q2*tau12*c4
+    jac[1::2, 1] = -gamma2*q2*c1
+    return jac
+
 def UNIQUAC_gammas_binary(x1, r1, r2, q1, q2, tau12, tau21):
     x0 = q1*x1
     x2 = x1 - 1
@@ -36,7 +36,7 @@ Temperature Dependent
              critical_zero, ranked_methods, __call__, polynomial_from_method,
              method, valid_methods, test_property_validity,
              T_dependent_property, plot_T_dependent_property, interpolate,
-             add_method, add_tabular_data, fit_add_model, fit_data_to_model, solve_property,
+             add_method, add_tabular_data, interpolate_many, fit_add_model, fit_data_to_model, solve_property,
              calculate_derivative, T_dependent_property_derivative,
              calculate_integral, T_dependent_property_integral,
              calculate_integral_over_T, T_dependent_property_integral_over_T,
@@ -71,6 +71,14 @@ Temperature, Pressure, and Composition Dependent
     :undoc-members:
     :show-inheritance:
 
+Tabular Data Interpolation
+--------------------------
+.. autoclass:: Spline1D
+    :members: __call__, evaluate_many
+
+.. autoclass:: Spline2D
+    :members: __call__, evaluate_many
+
 '''
 NEGLIGIBLE = 'NEGLIGIBLE'
 LINEAR = 'LINEAR'
@@ -102,6 +110,8 @@ from . import functional
 from .functional import *
 from . import multi_cheb_1d
 from .multi_cheb_1d import *
+from . import spline
+from .spline import *
 from . import t_dependent_property
 from .t_dependent_property import *
 from . import tp_dependent_property
@@ -112,6 +122,7 @@ from .mixture_property import *
 __all__ = (
     *functional.__all__,
     *multi_cheb_1d.__all__,
+    *spline.__all__,
     *t_dependent_property.__all__,
     *tp_dependent_property.__all__,
     *mixture_property.__all__,
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, 2017, 2018, 2019, 2020 Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+__all__ = ['Spline1D', 'Spline2D']
+
+from bisect import bisect_right
+import numpy as np
+
+def spline_coefficients(xs, ys, cubic=True):
+    r'''Compute the piecewise polynomial coefficients of an interpolating
+    spline through the points `xs`, `ys`. For each interval `i` the
+    coefficients `[a, b, c, d]` describe
+    :math:`y = a + b t + c t^2 + d t^3` with :math:`t = x - x_i`.
+
+    The cubic spline uses not-a-knot end conditions, which makes it identical
+    to SciPy's cubic `interp1d` and to a FITPACK tensor-product spline on a
+    grid; at least four points are required. Otherwise the coefficients of
+    the linear interpolant are returned.
+    '''
+    N = len(xs)
+    hs = [xs[i+1] - xs[i] for i in range(N-1)]
+    slopes = [(ys[i+1] - ys[i])/hs[i] for i in range(N-1)]
+    if not cubic:
+        return [[ys[i], slopes[i], 0.0, 0.0] for i in range(N-1)]
+
+    # Solve for the second derivatives M at the interior points; the
+    # not-a-knot conditions are used to eliminate M[0] and M[-1] so the
+    # remaining system is tridiagonal
+    m = N - 2
+    a = [0.0]*m
+    b = [0.0]*m
+    c = [0.0]*m
+    r = [0.0]*m
+    for k in range(m):
+        i = k + 1
+        a[k] = hs[i-1]
+        b[k] = 2.0*(hs[i-1] + hs[i])
+        c[k] = hs[i]
+        r[k] = 6.0*(slopes[i] - slopes[i-1])
+    h0, h1 = hs[0], hs[1]
+    b[0] = (h0 + h1)*(h0 + 2.0*h1)/h1
+    c[0] = (h1 - h0)*(h1 + h0)/h1
+    hn, hn1 = hs[-2], hs[-1]
+    b[-1] = (hn + hn1)*(2.0*hn + hn1)/hn
+    a[-1] = (hn - hn1)*(hn + hn1)/hn
+
+    # Thomas algorithm
+    for k in range(1, m):
+        w = a[k]/b[k-1]
+        b[k] -= w*c[k-1]
+        r[k] -= w*r[k-1]
+    Ms = [0.0]*N
+    Ms[m] = r[m-1]/b[m-1]
+    for k in range(m-2, -1, -1):
+        Ms[k+1] = (r[k] - c[k]*Ms[k+2])/b[k]
+    Ms[0] = ((h0 + h1)*Ms[1] - h0*Ms[2])/h1
+    Ms[-1] = ((hn + hn1)*Ms[-2] - hn1*Ms[-3])/hn
+
+    coeffs = []
+    for i in range(N-1):
+        h = hs[i]
+        coeffs.append([ys[i], slopes[i] - h*(2.0*Ms[i] + Ms[i+1])/6.0,
+                       0.5*Ms[i], (Ms[i+1] - Ms[i])/(6.0*h)])
+    return coeffs
+
+
+class Spline1D(object):
+    r'''Interpolating spline through tabular data, with precomputed
+    coefficients for each interval. Within the data range the spline is cubic
+    (if `cubic` is True) or linear; outside of it, the property is linearly
+    extrapolated from the first or last two points.
+
+    Points are sorted on construction, so decreasing `xs` (such as those
+    produced by a `1/T` transform) are accepted.
+
+    Parameters
+    ----------
+    xs : list[float]
+        Independent variable, [-]
+    ys : list[float]
+        Dependent variable, [-]
+    cubic : bool
+        Whether to use a not-a-knot cubic spline or linear interpolation
+        within the data range; requires four points or more, [-]
+
+    Examples
+    --------
+    >>> spline = Spline1D([1.0, 2.0, 3.0, 4.0, 5.0], [1.0, 4.0, 9.0, 16.0, 25.0])
+    >>> spline(2.5), spline(6.0)
+    (6.25, 34.0)
+    >>> spline.evaluate_many(np.array([0.0, 2.5]))
+    array([-2.  ,  6.25])
+    '''
+    def __init__(self, xs, ys, cubic=True):
+        if xs[0] > xs[-1]:
+            xs, ys = xs[::-1], ys[::-1]
+        self.xs = xs = [float(x) for x in xs]
+        self.ys = ys = [float(y) for y in ys]
+        self.N = N = len(xs)
+        self.cubic = cubic
+        self.coeffs = spline_coefficients(xs, ys, cubic)
+        self.x_low, self.x_high = xs[0], xs[-1]
+        self.slope_low = (ys[1] - ys[0])/(xs[1] - xs[0])
+        self.slope_high = (ys[-1] - ys[-2])/(xs[-1] - xs[-2])
+
+    def __call__(self, x):
+        if x < self.x_low:
+            return self.ys[0] + (x - self.x_low)*self.slope_low
+        elif x > self.x_high:
+            return self.ys[-1] + (x - self.x_high)*self.slope_high
+        xs = self.xs
+        i = bisect_right(xs, x) - 1
+        if i == self.N - 1:
+            i -= 1
+        a, b, c, d = self.coeffs[i]
+        t = x - xs[i]
+        return a + t*(b + t*(c + t*d))
+
+    def evaluate_many(self, xs):
+        r'''Evaluate the spline at an array of points.
+
+        Parameters
+        ----------
+        xs : ndarray
+            Independent variable, [-]
+
+        Returns
+        -------
+        ys : ndarray
+            Dependent variable, [-]
+        '''
+        try:
+            arrays = self._arrays
+        except AttributeError:
+            arrays = self._arrays = (np.array(self.xs), np.array(self.coeffs).T)
+        knots, (a, b, c, d) = arrays
+        xs = np.asarray(xs, dtype=float)
+        idx = np.clip(np.searchsorted(knots, xs, side='right') - 1, 0, self.N - 2)
+        t = xs - knots[idx]
+        ys = a[idx] + t*(b[idx] + t*(c[idx] + t*d[idx]))
+        ys = np.where(xs < self.x_low, self.ys[0] + (xs - self.x_low)*self.slope_low, ys)
+        return np.where(xs > self.x_high, self.ys[-1] + (xs - self.x_high)*self.slope_high, ys)
+
+
+class Spline2D(object):
+    r'''Interpolating tensor-product spline through gridded tabular data,
+    with the bicubic (or bilinear) coefficients of every grid cell
+    precomputed. Outside of the grid, the bilinear interpolant is evaluated
+    at the nearest point on the boundary of the grid.
+
+    Parameters
+    ----------
+    xs : list[float]
+        First independent variable, [-]
+    ys : list[float]
+        Second independent variable, [-]
+    zs : list[list[float]]
+        Dependent variable, indexed as `zs[j][i]` for `ys[j]` and `xs[i]`, [-]
+    cubic : bool
+        Whether to use a not-a-knot cubic spline or linear interpolation in
+        both directions within the grid; requires four points or more in each
+        direction, [-]
+
+    Examples
+    --------
+    >>> spline = Spline2D([1.0, 2.0, 3.0], [10.0, 20.0, 30.0], [[1.0, 2.0, 4.0], [3.0, 5.0, 9.0], [6.0, 10.0, 20.0]], cubic=False)
+    >>> spline(1.5, 25.0), spline(0.0, 15.0)
+    (6.0, 2.0)
+    '''
+    def __init__(self, xs, ys, zs, cubic=True):
+        zs = [[float(z) for z in r] for r in zs]
+        if xs[0] > xs[-1]:
+            xs = xs[::-1]
+            zs = [r[::-1] for r in zs]
+        if ys[0] > ys[-1]:
+            ys = ys[::-1]
+            zs = zs[::-1]
+        self.xs = xs = [float(x) for x in xs]
+        self.ys = ys = [float(y) for y in ys]
+        self.Nx, self.Ny = len(xs), len(ys)
+        self.cubic = cubic
+        self.coeffs = self._cell_coefficients(xs, ys, zs, cubic)
+        self.linear_coeffs = self._cell_coefficients(xs, ys, zs, False) if cubic else self.coeffs
+
+    @staticmethod
+    def _cell_coefficients(xs, ys, zs, cubic):
+        # Spline each row in x, then spline each x-coefficient in y; both
+        # steps are linear so this is the exact tensor-product interpolant
+        Nx, Ny = len(xs), len(ys)
+        row_coeffs = [spline_coefficients(xs, r, cubic) for r in zs]
+        cells = [[[0.0]*16 for i in range(Nx-1)] for j in range(Ny-1)]
+        for i in range(Nx-1):
+            for k in range(4):
+                col_coeffs = spline_coefficients(ys, [row_coeffs[j][i][k] for j in range(Ny)], cubic)
+                for j in range(Ny-1):
+                    cell = cells[j][i]
+                    for l in range(4):
+                        cell[4*k + l] = col_coeffs[j][l]
+        return cells
+
+    def _evaluate(self, x, y, coeffs):
+        xs, ys = self.xs, self.ys
+        i = bisect_right(xs, x) - 1
+        if i == self.Nx - 1:
+            i -= 1
+        j = bisect_right(ys, y) - 1
+        if j == self.Ny - 1:
+            j -= 1
+        c = coeffs[j][i]
+        t, u = x - xs[i], y - ys[j]
+        c0 = c[0] + u*(c[1] + u*(c[2] + u*c[3]))
+        c1 = c[4] + u*(c[5] + u*(c[6] + u*c[7]))
+        c2 = c[8] + u*(c[9] + u*(c[10] + u*c[11]))
+        c3 = c[12] + u*(c[13] + u*(c[14] + u*c[15]))
+        return c0 + t*(c1 + t*(c2 + t*c3))
+
+    def __call__(self, x, y):
+        xs, ys = self.xs, self.ys
+        if x < xs[0] or x > xs[-1] or y < ys[0] or y > ys[-1]:
+            x = min(max(x, xs[0]), xs[-1])
+            y = min(max(y, ys[0]), ys[-1])
+            return self._evaluate(x, y, self.linear_coeffs)
+        return self._evaluate(x, y, self.coeffs)
+
+    def evaluate_many(self, xs, ys):
+        r'''Evaluate the spline at arrays of points.
+
+        Parameters
+        ----------
+        xs : ndarray
+            First independent variable, [-]
+        ys : ndarray
+            Second independent variable, [-]
+
+        Returns
+        -------
+        zs : ndarray
+            Dependent variable, [-]
+        '''
+        try:
+            arrays = self._arrays
+        except AttributeError:
+            arrays = self._arrays = (np.array(self.xs), np.array(self.ys),
+                                     np.array(self.coeffs), np.array(self.linear_coeffs))
+        knots_x, knots_y, coeffs, linear_coeffs = arrays
+        xs, ys = np.broadcast_arrays(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+        outside = (xs < knots_x[0]) | (xs > knots_x[-1]) | (ys < knots_y[0]) | (ys > knots_y[-1])
+        xs = np.clip(xs, knots_x[0], knots_x[-1])
+        ys = np.clip(ys, knots_y[0], knots_y[-1])
+        i = np.clip(np.searchsorted(knots_x, xs, side='right') - 1, 0, self.Nx - 2)
+        j = np.clip(np.searchsorted(knots_y, ys, side='right') - 1, 0, self.Ny - 2)
+        c = np.where(outside[..., None], linear_coeffs[j, i], coeffs[j, i])
+        t, u = xs - knots_x[i], ys - knots_y[j]
+        c0 = c[..., 0] + u*(c[..., 1] + u*(c[..., 2] + u*c[..., 3]))
+        c1 = c[..., 4] + u*(c[..., 5] + u*(c[..., 6] + u*c[..., 7]))
+        c2 = c[..., 8] + u*(c[..., 9] + u*(c[..., 10] + u*c[..., 11]))
+        c3 = c[..., 12] + u*(c[..., 13] + u*(c[..., 14] + u*c[..., 15]))
+        return c0 + t*(c1 + t*(c2 + t*c3))
@@ -119,6 +119,18 @@ from thermo.utils import (VDI_TABULAR, POLY_FIT, EXP_POLY_FIT, POLY_FIT_LN_TAU,
                           STABLEPOLY_FIT_LN_TAU, EXP_STABLEPOLY_FIT_LN_TAU,
                           CHEB_FIT, EXP_CHEB_FIT, CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU,
                           has_matplotlib)
+from thermo.utils.spline import Spline1D
+
+
+def _transform_many(func, values):
+    # Interpolation transforms are often written with scalar math functions
+    try:
+        transformed = np.asarray(func(values), dtype=float)
+        if transformed.shape == values.shape:
+            return transformed
+    except:
+        pass
+    return np.array([func(v) for v in values.tolist()], dtype=float)
 
 
 def generate_fitting_function(model,
@@ -414,7 +426,7 @@ class TDependentProperty(object):
         Stores all interpolation objects, idexed by name and property
         transform methods with the format {(name, interpolation_T,
         interpolation_property, interpolation_property_inv):
-        (extrapolator, spline)}, [-]
+        :obj:`Spline1D <thermo.utils.Spline1D>`}, [-]
     all_methods : set
         Set of all methods available for a given CASRN and set of properties,
         [-]
@@ -444,6 +456,8 @@ class TDependentProperty(object):
     P_dependent = False
     forced = False
 
+    _evaluate = None
+
     property_min = 0
     property_max = 1E4  # Arbitrary max
 
@@ -1153,12 +1167,20 @@ class TDependentProperty(object):
         # By default, share state among subsequent objects
         return self
 
+    def __getstate__(self):
+        # The bound evaluator is a local function and cannot be pickled; it
+        # is rebuilt on first use
+        state = self.__dict__.copy()
+        state.pop('_evaluate', None)
+        return state
+
     def __eq__(self, other):
         return self.__hash__() == hash(other)
 
     hash_ignore_props = ('extrapolation_coeffs', 'prop_cached',
                          'TP_cached', 'tabular_data_interpolators',
-                         'tabular_data_interpolators_P', 'T_cached')
+                         'tabular_data_interpolators_P', 'T_cached',
+                         '_evaluate')
     def __hash__(self):
         d = self.__dict__
         # extrapolation values and interpolation objects should be ignored
@@ -1254,7 +1276,10 @@ class TDependentProperty(object):
         if T == self.T_cached:
             return self.prop_cached
         else:
-            self.prop_cached = self.T_dependent_property(T)
+            evaluate = self._evaluate
+            if evaluate is None:
+                evaluate = self.evaluator()
+            self.prop_cached = evaluate(T)
             self.T_cached = T
             return self.prop_cached
 
@@ -1287,7 +1312,7 @@ class TDependentProperty(object):
         d['all_methods'] = list(d['all_methods'])
         d['tabular_data_interpolators'] = {}
 
-        ignored = ('correlations', 'extrapolation_coeffs')
+        ignored = ('correlations', 'extrapolation_coeffs', '_evaluate')
         for i in ignored:
             try: del d[i]
             except: pass
@@ -1782,6 +1807,7 @@ class TDependentProperty(object):
                              "available methods are %s" %(method, self.all_methods))
         self.T_cached = None
         self._method = method
+        self._clear_evaluator()
 
     def valid_methods(self, T=None):
         r'''Method to obtain a sorted list of methods that have data
@@ -1863,6 +1889,7 @@ class TDependentProperty(object):
         
         
         self.T_limits[CHEB_FIT] = (Tmin, Tmax)
+        self._clear_evaluator()
         self.cheb_fit_offset, self.cheb_fit_scale = polynomial_offset_scale(Tmin, Tmax)
         self.cheb_fit_d1_coeffs = chebder(cheb_fit_coeffs, m=1, scl=self.cheb_fit_scale)
         self.cheb_fit_d2_coeffs = chebder(self.cheb_fit_d1_coeffs, m=1, scl=self.cheb_fit_scale)
@@ -1888,6 +1915,7 @@ class TDependentProperty(object):
         self.exp_cheb_fit_Tmax = Tmax
         self.exp_cheb_fit_coeffs = cheb_fit_coeffs
         self.T_limits[EXP_CHEB_FIT] = (Tmin, Tmax)
+        self._clear_evaluator()
         self.exp_cheb_fit_offset, self.exp_cheb_fit_scale = polynomial_offset_scale(Tmin, Tmax)
 
         self.exp_cheb_fit_d1_coeffs = chebder(cheb_fit_coeffs, m=1, scl=self.exp_cheb_fit_scale)
@@ -1913,6 +1941,7 @@ class TDependentProperty(object):
         self.cheb_fit_ln_tau_Tc = Tc
         self.cheb_fit_ln_tau_coeffs = cheb_fit_coeffs
         self.T_limits[CHEB_FIT_LN_TAU] = (Tmin, Tmax)
+        self._clear_evaluator()
         
         xmin = trunc_log(1.0 - Tmin/Tc)
         xmax = trunc_log(1.0 - Tmax/Tc)
@@ -1943,6 +1972,7 @@ class TDependentProperty(object):
         xmin = trunc_log(1.0 - Tmin/Tc)
         xmax = trunc_log(1.0 - Tmax/Tc)
         self.T_limits[EXP_CHEB_FIT_LN_TAU] = (Tmin, Tmax)
+        self._clear_evaluator()
         self.exp_cheb_fit_ln_tau_offset, self.exp_cheb_fit_ln_tau_scale = polynomial_offset_scale(xmin, xmax)
         
         self.exp_cheb_fit_ln_tau_d1_coeffs = chebder(cheb_fit_coeffs, m=1, scl=self.exp_cheb_fit_ln_tau_scale)
@@ -1969,6 +1999,7 @@ class TDependentProperty(object):
         self.stablepoly_fit_offset, self.stablepoly_fit_scale = polynomial_offset_scale(Tmin, Tmax)
         
         self.T_limits[STABLEPOLY_FIT] = (Tmin, Tmax)
+        self._clear_evaluator()
         
         
         self.stablepoly_fit_Tmax_value, self.stablepoly_fit_Tmax_slope, self.stablepoly_fit_Tmax_dT2 = horner_stable_and_der2(self.stablepoly_fit_Tmax, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)
@@ -1992,6 +2023,7 @@ class TDependentProperty(object):
         self.exp_stablepoly_fit_coeffs = stablepoly_fit_coeffs
         self.exp_stablepoly_fit_offset, self.exp_stablepoly_fit_scale = polynomial_offset_scale(Tmin, Tmax)
         self.T_limits[EXP_STABLEPOLY_FIT] = (Tmin, Tmax)
+        self._clear_evaluator()
                 
         self.exp_stablepoly_fit_Tmax_value, self.exp_stablepoly_fit_Tmax_slope, self.exp_stablepoly_fit_Tmax_dT2 = exp_horner_stable_and_der2(self.exp_stablepoly_fit_Tmax, self.exp_stablepoly_fit_coeffs, self.exp_stablepoly_fit_offset, self.exp_stablepoly_fit_scale)
         self.exp_stablepoly_fit_Tmin_value, self.exp_stablepoly_fit_Tmin_slope, self.exp_stablepoly_fit_Tmin_dT2 = exp_horner_stable_and_der2(self.exp_stablepoly_fit_Tmin, self.exp_stablepoly_fit_coeffs, self.exp_stablepoly_fit_offset, self.exp_stablepoly_fit_scale)
@@ -2021,6 +2053,7 @@ class TDependentProperty(object):
         
         self.stablepoly_fit_ln_tau_offset, self.stablepoly_fit_ln_tau_scale = polynomial_offset_scale(xmin, xmax)
         self.T_limits[STABLEPOLY_FIT_LN_TAU] = (Tmin, Tmax)
+        self._clear_evaluator()
 
     def _set_exp_stablepoly_fit_ln_tau(self, stablepoly_fit):
         if len(stablepoly_fit) != 4:
@@ -2041,6 +2074,7 @@ class TDependentProperty(object):
         self.exp_stablepoly_fit_ln_tau_coeffs = stablepoly_fit_coeffs
         xmin, xmax = trunc_log(1.0 - Tmin/Tc), trunc_log(1.0 - Tmax/Tc)
         self.T_limits[EXP_STABLEPOLY_FIT_LN_TAU] = (Tmin, Tmax)
+        self._clear_evaluator()
         self.exp_stablepoly_fit_offset_ln_tau, self.exp_stablepoly_fit_scale_ln_tau = polynomial_offset_scale(xmin, xmax)
     
     def _set_exp_poly_fit(self, poly_fit):
@@ -2060,6 +2094,7 @@ class TDependentProperty(object):
         self.exp_poly_fit_Tmax = Tmax
         self.exp_poly_fit_coeffs = poly_fit_coeffs
         self.T_limits[EXP_POLY_FIT] = (Tmin, Tmax)
+        self._clear_evaluator()
         
         
         self.exp_poly_fit_Tmax_value, self.exp_poly_fit_Tmax_slope, self.exp_poly_fit_Tmax_dT2 = exp_horner_backwards_and_der2(self.exp_poly_fit_Tmax, self.exp_poly_fit_coeffs)
@@ -2084,6 +2119,7 @@ class TDependentProperty(object):
         self.poly_fit_ln_tau_Tc = Tc
         self.poly_fit_ln_tau_coeffs = poly_fit_coeffs
         self.T_limits[POLY_FIT_LN_TAU] = (Tmin, Tmax)
+        self._clear_evaluator()
 
         self.poly_fit_ln_tau_Tmax_value, self.poly_fit_ln_tau_Tmax_slope, self.poly_fit_ln_tau_Tmax_dT2 = horner_backwards_ln_tau_and_der2(Tmax, Tc, poly_fit_coeffs)
         self.poly_fit_ln_tau_Tmin_value, self.poly_fit_ln_tau_Tmin_slope, self.poly_fit_ln_tau_Tmin_dT2 = horner_backwards_ln_tau_and_der2(Tmin, Tc, poly_fit_coeffs)
@@ -2106,6 +2142,7 @@ class TDependentProperty(object):
         self.exp_poly_fit_ln_tau_Tc = Tc
         self.exp_poly_fit_ln_tau_coeffs = poly_fit_coeffs
         self.T_limits[EXP_POLY_FIT_LN_TAU] = (Tmin, Tmax)
+        self._clear_evaluator()
 
         self.exp_poly_fit_ln_tau_Tmax_value, self.exp_poly_fit_ln_tau_Tmax_slope, self.exp_poly_fit_ln_tau_Tmax_dT2 = exp_horner_backwards_ln_tau_and_der2(Tmax, Tc, poly_fit_coeffs)
         self.exp_poly_fit_ln_tau_Tmin_value, self.exp_poly_fit_ln_tau_Tmin_slope, self.exp_poly_fit_ln_tau_Tmin_dT2 = exp_horner_backwards_ln_tau_and_der2(Tmin, Tc, poly_fit_coeffs)
@@ -2134,6 +2171,7 @@ class TDependentProperty(object):
             self.poly_fit_Tmin_value = self.calculate(self.poly_fit_Tmin, POLY_FIT)
             _, self.poly_fit_Tmin_slope, self.poly_fit_Tmin_dT2 = horner_and_der2(self.poly_fit_coeffs, self.poly_fit_Tmin)
             self.T_limits[POLY_FIT] = (self.poly_fit_Tmin, self.poly_fit_Tmax)
+            self._clear_evaluator()
             try:
                 self._custom_set_poly_fit()
             except:
@@ -2250,6 +2288,193 @@ class TDependentProperty(object):
         else:
             raise ValueError("Unknown method; methods are %s" %(self.all_methods))
 
+    def _method_kernel(self, method):
+        r'''Return a function of `T` only which calculates the property with
+        the specified method, with the coefficients of the method bound so no
+        method lookup is needed when it is called. Methods implemented by
+        subclasses are bound through :obj:`calculate`.
+        '''
+        if method == POLY_FIT:
+            coeffs = self.poly_fit_coeffs
+            return lambda T: horner(coeffs, T)
+        elif method == EXP_POLY_FIT:
+            coeffs = self.exp_poly_fit_coeffs
+            return lambda T: exp_horner_backwards(T, coeffs)
+        elif method == POLY_FIT_LN_TAU:
+            Tc, coeffs = self.poly_fit_ln_tau_Tc, self.poly_fit_ln_tau_coeffs
+            return lambda T: horner_backwards_ln_tau(T, Tc, coeffs)
+        elif method == EXP_POLY_FIT_LN_TAU:
+            Tc, coeffs = self.exp_poly_fit_ln_tau_Tc, self.exp_poly_fit_ln_tau_coeffs
+            return lambda T: exp_horner_backwards_ln_tau(T, Tc, coeffs)
+        elif method == STABLEPOLY_FIT:
+            coeffs, offset, scale = self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale
+            return lambda T: horner_stable(T, coeffs, offset, scale)
+        elif method == EXP_STABLEPOLY_FIT:
+            coeffs, offset, scale = self.exp_stablepoly_fit_coeffs, self.exp_stablepoly_fit_offset, self.exp_stablepoly_fit_scale
+            return lambda T: exp_horner_stable(T, coeffs, offset, scale)
+        elif method == CHEB_FIT:
+            coeffs, offset, scale = self.cheb_fit_coeffs, self.cheb_fit_offset, self.cheb_fit_scale
+            return lambda T: chebval(T, coeffs, offset, scale)
+        elif method == EXP_CHEB_FIT:
+            coeffs, offset, scale = self.exp_cheb_fit_coeffs, self.exp_cheb_fit_offset, self.exp_cheb_fit_scale
+            return lambda T: exp_cheb(T, coeffs, offset, scale)
+        elif method == CHEB_FIT_LN_TAU:
+            Tc, coeffs, offset, scale = self.cheb_fit_ln_tau_Tc, self.cheb_fit_ln_tau_coeffs, self.cheb_fit_ln_tau_offset, self.cheb_fit_ln_tau_scale
+            return lambda T: chebval_ln_tau(T, Tc, coeffs, offset, scale)
+        elif method == STABLEPOLY_FIT_LN_TAU:
+            Tc, coeffs, offset, scale = self.stablepoly_fit_ln_tau_Tc, self.stablepoly_fit_ln_tau_coeffs, self.stablepoly_fit_ln_tau_offset, self.stablepoly_fit_ln_tau_scale
+            return lambda T: horner_stable_ln_tau(T, Tc, coeffs, offset, scale)
+        elif method == EXP_CHEB_FIT_LN_TAU:
+            Tc, coeffs, offset, scale = self.exp_cheb_fit_ln_tau_Tc, self.exp_cheb_fit_ln_tau_coeffs, self.exp_cheb_fit_ln_tau_offset, self.exp_cheb_fit_ln_tau_scale
+            return lambda T: exp_cheb_ln_tau(T, Tc, coeffs, offset, scale)
+        elif method == EXP_STABLEPOLY_FIT_LN_TAU:
+            Tc, coeffs, offset, scale = self.exp_stablepoly_fit_ln_tau_Tc, self.exp_stablepoly_fit_ln_tau_coeffs, self.exp_stablepoly_fit_offset_ln_tau, self.exp_stablepoly_fit_scale_ln_tau
+            return lambda T: exp_horner_stable_ln_tau(T, Tc, coeffs, offset, scale)
+        elif method in self.tabular_data:
+            interpolate = self.interpolate
+            return lambda T: interpolate(T, method)
+        elif method in self.local_methods:
+            return self.local_methods[method].f
+        elif method in self.correlations:
+            call, kwargs, _ = self.correlations[method]
+            return lambda T: call(T, **kwargs)
+        calculate = self.calculate
+        return lambda T: calculate(T, method)
+
+    def _clear_evaluator(self):
+        # Only the instance ever stores an evaluator; the class default is None
+        try:
+            del self._evaluate
+        except AttributeError:
+            pass
+
+    def evaluator(self):
+        r'''Method to obtain a function of temperature only which calculates
+        the property with the selected
+        :obj:`method <thermo.utils.TDependentProperty.method>`, with the same
+        results as :obj:`T_dependent_property`.
+
+        The coefficients and valid temperature range of the method are bound
+        into the function when it is created, so a call is a range check plus
+        one direct call of the correlation. Temperatures outside the range,
+        and any value which fails to calculate or is not valid, are handed to
+        :obj:`T_dependent_property`, which applies extrapolation and error
+        handling as usual.
+
+        The function is created once and stored until the method or its
+        coefficients are changed; callers evaluating the property many times
+        may keep a reference to it. It must not be kept after the method is
+        changed. It is not pickled with the object.
+
+        Returns
+        -------
+        evaluate : callable
+            Function with the signature `evaluate(T)` returning the property,
+            [`units`]
+
+        Examples
+        --------
+        >>> from thermo import VaporPressure
+        >>> obj = VaporPressure(Tc=591.72, exp_cheb_fit=(309.0, 591.72, [12.570668791524573, 3.1092695610681673, -0.5485217707981505, 0.11115875762247596, -0.01809803938553478, 0.003674911307077089, -0.00037626163070525465, 0.0001962813915017403, 6.120764548889213e-05, 3.602752453735203e-05]))
+        >>> f = obj.evaluator()
+        >>> f(400.0), obj.T_dependent_property(400.0)
+        (157186.8176686, 157186.8176686)
+        '''
+        evaluate = self._evaluate
+        if evaluate is not None:
+            return evaluate
+        method = self._method
+        slow = self.T_dependent_property
+        if method is None or method not in self.T_limits:
+            self._evaluate = slow
+            return slow
+        Tmin, Tmax = self.T_limits[method]
+        kernel = self._method_kernel(method)
+        property_min, property_max = self.property_min, self.property_max
+
+        def evaluate(T):
+            if Tmin <= T <= Tmax:
+                try:
+                    prop = kernel(T)
+                    if property_min <= prop <= property_max:
+                        return prop
+                except:
+                    pass
+            return slow(T)
+
+        self._evaluate = evaluate
+        return evaluate
+
+    def _calculate_many(self, Ts, method):
+        r'''Evaluate a method at an array of temperatures, all of which must be
+        within the range of the method. The polynomial and Chebyshev fits are
+        evaluated with array operations; correlations are first tried on the
+        whole array, and anything else is evaluated one point at a time.
+
+        Points which fail to calculate are returned as NaN.
+        '''
+        if method == POLY_FIT:
+            return horner(self.poly_fit_coeffs, Ts)
+        elif method == EXP_POLY_FIT:
+            return np.exp(horner(self.exp_poly_fit_coeffs, Ts))
+        elif method == STABLEPOLY_FIT:
+            return horner_stable(Ts, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)
+        elif method == EXP_STABLEPOLY_FIT:
+            return np.exp(horner_stable(Ts, self.exp_stablepoly_fit_coeffs, self.exp_stablepoly_fit_offset, self.exp_stablepoly_fit_scale))
+        elif method == CHEB_FIT:
+            return chebval(Ts, self.cheb_fit_coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+        elif method == EXP_CHEB_FIT:
+            return np.exp(chebval(Ts, self.exp_cheb_fit_coeffs, self.exp_cheb_fit_offset, self.exp_cheb_fit_scale))
+        elif method in (POLY_FIT_LN_TAU, EXP_POLY_FIT_LN_TAU, STABLEPOLY_FIT_LN_TAU,
+                        EXP_STABLEPOLY_FIT_LN_TAU, CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU):
+            if method == POLY_FIT_LN_TAU:
+                Tc = self.poly_fit_ln_tau_Tc
+            elif method == EXP_POLY_FIT_LN_TAU:
+                Tc = self.exp_poly_fit_ln_tau_Tc
+            elif method == STABLEPOLY_FIT_LN_TAU:
+                Tc = self.stablepoly_fit_ln_tau_Tc
+            elif method == EXP_STABLEPOLY_FIT_LN_TAU:
+                Tc = self.exp_stablepoly_fit_ln_tau_Tc
+            elif method == CHEB_FIT_LN_TAU:
+                Tc = self.cheb_fit_ln_tau_Tc
+            else:
+                Tc = self.exp_cheb_fit_ln_tau_Tc
+            # All of the ln tau forms are zero at and above Tc
+            above_Tc = Ts >= Tc
+            lntaus = np.log(1.0 - np.where(above_Tc, 0.0, Ts)/Tc)
+            if method == POLY_FIT_LN_TAU:
+                props = horner(self.poly_fit_ln_tau_coeffs, lntaus)
+            elif method == EXP_POLY_FIT_LN_TAU:
+                props = np.exp(horner(self.exp_poly_fit_ln_tau_coeffs, lntaus))
+            elif method == STABLEPOLY_FIT_LN_TAU:
+                props = horner_stable(lntaus, self.stablepoly_fit_ln_tau_coeffs, self.stablepoly_fit_ln_tau_offset, self.stablepoly_fit_ln_tau_scale)
+            elif method == EXP_STABLEPOLY_FIT_LN_TAU:
+                props = np.exp(horner_stable(lntaus, self.exp_stablepoly_fit_ln_tau_coeffs, self.exp_stablepoly_fit_offset_ln_tau, self.exp_stablepoly_fit_scale_ln_tau))
+            elif method == CHEB_FIT_LN_TAU:
+                props = chebval(lntaus, self.cheb_fit_ln_tau_coeffs, self.cheb_fit_ln_tau_offset, self.cheb_fit_ln_tau_scale)
+            else:
+                props = np.exp(chebval(lntaus, self.exp_cheb_fit_ln_tau_coeffs, self.exp_cheb_fit_ln_tau_offset, self.exp_cheb_fit_ln_tau_scale))
+            return np.where(above_Tc, 0.0, props)
+        elif method in self.tabular_data:
+            return self.interpolate_many(Ts, method)
+        elif method in self.correlations:
+            call, kwargs, _ = self.correlations[method]
+            try:
+                props = np.asarray(call(Ts, **kwargs), dtype=float)
+                if props.shape == Ts.shape:
+                    return props
+            except:
+                # Correlations written with scalar math functions
+                pass
+        props = np.full(Ts.shape, np.nan)
+        calculate = self.calculate
+        for i, T in enumerate(Ts.tolist()):
+            try:
+                props[i] = calculate(T, method)
+            except:
+                pass
+        return props
+
     def _base_calculate_P(self, T, P, method):
         if method in self.tabular_data_P:
             return self.interpolate_P(T, P, method)
@@ -2330,6 +2555,70 @@ class TDependentProperty(object):
             elif self.RAISE_PROPERTY_CALCULATION_ERROR: 
                 raise RuntimeError("%s method '%s' is not valid at T=%s K for component with CASRN '%s'" %(self.name, method, T, self.CASRN))
     
+    def T_dependent_property_many(self, Ts):
+        r'''Method to calculate the property at many temperatures with the
+        selected :obj:`method <thermo.utils.TDependentProperty.method>`.
+        This is the array equivalent of :obj:`T_dependent_property`.
+
+        The temperatures are split once into those inside the valid range of
+        the method, which are calculated together with array operations
+        wherever the method allows it, and those which need to be
+        extrapolated. Values which cannot be calculated, or which fail
+        :obj:`test_property_validity <thermo.utils.TDependentProperty.test_property_validity>`,
+        are returned as NaN.
+
+        Parameters
+        ----------
+        Ts : list[float] or ndarray
+            Temperatures at which to calculate the property, [K]
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, [`units`]
+
+        Examples
+        --------
+        >>> from thermo import HeatCapacityGas
+        >>> obj = HeatCapacityGas(extrapolation='linear', poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228]))
+        >>> obj.T_dependent_property_many([300.0, 500.0, 1200.0])
+        array([ 53.13227,  77.82515, 135.87055])
+        '''
+        Ts = np.asarray(Ts, dtype=float)
+        props = np.full(Ts.shape, np.nan)
+        method = self._method
+        if method is None:
+            if self.RAISE_PROPERTY_CALCULATION_ERROR:
+                raise RuntimeError("No %s method selected for component with CASRN '%s'" %(self.name.lower(), self.CASRN))
+            return props
+        try:
+            T_low, T_high = self.T_limits[method]
+            in_range = (Ts >= T_low) & (Ts <= T_high)
+        except KeyError:
+            in_range = np.array([self.test_method_validity(T, method) for T in Ts.tolist()], dtype=bool)
+        if in_range.any():
+            with np.errstate(all='ignore'):
+                props_in_range = self._calculate_many(Ts[in_range], method)
+            valid = (props_in_range >= self.property_min) & (props_in_range <= self.property_max)
+            if self.RAISE_PROPERTY_CALCULATION_ERROR and not valid.all():
+                T_bad = Ts[in_range][~valid][0]
+                raise RuntimeError("%s method '%s' computed an invalid value at T=%s K for component with CASRN '%s'" %(self.name, method, T_bad, self.CASRN))
+            props[in_range] = np.where(valid, props_in_range, np.nan)
+        out_of_range = ~in_range
+        if out_of_range.any():
+            if self._extrapolation is None:
+                if self.RAISE_PROPERTY_CALCULATION_ERROR:
+                    raise RuntimeError("%s method '%s' is not valid at T=%s K for component with CASRN '%s'" %(self.name, method, Ts[out_of_range][0], self.CASRN))
+            else:
+                extrapolate = self.extrapolate
+                for i in np.flatnonzero(out_of_range).tolist():
+                    try:
+                        props[i] = extrapolate(float(Ts[i]), method)
+                    except:
+                        if self.RAISE_PROPERTY_CALCULATION_ERROR:
+                            raise RuntimeError("Failed to extrapolate %s method '%s' at T=%s K for component with CASRN '%s'" %(self.name.lower(), method, Ts[i], self.CASRN))
+        return props
+
     def calculate_transform(self, T, method, transform):
         if transform == PROPERTY_TRANSFORM_LN:
             if method == EXP_POLY_FIT:
@@ -2627,7 +2916,8 @@ class TDependentProperty(object):
         :obj:`interpolation_property`, and :obj:`interpolation_property_inv` if set. If
         any of these are changed after the interpolators were first created,
         new interpolators are created with the new transforms.
-        All interpolation is performed via the `interp1d` function.
+        The spline coefficients are computed once and stored in
+        :obj:`tabular_data_interpolators`.
 
         Parameters
         ----------
@@ -2643,55 +2933,65 @@ class TDependentProperty(object):
         '''
         # Cannot use method as key - need its id; faster also
         key = (name, id(self.interpolation_T), id(self.interpolation_property), id(self.interpolation_property_inv))
+        try:
+            spline = self.tabular_data_interpolators[key]
+        except KeyError:
+            spline = self._tabular_spline(name, key)
 
-        # If the interpolator and extrapolator has already been created, load it
-#        if isinstance(self.tabular_data_interpolators, dict) and key in self.tabular_data_interpolators:
-#            extrapolator, spline = self.tabular_data_interpolators[key]
-
-        if key in self.tabular_data_interpolators:
-            extrapolator, spline = self.tabular_data_interpolators[key]
-        else:
-            from scipy.interpolate import interp1d
-            Ts, properties = self.tabular_data[name]
+        if self.interpolation_T is not None:
+            T = self.interpolation_T(T)
+        prop = spline(T)
+        if self.interpolation_property is not None:
+            prop = self.interpolation_property_inv(prop)
+        return prop
 
-            if self.interpolation_T is not None:  # Transform ths Ts with interpolation_T if set
-                Ts_interp = [self.interpolation_T(T) for T in Ts]
-            else:
-                Ts_interp = Ts
-            if self.interpolation_property is not None:  # Transform ths props with interpolation_property if set
-                properties_interp = [self.interpolation_property(p) for p in properties]
-            else:
-                properties_interp = properties
-            # Only allow linear extrapolation, but with whatever transforms are specified
-            extrapolator = interp1d(Ts_interp, properties_interp, fill_value='extrapolate')
-            # If more than 5 property points, create a spline interpolation
-            if len(properties) >= 5:
-                spline = interp1d(Ts_interp, properties_interp, kind='cubic')
-            else:
-                spline = None
-#            if isinstance(self.tabular_data_interpolators, dict):
-#                self.tabular_data_interpolators[key] = (extrapolator, spline)
-#            else:
-#                self.tabular_data_interpolators = {key: (extrapolator, spline)}
-            self.tabular_data_interpolators[key] = (extrapolator, spline)
-
-        # Load the stores values, tor checking which interpolation strategy to
-        # use.
+    def _tabular_spline(self, name, key):
+        # Build and store the spline for a tabular data set, with the
+        # transforms applied to the data once
         Ts, properties = self.tabular_data[name]
-
-        if T < Ts[0] or T > Ts[-1] or not spline:
-            tool = extrapolator
+        if self.interpolation_T is not None:  # Transform ths Ts with interpolation_T if set
+            Ts_interp = [self.interpolation_T(T) for T in Ts]
+        else:
+            Ts_interp = Ts
+        if self.interpolation_property is not None:  # Transform ths props with interpolation_property if set
+            properties_interp = [self.interpolation_property(p) for p in properties]
         else:
-            tool = spline
+            properties_interp = properties
+        # If more than 5 property points, use a cubic spline
+        spline = Spline1D(Ts_interp, properties_interp, cubic=len(properties) >= 5)
+        self.tabular_data_interpolators[key] = spline
+        return spline
 
-        if self.interpolation_T:
-            T = self.interpolation_T(T)
-        prop = tool(T)  # either spline, or linear interpolation
+    def interpolate_many(self, Ts, name):
+        r'''Method to perform interpolation on a given tabular data set
+        previously added via :obj:`add_tabular_data` at an array of
+        temperatures. The same spline as :obj:`interpolate` is used.
 
-        if self.interpolation_property:
-            prop = self.interpolation_property_inv(prop)
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to interpolate the property, [K]
+        name : str
+            The name assigned to the tabular data set
 
-        return float(prop)
+        Returns
+        -------
+        props : ndarray
+            Calculated properties, [`units`]
+        '''
+        key = (name, id(self.interpolation_T), id(self.interpolation_property), id(self.interpolation_property_inv))
+        try:
+            spline = self.tabular_data_interpolators[key]
+        except KeyError:
+            spline = self._tabular_spline(name, key)
+
+        Ts = np.asarray(Ts, dtype=float)
+        if self.interpolation_T is not None:
+            Ts = _transform_many(self.interpolation_T, Ts)
+        props = spline.evaluate_many(Ts)
+        if self.interpolation_property is not None:
+            props = _transform_many(self.interpolation_property_inv, props)
+        return props
     
 
     def add_correlation(self, name, model, Tmin, Tmax, **kwargs):
@@ -2820,6 +3120,7 @@ class TDependentProperty(object):
                                                   f_int, f_int_over_T)
         self._method = name
         self.T_cached = None
+        self._clear_evaluator()
         self.all_methods.add(name)
         self.T_limits[name] = (0. if Tmin is None else Tmin,
                                inf if Tmax is None else Tmax)
@@ -3166,6 +3467,113 @@ class TDependentProperty(object):
                     %(order, self.name.lower(), method, T, self.CASRN)
                 )
 
+    def _calculate_derivative_many(self, Ts, method, order=1):
+        r'''Evaluate a derivative of a method at an array of temperatures, all
+        of which must be within the range of the method. Polynomial and
+        Chebyshev fits are evaluated with array operations and other methods
+        one point at a time.
+
+        Points which fail to calculate are returned as NaN.
+        '''
+        if method == POLY_FIT:
+            if order == 1:
+                return horner(self.poly_fit_d_coeffs, Ts)
+            if order == 2:
+                return horner(self.poly_fit_d2_coeffs, Ts)
+            if order == 3:
+                return horner_and_der3(self.poly_fit_coeffs, Ts)[3]
+        elif method == STABLEPOLY_FIT:
+            if order == 1:
+                return horner_stable_and_der(Ts, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)[1]
+            if order == 2:
+                return horner_stable_and_der2(Ts, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)[2]
+            if order == 3:
+                return horner_stable_and_der3(Ts, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)[3]
+        elif method == CHEB_FIT:
+            if order == 1:
+                return chebval(Ts, self.cheb_fit_d1_coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+            if order == 2:
+                return chebval(Ts, self.cheb_fit_d2_coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+            if order == 3:
+                return chebval(Ts, self.cheb_fit_d3_coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+            if order == 4:
+                return chebval(Ts, self.cheb_fit_d4_coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+        elif method == EXP_POLY_FIT and order == 1:
+            f, der = horner_and_der(self.exp_poly_fit_coeffs, Ts)
+            return np.exp(f)*der
+        elif method == EXP_CHEB_FIT and order == 1:
+            return (np.exp(chebval(Ts, self.exp_cheb_fit_coeffs, self.exp_cheb_fit_offset, self.exp_cheb_fit_scale))
+                    *chebval(Ts, self.exp_cheb_fit_d1_coeffs, self.exp_cheb_fit_offset, self.exp_cheb_fit_scale))
+        ders = np.full(Ts.shape, np.nan)
+        calculate_derivative = self.calculate_derivative
+        for i, T in enumerate(Ts.tolist()):
+            try:
+                ders[i] = calculate_derivative(T, method, order)
+            except:
+                pass
+        return ders
+
+    def T_dependent_property_derivative_many(self, Ts, order=1):
+        r'''Method to obtain a derivative of a property with respect to
+        temperature, of a given order, at many temperatures. This is the
+        array equivalent of :obj:`T_dependent_property_derivative`.
+
+        Temperatures inside the valid range of the method are calculated
+        together with array operations wherever the method allows it; the
+        others are extrapolated one at a time. Values which cannot be
+        calculated are returned as NaN.
+
+        Parameters
+        ----------
+        Ts : list[float] or ndarray
+            Temperatures at which to calculate the derivative, [K]
+        order : int
+            Order of the derivative, >= 1
+
+        Returns
+        -------
+        derivatives : ndarray
+            Calculated derivative property, [`units/K^order`]
+
+        Examples
+        --------
+        >>> from thermo import HeatCapacityGas
+        >>> obj = HeatCapacityGas(extrapolation='linear', poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228]))
+        >>> obj.T_dependent_property_derivative_many([300.0, 500.0, 1200.0])
+        array([0.11380, 0.12316, 0.06650])
+        '''
+        Ts = np.asarray(Ts, dtype=float)
+        ders = np.full(Ts.shape, np.nan)
+        method = self._method
+        if method is None:
+            if self.RAISE_PROPERTY_CALCULATION_ERROR:
+                raise RuntimeError("No %s method selected for component with CASRN '%s'" %(self.name.lower(), self.CASRN))
+            return ders
+        if method in self.T_limits:
+            Tmin, Tmax = self.T_limits[method]
+            in_range = (Ts >= Tmin) & (Ts <= Tmax)
+        else:
+            in_range = np.ones(Ts.shape, dtype=bool)
+        if in_range.any():
+            with np.errstate(all='ignore'):
+                ders[in_range] = self._calculate_derivative_many(Ts[in_range], method, order)
+        out_of_range = ~in_range
+        if out_of_range.any():
+            if self._extrapolation is None:
+                if self.RAISE_PROPERTY_CALCULATION_ERROR:
+                    raise RuntimeError("%s method '%s' is not valid at T=%s K for component with CASRN '%s'"
+                                       %(self.name, method, Ts[out_of_range][0], self.CASRN))
+            else:
+                extrapolate_derivative = self.extrapolate_derivative
+                for i in np.flatnonzero(out_of_range).tolist():
+                    try:
+                        ders[i] = extrapolate_derivative(float(Ts[i]), method, order)
+                    except:
+                        if self.RAISE_PROPERTY_CALCULATION_ERROR:
+                            raise RuntimeError("Failed to extrapolate %sth derivative of %s method '%s' at T=%s K for component with CASRN '%s'"
+                                               %(order, self.name.lower(), method, Ts[i], self.CASRN))
+        return ders
+
     def calculate_integral(self, T1, T2, method):
         r'''Method to calculate the integral of a property with respect to
         temperature, using a specified method. Uses SciPy's `quad` function
@@ -3305,6 +3713,53 @@ class TDependentProperty(object):
                 return None
         return integral
 
+    def T_dependent_property_integral_many(self, T1s, T2s):
+        r'''Method to calculate the integral of a property with respect to
+        temperature for many pairs of temperature limits. This is the array
+        equivalent of :obj:`T_dependent_property_integral`.
+
+        When the selected method is a polynomial fit, all pairs of limits
+        inside its range are integrated together with array operations; the
+        other pairs use :obj:`T_dependent_property_integral` one at a time.
+        Integrals which cannot be calculated are returned as NaN.
+
+        Parameters
+        ----------
+        T1s : list[float] or ndarray
+            Lower limits of integration, [K]
+        T2s : list[float] or ndarray
+            Upper limits of integration, [K]
+
+        Returns
+        -------
+        integrals : ndarray
+            Calculated integrals of the property over the given ranges,
+            [`units*K`]
+
+        Examples
+        --------
+        >>> from thermo import HeatCapacityGas
+        >>> obj = HeatCapacityGas(extrapolation='linear', poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228]))
+        >>> obj.T_dependent_property_integral_many([298.15, 298.15], [500.0, 1200.0])
+        array([13159.403, 90316.606])
+        '''
+        T1s, T2s = np.broadcast_arrays(np.asarray(T1s, dtype=float), np.asarray(T2s, dtype=float))
+        integrals = np.full(T1s.shape, np.nan)
+        done = np.zeros(T1s.shape, dtype=bool)
+        method = self._method
+        if method == POLY_FIT:
+            Tmin, Tmax = self.T_limits[method]
+            done = (T1s >= Tmin) & (T1s <= Tmax) & (T2s >= Tmin) & (T2s <= Tmax)
+            if done.any():
+                coeffs = self.poly_fit_int_coeffs
+                integrals[done] = horner(coeffs, T2s[done]) - horner(coeffs, T1s[done])
+        integral = self.T_dependent_property_integral
+        for i in np.flatnonzero(~done).tolist():
+            value = integral(float(T1s[i]), float(T2s[i]))
+            if value is not None:
+                integrals[i] = value
+        return integrals
+
     def calculate_integral_over_T(self, T1, T2, method):
         r'''Method to calculate the integral of a property over temperature
         with respect to temperature, using a specified method. Uses SciPy's
@@ -3444,6 +3899,48 @@ class TDependentProperty(object):
                 return None
         return integral
 
+    def T_dependent_property_integral_over_T_many(self, T1s, T2s):
+        r'''Method to calculate the integral of a property over temperature
+        with respect to temperature for many pairs of temperature limits. This
+        is the array equivalent of :obj:`T_dependent_property_integral_over_T`.
+
+        When the selected method is a polynomial fit, all pairs of limits
+        inside its range are integrated together with array operations; the
+        other pairs use :obj:`T_dependent_property_integral_over_T` one at a
+        time. Integrals which cannot be calculated are returned as NaN.
+
+        Parameters
+        ----------
+        T1s : list[float] or ndarray
+            Lower limits of integration, [K]
+        T2s : list[float] or ndarray
+            Upper limits of integration, [K]
+
+        Returns
+        -------
+        integrals : ndarray
+            Calculated integrals of the property over temperature over the
+            given ranges, [`units`]
+        '''
+        T1s, T2s = np.broadcast_arrays(np.asarray(T1s, dtype=float), np.asarray(T2s, dtype=float))
+        integrals = np.full(T1s.shape, np.nan)
+        done = np.zeros(T1s.shape, dtype=bool)
+        method = self._method
+        if method == POLY_FIT:
+            Tmin, Tmax = self.T_limits[method]
+            done = (T1s >= Tmin) & (T1s <= Tmax) & (T2s >= Tmin) & (T2s <= Tmax)
+            if done.any():
+                coeffs, log_coeff = self.poly_fit_T_int_T_coeffs, self.poly_fit_log_coeff
+                T1s_done, T2s_done = T1s[done], T2s[done]
+                integrals[done] = (horner(coeffs, T2s_done) - horner(coeffs, T1s_done)
+                                   + log_coeff*np.log(T2s_done/T1s_done))
+        integral_over_T = self.T_dependent_property_integral_over_T
+        for i in np.flatnonzero(~done).tolist():
+            value = integral_over_T(float(T1s[i]), float(T2s[i]))
+            if value is not None:
+                integrals[i] = value
+        return integrals
+
     def _get_extrapolation_coeffs(self, extrapolation, method, low):
         if extrapolation is None or extrapolation == 'None': return
         T_limits = self.T_limits
@@ -3883,9 +4380,8 @@ class TDependentProperty(object):
         '''tabular_data, dict: Stored (Ts, properties) for any
         tabular data; indexed by provided or autogenerated name.'''
         self.tabular_data_interpolators = {}
-        '''tabular_data_interpolators, dict: Stored (extrapolator,
-        spline) tuples which are interp1d instances for each set of tabular
-        data; indexed by tuple of (name, interpolation_T,
+        '''tabular_data_interpolators, dict: Stored :obj:`Spline1D <thermo.utils.Spline1D>`
+        instances for each set of tabular data; indexed by tuple of (name, interpolation_T,
         interpolation_property, interpolation_property_inv) to ensure that
         if an interpolation transform is altered, the old interpolator which
         had been created is no longer used.'''
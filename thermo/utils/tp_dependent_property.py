@@ -21,6 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from thermo.utils import TDependentProperty, has_matplotlib
+from thermo.utils.spline import Spline2D
 from fluids.numerics import linspace, derivative
 import numpy as np
 
@@ -83,9 +84,8 @@ class TPDependentProperty(TDependentProperty):
         tabular data; indexed by provided or autogenerated name.'''
         
         self.tabular_data_interpolators_P = {}
-        '''tabular_data_interpolators_P, dict: Stored (extrapolator,
-        spline) tuples which are interp2d instances for each set of tabular
-        data; indexed by tuple of (name, interpolation_T, interpolation_P,
+        '''tabular_data_interpolators_P, dict: Stored :obj:`Spline2D <thermo.utils.Spline2D>`
+        instances for each set of tabular data; indexed by tuple of (name, interpolation_T, interpolation_P,
         interpolation_property, interpolation_property_inv) to ensure that
         if an interpolation transform is altered, the old interpolator which
         had been created is no longer used.'''
@@ -359,13 +359,15 @@ class TPDependentProperty(TDependentProperty):
         them for quick future use.
 
         Interpolation is cubic-spline based if 5 or more points are available,
-        and linearly interpolated if not. Extrapolation is always performed
-        linearly. This function uses the transforms :obj:`interpolation_T`,
+        and linearly interpolated if not. Outside of the data, the linear
+        interpolant at the nearest point on the edge of the data is returned.
+        This function uses the transforms :obj:`interpolation_T`,
         :obj:`interpolation_P`,
         :obj:`interpolation_property`, and :obj:`interpolation_property_inv` if set. If
         any of these are changed after the interpolators were first created,
         new interpolators are created with the new transforms.
-        All interpolation is performed via the `interp2d` function.
+        The spline coefficients are computed once and stored in
+        :obj:`tabular_data_interpolators_P`.
 
         Parameters
         ----------
@@ -387,13 +389,10 @@ class TPDependentProperty(TDependentProperty):
             if T < Ts[0] or T > Ts[-1] or P < Ps[0] or P > Ps[-1]:
                 raise ValueError("Extrapolation not permitted and conditions outside of range")
 
-        # If the interpolator and extrapolator has already been created, load it
-        if key in self.tabular_data_interpolators_P:
-            extrapolator, spline = self.tabular_data_interpolators_P[key]
-        else:
-            from scipy.interpolate import interp2d
-
-
+        # If the spline has already been created, load it
+        try:
+            spline = self.tabular_data_interpolators_P[key]
+        except KeyError:
             if self.interpolation_T:  # Transform ths Ts with interpolation_T if set
                 Ts2 = [self.interpolation_T(T2) for T2 in Ts]
             else:
@@ -406,34 +405,20 @@ class TPDependentProperty(TDependentProperty):
                 properties2 = [[self.interpolation_property(p) for p in r] for r in properties]
             else:
                 properties2 = properties
-            # Only allow linear extrapolation, but with whatever transforms are specified
-            extrapolator = interp2d(Ts2, Ps2, properties2)  # interpolation if fill value is missing
             # If more than 5 property points, create a spline interpolation
-            if len(properties) >= 5:
-                spline = interp2d(Ts2, Ps2, properties2, kind='cubic')
-            else:
-                spline = None
-            self.tabular_data_interpolators_P[key] = (extrapolator, spline)
-
-        # Load the stores values, tor checking which interpolation strategy to
-        # use.
-        Ts, Ps, properties = self.tabular_data_P[name]
-
-        if T < Ts[0] or T > Ts[-1] or not spline or P < Ps[0] or P > Ps[-1]:
-            tool = extrapolator
-        else:
-            tool = spline
+            spline = Spline2D(Ts2, Ps2, properties2, cubic=len(properties) >= 5 and len(Ts) >= 4)
+            self.tabular_data_interpolators_P[key] = spline
 
         if self.interpolation_T:
             T = self.interpolation_T(T)
         if self.interpolation_P:
             P = self.interpolation_P(P)
-        prop = tool(T, P)  # either spline, or linear interpolation
+        prop = spline(T, P)  # either spline, or linear interpolation
 
         if self.interpolation_property:
             prop = self.interpolation_property_inv(prop)
 
-        return float(prop)
+        return prop
 
     def plot_isotherm(self, T, Pmin=None, Pmax=None, methods_P=[], pts=50,
                       only_valid=True, show=True):  # pragma: no cover
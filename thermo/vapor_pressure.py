@@ -70,6 +70,7 @@ from math import e, inf
 from chemicals.utils import log, exp, isnan
 from chemicals.dippr import EQ101
 from chemicals import miscdata
+from chemicals.data_reader import data_source
 from chemicals.miscdata import lookup_VDI_tabular_data
 from chemicals.vapor_pressure import *
 from chemicals.vapor_pressure import dAntoine_dT, d2Antoine_dT2, dWagner_original_dT, d2Wagner_original_dT2, dWagner_dT, d2Wagner_dT2, dTRC_Antoine_extended_dT, d2TRC_Antoine_extended_dT2
@@ -305,7 +306,7 @@ class VaporPressure(TDependentProperty):
         if load_data:
             CASRN = self.CASRN
             CASRN_int = None if not CASRN else CAS_to_int(CASRN)
-            df_wb = miscdata.webbook_data
+            df_wb = data_source('webbook_constants.tsv')
             if CASRN == '7732-18-5':
                 methods.append(IAPWS)
                 T_limits[IAPWS] = (235.0, iapws95_Tc)
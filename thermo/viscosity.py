@@ -105,6 +105,7 @@ from chemicals.utils import log, exp, log10, isinf, isnan
 from chemicals.utils import none_and_length_check, mixing_simple, mixing_logarithmic
 from thermo.utils import TPDependentProperty, MixtureProperty
 from chemicals import miscdata
+from chemicals.data_reader import data_source
 from chemicals.miscdata import lookup_VDI_tabular_data
 from thermo import electrochem
 from thermo.electrochem import Laliberte_viscosity
@@ -363,7 +364,7 @@ class ViscosityLiquid(TPDependentProperty):
         CASRN = self.CASRN
         if load_data:
             CASRN_int = None if not CASRN else CAS_to_int(CASRN)
-            jb_df = miscdata.joback_predictions
+            jb_df = data_source('joback_predictions.tsv')
             if self.MW is not None and CASRN_int in jb_df.index:
                 mul0 = float(jb_df.at[CASRN_int, 'mul0'])
                 if not isnan(mul0):
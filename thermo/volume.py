@@ -841,9 +841,8 @@ class VolumeSupercriticalLiquid(VolumeLiquid):
         '''tabular_data, dict: Stored (Ts, properties) for any
         tabular data; indexed by provided or autogenerated name.'''
         self.tabular_data_interpolators = {}
-        '''tabular_data_interpolators, dict: Stored (extrapolator,
-        spline) tuples which are interp1d instances for each set of tabular
-        data; indexed by tuple of (name, interpolation_T,
+        '''tabular_data_interpolators, dict: Stored :obj:`Spline1D <thermo.utils.Spline1D>`
+        instances for each set of tabular data; indexed by tuple of (name, interpolation_T,
         interpolation_property, interpolation_property_inv) to ensure that
         if an interpolation transform is altered, the old interpolator which
         had been created is no longer used.'''
@@ -852,9 +851,8 @@ class VolumeSupercriticalLiquid(VolumeLiquid):
         '''tabular_data_P, dict: Stored (Ts, Ps, properties) for any
         tabular data; indexed by provided or autogenerated name.'''
         self.tabular_data_interpolators_P = {}
-        '''tabular_data_interpolators_P, dict: Stored (extrapolator,
-        spline) tuples which are interp2d instances for each set of tabular
-        data; indexed by tuple of (name, interpolation_T, interpolation_P,
+        '''tabular_data_interpolators_P, dict: Stored :obj:`Spline2D <thermo.utils.Spline2D>`
+        instances for each set of tabular data; indexed by tuple of (name, interpolation_T, interpolation_P,
         interpolation_property, interpolation_property_inv) to ensure that
         if an interpolation transform is altered, the old interpolator which
         had been created is no longer used.'''
@@ -33,7 +33,7 @@ Wilson Class
 ============
 
 .. autoclass:: Wilson
-    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks, lambdas, dlambdas_dT, d2lambdas_dT2, d3lambdas_dT3, from_DDBST, from_DDBST_as_matrix
+    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks, lambdas, dlambdas_dT, d2lambdas_dT2, d3lambdas_dT3, from_DDBST, from_DDBST_as_matrix, evaluate_many
     :undoc-members:
     :show-inheritance:
     :exclude-members: gammas
@@ -45,6 +45,8 @@ Wilson Functional Calculations
 Wilson Regression Calculations
 ==============================
 .. autofunction:: wilson_gammas_binaries
+.. autofunction:: wilson_gammas_binaries_vectorized
+.. autofunction:: wilson_gammas_binaries_jac_vectorized
 
 '''
 
@@ -53,13 +55,16 @@ from math import log, exp
 from fluids.constants import R
 from fluids.numerics import numpy as np, trunc_exp
 from thermo.activity import GibbsExcess, interaction_exp, dinteraction_exp_dT, d2interaction_exp_dT2, d3interaction_exp_dT3
+from thermo.fitting import LeastSquaresResiduals
 
 try:
     array, zeros, npsum, nplog, ones = np.array, np.zeros, np.sum, np.log, np.ones
 except (ImportError, AttributeError):
     pass
 
-__all__ = ['Wilson', 'Wilson_gammas', 'wilson_gammas_binaries', 'wilson_gammas_binaries_jac']
+__all__ = ['Wilson', 'Wilson_gammas', 'wilson_gammas_binaries', 'wilson_gammas_binaries_jac',
+           'wilson_many', 'wilson_many_loop', 'wilson_gammas_binaries_vectorized',
+           'wilson_gammas_binaries_jac_vectorized']
 
 
 def wilson_xj_Lambda_ijs(xs, lambdas, N, xj_Lambda_ijs=None):
@@ -209,6 +214,63 @@ def wilson_gammas(xs, N, lambdas, xj_Lambda_ijs_inv, gammas=None, vec0=None):
 
     return gammas
 
+def wilson_many(Ts, xs, A, B, C, D, E, F):
+    # Same calculations as `wilson_gammas`, `Wilson.GE` and `wilson_dGE_dxs`,
+    # done for every row of `xs` (each at its own temperature) at once with
+    # array broadcasting; requires NumPy
+    xs = array(xs, dtype=float)
+    Ts = np.broadcast_to(array(Ts, dtype=float), xs.shape[:1])
+    T = Ts[:, None, None]
+    lambdas = np.exp(array(A, dtype=float) + array(B, dtype=float)/T
+                     + array(C, dtype=float)*np.log(T) + array(D, dtype=float)*T
+                     + array(E, dtype=float)/(T*T) + array(F, dtype=float)*(T*T))
+
+    xj_Lambda_ijs = np.einsum('mj,mij->mi', xs, lambdas)
+    xj_Lambda_ijs_inv = 1.0/xj_Lambda_ijs
+    log_xj_Lambda_ijs = np.log(xj_Lambda_ijs)
+    # sum_j x_j lambda_ji/sum_k x_k lambda_jk, shared by gammas and dGE_dxs
+    vec0 = np.einsum('mj,mji->mi', xs*xj_Lambda_ijs_inv, lambdas)
+
+    RT = R*Ts
+    GEs = -RT*(xs*log_xj_Lambda_ijs).sum(axis=1)
+    dGE_dxs = -RT[:, None]*(log_xj_Lambda_ijs + vec0)
+    gammas = np.exp(1.0 - vec0)*xj_Lambda_ijs_inv
+    return gammas, GEs, dGE_dxs
+
+def wilson_many_loop(Ts, xs, M, N, A, B, C, D, E, F, gammas=None, GEs=None,
+                     dGE_dxs=None):
+    # Loop form of `wilson_many` reusing one set of work arrays for every row
+    # of `xs`; this is the variant compiled by `thermo.numba`
+    if gammas is None:
+        gammas = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas = zeros((M, N)) # numba: uncomment
+    if dGE_dxs is None:
+        dGE_dxs = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs = zeros((M, N)) # numba: uncomment
+    if GEs is None:
+        GEs = [0.0]*M
+
+    lambdas = [[0.0]*N for _ in range(N)] # numba: delete
+#    lambdas = zeros((N, N)) # numba: uncomment
+    xj_Lambda_ijs = [0.0]*N
+    xj_Lambda_ijs_inv = [0.0]*N
+    log_xj_Lambda_ijs = [0.0]*N
+    vec0 = [0.0]*N
+    for row in range(M):
+        T = Ts[row]
+        xs_row = xs[row]
+        interaction_exp(T, N, A, B, C, D, E, F, lambdas)
+        wilson_xj_Lambda_ijs(xs_row, lambdas, N, xj_Lambda_ijs)
+        GE = 0.0
+        for i in range(N):
+            xj_Lambda_ijs_inv[i] = 1.0/xj_Lambda_ijs[i]
+            log_xj_Lambda_ijs[i] = log(xj_Lambda_ijs[i])
+            GE += xs_row[i]*log_xj_Lambda_ijs[i]
+        GEs[row] = -GE*R*T
+        wilson_gammas(xs_row, N, lambdas, xj_Lambda_ijs_inv, gammas[row], vec0)
+        wilson_dGE_dxs(xs_row, T, N, log_xj_Lambda_ijs, lambdas, xj_Lambda_ijs_inv, dGE_dxs[row])
+    return gammas, GEs, dGE_dxs
+
 MIN_LAMBDA_WILSON = 1e-20
 
 def wilson_gammas_binaries(xs, lambda12, lambda21, calc=None):
@@ -357,6 +419,107 @@ def wilson_gammas_binaries_jac(xs, lambda12, lambda21, calc=None):
     return calc
 
 
+def wilson_gammas_binaries_vectorized(xs, lambda12, lambda21):
+    r'''Calculates activity coefficients at fixed `lambda` values for a
+    binary system at a series of mole fractions, for all of the points at
+    once with array operations. This is the same calculation as
+    :obj:`wilson_gammas_binaries`, but is much faster for large numbers of
+    points; it requires NumPy.
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        [-]
+    lambda12 : float
+        `lambda` parameter for 12, [-]
+    lambda21 : float
+        `lambda` parameter for 21, [-]
+
+    Returns
+    -------
+    gammas : ndarray[float]
+        Activity coefficient for each species in the liquid mixture,
+        indexed the same as `xs`, [-]
+
+    Examples
+    --------
+    >>> wilson_gammas_binaries_vectorized(np.array([.1, .9, 0.3, 0.7, .85, .15]), 0.1759, 0.7991).tolist()
+    [3.42989, 1.03432, 1.74338, 1.21234, 1.01766, 2.30656]
+    '''
+    if lambda12 < MIN_LAMBDA_WILSON:
+        lambda12 = MIN_LAMBDA_WILSON
+    if lambda21 < MIN_LAMBDA_WILSON:
+        lambda21 = MIN_LAMBDA_WILSON
+    x1 = array(xs, dtype=float)[::2]
+    x2 = 1.0 - x1
+
+    c0 = 1.0/(x1 + x2*lambda12)
+    c1 = 1.0/(x2 + x1*lambda21)
+    c3 = lambda12*c0 - lambda21*c1
+
+    gammas = np.empty(2*x1.size)
+    # Limited as in `trunc_exp`
+    gammas[::2] = np.exp(np.minimum(c3*x2, 709.78))*c0
+    gammas[1::2] = np.exp(np.minimum(-c3*x1, 709.78))*c1
+    return gammas
+
+def wilson_gammas_binaries_jac_vectorized(xs, lambda12, lambda21):
+    r'''Calculates the derivatives of the activity coefficients calculated by
+    :obj:`wilson_gammas_binaries_vectorized` with respect to `lambda12` and
+    `lambda21`, for all of the points at once with array operations; it
+    requires NumPy.
+
+    Parameters
+    ----------
+    xs : ndarray[float]
+        Liquid mole fractions of each species in the format
+        x0_0, x1_0, (component 1 point1, component 2 point 1),
+        x0_1, x1_1, (component 1 point2, component 2 point 2), ...
+        [-]
+    lambda12 : float
+        `lambda` parameter for 12, [-]
+    lambda21 : float
+        `lambda` parameter for 21, [-]
+
+    Returns
+    -------
+    jac : ndarray[float]
+        Derivatives of each activity coefficient with respect to `lambda12`
+        and `lambda21`; one row per activity coefficient, indexed the same
+        as `xs`, [-]
+
+    Examples
+    --------
+    >>> wilson_gammas_binaries_jac_vectorized(np.array([.1, .9]), 0.1759, 0.7991).tolist()
+    [[-7.324006, -2.893296], [-0.1550149, -0.00860765]]
+    '''
+    if lambda12 < MIN_LAMBDA_WILSON:
+        lambda12 = MIN_LAMBDA_WILSON
+    if lambda21 < MIN_LAMBDA_WILSON:
+        lambda21 = MIN_LAMBDA_WILSON
+    x1 = array(xs, dtype=float)[::2]
+    x2 = 1.0 - x1
+
+    c0 = lambda12*x2
+    c2 = 1.0/(c0 + x1)
+    c3 = lambda21*x1
+    c5 = 1.0/(c3 + x2)
+    c6 = c2*lambda12 - c5*lambda21
+    c7 = np.exp(np.minimum(c6*x2, 709.78))
+    c8 = c2*c5
+    c9 = np.exp(np.minimum(-c6*x1, 709.78))
+
+    jac = np.empty((2*x1.size, 2))
+    jac[::2, 0] = -c7*lambda12*x2*x2*c2*c2*c2
+    jac[::2, 1] = c7*c8*x2*(c3*c5 - 1.0)
+    jac[1::2, 0] = c8*c9*x1*(c0*c2 - 1.0)
+    jac[1::2, 1] = -c9*lambda21*x1*x1*c5*c5*c5
+    return jac
+
+
 class Wilson(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the Wilson equation. This model is capable of representing most
@@ -1592,6 +1755,48 @@ class Wilson(GibbsExcess):
         self._gammas = gammas
         return gammas
 
+    def evaluate_many(self, Ts, xs_matrix):
+        r'''Method to calculate the activity coefficients, excess Gibbs energy
+        and its mole fraction derivatives with the Wilson model at many
+        temperatures and compositions at once, with the same parameters as
+        the existing object. Every state is evaluated at once with array
+        broadcasting by :obj:`wilson_many`, which is much faster than
+        creating an object with :obj:`to_T_xs` for each state.
+
+        Parameters
+        ----------
+        Ts : ndarray[float]
+            Temperatures, one per composition or a single temperature for
+            every composition, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Results of each state; the keys are 'T', 'gammas' (one row per
+            composition and one column per component), 'GE' and 'dGE_dxs'
+            (one row per composition and one column per component), [-]
+
+        Notes
+        -----
+        Requires NumPy. :obj:`wilson_many_loop` is an equivalent function
+        written with loops, which `thermo.numba` compiles.
+
+        Examples
+        --------
+        >>> GE = Wilson(T=300.0, xs=[0.252, 0.748], lambda_as=[[0, log(0.154)], [log(0.888), 0]])
+        >>> res = GE.evaluate_many(300.0, [[0.252, 0.748], [0.5, 0.5]])
+        >>> res['gammas'].tolist()
+        [[1.881492608717, 1.165577493112], [1.23741299, 1.48367070]]
+        '''
+        xs_matrix = array(xs_matrix, dtype=float)
+        Ts = np.broadcast_to(array(Ts, dtype=float), xs_matrix.shape[:1])
+        gammas, GEs, dGE_dxs = wilson_many(Ts, xs_matrix, self.lambda_as, self.lambda_bs,
+                                           self.lambda_cs, self.lambda_ds,
+                                           self.lambda_es, self.lambda_fs)
+        return {'T': Ts, 'gammas': gammas, 'GE': GEs, 'dGE_dxs': dGE_dxs}
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, use_numba=False,
                                   do_statistics=True, **kwargs):
@@ -1599,21 +1804,9 @@ class Wilson(GibbsExcess):
         if use_numba:
             from thermo.numba import wilson_gammas_binaries as work_func, wilson_gammas_binaries_jac as jac_func
         else:
-            work_func = wilson_gammas_binaries
-            jac_func = wilson_gammas_binaries_jac
-        
-        # Allocate all working memory
-        pts = len(xs)
-        pts2 = pts*2
-        gammas_iter, jac_iter = zeros(pts2), zeros((pts2, 2))
-
-        # Plain objective functions
-        def fitting_func(xs, lambda12, lambda21):
-            return work_func(xs, lambda12, lambda21, gammas_iter)
-            
-        def analytical_jac(xs, lambda12, lambda21):
-            return jac_func(xs, lambda12, lambda21, jac_iter)
-        
+            work_func = wilson_gammas_binaries_vectorized
+            jac_func = wilson_gammas_binaries_jac_vectorized
+
         # The extend calls has been tested to be the fastest compared to numpy and list comprehension
         xs_working = []
         for xsi in xs:
@@ -1624,25 +1817,19 @@ class Wilson(GibbsExcess):
             
         xs_working = array(xs_working)
         gammas_working = array(gammas_working)
-        
-        # Objective functions for leastsq maximum speed
-        def func_wrapped_for_leastsq(params):
-            return work_func(xs_working, params[0], params[1], gammas_iter) - gammas_working
 
-        def jac_wrapped_for_leastsq(params):
-            return jac_func(xs_working, params[0], params[1], jac_iter)
-
-        
+        # Objective functions evaluating every point at once
+        residuals = LeastSquaresResiduals(work_func, xs_working, gammas_working, jac=jac_func)
         fit_parameters = ['lambda12', 'lambda21']
-        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=fitting_func,
+        return GibbsExcess._regress_binary_parameters(gammas_working, xs_working, fitting_func=residuals.calc,
                                                       fit_parameters=fit_parameters,
                                                       use_fit_parameters=fit_parameters,
                                                       initial_guesses=cls._gamma_parameter_guesses,
-                                                      analytical_jac=analytical_jac,
+                                                      analytical_jac=residuals.jac,
                                                       use_numba=use_numba,
                                                       do_statistics=do_statistics,
-                                                      func_wrapped_for_leastsq=func_wrapped_for_leastsq,
-                                                      jac_wrapped_for_leastsq=jac_wrapped_for_leastsq,
+                                                      func_wrapped_for_leastsq=residuals.residuals,
+                                                      jac_wrapped_for_leastsq=residuals.jacobian,
                                                       **kwargs)
 
     